@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the time to split audio into chunks.
+
+The output transport splits TTS audio into 10ms (by default 20ms) chunks and
+VAD analyzers consume audio in 32ms windows. Slicing a `bytearray` after every
+chunk copies all the remaining audio, which is quadratic with the size of the
+audio (e.g. a TTS service that delivers several seconds at once).
+`AudioRingBuffer` hands out chunks without copying the remaining audio.
+"""
+
+import argparse
+import time
+
+from pipecat.audio.ring_buffer import AudioRingBuffer
+
+
+def bytearray_chunks(audio: bytes, chunk_size: int) -> int:
+    buffer = bytearray()
+    buffer.extend(audio)
+    count = 0
+    while len(buffer) >= chunk_size:
+        bytes(buffer[:chunk_size])
+        buffer = buffer[chunk_size:]
+        count += 1
+    return count
+
+
+def ring_buffer_chunks(audio: bytes, chunk_size: int) -> int:
+    buffer = AudioRingBuffer()
+    buffer.write(audio)
+    count = 0
+    for chunk in buffer.chunks(chunk_size):
+        bytes(chunk)
+        count += 1
+    return count
+
+
+def ms(func, audio: bytes, chunk_size: int, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(audio, chunk_size)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audio chunking time")
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    chunk_size = args.sample_rate * args.chunk_ms // 1000 * 2
+
+    print(f"{'audio (s)':>9} | {'bytearray (ms)':>14} | {'ring buffer (ms)':>16} | {'speedup':>7}")
+    for secs in [1, 5, 10, 30]:
+        audio = bytes(args.sample_rate * 2 * secs)
+        old = ms(bytearray_chunks, audio, chunk_size, args.repeat)
+        new = ms(ring_buffer_chunks, audio, chunk_size, args.repeat)
+        print(f"{secs:>9} | {old:>14.2f} | {new:>16.2f} | {old / new:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the cost of converting frame audio when several processors use it.
+
+Every consumer of an audio frame (e.g. VAD, volume, STT, an audio recorder)
+used to convert `frame.audio` to a NumPy array on its own. Audio frames now
+cache their int16 and float32 arrays (`frame.samples` and
+`frame.float_samples`), so the audio is converted at most once. We measure the
+time per frame spent converting audio for a number of consumers, each needing
+int16 and float32 samples.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pipecat.frames.frames import InputAudioRawFrame
+
+
+def consume_bytes(frame: InputAudioRawFrame):
+    samples = np.frombuffer(frame.audio, dtype=np.int16)
+    floats = samples.astype(np.float32) / 32768.0
+    return samples, floats
+
+
+def consume_views(frame: InputAudioRawFrame):
+    return frame.samples, frame.float_samples
+
+
+def us_per_frame(consume, audio: bytes, consumers: int, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame = InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)
+        for _ in range(consumers):
+            consume(frame)
+    return (time.perf_counter() - start) / frames * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audio frame array views")
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=50000)
+    args = parser.parse_args()
+
+    audio = (np.random.randn(16 * args.chunk_ms) * 3000).astype(np.int16).tobytes()
+
+    # Frame creation only, subtracted from the results.
+    base = us_per_frame(consume_views, audio, 0, args.frames)
+
+    print(f"{'consumers':>9} | {'bytes (us)':>10} | {'views (us)':>10} | {'speedup':>7}")
+    for consumers in [1, 2, 4, 8]:
+        from_bytes = us_per_frame(consume_bytes, audio, consumers, args.frames) - base
+        from_views = us_per_frame(consume_views, audio, consumers, args.frames) - base
+        print(
+            f"{consumers:>9} | {from_bytes:>10.2f} | {from_views:>10.2f} | {from_bytes / from_views:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
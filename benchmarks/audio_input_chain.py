@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the cost of input audio processing (audio filter and VAD) for many
+streams.
+
+We compare awaiting the audio filter in the event loop and then running VAD in
+an executor (what input transports used to do) with `AudioInputChain`, which
+runs both in a single executor job per audio frame. We report event loop
+thread CPU and total CPU per frame, and the wall time to process all the
+frames. The filter is a simple high-pass filter standing in for noise
+suppression, and VAD is Silero.
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.signal import butter, lfilter, lfilter_zi
+
+from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
+from pipecat.audio.input_chain import AudioInputChain
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.frames.frames import FilterControlFrame
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 320  # 20ms
+
+
+class HighPassFilter(BaseAudioFilter):
+    def __init__(self):
+        self._b, self._a = butter(2, 100, btype="highpass", fs=SAMPLE_RATE)
+        self._zi = lfilter_zi(self._b, self._a) * 0
+
+    async def start(self, sample_rate: int):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def process_frame(self, frame: FilterControlFrame):
+        pass
+
+    async def filter(self, audio: bytes) -> bytes:
+        samples = np.frombuffer(audio, dtype=np.int16)
+        return self.filter_samples(samples).tobytes()
+
+    def filter_samples(self, samples: np.ndarray) -> np.ndarray:
+        filtered, self._zi = lfilter(self._b, self._a, samples, zi=self._zi)
+        return np.clip(filtered, -32768, 32767).astype(np.int16)
+
+
+async def loop_filter_then_vad(audio_filter, vad_analyzer, audio, executor):
+    audio = await audio_filter.filter(audio)
+    return audio, await vad_analyzer.analyze_audio_async(audio, executor)
+
+
+async def run(mode: str, streams: int, frames: int):
+    rng = np.random.default_rng(0)
+    audio = [(rng.normal(0, 3000, FRAME_SAMPLES)).astype(np.int16).tobytes() for _ in range(frames)]
+
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def stream():
+        vad_analyzer = SileroVADAnalyzer(sample_rate=SAMPLE_RATE)
+        vad_analyzer.set_sample_rate(SAMPLE_RATE)
+        audio_filter = HighPassFilter()
+        chain = AudioInputChain(audio_filter=audio_filter, vad_analyzer=vad_analyzer)
+        for a in audio:
+            if mode == "loop filter":
+                await loop_filter_then_vad(audio_filter, vad_analyzer, a, executor)
+            else:
+                await chain.process(a, executor)
+
+    start_wall = time.perf_counter()
+    start_loop_cpu = time.thread_time()
+    start_cpu = time.process_time()
+    await asyncio.gather(*[stream() for _ in range(streams)])
+    wall = time.perf_counter() - start_wall
+    loop_cpu = time.thread_time() - start_loop_cpu
+    cpu = time.process_time() - start_cpu
+    executor.shutdown()
+
+    total = streams * frames
+    print(
+        f"{mode:>12} | {loop_cpu / total * 1e6:>15.1f} | {cpu / total * 1e6:>14.1f} | {wall:>8.2f}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Input audio filter and VAD cost")
+    parser.add_argument("--streams", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=250)
+    args = parser.parse_args()
+
+    print(f"{'mode':>12} | {'loop CPU (us)':>15} | {'total CPU (us)':>14} | {'wall (s)':>8}")
+    for mode in ["loop filter", "chain"]:
+        await run(mode, args.streams, args.frames)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
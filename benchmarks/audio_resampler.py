@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the CPU cost of resampling audio streams.
+
+Audio is resampled in small chunks (e.g. 20ms), as transports, serializers and
+services do. We compare the one-shot resampler (`SOXRAudioResampler`, very high
+quality), which sets up a new resampler for every chunk, with the streaming
+resampler (`SOXRStreamAudioResampler`) that keeps the resampler state between
+chunks.
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+RATES = [(24000, 16000), (16000, 8000), (8000, 16000), (24000, 8000), (16000, 48000)]
+
+
+async def cpu_us_per_chunk(
+    resampler: BaseAudioResampler, in_rate: int, out_rate: int, chunk_ms: int, chunks: int
+) -> float:
+    samples = in_rate * chunk_ms // 1000
+    chunk = (np.random.randn(samples) * 3000).astype(np.int16).tobytes()
+
+    start = time.process_time()
+    for _ in range(chunks):
+        await resampler.resample(chunk, in_rate, out_rate)
+    return (time.process_time() - start) / chunks * 1_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Audio resampler CPU usage")
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    parser.add_argument("--chunks", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(
+        f"{'rates':>13} | {'one-shot VHQ (us)':>17} | {'stream HQ (us)':>14} | {'stream VHQ (us)':>15} | {'speedup':>7}"
+    )
+    for in_rate, out_rate in RATES:
+        one_shot = await cpu_us_per_chunk(
+            SOXRAudioResampler(quality="VHQ"), in_rate, out_rate, args.chunk_ms, args.chunks
+        )
+        stream_hq = await cpu_us_per_chunk(
+            SOXRStreamAudioResampler(quality="HQ"), in_rate, out_rate, args.chunk_ms, args.chunks
+        )
+        stream_vhq = await cpu_us_per_chunk(
+            SOXRStreamAudioResampler(quality="VHQ"), in_rate, out_rate, args.chunk_ms, args.chunks
+        )
+        rates = f"{in_rate}->{out_rate}"
+        print(
+            f"{rates:>13} | {one_shot:>17.2f} | {stream_hq:>14.2f} | {stream_vhq:>15.2f} | {one_shot / stream_hq:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures threads and latency of blocking work for many sessions.
+
+Every session runs a small blocking job (similar to a VAD window) every 32ms,
+and one noisy session periodically submits a burst of jobs. We compare:
+
+- `per-session`: one thread pool per session (what input transports used to
+  do). Threads grow with the number of sessions.
+- `fifo`: a single bounded thread pool (like the default `asyncio` executor
+  used by `asyncio.to_thread()`). Work of other sessions waits behind bursts.
+- `fair`: a bounded `ExecutorPool`, where sessions take turns.
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pipecat.utils.executors import ExecutorPool
+
+WINDOW_SECS = 0.032
+
+
+def job(work: np.ndarray):
+    # Releases the GIL, like ONNX or soxr do.
+    for _ in range(20):
+        np.dot(work, work)
+
+
+async def session(executor, work: np.ndarray, duration: float, latencies: list):
+    loop = asyncio.get_running_loop()
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        start = time.perf_counter()
+        await loop.run_in_executor(executor, job, work)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(max(0.0, WINDOW_SECS - (time.perf_counter() - start)))
+
+
+async def noisy_session(executor, work: np.ndarray, duration: float, burst: int):
+    loop = asyncio.get_running_loop()
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        await asyncio.gather(*[loop.run_in_executor(executor, job, work) for _ in range(burst)])
+        await asyncio.sleep(0.5)
+
+
+async def run(mode: str, sessions: int, workers: int, burst: int, duration: float):
+    work = np.random.rand(64, 64).astype(np.float32)
+
+    pool = ExecutorPool("cpu-audio", workers)
+    fifo = ThreadPoolExecutor(max_workers=workers)
+    if mode == "per-session":
+        executors = [ThreadPoolExecutor(max_workers=1) for _ in range(sessions + 1)]
+    elif mode == "fifo":
+        executors = [fifo] * (sessions + 1)
+    else:
+        executors = [pool.executor(i) for i in range(sessions + 1)]
+
+    latencies = []
+    max_threads = 0
+
+    async def count_threads():
+        nonlocal max_threads
+        while True:
+            max_threads = max(max_threads, threading.active_count())
+            await asyncio.sleep(0.1)
+
+    counter = asyncio.create_task(count_threads())
+    cpu_start = time.process_time()
+    await asyncio.gather(
+        noisy_session(executors[0], work, duration, burst),
+        *[session(e, work, duration, latencies) for e in executors[1:]],
+    )
+    cpu = time.process_time() - cpu_start
+    counter.cancel()
+
+    latencies_ms = np.array(latencies) * 1000
+    print(
+        f"{mode:>12} | {max_threads:>7} | {np.percentile(latencies_ms, 50):>8.2f} | "
+        f"{np.percentile(latencies_ms, 99):>8.2f} | {cpu / duration * 100:>6.0f}%"
+    )
+
+    for executor in executors:
+        executor.shutdown()
+    fifo.shutdown()
+    pool.shutdown()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Shared executor pools")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':>12} | {'threads':>7} | {'p50 (ms)':>8} | {'p99 (ms)':>8} | {'CPU':>7}")
+    for mode in ["per-session", "fifo", "fair"]:
+        await run(mode, args.sessions, args.workers, args.burst, args.duration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures time to first bot audio with sentence and first phrase aggregation.
+
+The TTS service aggregates LLM tokens into sentences before synthesizing them,
+so a long first sentence delays the first audio: we wait for the whole
+sentence to be generated and the TTS takes longer to synthesize it (like most
+HTTP TTS services, the mock TTS synthesizes the whole text before returning
+audio). `FirstPhraseTextAggregator` releases the first phrase of each response
+early. We stream a few LLM responses through a mock TTS and report the TTS
+TTFB (as reported by TTFB metrics) and the time from `LLMFullResponseStartFrame`
+to the first audio frame.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import AsyncGenerator, List
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    MetricsFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.metrics.metrics import TTFBMetricsData
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import TTSService
+from pipecat.utils.text.first_phrase_text_aggregator import FirstPhraseTextAggregator
+from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+RESPONSES = [
+    "Well, that's a really good question, and honestly the answer depends on a "
+    "few different things that we should probably go through one at a time. "
+    "Let's start with the first one.",
+    "Sure thing: the fastest way to get there from the station is to take the "
+    "blue line north for about four stops and then walk. It takes around twenty "
+    "minutes.",
+    "I would suggest trying the pasta with mushrooms and a light cream sauce "
+    "since it's quick to make on a weekday evening. Do you want the recipe?",
+]
+
+
+class MockTTSService(TTSService):
+    """Synthesizes the whole text before returning audio."""
+
+    def __init__(self, ttfb: float, secs_per_char: float, **kwargs):
+        super().__init__(**kwargs)
+        self._ttfb = ttfb
+        self._secs_per_char = secs_per_char
+
+    def can_generate_metrics(self) -> bool:
+        return True
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        await self.start_ttfb_metrics()
+        yield TTSStartedFrame()
+        await asyncio.sleep(self._ttfb + len(text) * self._secs_per_char)
+        await self.stop_ttfb_metrics()
+        yield TTSAudioRawFrame(audio=b"\x00" * 3200, sample_rate=16000, num_channels=1)
+        yield TTSStoppedFrame()
+
+
+class LatencyCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.response_start = 0.0
+        self.first_audio: List[float] = []
+        self.ttfbs: List[float] = []
+        self._waiting = False
+        self._waiting_ttfb = False
+
+    def start_response(self):
+        self.response_start = time.perf_counter()
+        self._waiting = self._waiting_ttfb = True
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TTSAudioRawFrame) and self._waiting:
+            self.first_audio.append(time.perf_counter() - self.response_start)
+            self._waiting = False
+        elif isinstance(frame, MetricsFrame) and self._waiting_ttfb:
+            for data in frame.data:
+                if isinstance(data, TTFBMetricsData) and data.value > 0:
+                    self.ttfbs.append(data.value)
+                    self._waiting_ttfb = False
+        await self.push_frame(frame, direction)
+
+
+async def run(aggregator, args: argparse.Namespace):
+    tts = MockTTSService(
+        ttfb=args.tts_ttfb, secs_per_char=args.tts_secs_per_char, text_aggregator=aggregator
+    )
+    collector = LatencyCollector()
+    task = PipelineTask(
+        Pipeline([tts, collector]),
+        params=PipelineParams(enable_metrics=True),
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+
+    async def llm():
+        # Wait for the pipeline to start.
+        await asyncio.sleep(0.1)
+        for _ in range(args.rounds):
+            for response in RESPONSES:
+                collector.start_response()
+                await task.queue_frame(LLMFullResponseStartFrame())
+                # About 4 characters per token.
+                for i in range(0, len(response), 4):
+                    await task.queue_frame(LLMTextFrame(text=response[i : i + 4]))
+                    await asyncio.sleep(args.token_interval)
+                await task.queue_frame(LLMFullResponseEndFrame())
+                await asyncio.sleep(1.0)
+        await task.queue_frame(EndFrame())
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), llm())
+    return collector
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Time to first audio per text aggregator")
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--token-interval", type=float, default=0.02)
+    parser.add_argument("--tts-ttfb", type=float, default=0.15)
+    parser.add_argument("--tts-secs-per-char", type=float, default=0.002)
+    args = parser.parse_args()
+
+    print(f"{'aggregator':>12} | {'TTS TTFB (ms)':>13} | {'first audio (ms)':>16}")
+    for name, aggregator in [
+        ("sentence", SimpleTextAggregator()),
+        ("first phrase", FirstPhraseTextAggregator()),
+    ]:
+        collector = await run(aggregator, args)
+        ttfb = statistics.mean(collector.ttfbs) * 1000
+        first_audio = statistics.mean(collector.first_audio) * 1000
+        print(f"{name:>12} | {ttfb:>13.0f} | {first_audio:>16.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures allocations/s and memory per frame for audio frames.
+
+Audio frames are the most common frames in a pipeline (one every 10-20 ms per
+direction). This benchmark compares the current frame classes with a copy of
+the previous implementation (regular dataclasses with a `name` string and a
+`metadata` dict created for every frame and locked id counters).
+"""
+
+import argparse
+import collections
+import itertools
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from pipecat.frames.frames import InputAudioRawFrame, OutputAudioRawFrame, TTSAudioRawFrame
+
+#
+# Previous frame implementation.
+#
+
+_COUNTS = collections.defaultdict(itertools.count)
+_COUNTS_LOCK = threading.Lock()
+_ID = itertools.count()
+_ID_LOCK = threading.Lock()
+
+
+def legacy_obj_id() -> int:
+    with _ID_LOCK:
+        return next(_ID)
+
+
+def legacy_obj_count(obj) -> int:
+    with _COUNTS_LOCK:
+        return next(_COUNTS[obj.__class__.__name__])
+
+
+@dataclass
+class LegacyFrame:
+    id: int = field(init=False)
+    name: str = field(init=False)
+    pts: Optional[int] = field(init=False)
+    metadata: Dict[str, Any] = field(init=False)
+
+    def __post_init__(self):
+        self.id: int = legacy_obj_id()
+        self.name: str = f"{self.__class__.__name__}#{legacy_obj_count(self)}"
+        self.pts: Optional[int] = None
+        self.metadata: Dict[str, Any] = {}
+
+
+@dataclass
+class LegacySystemFrame(LegacyFrame):
+    pass
+
+
+@dataclass
+class LegacyDataFrame(LegacyFrame):
+    pass
+
+
+@dataclass
+class LegacyAudioRawFrame:
+    audio: bytes
+    sample_rate: int
+    num_channels: int
+    num_frames: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self.num_frames = int(len(self.audio) / (self.num_channels * 2))
+
+
+@dataclass
+class LegacyInputAudioRawFrame(LegacySystemFrame, LegacyAudioRawFrame):
+    def __post_init__(self):
+        super().__post_init__()
+        self.num_frames = int(len(self.audio) / (self.num_channels * 2))
+
+
+@dataclass
+class LegacyOutputAudioRawFrame(LegacyDataFrame, LegacyAudioRawFrame):
+    def __post_init__(self):
+        super().__post_init__()
+        self.num_frames = int(len(self.audio) / (self.num_channels * 2))
+
+
+@dataclass
+class LegacyTTSAudioRawFrame(LegacyOutputAudioRawFrame):
+    pass
+
+
+#
+# Benchmark
+#
+
+
+def allocations_per_second(frame_cls, audio: bytes, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        frame_cls(audio=audio, sample_rate=16000, num_channels=1)
+    return count / (time.perf_counter() - start)
+
+
+def bytes_per_frame(frame_cls, audio: bytes, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # All the frames share the same audio buffer, so we only measure the frame
+    # objects themselves.
+    frames = [frame_cls(audio=audio, sample_rate=16000, num_channels=1) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding the frames.
+    return (after - before - frames.__sizeof__()) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audio frame allocation benchmark")
+    parser.add_argument("--frames", type=int, default=200000)
+    args = parser.parse_args()
+
+    # 20ms of 16kHz mono audio.
+    audio = b"\x00" * 640
+
+    pairs = [
+        (LegacyInputAudioRawFrame, InputAudioRawFrame),
+        (LegacyOutputAudioRawFrame, OutputAudioRawFrame),
+        (LegacyTTSAudioRawFrame, TTSAudioRawFrame),
+    ]
+
+    print(f"{'frame':>24} | {'impl':>8} | {'allocs/s':>12} | {'bytes/frame':>12}")
+    for legacy_cls, frame_cls in pairs:
+        for impl, cls in (("legacy", legacy_cls), ("current", frame_cls)):
+            rate = allocations_per_second(cls, audio, args.frames)
+            size = bytes_per_frame(cls, audio, min(args.frames, 50000))
+            print(f"{frame_cls.__name__:>24} | {impl:>8} | {rate:>12.0f} | {size:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Compares `isinstance()` chains with `FrameDispatcher` in `process_frame()`.
+
+Audio frames usually fall at the end of long `isinstance()` chains (e.g. in
+`BaseOutputTransport.process_frame()`), so every audio frame pays for all the
+checks before it. This benchmark replicates the output transport chain with
+no-op handlers and measures the time spent per frame with both approaches.
+"""
+
+import argparse
+import asyncio
+import time
+
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    MixerControlFrame,
+    OutputAudioRawFrame,
+    OutputImageRawFrame,
+    SpriteFrame,
+    StartFrame,
+    StartInterruptionFrame,
+    StopInterruptionFrame,
+    SystemFrame,
+    TextFrame,
+    TransportMessageUrgentFrame,
+    TTSAudioRawFrame,
+)
+from pipecat.processors.frame_dispatcher import FrameDispatcher
+from pipecat.processors.frame_processor import FrameDirection
+
+
+class Handlers:
+    def __init__(self):
+        self.handled = 0
+
+    async def handle(self, frame: Frame, direction: FrameDirection):
+        self.handled += 1
+
+
+class LegacyOutputTransport(Handlers):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        if isinstance(frame, StartFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, CancelFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, (StartInterruptionFrame, StopInterruptionFrame)):
+            await self.handle(frame, direction)
+        elif isinstance(frame, TransportMessageUrgentFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, SystemFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, EndFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, MixerControlFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, OutputAudioRawFrame):
+            await self.handle(frame, direction)
+        elif isinstance(frame, (OutputImageRawFrame, SpriteFrame)):
+            await self.handle(frame, direction)
+        elif frame.pts:
+            await self.handle(frame, direction)
+        elif direction == FrameDirection.UPSTREAM:
+            await self.handle(frame, direction)
+        else:
+            await self.handle(frame, direction)
+
+
+class DispatchOutputTransport(Handlers):
+    __dispatcher = FrameDispatcher()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await self.__dispatcher.dispatch(self, frame, direction)
+
+    @__dispatcher.handler(
+        StartFrame,
+        CancelFrame,
+        StartInterruptionFrame,
+        StopInterruptionFrame,
+        TransportMessageUrgentFrame,
+        SystemFrame,
+        EndFrame,
+        MixerControlFrame,
+        OutputAudioRawFrame,
+        OutputImageRawFrame,
+        SpriteFrame,
+        Frame,
+    )
+    async def __handle(self, frame: Frame, direction: FrameDirection):
+        await self.handle(frame, direction)
+
+
+async def ns_per_frame(processor: Handlers, frame: Frame, count: int) -> float:
+    direction = FrameDirection.DOWNSTREAM
+    start = time.perf_counter()
+    for _ in range(count):
+        await processor.process_frame(frame, direction)
+    elapsed = time.perf_counter() - start
+    assert processor.handled == count
+    return elapsed / count * 1_000_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="isinstance() chain vs frame dispatcher")
+    parser.add_argument("--frames", type=int, default=500000)
+    args = parser.parse_args()
+
+    audio = b"\x00" * 640
+    frames = [
+        InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1),
+        OutputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1),
+        TTSAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1),
+        TextFrame(text="Hello"),
+    ]
+
+    print(f"{'frame':>20} | {'legacy (ns)':>12} | {'dispatch (ns)':>14}")
+    for frame in frames:
+        legacy = await ns_per_frame(LegacyOutputTransport(), frame, args.frames)
+        dispatch = await ns_per_frame(DispatchOutputTransport(), frame, args.frames)
+        print(f"{frame.__class__.__name__:>20} | {legacy:>12.1f} | {dispatch:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Compares queued and inline frame processors.
+
+A pipeline with a number of pass-through processors is created and text frames
+are pushed through it. We measure the throughput (frames/s) by pushing all the
+frames at once and the per-frame latency and CPU time by pushing one frame at a
+time and waiting for it to reach the end of the pipeline (which is closer to
+what happens with real-time audio).
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Optional
+
+from loguru import logger
+
+from pipecat.frames.frames import EndFrame, Frame, TextFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+
+class TimingSink(FrameProcessor):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.received = 0
+        self.latencies = []
+        self.sent_time: Optional[float] = None
+        self.event = asyncio.Event()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, TextFrame):
+            self.received += 1
+            if self.sent_time:
+                self.latencies.append(time.perf_counter() - self.sent_time)
+            self.event.set()
+
+        await self.push_frame(frame, direction)
+
+
+async def run_pipeline(stages: int, inline: bool, frames: int, paced: bool) -> TimingSink:
+    sink = TimingSink()
+    processors = [IdentityFilter() for _ in range(stages)] + [sink]
+    task = PipelineTask(
+        Pipeline(processors, inline=inline),
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+
+    async def push_frames():
+        # Give the runner time to start the pipeline.
+        await asyncio.sleep(0.1)
+        for i in range(frames):
+            if paced:
+                sink.event.clear()
+                sink.sent_time = time.perf_counter()
+                await task.queue_frame(TextFrame(text=f"{i}"))
+                await sink.event.wait()
+            else:
+                await task.queue_frame(TextFrame(text=f"{i}"))
+        await task.queue_frame(EndFrame())
+
+    runner = PipelineRunner(handle_sigint=False)
+    await asyncio.gather(runner.run(task), push_frames())
+    return sink
+
+
+async def benchmark(stages: int, inline: bool, frames: int):
+    start = time.perf_counter()
+    sink = await run_pipeline(stages, inline, frames, paced=False)
+    elapsed = time.perf_counter() - start - 0.1
+    assert sink.received == frames
+
+    paced_frames = min(frames, 5000)
+    cpu_start = time.process_time()
+    sink = await run_pipeline(stages, inline, paced_frames, paced=True)
+    cpu = (time.process_time() - cpu_start) / paced_frames * 1_000_000
+    latencies = sorted(sink.latencies)
+    p50 = statistics.median(latencies) * 1_000_000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1_000_000
+
+    mode = "inline" if inline else "queued"
+    print(
+        f"{mode:>8} | {stages:>6} | {frames / elapsed:>10.0f} | {cpu:>10.1f} | {p50:>10.1f} | {p99:>10.1f}",
+        flush=True,
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Queued vs inline frame processors")
+    parser.add_argument("--stages", type=int, nargs="+", default=[1, 4, 12])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':>8} | {'stages':>6} | {'frames/s':>10} | {'cpu (us)':>10} | {'p50 (us)':>10} | {'p99 (us)':>10}"
+    )
+    for stages in args.stages:
+        for inline in (False, True):
+            await benchmark(stages, inline, args.frames)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the overhead of processor latency statistics.
+
+A pipeline with a number of pass-through processors is run with statistics
+disabled and enabled (`PipelineParams.enable_processor_stats`) and the
+throughput (frames/s) is compared. The statistics collected are printed at the
+end.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from pipecat.frames.frames import EndFrame, TextFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+
+async def run_pipeline(stages: int, frames: int, stats: bool) -> PipelineTask:
+    task = PipelineTask(
+        Pipeline([IdentityFilter() for _ in range(stages)]),
+        params=PipelineParams(enable_processor_stats=stats),
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+    await task.queue_frames([TextFrame(text=f"{i}") for i in range(frames)] + [EndFrame()])
+    await PipelineRunner(handle_sigint=False).run(task)
+    return task
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Processor statistics overhead")
+    parser.add_argument("--stages", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'stats':>8} | {'frames/s':>10}")
+    for stats in (False, True):
+        start = time.perf_counter()
+        task = await run_pipeline(args.stages, args.frames, stats)
+        elapsed = time.perf_counter() - start
+        print(f"{'enabled' if stats else 'disabled':>8} | {args.frames / elapsed:>10.0f}")
+
+    print()
+    print(
+        f"{'processor':>20} | {'wait p50 (us)':>14} | {'wait p99 (us)':>14} | {'proc p99 (us)':>14}"
+    )
+    for s in task.processor_stats():
+        print(
+            f"{s.processor:>20} | {s.queue_wait.p50 * 1e6:>14.1f} | {s.queue_wait.p99 * 1e6:>14.1f} | {s.processing_time.p99 * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
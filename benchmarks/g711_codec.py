@@ -0,0 +1,147 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the CPU cost of converting G.711 telephony audio.
+
+Every phone call (e.g. Twilio or Telnyx) decodes 8kHz μ-law packets into PCM at
+the pipeline rate and encodes the bot audio (e.g. 24kHz TTS audio) back into
+8kHz μ-law, one 20ms packet at a time. We simulate many concurrent calls, each
+with its own codec state, and compare the previous path (`audioop` and a
+resampler, in separate passes) with the lookup table codec that decodes and
+resamples (or resamples and encodes) in a single pass.
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from pipecat.audio.g711 import G711StreamDecoder, G711StreamEncoder, g711_encode
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+try:
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ModuleNotFoundError:
+    audioop = None
+
+
+class AudioopDecoder:
+    def __init__(self):
+        self._resampler = SOXRStreamAudioResampler()
+
+    async def decode(self, data: bytes, in_rate: int, out_rate: int) -> bytes:
+        return await self._resampler.resample(audioop.ulaw2lin(data, 2), in_rate, out_rate)
+
+
+class AudioopEncoder:
+    def __init__(self):
+        self._resampler = SOXRStreamAudioResampler()
+
+    async def encode(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+        return audioop.lin2ulaw(await self._resampler.resample(audio, in_rate, out_rate), 2)
+
+
+def packet(sample_rate: int, packet_ms: int) -> bytes:
+    samples = sample_rate * packet_ms // 1000
+    return (np.random.randn(samples) * 3000).astype(np.int16).tobytes()
+
+
+async def cpu_us_per_packet(codecs, convert, data: bytes, in_rate, out_rate, packets) -> float:
+    start = time.process_time()
+    for _ in range(packets):
+        for codec in codecs:
+            await convert(codec, data, in_rate, out_rate)
+    return (time.process_time() - start) / (packets * len(codecs)) * 1_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="G.711 codec CPU usage")
+    parser.add_argument("--streams", type=int, default=1000)
+    parser.add_argument("--packet-ms", type=int, default=20)
+    parser.add_argument("--packets", type=int, default=50)
+    args = parser.parse_args()
+
+    ulaw = g711_encode(np.frombuffer(packet(8000, args.packet_ms), dtype=np.int16))
+    pcm_24k = packet(24000, args.packet_ms)
+
+    # The same rate scenarios only measure the codec (there's no resampling).
+    scenarios = [
+        (
+            "decode 8000->8000",
+            ulaw,
+            8000,
+            8000,
+            AudioopDecoder,
+            G711StreamDecoder,
+            lambda codec, data, i, o: codec.decode(data, i, o),
+        ),
+        (
+            "decode 8000->16000",
+            ulaw,
+            8000,
+            16000,
+            AudioopDecoder,
+            G711StreamDecoder,
+            lambda codec, data, i, o: codec.decode(data, i, o),
+        ),
+        (
+            "encode 8000->8000",
+            packet(8000, args.packet_ms),
+            8000,
+            8000,
+            AudioopEncoder,
+            G711StreamEncoder,
+            lambda codec, data, i, o: codec.encode(data, i, o),
+        ),
+        (
+            "encode 24000->8000",
+            pcm_24k,
+            24000,
+            8000,
+            AudioopEncoder,
+            G711StreamEncoder,
+            lambda codec, data, i, o: codec.encode(data, i, o),
+        ),
+    ]
+
+    print(f"{args.streams} streams, {args.packet_ms}ms packets")
+    print(
+        f"{'scenario':>18} | {'audioop (us)':>12} | {'fused (us)':>10} | {'fused core %':>12} | {'speedup':>7}"
+    )
+    for name, data, in_rate, out_rate, audioop_cls, fused_cls, convert in scenarios:
+        fused = await cpu_us_per_packet(
+            [fused_cls() for _ in range(args.streams)],
+            convert,
+            data,
+            in_rate,
+            out_rate,
+            args.packets,
+        )
+        # Percentage of a core needed to convert all the streams in real time.
+        fused_core = fused * args.streams / (args.packet_ms * 1000) * 100
+        if audioop:
+            previous = await cpu_us_per_packet(
+                [audioop_cls() for _ in range(args.streams)],
+                convert,
+                data,
+                in_rate,
+                out_rate,
+                args.packets,
+            )
+            print(
+                f"{name:>18} | {previous:>12.2f} | {fused:>10.2f} | {fused_core:>11.1f}% | {previous / fused:>6.2f}x"
+            )
+        else:
+            print(f"{name:>18} | {'n/a':>12} | {fused:>10.2f} | {fused_core:>11.1f}% | {'n/a':>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
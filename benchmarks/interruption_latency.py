@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures barge-in latency.
+
+A pipeline with a number of processors and an output transport (that writes
+audio in real-time) is created. The bot is made to speak and, once audio is
+being written, the user interrupts it (`UserStartedSpeakingFrame` and
+`StartInterruptionFrame`). We measure the time from the interruption to the
+moment the output transport stops writing bot audio.
+
+Processors are either idle (waiting for frames) or busy (e.g. an LLM or TTS
+service waiting for a response) when the interruption happens. Busy processors
+need to stop what they are doing, which is the common case during a barge-in.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    StartInterruptionFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+    UserStartedSpeakingFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import TransportParams
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+SAMPLE_RATE = 16000
+
+
+class BusyProcessor(FrameProcessor):
+    """Forwards text frames and then waits for a (never ending) response."""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        await self.push_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(3600)
+
+
+class FakeOutputTransport(BaseOutputTransport):
+    """Output transport that writes audio in real-time (like a real device)."""
+
+    def __init__(self):
+        super().__init__(TransportParams(audio_out_enabled=True, audio_out_sample_rate=SAMPLE_RATE))
+        self.last_write_time = 0.0
+
+    async def write_raw_audio_frames(self, frames: bytes):
+        try:
+            await asyncio.sleep(len(frames) / (SAMPLE_RATE * 2))
+        finally:
+            self.last_write_time = time.perf_counter()
+
+
+async def run_interruptions(stages: int, busy: bool, rounds: int):
+    transport = FakeOutputTransport()
+    processor_cls = BusyProcessor if busy else IdentityFilter
+    processors = [processor_cls() for _ in range(stages)] + [transport]
+    task = PipelineTask(
+        Pipeline(processors),
+        params=PipelineParams(allow_interruptions=True, audio_out_sample_rate=SAMPLE_RATE),
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+
+    # 20ms of audio.
+    audio = b"\x00" * int(SAMPLE_RATE * 0.02) * 2
+
+    latencies = []
+
+    async def interrupt():
+        # Give the runner time to start the pipeline.
+        await asyncio.sleep(0.1)
+        for _ in range(rounds):
+            # One second of bot audio.
+            # Audio goes first, otherwise busy processors would block it.
+            await task.queue_frames(
+                [
+                    TTSAudioRawFrame(audio=audio, sample_rate=SAMPLE_RATE, num_channels=1)
+                    for _ in range(50)
+                ]
+                + [TextFrame(text="Hello!")]
+            )
+            await asyncio.sleep(0.2)
+
+            start_time = time.perf_counter()
+            await task.queue_frames([UserStartedSpeakingFrame(), StartInterruptionFrame()])
+            await asyncio.sleep(0.1)
+            latencies.append(transport.last_write_time - start_time)
+        await task.queue_frame(EndFrame())
+
+    runner = PipelineRunner(handle_sigint=False)
+    await asyncio.gather(runner.run(task), interrupt())
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Barge-in latency benchmark")
+    parser.add_argument("--stages", type=int, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'stages':>6} | {'mode':>6} | {'p50 (ms)':>10} | {'p99 (ms)':>10} | {'max (ms)':>10}")
+    for stages in args.stages:
+        for busy in (False, True):
+            mode = "busy" if busy else "idle"
+            latencies = sorted(await run_interruptions(stages, busy, args.rounds))
+            p50 = statistics.median(latencies) * 1000
+            p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+            print(
+                f"{stages:>6} | {mode:>6} | {p50:>10.2f} | {p99:>10.2f} | {latencies[-1] * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
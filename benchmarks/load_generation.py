@@ -0,0 +1,415 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Runs many concurrent voice bot sessions in a single process.
+
+Every session is a regular voice bot pipeline (input transport with VAD, STT,
+context aggregators, LLM, TTS and output transport) with mock services that
+emit timed frames and a fake transport that sends and receives audio in
+real-time. The user in each session speaks, waits for the bot to answer and
+speaks again. No network access or API keys are needed.
+
+We report pipeline frames/s, CPU per session, peak RSS, event loop lag and
+end-to-end turn latency (from the moment the user stops speaking to the first
+bot audio written by the output transport). Turn latency includes the VAD stop
+time, the user aggregation timeout and the mock services latencies, so what
+matters is how it grows with the number of sessions.
+"""
+
+import argparse
+import asyncio
+import random
+import resource
+import statistics
+import sys
+import time
+from typing import AsyncGenerator, List
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.frames.frames import (
+    BotStoppedSpeakingFrame,
+    CancelFrame,
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    StartFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.observers.base_observer import BaseObserver
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.aggregators.llm_response import (
+    LLMAssistantContextAggregator,
+    LLMUserContextAggregator,
+)
+from pipecat.processors.aggregators.openai_llm_context import (
+    OpenAILLMContext,
+    OpenAILLMContextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import LLMService, SegmentedSTTService, TTSService
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import BaseTransport, TransportParams
+from pipecat.utils.time import time_now_iso8601
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+SAMPLE_RATE = 16000
+
+# Transports send and receive 20ms of audio at a time.
+FRAME_SECS = 0.02
+
+
+class Session:
+    """Turn state and results of a single session."""
+
+    def __init__(self):
+        # When the user stopped speaking, 0 if we are not waiting for the bot.
+        self.turn_start = 0.0
+        self.bot_stopped_speaking = asyncio.Event()
+        self.latencies: List[float] = []
+        self.timeouts = 0
+
+
+class FramesObserver(BaseObserver):
+    def __init__(self):
+        self.frames = 0
+
+    async def on_push_frame(
+        self,
+        src: FrameProcessor,
+        dst: FrameProcessor,
+        frame: Frame,
+        direction: FrameDirection,
+        timestamp: int,
+    ):
+        self.frames += 1
+
+
+class MockVADAnalyzer(VADAnalyzer):
+    """Detects voice in any non-silent audio. Volume is still computed."""
+
+    def num_frames_required(self) -> int:
+        # Same as Silero.
+        return 512 if self.sample_rate == 16000 else 256
+
+    def voice_confidence(self, buffer) -> float:
+        return 1.0 if np.frombuffer(buffer, dtype=np.int16).any() else 0.0
+
+
+class MockSTTService(SegmentedSTTService):
+    def __init__(self, latency: float, **kwargs):
+        super().__init__(**kwargs)
+        self._latency = latency
+
+    async def run_stt(self, audio: bytes) -> AsyncGenerator[Frame, None]:
+        await asyncio.sleep(self._latency)
+        yield TranscriptionFrame(
+            text="Tell me something interesting.", user_id="user", timestamp=time_now_iso8601()
+        )
+
+
+class MockLLMService(LLMService):
+    def __init__(self, ttft: float, token_interval: float, words: int, **kwargs):
+        super().__init__(**kwargs)
+        self._ttft = ttft
+        self._token_interval = token_interval
+        # Sentences of 8 words, so the TTS gets a few sentences per response.
+        self._tokens = [
+            f" word{i}." if (i + 1) % 8 == 0 or i == words - 1 else f" word{i}"
+            for i in range(words)
+        ]
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, OpenAILLMContextFrame):
+            await self.push_frame(LLMFullResponseStartFrame())
+            await asyncio.sleep(self._ttft)
+            for token in self._tokens:
+                await self.push_frame(LLMTextFrame(text=token))
+                await asyncio.sleep(self._token_interval)
+            await self.push_frame(LLMFullResponseEndFrame())
+        else:
+            await self.push_frame(frame, direction)
+
+
+class MockTTSService(TTSService):
+    def __init__(self, ttfb: float, secs_per_word: float, **kwargs):
+        super().__init__(**kwargs)
+        self._ttfb = ttfb
+        self._secs_per_word = secs_per_word
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        yield TTSStartedFrame()
+        await asyncio.sleep(self._ttfb)
+        # Audio is generated faster than real-time, in 100ms chunks.
+        chunk = b"\x00" * int(self.sample_rate * 0.1) * 2
+        chunks = round(len(text.split()) * self._secs_per_word / 0.1)
+        for _ in range(chunks):
+            yield TTSAudioRawFrame(audio=chunk, sample_rate=self.sample_rate, num_channels=1)
+        yield TTSStoppedFrame()
+
+
+class FakeInputTransport(BaseInputTransport):
+    """Receives the user audio in real-time. The user speaks for a while,
+    waits for the bot to answer and after a pause speaks again.
+
+    """
+
+    def __init__(
+        self,
+        params: TransportParams,
+        session: Session,
+        *,
+        utterance_secs: float,
+        pause_secs: float,
+        turn_timeout: float,
+        **kwargs,
+    ):
+        super().__init__(params, **kwargs)
+        self._session = session
+        self._utterance_frames = round(utterance_secs / FRAME_SECS)
+        self._pause_frames = round(pause_secs / FRAME_SECS)
+        self._turn_timeout = turn_timeout
+        self._user_task = None
+        self._next_time = 0.0
+
+        samples = int(SAMPLE_RATE * FRAME_SECS)
+        t = np.arange(samples) / SAMPLE_RATE
+        self._speech = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16).tobytes()
+        self._silence = b"\x00" * samples * 2
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        if not self._user_task:
+            self._user_task = self.create_task(self._user_task_handler())
+
+    async def stop(self, frame: EndFrame):
+        await self._cancel_user_task()
+        await super().stop(frame)
+
+    async def cancel(self, frame: CancelFrame):
+        await self._cancel_user_task()
+        await super().cancel(frame)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, BotStoppedSpeakingFrame):
+            self._session.bot_stopped_speaking.set()
+
+    async def _cancel_user_task(self):
+        if self._user_task:
+            await self.cancel_task(self._user_task)
+            self._user_task = None
+
+    async def _push_user_audio(self, audio: bytes):
+        await self.push_audio_frame(
+            InputAudioRawFrame(audio=audio, sample_rate=SAMPLE_RATE, num_channels=1)
+        )
+        # Keep a fixed schedule, if we fall behind audio arrives in bursts (as
+        # it would with a real transport).
+        self._next_time += FRAME_SECS
+        await asyncio.sleep(max(0.0, self._next_time - self.get_event_loop().time()))
+
+    async def _user_task_handler(self):
+        loop = self.get_event_loop()
+        self._next_time = loop.time()
+        while True:
+            for _ in range(self._utterance_frames):
+                await self._push_user_audio(self._speech)
+
+            self._session.bot_stopped_speaking.clear()
+            self._session.turn_start = time.perf_counter()
+
+            deadline = loop.time() + self._turn_timeout
+            while not self._session.bot_stopped_speaking.is_set() and loop.time() < deadline:
+                await self._push_user_audio(self._silence)
+            if not self._session.bot_stopped_speaking.is_set():
+                self._session.turn_start = 0.0
+                self._session.timeouts += 1
+
+            for _ in range(self._pause_frames):
+                await self._push_user_audio(self._silence)
+
+
+class FakeOutputTransport(BaseOutputTransport):
+    """Writes the bot audio in real-time (like a real device)."""
+
+    def __init__(self, params: TransportParams, session: Session, **kwargs):
+        super().__init__(params, **kwargs)
+        self._session = session
+        self._next_time = 0.0
+
+    async def write_raw_audio_frames(self, frames: bytes):
+        if self._session.turn_start:
+            self._session.latencies.append(time.perf_counter() - self._session.turn_start)
+            self._session.turn_start = 0.0
+        # The device plays audio at a fixed rate, so being a bit late doesn't
+        # make the next write wait longer. A long delay means there was no
+        # audio to play.
+        now = self.get_event_loop().time()
+        if self._next_time < now - 0.2:
+            self._next_time = now
+        self._next_time += len(frames) / (SAMPLE_RATE * 2)
+        await asyncio.sleep(max(0.0, self._next_time - now))
+
+
+class FakeTransport(BaseTransport):
+    def __init__(self, session: Session, args: argparse.Namespace):
+        super().__init__()
+        params = TransportParams(
+            audio_in_enabled=True,
+            audio_out_enabled=True,
+            vad_enabled=True,
+            vad_audio_passthrough=True,
+            vad_analyzer=MockVADAnalyzer(params=VADParams()),
+        )
+        self._input = FakeInputTransport(
+            params,
+            session,
+            utterance_secs=args.utterance_secs,
+            pause_secs=args.pause_secs,
+            turn_timeout=args.turn_timeout,
+        )
+        self._output = FakeOutputTransport(params, session)
+
+    def input(self) -> FrameProcessor:
+        return self._input
+
+    def output(self) -> FrameProcessor:
+        return self._output
+
+
+def create_task(session: Session, observer: BaseObserver, args: argparse.Namespace):
+    transport = FakeTransport(session, args)
+
+    context = OpenAILLMContext(
+        messages=[{"role": "system", "content": "You are a helpful voice assistant."}]
+    )
+
+    pipeline = Pipeline(
+        [
+            transport.input(),
+            MockSTTService(latency=args.stt_latency),
+            LLMUserContextAggregator(context),
+            MockLLMService(
+                ttft=args.llm_ttft,
+                token_interval=args.llm_token_interval,
+                words=args.response_words,
+            ),
+            MockTTSService(ttfb=args.tts_ttfb, secs_per_word=args.tts_secs_per_word),
+            transport.output(),
+            LLMAssistantContextAggregator(context),
+        ]
+    )
+
+    return PipelineTask(
+        pipeline,
+        params=PipelineParams(
+            allow_interruptions=True,
+            audio_in_sample_rate=SAMPLE_RATE,
+            audio_out_sample_rate=SAMPLE_RATE,
+        ),
+        observers=[observer],
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+
+
+async def run_session(task: PipelineTask, ramp_up: float):
+    # Don't start all the sessions at the same time.
+    await asyncio.sleep(random.uniform(0, ramp_up))
+    await PipelineRunner(handle_sigint=False).run(task)
+
+
+async def measure_loop_lag(lags: List[float], interval: float = 0.01):
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * p) - 1, 0)] if values else 0.0
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Concurrent voice bot sessions load generator")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--ramp-up", type=float, default=1.0)
+    parser.add_argument("--utterance-secs", type=float, default=1.5)
+    parser.add_argument("--pause-secs", type=float, default=1.0)
+    parser.add_argument("--turn-timeout", type=float, default=15.0)
+    parser.add_argument("--stt-latency", type=float, default=0.1)
+    parser.add_argument("--llm-ttft", type=float, default=0.3)
+    parser.add_argument("--llm-token-interval", type=float, default=0.02)
+    parser.add_argument("--response-words", type=int, default=12)
+    parser.add_argument("--tts-ttfb", type=float, default=0.15)
+    parser.add_argument("--tts-secs-per-word", type=float, default=0.3)
+    args = parser.parse_args()
+
+    observer = FramesObserver()
+    sessions = [Session() for _ in range(args.sessions)]
+    tasks = [create_task(session, observer, args) for session in sessions]
+
+    lags = []
+    lag_task = asyncio.create_task(measure_loop_lag(lags))
+
+    start_time = time.perf_counter()
+    start_cpu = time.process_time()
+
+    runs = asyncio.gather(*[run_session(task, args.ramp_up) for task in tasks])
+    await asyncio.sleep(args.duration)
+    await asyncio.gather(*[task.cancel() for task in tasks])
+    await runs
+
+    elapsed = time.perf_counter() - start_time
+    cpu = time.process_time() - start_cpu
+
+    lag_task.cancel()
+    try:
+        await lag_task
+    except asyncio.CancelledError:
+        pass
+
+    latencies = [latency for session in sessions for latency in session.latencies]
+    timeouts = sum(session.timeouts for session in sessions)
+    # ru_maxrss is in kilobytes on Linux.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"{'metric':>26} | {'value':>10}")
+    print(f"{'sessions':>26} | {args.sessions:>10}")
+    print(f"{'frames/s':>26} | {observer.frames / elapsed:>10.1f}")
+    print(f"{'CPU per session (%)':>26} | {cpu / elapsed / args.sessions * 100:>10.2f}")
+    print(f"{'peak RSS (MB)':>26} | {peak_rss:>10.1f}")
+    print(f"{'loop lag p50 (ms)':>26} | {statistics.median(lags) * 1000:>10.2f}")
+    print(f"{'loop lag p99 (ms)':>26} | {percentile(lags, 0.99) * 1000:>10.2f}")
+    print(f"{'loop lag max (ms)':>26} | {max(lags) * 1000:>10.2f}")
+    print(f"{'turns':>26} | {len(latencies):>10}")
+    print(f"{'turn timeouts':>26} | {timeouts:>10}")
+    if latencies:
+        print(f"{'turn latency p50 (ms)':>26} | {statistics.median(latencies) * 1000:>10.2f}")
+        print(f"{'turn latency p99 (ms)':>26} | {percentile(latencies, 0.99) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the cost of removing Markdown from the text sent to TTS services.
+
+`MarkdownTextFilter` runs for every sentence of every LLM response. It used to
+create a `markdown.Markdown()` instance per sentence, render the sentence to
+HTML and then strip the HTML with a dozen regular expressions. It now filters
+the text line by line in a single pass. We filter the sentences of a typical
+LLM response (lists, bold text, links, headings and plain sentences) with both
+and report the time per sentence.
+
+The previous filter needs the Markdown package (`pip install markdown`).
+"""
+
+import argparse
+import re
+import time
+
+from pipecat.utils.text.markdown_text_filter import MarkdownTextFilter
+
+try:
+    from markdown import Markdown
+except ModuleNotFoundError as e:
+    print(f"Exception: {e}")
+    print("In order to run this benchmark, you need to `pip install markdown`.")
+    raise SystemExit(1)
+
+RESPONSE = [
+    "Sure!",
+    " Here are a few options for your trip to **Lisbon**:",
+    "\n\n1. **Alfama**: the oldest district, with narrow streets and *fado* houses.",
+    "\n2. **Belém**: home of the famous `pastéis de nata` and the tower.",
+    "\n3. **LX Factory**: a creative hub with shops & restaurants.",
+    "\n\n## Getting around",
+    "\nThe easiest way is the metro, see [the official map](https://www.metrolisboa.pt) for details.",
+    " Trams are great too, but they can be crowded in the summer.",
+    "\n\n- Buy a *Viva Viagem* card.",
+    "\n- Top it up with at least 10 euros.",
+    "\n\nLet me know if you want restaurant recommendations, or anything else!",
+]
+
+
+class MarkdownRenderingFilter:
+    """The previous filter: renders the text to HTML and strips it."""
+
+    def filter(self, text: str) -> str:
+        text = re.sub(r"^\s*\n", " ", text, flags=re.MULTILINE)
+        text = re.sub(r"(?<!`)`([^`\n]+)`(?!`)", r"\1", text)
+        text = re.sub(r"(\S)(\1{4,})", "", text)
+        text = re.sub(r"^(\d+\.)\s", r"§NUM§\1 ", text)
+        text = re.sub(r"^( +)|\s+$", lambda m: "§" * len(m.group(0)), text, flags=re.MULTILINE)
+        text = re.sub(r"§\| ", "| ", text)
+        text = Markdown(extensions=[]).convert(text)
+        text = re.sub("<[^<]+?>", "", text)
+        text = text.replace("&nbsp;", " ")
+        text = text.replace("&lt;", "<")
+        text = text.replace("&gt;", ">")
+        text = text.replace("&amp;", "&")
+        text = re.sub(r"\*\*", "", text)
+        text = re.sub(r"(^|\s)\*|\*($|\s)", r"\1\2", text)
+        text = re.sub(r"\|", "", text)
+        text = re.sub(r"^\s*[-:]+\s*$", "", text, flags=re.MULTILINE)
+        text = text.replace("§NUM§", "")
+        return re.sub("§", " ", text)
+
+
+def run(text_filter, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for sentence in RESPONSE:
+            # TTS services remove leading newlines before filtering.
+            text_filter.filter(sentence.lstrip("\n"))
+    return (time.perf_counter() - start) / (iterations * len(RESPONSE)) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Markdown text filter")
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    rendering = run(MarkdownRenderingFilter(), args.iterations)
+    single_pass = run(MarkdownTextFilter(), args.iterations)
+
+    print(f"{'filter':>20} | {'per sentence (µs)':>17}")
+    print(f"{'Markdown rendering':>20} | {rendering:>17.1f}")
+    print(f"{'single pass':>20} | {single_pass:>17.1f}")
+    print(f"speedup: {rendering / single_pass:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
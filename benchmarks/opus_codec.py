@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the bandwidth and CPU cost of sending websocket audio as Opus.
+
+`ProtobufFrameSerializer` sends raw 16-bit PCM by default. With
+`audio_codec="opus"` the audio is encoded by the serializer (and decoded on
+the other end). We serialize 20ms output audio frames of a synthetic voice-like
+signal and measure the bytes per second on the wire and the CPU time per frame
+spent serializing (encoding) and deserializing (decoding).
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from pipecat.frames.frames import OutputAudioRawFrame
+from pipecat.serializers.protobuf import ProtobufFrameSerializer
+
+
+def voice(sample_rate: int, secs: float) -> bytes:
+    # A few harmonics with a syllable-like envelope and some noise.
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    f0 = 140 + 20 * np.sin(2 * np.pi * 0.5 * t)
+    signal = sum(np.sin(2 * np.pi * f0 * h * t) / h for h in range(1, 8))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
+    signal = signal * envelope + 0.05 * np.random.randn(len(t))
+    return (signal / np.max(np.abs(signal)) * 12000).astype(np.int16).tobytes()
+
+
+async def run(params: ProtobufFrameSerializer.InputParams, sample_rate: int, secs: float):
+    serializer = ProtobufFrameSerializer(params)
+    audio = voice(sample_rate, secs)
+    chunk_size = sample_rate // 50 * 2
+
+    frames = 0
+    wire_bytes = 0
+    serialize_time = 0.0
+    deserialize_time = 0.0
+    for i in range(0, len(audio), chunk_size):
+        frame = OutputAudioRawFrame(
+            audio=audio[i : i + chunk_size], sample_rate=sample_rate, num_channels=1
+        )
+        start = time.perf_counter()
+        data = await serializer.serialize(frame)
+        serialize_time += time.perf_counter() - start
+        frames += 1
+        if not data:
+            continue
+        wire_bytes += len(data)
+        start = time.perf_counter()
+        await serializer.deserialize(data)
+        deserialize_time += time.perf_counter() - start
+
+    kbps = wire_bytes * 8 / secs / 1000
+    return kbps, serialize_time / frames * 1e6, deserialize_time / frames * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Opus vs PCM websocket audio")
+    parser.add_argument("--secs", type=float, default=30.0)
+    parser.add_argument("--bitrate", type=int, default=32000)
+    args = parser.parse_args()
+
+    print(
+        f"{'rate':>5} | {'codec':>16} | {'kbps':>6} | {'serialize (us)':>14} | {'deserialize (us)':>16}"
+    )
+    for sample_rate in [16000, 24000]:
+        configs = [("pcm", ProtobufFrameSerializer.InputParams())]
+        for complexity in [5, 10]:
+            params = ProtobufFrameSerializer.InputParams(
+                audio_codec="opus", opus_bitrate=args.bitrate, opus_complexity=complexity
+            )
+            configs.append((f"opus (cmplx {complexity})", params))
+        for name, params in configs:
+            kbps, ser, deser = await run(params, sample_rate, args.secs)
+            print(f"{sample_rate:>5} | {name:>16} | {kbps:>6.1f} | {ser:>14.1f} | {deser:>16.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures `ParallelPipeline` throughput and memory under audio load.
+
+Audio frames are pushed through a parallel pipeline with a number of
+pass-through branches. We measure the throughput (frames/s) and the number of
+frame ids the parallel pipeline keeps to avoid pushing the same frame twice.
+Previously, one id was kept for every frame (forever).
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from pipecat.frames.frames import EndFrame, OutputAudioRawFrame
+from pipecat.pipeline.parallel_pipeline import ParallelPipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+
+async def benchmark(branches: int, frames: int):
+    pipeline = ParallelPipeline(*[[IdentityFilter()] for _ in range(branches)])
+    task = PipelineTask(pipeline, check_dangling_tasks=False, idle_timeout_secs=None)
+
+    # 20ms of 16kHz mono audio.
+    audio = b"\x00" * 640
+
+    async def push_frames():
+        # Give the runner time to start the pipeline.
+        await asyncio.sleep(0.1)
+        for _ in range(frames):
+            await task.queue_frame(
+                OutputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)
+            )
+        await task.queue_frame(EndFrame())
+
+    runner = PipelineRunner(handle_sigint=False)
+    start = time.perf_counter()
+    await asyncio.gather(runner.run(task), push_frames())
+    elapsed = time.perf_counter() - start - 0.1
+
+    tracker = getattr(pipeline, "_fan_out_tracker", None)
+    tracked = len(tracker) if tracker is not None else len(pipeline._seen_ids)
+    print(f"{branches:>8} | {frames / elapsed:>10.0f} | {tracked:>12}", flush=True)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="ParallelPipeline audio load benchmark")
+    parser.add_argument("--branches", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'branches':>8} | {'frames/s':>10} | {'tracked ids':>12}")
+    for branches in args.branches:
+        await benchmark(branches, args.frames)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures Silero VAD cost for many concurrent audio streams.
+
+Every input transport runs its own `SileroVADAnalyzer` (one ONNX session and
+one inference per 32ms window) in its own single thread executor. We compare
+that with `BatchedSileroVADAnalyzer`, where all the streams share a
+`SileroVADBatcher` that runs the windows of all the streams as a single
+batched inference. For every 32ms window of all the streams we measure the
+CPU used and the time until all the streams have their VAD state.
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.vad.silero import BatchedSileroVADAnalyzer, SileroVADAnalyzer, SileroVADBatcher
+
+logger.remove(0)
+
+SAMPLE_RATE = 16000
+WINDOW_BYTES = 1024
+
+
+def audio_windows(streams: int, windows: int):
+    rng = np.random.default_rng(0)
+    audio = (rng.normal(0, 3000, (streams, windows * WINDOW_BYTES // 2))).astype(np.int16)
+    return [
+        [audio[s, w * 512 : (w + 1) * 512].tobytes() for s in range(streams)]
+        for w in range(windows)
+    ]
+
+
+async def run(analyzers, executors, windows):
+    for analyzer in analyzers:
+        analyzer.set_sample_rate(SAMPLE_RATE)
+
+    # Warm up.
+    await asyncio.gather(
+        *[
+            a.analyze_audio_async(windows[0][i], e)
+            for i, (a, e) in enumerate(zip(analyzers, executors))
+        ]
+    )
+
+    latencies = []
+    cpu_start = time.process_time()
+    for chunks in windows[1:]:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[a.analyze_audio_async(c, e) for a, c, e in zip(analyzers, chunks, executors)]
+        )
+        latencies.append(time.perf_counter() - start)
+    cpu = time.process_time() - cpu_start
+
+    cpu_per_window_us = cpu / (len(windows) - 1) / len(analyzers) * 1_000_000
+    return cpu_per_window_us, np.percentile(latencies, 50) * 1000, np.max(latencies) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Silero VAD batching")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--windows", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'streams':>7} | {'single CPU/window (us)':>22} | {'single p50/max (ms)':>19} | "
+        f"{'batched CPU/window (us)':>23} | {'batched p50/max (ms)':>20}"
+    )
+    for streams in args.streams:
+        windows = audio_windows(streams, args.windows)
+
+        analyzers = [SileroVADAnalyzer(sample_rate=SAMPLE_RATE) for _ in range(streams)]
+        executors = [ThreadPoolExecutor(max_workers=1) for _ in range(streams)]
+        single_cpu, single_p50, single_max = await run(analyzers, executors, windows)
+        for executor in executors:
+            executor.shutdown()
+
+        batcher = SileroVADBatcher()
+        analyzers = [
+            BatchedSileroVADAnalyzer(batcher=batcher, sample_rate=SAMPLE_RATE)
+            for _ in range(streams)
+        ]
+        batched_cpu, batched_p50, batched_max = await run(analyzers, [None] * streams, windows)
+        batcher.close()
+
+        print(
+            f"{streams:>7} | {single_cpu:>22.1f} | {f'{single_p50:.1f} / {single_max:.1f}':>19} | "
+            f"{batched_cpu:>23.1f} | {f'{batched_p50:.1f} / {batched_max:.1f}':>20}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the cost of creating Silero VAD analyzers (e.g. one per call).
+
+Previously every `SileroVADAnalyzer` loaded the model into its own ONNX
+session. Now all the analyzers in a process share a single session and only
+keep their own stream state. We measure the time to create an analyzer and
+the memory used by N analyzers, for one session per analyzer (the previous
+behavior) and for the shared session.
+
+Run each mode in a separate process, so memory measurements are independent:
+
+    python silero_vad_startup.py --mode session-per-analyzer
+    python silero_vad_startup.py --mode shared
+"""
+
+import argparse
+import resource
+import time
+
+import numpy as np
+
+from pipecat.audio.vad import silero
+from pipecat.audio.vad.silero import SileroVADAnalyzer, warm_up_silero_vad
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Silero VAD analyzer startup cost")
+    parser.add_argument("--mode", choices=["session-per-analyzer", "shared"], default="shared")
+    parser.add_argument("--analyzers", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.mode == "session-per-analyzer":
+        # Don't cache sessions, so every analyzer creates its own.
+        silero.get_silero_session = lambda path=None, force_onnx_cpu=True: silero._create_session(
+            str(path or silero._model_file_path()), force_onnx_cpu
+        )
+
+    audio = (np.random.randn(512) * 3000).astype(np.int16).tobytes()
+
+    rss_start = rss_mb()
+
+    start = time.perf_counter()
+    warm_up_silero_vad()
+    warm_up_ms = (time.perf_counter() - start) * 1000
+
+    analyzers = []
+    create_ms = []
+    first_ms = []
+    for _ in range(args.analyzers):
+        start = time.perf_counter()
+        analyzer = SileroVADAnalyzer(sample_rate=16000)
+        analyzer.set_sample_rate(16000)
+        create_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        analyzer.voice_confidence(audio)
+        first_ms.append((time.perf_counter() - start) * 1000)
+
+        analyzers.append(analyzer)
+
+    rss_end = rss_mb()
+
+    print(f"mode: {args.mode}, analyzers: {args.analyzers}")
+    print(f"  warm-up:                   {warm_up_ms:8.2f} ms")
+    print(f"  create analyzer (mean):    {np.mean(create_ms):8.2f} ms")
+    print(f"  create analyzer (p99):     {np.percentile(create_ms, 99):8.2f} ms")
+    print(f"  first inference (mean):    {np.mean(first_ms):8.2f} ms")
+    print(f"  RSS growth:                {rss_end - rss_start:8.1f} MB")
+    print(f"  RSS per analyzer:          {(rss_end - rss_start) / args.analyzers:8.3f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures `SyncParallelPipeline` throughput with frames in flight.
+
+A synchronized parallel pipeline with two branches (e.g. an image generation
+branch and a TTS branch) is created. Each branch has a couple of stages that
+take some time to process every text frame. We measure the time it takes to
+get the output for a number of text frames when the internal pipelines process
+one frame at a time and when multiple frames are in flight.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from pipecat.frames.frames import EndFrame, Frame, TextFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.sync_parallel_pipeline import SyncParallelPipeline
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+
+class DelayProcessor(FrameProcessor):
+    def __init__(self, delay: float):
+        super().__init__()
+        self._delay = delay
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(self._delay)
+        await self.push_frame(frame, direction)
+
+
+class CountingSink(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.received = 0
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            self.received += 1
+        await self.push_frame(frame, direction)
+
+
+async def benchmark(frames: int, max_frames_in_flight: int, delay: float):
+    sink = CountingSink()
+    pipeline = Pipeline(
+        [
+            SyncParallelPipeline(
+                [DelayProcessor(delay), DelayProcessor(delay)],
+                [DelayProcessor(delay / 2), DelayProcessor(delay / 2)],
+                max_frames_in_flight=max_frames_in_flight,
+            ),
+            sink,
+        ]
+    )
+    task = PipelineTask(pipeline, check_dangling_tasks=False, idle_timeout_secs=None)
+    await task.queue_frames([TextFrame(text=f"{i}") for i in range(frames)] + [EndFrame()])
+
+    start = time.perf_counter()
+    await PipelineRunner(handle_sigint=False).run(task)
+    elapsed = time.perf_counter() - start
+    assert sink.received == frames
+
+    print(f"{max_frames_in_flight:>9} | {elapsed:>8.2f} | {frames / elapsed:>10.1f}", flush=True)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="SyncParallelPipeline frames in flight")
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--in-flight", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"{'in flight':>9} | {'time (s)':>8} | {'frames/s':>10}")
+    for max_frames_in_flight in args.in_flight:
+        await benchmark(args.frames, max_frames_in_flight, args.delay)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures the cost of observers in the audio path.
+
+Audio frames are passed to `TaskObserver.on_push_frame()` (which is what
+processors call on every frame hop) with a few observers registered. We compare
+observers that receive all frames with observers that declare the frame types
+they are interested in (like the built-in loggers and `RTVIObserver`).
+"""
+
+import argparse
+import asyncio
+import time
+
+from pipecat.frames.frames import (
+    Frame,
+    LLMTextFrame,
+    OutputAudioRawFrame,
+    TranscriptionFrame,
+)
+from pipecat.observers.base_observer import BaseObserver
+from pipecat.pipeline.task_observer import TaskObserver
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.utils.asyncio import TaskManager
+
+
+class AllFramesObserver(BaseObserver):
+    async def on_push_frame(
+        self,
+        src: FrameProcessor,
+        dst: FrameProcessor,
+        frame: Frame,
+        direction: FrameDirection,
+        timestamp: int,
+    ):
+        pass
+
+
+class TextObserver(AllFramesObserver):
+    frame_types = (LLMTextFrame, TranscriptionFrame)
+
+
+async def ns_per_frame(observer_cls, observers: int, frames: int) -> float:
+    task_manager = TaskManager()
+    task_manager.set_event_loop(asyncio.get_running_loop())
+    task_observer = TaskObserver(
+        observers=[observer_cls() for _ in range(observers)], task_manager=task_manager
+    )
+    await task_observer.start()
+
+    src = IdentityFilter()
+    dst = IdentityFilter()
+    frame = OutputAudioRawFrame(audio=b"\x00" * 640, sample_rate=16000, num_channels=1)
+    direction = FrameDirection.DOWNSTREAM
+
+    start = time.perf_counter()
+    for i in range(frames):
+        await task_observer.on_push_frame(src, dst, frame, direction, i)
+        # Let the observer tasks run so their queues don't grow forever.
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    await task_observer.stop()
+    return elapsed / frames * 1_000_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Observer overhead on audio frames")
+    parser.add_argument("--observers", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--frames", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{'observers':>10} | {'all frames (ns)':>16} | {'filtered (ns)':>14}")
+    for observers in args.observers:
+        unfiltered = await ns_per_frame(AllFramesObserver, observers, args.frames)
+        filtered = await ns_per_frame(TextObserver, observers, args.frames)
+        print(f"{observers:>10} | {unfiltered:>16.1f} | {filtered:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures end of sentence detection cost when aggregating streamed LLM text.
+
+Text aggregators are called for every LLM token. They used to look for the
+end of a sentence in the whole buffered text on every call, so long responses
+without punctuation (e.g. lists, code, long clauses) were quadratic. They now
+use `EndOfSentenceScanner`, which only looks at the new text. We stream a few
+kilobytes of text in LLM-sized tokens and measure the total time per
+response.
+"""
+
+import argparse
+import random
+import time
+
+from pipecat.utils.string import match_endofsentence
+from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
+
+WORDS = (
+    "the pipeline sends audio frames to the speech service which returns text "
+    "with numbers like 3.14 and emails like support@pipecat.ai to the user"
+).split()
+
+
+class RescanTextAggregator(SimpleTextAggregator):
+    """The previous behavior: scans the whole buffered text every time."""
+
+    def aggregate(self, text: str):
+        self._text += text
+        eos_end_marker = match_endofsentence(self._text)
+        if eos_end_marker:
+            result = self._text[:eos_end_marker]
+            self._text = self._text[eos_end_marker:]
+            return result
+        return None
+
+
+def tokens(size: int, sentence_words: int) -> list:
+    # One token per word (with its leading space), like most LLM tokenizers.
+    stream = []
+    length = 0
+    while length < size:
+        word = random.choice(WORDS)
+        if sentence_words and len(stream) % sentence_words == sentence_words - 1:
+            word += "."
+        stream.append(f" {word}")
+        length += len(word) + 1
+    return stream
+
+
+def run(aggregator, stream: list) -> float:
+    start = time.perf_counter()
+    for token in stream:
+        aggregator.aggregate(token)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming end of sentence detection")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+
+    print(f"{'text':>19} | {'rescan (ms)':>11} | {'scanner (ms)':>12} | {'speedup':>7}")
+    for size in [2000, 4000, 8000]:
+        for sentence_words, name in [(20, "sentences"), (0, "no punctuation")]:
+            stream = tokens(size, sentence_words)
+            rescan = sum(run(RescanTextAggregator(), stream) for _ in range(args.runs))
+            scanner = sum(run(SimpleTextAggregator(), stream) for _ in range(args.runs))
+            print(
+                f"{f'{size // 1000}KB {name}':>19} | {rescan / args.runs:>11.2f} | "
+                f"{scanner / args.runs:>12.2f} | {rescan / scanner:>6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures time to first audio and TTS usage with a TTS audio cache.
+
+Bots repeat the same greetings, fillers and prompts many times. We send a mix
+of repeated phrases (Zipf distributed) and unique sentences to a mock HTTP TTS
+service and report the time from `TTSSpeakFrame` to the first audio, the
+cache hit rate and the characters sent to the TTS provider (i.e. vendor
+spend): without a cache, with the in-memory cache, and with a disk cache
+populated by a previous run (e.g. after a restart).
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import AsyncGenerator, List
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import TTSService
+from pipecat.services.tts_cache import TTSAudioCache
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+SAMPLE_RATE = 24000
+
+PHRASES = [
+    "Hi! Thanks for calling, how can I help you today?",
+    "One moment please.",
+    "Sure.",
+    "Let me check that for you.",
+    "Is there anything else I can help you with?",
+    "Could you repeat that, please?",
+    "Got it.",
+    "Please say or enter your account number.",
+    "Thanks for calling, goodbye!",
+    "I'm sorry, I didn't catch that.",
+]
+
+
+class MockHTTPTTSService(TTSService):
+    def __init__(self, ttfb: float, **kwargs):
+        super().__init__(sample_rate=SAMPLE_RATE, **kwargs)
+        self._ttfb = ttfb
+        self.characters = 0
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        self.characters += len(text)
+        yield TTSStartedFrame()
+        await asyncio.sleep(self._ttfb)
+        # About 60ms of audio per character, in 100ms chunks.
+        chunk = b"\x01\x00" * (SAMPLE_RATE // 10)
+        for _ in range(max(1, len(text) * 60 // 100)):
+            yield TTSAudioRawFrame(audio=chunk, sample_rate=SAMPLE_RATE, num_channels=1)
+        yield TTSStoppedFrame()
+
+
+class FirstAudioSink(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.start_time = 0.0
+        self.latencies: List[float] = []
+        self.spoken = asyncio.Event()
+        self._waiting = False
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self._waiting = True
+        self.spoken.clear()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TTSAudioRawFrame) and self._waiting:
+            self.latencies.append(time.perf_counter() - self.start_time)
+            self._waiting = False
+        elif isinstance(frame, TTSTextFrame):
+            self.spoken.set()
+        await self.push_frame(frame, direction)
+
+
+def utterances(count: int, repeated: float) -> List[str]:
+    weights = [1 / (i + 1) for i in range(len(PHRASES))]
+    result = []
+    for i in range(count):
+        if random.random() < repeated:
+            result.append(random.choices(PHRASES, weights)[0])
+        else:
+            result.append(f"Your order number {i} will arrive in {i % 7 + 2} days.")
+    return result
+
+
+async def run(texts: List[str], cache, args: argparse.Namespace):
+    tts = MockHTTPTTSService(ttfb=args.ttfb, audio_cache=cache)
+    sink = FirstAudioSink()
+    task = PipelineTask(
+        Pipeline([tts, sink]),
+        params=PipelineParams(audio_out_sample_rate=SAMPLE_RATE),
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+
+    async def speak():
+        await asyncio.sleep(0.1)
+        for text in texts:
+            sink.start()
+            await task.queue_frame(TTSSpeakFrame(text=text))
+            await sink.spoken.wait()
+        await task.queue_frame(EndFrame())
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), speak())
+    return sink.latencies, tts.characters
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="TTS audio cache")
+    parser.add_argument("--utterances", type=int, default=200)
+    parser.add_argument("--repeated", type=float, default=0.7)
+    parser.add_argument("--ttfb", type=float, default=0.2)
+    args = parser.parse_args()
+
+    random.seed(0)
+    texts = utterances(args.utterances, args.repeated)
+
+    print(
+        f"{'cache':>12} | {'first audio p50 (ms)':>20} | {'mean (ms)':>9} | "
+        f"{'hit rate':>8} | {'TTS characters':>14}"
+    )
+    with tempfile.TemporaryDirectory() as disk_dir:
+        # The disk cache is populated by a previous run.
+        await run(texts, TTSAudioCache(disk_dir=disk_dir), args)
+
+        for name, cache in [
+            ("none", None),
+            ("memory", TTSAudioCache()),
+            ("disk (warm)", TTSAudioCache(disk_dir=disk_dir)),
+        ]:
+            latencies, characters = await run(texts, cache, args)
+            hit_rate = 0.0
+            if cache:
+                stats = cache.stats()
+                hit_rate = (stats.memory_hits + stats.disk_hits) / len(texts)
+            print(
+                f"{name:>12} | {statistics.median(latencies) * 1000:>20.1f} | "
+                f"{statistics.mean(latencies) * 1000:>9.1f} | {hit_rate:>8.0%} | {characters:>14}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Measures silence between sentences with and without TTS synthesis lookahead.
+
+HTTP TTS services synthesize one sentence per request. Without lookahead the
+request for a sentence only starts when the audio of the previous one has been
+received, so if audio is streamed at about real-time speed (e.g. Piper or XTTS)
+there's a request round trip of silence between sentences. With
+`synthesis_lookahead` the next sentences are requested while the audio of the
+current one is streamed. We play the TTS output audio in real-time (simulated)
+and report the silence between sentences and the total response time.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import AsyncGenerator
+
+from loguru import logger
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.ai_services import TTSService
+
+logger.remove(0)
+logger.add(sys.stderr, level="WARNING")
+
+SAMPLE_RATE = 16000
+
+SENTENCE = "This is a sentence of about ten words for the benchmark."
+
+
+class MockHTTPTTSService(TTSService):
+    """Returns audio after a round trip, streamed at `realtime_factor` times
+    real-time speed in 100ms chunks.
+
+    """
+
+    def __init__(self, round_trip: float, realtime_factor: float, secs_per_word: float, **kwargs):
+        super().__init__(sample_rate=SAMPLE_RATE, **kwargs)
+        self._round_trip = round_trip
+        self._realtime_factor = realtime_factor
+        self._secs_per_word = secs_per_word
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        yield TTSStartedFrame()
+        await asyncio.sleep(self._round_trip)
+        chunk = b"\x00" * int(SAMPLE_RATE * 0.1) * 2
+        for _ in range(round(len(text.split()) * self._secs_per_word / 0.1)):
+            yield TTSAudioRawFrame(audio=chunk, sample_rate=SAMPLE_RATE, num_channels=1)
+            await asyncio.sleep(0.1 / self._realtime_factor)
+        yield TTSStoppedFrame()
+
+
+class PlaybackSink(FrameProcessor):
+    """Plays audio in real-time (simulated) and measures silence after the
+    first audio. Playback starts `jitter_buffer` seconds after the first audio
+    is received, as transports usually do.
+
+    """
+
+    def __init__(self, jitter_buffer: float = 0.05):
+        super().__init__()
+        self.jitter_buffer = jitter_buffer
+        self.start_time = 0.0
+        self.first_audio_time = 0.0
+        self.playback_end = 0.0
+        self.silence = 0.0
+        self.done = asyncio.Event()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        now = time.perf_counter()
+        if isinstance(frame, LLMFullResponseStartFrame):
+            self.start_time = now
+        elif isinstance(frame, TTSAudioRawFrame):
+            if not self.first_audio_time:
+                self.first_audio_time = now
+                self.playback_end = now + self.jitter_buffer
+            elif now > self.playback_end:
+                self.silence += now - self.playback_end
+                self.playback_end = now
+            self.playback_end += len(frame.audio) / 2 / SAMPLE_RATE
+        elif isinstance(frame, LLMFullResponseEndFrame):
+            self.done.set()
+        await self.push_frame(frame, direction)
+
+
+async def run(lookahead: int, args: argparse.Namespace):
+    tts = MockHTTPTTSService(
+        round_trip=args.round_trip,
+        realtime_factor=args.realtime_factor,
+        secs_per_word=args.secs_per_word,
+        synthesis_lookahead=lookahead,
+    )
+    sink = PlaybackSink()
+    task = PipelineTask(
+        Pipeline([tts, sink]),
+        params=PipelineParams(audio_out_sample_rate=SAMPLE_RATE),
+        check_dangling_tasks=False,
+        idle_timeout_secs=None,
+    )
+
+    async def llm():
+        await asyncio.sleep(0.1)
+        await task.queue_frame(LLMFullResponseStartFrame())
+        # The LLM is much faster than the TTS.
+        for _ in range(args.sentences):
+            await task.queue_frame(TextFrame(text=f" {SENTENCE}"))
+        await task.queue_frame(LLMFullResponseEndFrame())
+        await sink.done.wait()
+        await task.queue_frame(EndFrame())
+
+    await asyncio.gather(PipelineRunner(handle_sigint=False).run(task), llm())
+    total = max(sink.playback_end, time.perf_counter()) - sink.start_time
+    return sink.silence, total
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="TTS synthesis lookahead")
+    parser.add_argument("--sentences", type=int, default=5)
+    parser.add_argument("--round-trip", type=float, default=0.25)
+    parser.add_argument("--realtime-factor", type=float, default=1.0)
+    parser.add_argument("--secs-per-word", type=float, default=0.3)
+    args = parser.parse_args()
+
+    print(f"{'lookahead':>9} | {'silence between sentences (ms)':>30} | {'total (s)':>9}")
+    for lookahead in [0, 1, 2]:
+        silence, total = await run(lookahead, args)
+        print(f"{lookahead:>9} | {silence * 1000:>30.0f} | {total:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
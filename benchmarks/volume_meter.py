@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Compares the VAD volume measurements.
+
+`VADAnalyzer` measures the volume of every VAD window (e.g. 32ms at 16kHz) to
+ignore quiet audio. `calculate_audio_volume()` uses pyloudnorm, which designs
+the K-weighting filter and filters the window from scratch every time, while
+`VolumeMeter` keeps the filter (and its state) between windows and works in
+float32. We measure the CPU used per window (with Silero inference as a
+reference) and how far the volumes, and the resulting volume gate decisions,
+are from pyloudnorm.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.utils import calculate_audio_volume, exp_smoothing
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VAD_MIN_VOLUME
+from pipecat.audio.volume_meter import VolumeMeter
+
+logger.remove(0)
+
+SMOOTHING_FACTOR = 0.2
+
+
+def speech_like(sample_rate: int, secs: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    # Syllables (~4 per second) with random loudness, pauses every few seconds
+    # and background noise.
+    loudness = rng.uniform(500, 10000, int(secs * 4) + 1)[(t * 4).astype(int)]
+    syllables = np.sin(np.pi * 4 * t) ** 2 * loudness
+    pauses = np.where(np.floor(t / 2) % 3 == 2, 0, 1)
+    voice = np.sin(2 * np.pi * 180 * t) + 0.5 * np.sin(2 * np.pi * 900 * t)
+    audio = syllables * pauses * voice + rng.normal(0, 50, len(t))
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def windows(audio: np.ndarray, size: int):
+    return [audio[i : i + size].tobytes() for i in range(0, len(audio) - size + 1, size)]
+
+
+def cpu_us_per_window(func, chunks) -> float:
+    start = time.process_time()
+    for chunk in chunks:
+        func(chunk)
+    return (time.process_time() - start) / len(chunks) * 1_000_000
+
+
+def gate(volumes):
+    smoothed = []
+    prev = 0
+    for volume in volumes:
+        prev = exp_smoothing(volume, prev, SMOOTHING_FACTOR)
+        smoothed.append(prev >= VAD_MIN_VOLUME)
+    return np.array(smoothed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VAD volume meter CPU usage and accuracy")
+    parser.add_argument("--secs", type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(
+        f"{'rate':>6} | {'silero (us)':>11} | {'pyloudnorm (us)':>15} | {'meter (us)':>10} | "
+        f"{'speedup':>7} | {'max diff':>8} | {'mean diff':>9} | {'gate mismatches':>15}"
+    )
+    for sample_rate in [8000, 16000]:
+        vad = SileroVADAnalyzer(sample_rate=sample_rate)
+        vad.set_sample_rate(sample_rate)
+        chunks = windows(speech_like(sample_rate, args.secs), vad.num_frames_required())
+
+        silero = cpu_us_per_window(vad.voice_confidence, chunks)
+        exact = cpu_us_per_window(lambda c: calculate_audio_volume(c, sample_rate), chunks)
+        meter = VolumeMeter(sample_rate)
+        fast = cpu_us_per_window(meter.volume, chunks)
+
+        meter = VolumeMeter(sample_rate)
+        exact_volumes = np.array([calculate_audio_volume(c, sample_rate) for c in chunks])
+        fast_volumes = np.array([meter.volume(c) for c in chunks])
+        diff = np.abs(exact_volumes - fast_volumes)
+        mismatches = int(np.sum(gate(exact_volumes) != gate(fast_volumes)))
+
+        print(
+            f"{sample_rate:>6} | {silero:>11.1f} | {exact:>15.1f} | {fast:>10.1f} | "
+            f"{exact / fast:>6.1f}x | {diff.max():>8.4f} | {diff.mean():>9.5f} | "
+            f"{f'{mismatches} / {len(chunks)}':>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
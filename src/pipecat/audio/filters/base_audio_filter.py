@@ -4,8 +4,12 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import asyncio
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from pipecat.audio.samples import audio_bytes, int16_samples
 from pipecat.frames.frames import FilterControlFrame
 
 
@@ -45,3 +49,28 @@ class BaseAudioFilter(ABC):
     @abstractmethod
     async def filter(self, audio: bytes) -> bytes:
         pass
+
+    def filter_samples(self, samples: np.ndarray) -> np.ndarray:
+        """Synchronous version of `filter()` that works on int16 samples. It
+        should return the same samples if they are not modified (e.g. the
+        filter is disabled).
+
+        Filters that implement it (see `implements_filter_samples()`) run
+        together with VAD in the session's `CPU_AUDIO_POOL` executor (see
+        `AudioInputChain`) instead of in the event loop. Calls of the same
+        session never overlap and run in order, but they might run in
+        different threads, so filters can keep state but not per-thread state.
+
+        By default, it runs `filter()` in a new event loop, so it can't be
+        called from a thread with a running event loop.
+
+        """
+        return int16_samples(asyncio.run(self.filter(audio_bytes(samples))))
+
+    @classmethod
+    def implements_filter_samples(cls) -> bool:
+        """Whether the filter implements `filter_samples()` (instead of using
+        the default, which just runs `filter()`).
+
+        """
+        return cls.filter_samples is not BaseAudioFilter.filter_samples
@@ -10,6 +10,7 @@ import numpy as np
 from loguru import logger
 
 from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
+from pipecat.audio.ring_buffer import AudioRingBuffer
 from pipecat.frames.frames import FilterControlFrame, FilterEnableFrame
 
 try:
@@ -33,7 +34,7 @@ class KoalaFilter(BaseAudioFilter):
         self._sample_rate = 0
         self._koala = pvkoala.create(access_key=f"{self._access_key}")
         self._koala_ready = True
-        self._audio_buffer = bytearray()
+        self._audio_buffer = AudioRingBuffer()
 
     async def start(self, sample_rate: int):
         self._sample_rate = sample_rate
@@ -51,25 +52,22 @@ class KoalaFilter(BaseAudioFilter):
             self._filtering = frame.enable
 
     async def filter(self, audio: bytes) -> bytes:
+        samples = np.frombuffer(audio, dtype=np.int16)
+        filtered = self.filter_samples(samples)
+        return audio if filtered is samples else filtered.tobytes()
+
+    def filter_samples(self, samples: np.ndarray) -> np.ndarray:
         if not self._koala_ready or not self._filtering:
-            return audio
+            return samples
 
-        self._audio_buffer.extend(audio)
+        self._audio_buffer.write(memoryview(samples).cast("B"))
 
         filtered_data: Sequence[int] = []
 
-        num_frames = len(self._audio_buffer) // 2
-        while num_frames >= self._koala.frame_length:
-            # Grab the number of frames required by Koala.
-            num_bytes = self._koala.frame_length * 2
-            audio = bytes(self._audio_buffer[:num_bytes])
-            # Process audio
-            data = np.frombuffer(audio, dtype=np.int16).tolist()
+        # Process the number of frames required by Koala, the rest is kept for
+        # later.
+        for chunk in self._audio_buffer.chunks(self._koala.frame_length * 2):
+            data = np.frombuffer(chunk, dtype=np.int16).tolist()
             filtered_data += self._koala.process(data)
-            # Adjust audio buffer and check again
-            self._audio_buffer = self._audio_buffer[num_bytes:]
-            num_frames = len(self._audio_buffer) // 2
-
-        filtered = np.array(filtered_data, dtype=np.int16).tobytes()
 
-        return filtered
+        return np.array(filtered_data, dtype=np.int16)
@@ -36,17 +36,18 @@ class NoisereduceFilter(BaseAudioFilter):
             self._filtering = frame.enable
 
     async def filter(self, audio: bytes) -> bytes:
-        if not self._filtering:
-            return audio
+        samples = np.frombuffer(audio, dtype=np.int16)
+        filtered = self.filter_samples(samples)
+        return audio if filtered is samples else filtered.tobytes()
 
-        data = np.frombuffer(audio, dtype=np.int16)
+    def filter_samples(self, samples: np.ndarray) -> np.ndarray:
+        if not self._filtering:
+            return samples
 
         # Add a small epsilon to avoid division by zero.
         epsilon = 1e-10
-        data = data.astype(np.float32) + epsilon
+        data = samples.astype(np.float32) + epsilon
 
         # Noise reduction
         reduced_noise = nr.reduce_noise(y=data, sr=self._sample_rate)
-        audio = np.clip(reduced_noise, -32768, 32767).astype(np.int16).tobytes()
-
-        return audio
+        return np.clip(reduced_noise, -32768, 32767).astype(np.int16)
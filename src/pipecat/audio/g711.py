@@ -0,0 +1,162 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""G.711 (μ-law and A-law) audio codec.
+
+Encoding and decoding are done with lookup tables, so converting a packet is a
+single NumPy `take()` (indices are always in range, so we use `mode="clip"`
+which skips bounds checking). The tables are bit-exact with the (deprecated)
+`audioop` module.
+
+`G711StreamDecoder` and `G711StreamEncoder` also resample the audio in the same
+pass, using preallocated buffers and a streaming resampler. They are meant to
+be used once per audio stream (e.g. the input and output audio of a phone
+call).
+"""
+
+import numpy as np
+
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+_ULAW_SEGMENT_ENDS = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+_ALAW_SEGMENT_ENDS = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF])
+
+
+def _ulaw_decode_table() -> np.ndarray:
+    value = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = (((value & 0x0F) << 3) + 0x84) << ((value & 0x70) >> 4)
+    return np.where(value & 0x80, 0x84 - t, t - 0x84).astype(np.int16)
+
+
+def _alaw_decode_table() -> np.ndarray:
+    value = np.arange(256, dtype=np.int32) ^ 0x55
+    segment = (value & 0x70) >> 4
+    t = (value & 0x0F) << 4
+    t = np.where(segment == 0, t + 8, (t + 0x108) << np.maximum(segment - 1, 0))
+    return np.where(value & 0x80, t, -t).astype(np.int16)
+
+
+def _pcm_values() -> np.ndarray:
+    # All the int16 values, in the order of their uint16 representation, so
+    # encoding tables can be indexed with `samples.view(np.uint16)`.
+    return np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32)
+
+
+def _ulaw_encode_table() -> np.ndarray:
+    value = _pcm_values() >> 2
+    mask = np.where(value < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(value), 8159) + 33
+    segment = np.searchsorted(_ULAW_SEGMENT_ENDS, magnitude)
+    encoded = np.where(
+        segment >= 8,
+        0x7F,
+        (segment << 4) | ((magnitude >> np.minimum(segment + 1, 8)) & 0x0F),
+    )
+    return (encoded ^ mask).astype(np.uint8)
+
+
+def _alaw_encode_table() -> np.ndarray:
+    value = _pcm_values() >> 3
+    mask = np.where(value < 0, 0x55, 0xD5)
+    magnitude = np.where(value < 0, -value - 1, value)
+    segment = np.searchsorted(_ALAW_SEGMENT_ENDS, magnitude)
+    quantized = np.where(segment < 2, magnitude >> 1, magnitude >> np.clip(segment, 2, 8))
+    encoded = np.where(segment >= 8, 0x7F, (segment << 4) | (quantized & 0x0F))
+    return (encoded ^ mask).astype(np.uint8)
+
+
+_DECODE_TABLES = {"ulaw": _ulaw_decode_table(), "alaw": _alaw_decode_table()}
+_ENCODE_TABLES = {"ulaw": _ulaw_encode_table(), "alaw": _alaw_encode_table()}
+
+
+def _decode_table(law: str) -> np.ndarray:
+    if law not in _DECODE_TABLES:
+        raise ValueError(f"Unsupported G.711 law: {law} (should be 'ulaw' or 'alaw')")
+    return _DECODE_TABLES[law]
+
+
+def _encode_table(law: str) -> np.ndarray:
+    if law not in _ENCODE_TABLES:
+        raise ValueError(f"Unsupported G.711 law: {law} (should be 'ulaw' or 'alaw')")
+    return _ENCODE_TABLES[law]
+
+
+def g711_decode(data: bytes, law: str = "ulaw") -> np.ndarray:
+    """Decodes μ-law (`law="ulaw"`) or A-law (`law="alaw"`) audio into int16
+    samples.
+
+    """
+    return _decode_table(law).take(np.frombuffer(data, dtype=np.uint8), mode="clip")
+
+
+def g711_encode(samples: np.ndarray, law: str = "ulaw") -> bytes:
+    """Encodes int16 samples into μ-law (`law="ulaw"`) or A-law (`law="alaw"`)
+    audio.
+
+    """
+    return _encode_table(law).take(samples.view(np.uint16), mode="clip").tobytes()
+
+
+class G711StreamDecoder:
+    """Decodes a G.711 audio stream and resamples it to the desired sample rate.
+
+    Packets are decoded into a preallocated buffer that is resampled directly,
+    without going through intermediate byte strings. Use a different instance
+    for each audio stream.
+
+    """
+
+    def __init__(self, law: str = "ulaw", *, quality: str = "HQ"):
+        self._table = _decode_table(law)
+        self._resampler = SOXRStreamAudioResampler(quality=quality)
+        self._buffer = np.empty(0, dtype=np.int16)
+
+    async def decode(self, data: bytes, in_rate: int, out_rate: int) -> bytes:
+        encoded = np.frombuffer(data, dtype=np.uint8)
+        if len(encoded) > len(self._buffer):
+            self._buffer = np.empty(len(encoded), dtype=np.int16)
+        pcm = self._buffer[: len(encoded)]
+        self._table.take(encoded, out=pcm, mode="clip")
+        return self._resampler.resample_samples(pcm, in_rate, out_rate).tobytes()
+
+    def reset(self):
+        self._resampler.reset()
+
+
+class G711StreamEncoder:
+    """Resamples an audio stream to the desired sample rate and encodes it
+    with G.711.
+
+    Resampled audio is encoded into a preallocated buffer. Use a different
+    instance for each audio stream.
+
+    """
+
+    def __init__(self, law: str = "ulaw", *, quality: str = "HQ"):
+        self._table = _encode_table(law)
+        self._resampler = SOXRStreamAudioResampler(quality=quality)
+        self._buffer = np.empty(0, dtype=np.uint8)
+
+    async def encode(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+        samples = np.frombuffer(audio, dtype=np.int16)
+        return self._encode(self._resampler.resample_samples(samples, in_rate, out_rate))
+
+    async def flush(self) -> bytes:
+        """Encodes the audio still kept by the resampler (e.g. at the end of
+        the stream).
+
+        """
+        return self._encode(np.frombuffer(await self._resampler.flush(), dtype=np.int16))
+
+    def reset(self):
+        self._resampler.reset()
+
+    def _encode(self, samples: np.ndarray) -> bytes:
+        if len(samples) > len(self._buffer):
+            self._buffer = np.empty(len(samples), dtype=np.uint8)
+        encoded = self._buffer[: len(samples)]
+        self._table.take(samples.view(np.uint16), out=encoded, mode="clip")
+        return encoded.tobytes()
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
+from pipecat.audio.samples import AudioData, int16_samples
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADState
+
+
+class AudioInputChain:
+    """Processes input transport audio: first the audio filter and then VAD.
+
+    If the audio filter implements `filter_samples()` and the VAD analyzer
+    doesn't compute voice confidence asynchronously (i.e. it doesn't override
+    `analyze_audio_async()`), both run in a single executor job per audio
+    frame. The filter works directly on the frame samples and VAD analyzes the
+    filtered samples, so audio is only converted back to bytes once (and only
+    if the filter modified it). Otherwise, each stage runs as it would on its
+    own.
+
+    Filters and VAD analyzers can keep state (e.g. a noise profile): the
+    session executor runs one job at a time and in order, even though jobs
+    might run in different threads of the shared pool.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        audio_filter: Optional[BaseAudioFilter] = None,
+        vad_analyzer: Optional[VADAnalyzer] = None,
+    ):
+        self._audio_filter = audio_filter
+        self._vad_analyzer = vad_analyzer
+
+        self._sync_filter = audio_filter is not None and audio_filter.implements_filter_samples()
+        self._sync_vad = vad_analyzer is not None and (
+            type(vad_analyzer).analyze_audio_async is VADAnalyzer.analyze_audio_async
+        )
+        self._fused = (not audio_filter or self._sync_filter) and (
+            not vad_analyzer or self._sync_vad
+        )
+
+    @property
+    def audio_filter(self) -> Optional[BaseAudioFilter]:
+        return self._audio_filter
+
+    @property
+    def vad_analyzer(self) -> Optional[VADAnalyzer]:
+        return self._vad_analyzer
+
+    @property
+    def fused(self) -> bool:
+        """Whether filter and VAD run in a single executor job."""
+        return self._fused
+
+    async def process(
+        self, audio: bytes, executor: Optional[Executor] = None
+    ) -> Tuple[bytes, Optional[VADState]]:
+        """Processes the audio of an input audio frame. Returns the (filtered)
+        audio and the VAD state (or None if there's no VAD analyzer).
+
+        """
+        if not self._audio_filter and not self._vad_analyzer:
+            return audio, None
+
+        loop = asyncio.get_running_loop()
+
+        if self._fused:
+            return await loop.run_in_executor(executor, self._process, audio)
+
+        samples: AudioData = audio
+        if self._sync_filter:
+            audio, samples = await loop.run_in_executor(executor, self._filter, audio)
+        elif self._audio_filter:
+            audio = samples = await self._audio_filter.filter(audio)
+
+        vad_state = None
+        if self._vad_analyzer:
+            vad_state = await self._vad_analyzer.analyze_audio_async(samples, executor)
+
+        return audio, vad_state
+
+    def _filter(self, audio: bytes) -> Tuple[bytes, np.ndarray]:
+        samples = int16_samples(audio)
+        filtered = self._audio_filter.filter_samples(samples)
+        # Filters return the same samples if they are disabled.
+        if filtered is samples:
+            return audio, samples
+        return filtered.tobytes(), filtered
+
+    def _process(self, audio: bytes) -> Tuple[bytes, Optional[VADState]]:
+        samples: AudioData = audio
+        if self._audio_filter:
+            audio, samples = self._filter(audio)
+        vad_state = None
+        if self._vad_analyzer:
+            # VAD analyzes the samples directly, no bytes needed.
+            vad_state = self._vad_analyzer.analyze_audio(samples)
+        return audio, vad_state
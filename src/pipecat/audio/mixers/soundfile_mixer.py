@@ -11,7 +11,9 @@ import numpy as np
 from loguru import logger
 
 from pipecat.audio.mixers.base_audio_mixer import BaseAudioMixer
+from pipecat.audio.samples import int16_samples
 from pipecat.frames.frames import MixerControlFrame, MixerEnableFrame, MixerUpdateSettingsFrame
+from pipecat.utils.executors import IO_POOL, get_default_executor_service
 
 try:
     import soundfile as sf
@@ -57,8 +59,10 @@ class SoundfileMixer(BaseAudioMixer):
 
     async def start(self, sample_rate: int):
         self._sample_rate = sample_rate
+        loop = asyncio.get_running_loop()
+        executor = get_default_executor_service().executor(IO_POOL, self)
         for sound_name, file_name in self._sound_files.items():
-            await asyncio.to_thread(self._load_sound_file, sound_name, file_name)
+            await loop.run_in_executor(executor, self._load_sound_file, sound_name, file_name)
 
     async def stop(self):
         pass
@@ -123,7 +127,7 @@ class SoundfileMixer(BaseAudioMixer):
         if not self._mixing or not self._current_sound in self._sounds:
             return audio
 
-        audio_np = np.frombuffer(audio, dtype=np.int16)
+        audio_np = int16_samples(audio)
         chunk_size = len(audio_np)
 
         # Sound currently playing.
@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Opus audio codec (through PyAV, which bundles libopus).
+
+`OpusStreamEncoder` and `OpusStreamDecoder` keep the codec state of a single
+audio stream (e.g. the output audio of a websocket session), so use one
+instance per stream. Opus only supports some sample rates, other rates are
+resampled in the same pass.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from pipecat.audio.ring_buffer import AudioRingBuffer
+from pipecat.audio.samples import AudioData, audio_buffer, int16_samples
+
+try:
+    import av
+    import soxr
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error("In order to use Opus, you need to `pip install pipecat-ai[opus]`.")
+    raise Exception(f"Missing module: {e}")
+
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+OPUS_FRAME_DURATIONS_MS = (10, 20, 40, 60)
+
+
+def _layout(num_channels: int) -> str:
+    if num_channels == 1:
+        return "mono"
+    elif num_channels == 2:
+        return "stereo"
+    raise ValueError(f"Opus only supports mono or stereo audio (got {num_channels} channels)")
+
+
+class OpusStreamEncoder:
+    """Encodes an audio stream into Opus packets.
+
+    Audio is buffered until there's enough for an Opus frame (`frame_ms`), so
+    each call returns zero or more packets. Audio at sample rates not supported
+    by Opus is resampled to 48000.
+
+    """
+
+    def __init__(self, *, bitrate: int = 32000, complexity: int = 10, frame_ms: int = 20):
+        if frame_ms not in OPUS_FRAME_DURATIONS_MS:
+            raise ValueError(
+                f"Unsupported Opus frame duration: {frame_ms}ms (should be one of {OPUS_FRAME_DURATIONS_MS})"
+            )
+        self._bitrate = bitrate
+        self._complexity = complexity
+        self._frame_ms = frame_ms
+
+        self._codec = None
+        self._codec_key: Optional[Tuple[int, int]] = None
+        self._codec_rate = 0
+        self._resampler: Optional[soxr.ResampleStream] = None
+        self._frame_bytes = 0
+        self._pts = 0
+        self._buffer = AudioRingBuffer()
+
+    async def encode(
+        self, audio: AudioData, sample_rate: int, num_channels: int = 1
+    ) -> List[bytes]:
+        self._setup(sample_rate, num_channels)
+
+        samples = int16_samples(audio)
+        if self._resampler:
+            samples = self._resampler.resample_chunk(samples.reshape(-1, num_channels))
+        self._buffer.write(audio_buffer(samples.reshape(-1)))
+
+        packets = []
+        layout = _layout(num_channels)
+        for chunk in self._buffer.chunks(self._frame_bytes):
+            frame = av.AudioFrame.from_ndarray(
+                np.frombuffer(chunk, dtype=np.int16).reshape(1, -1), format="s16", layout=layout
+            )
+            frame.sample_rate = self._codec_rate
+            frame.pts = self._pts
+            self._pts += frame.samples
+            packets.extend(bytes(packet) for packet in self._codec.encode(frame))
+        return packets
+
+    def reset(self):
+        """Discards the buffered audio (e.g. on interruptions)."""
+        self._buffer.clear()
+        if self._resampler:
+            self._resampler.clear()
+
+    def _setup(self, sample_rate: int, num_channels: int):
+        if self._codec_key == (sample_rate, num_channels):
+            return
+
+        codec_rate = sample_rate if sample_rate in OPUS_SAMPLE_RATES else 48000
+        codec = av.CodecContext.create("libopus", "w")
+        codec.sample_rate = codec_rate
+        codec.layout = _layout(num_channels)
+        codec.format = "s16"
+        codec.bit_rate = self._bitrate
+        codec.options = {
+            "application": "voip",
+            "compression_level": str(self._complexity),
+            "frame_duration": str(self._frame_ms),
+        }
+        codec.open()
+
+        self._codec = codec
+        self._codec_key = (sample_rate, num_channels)
+        self._codec_rate = codec_rate
+        self._resampler = None
+        if codec_rate != sample_rate:
+            self._resampler = soxr.ResampleStream(
+                sample_rate, codec_rate, num_channels, dtype="int16", quality="HQ"
+            )
+        self._frame_bytes = codec_rate * self._frame_ms // 1000 * num_channels * 2
+        self._pts = 0
+        self._buffer.clear()
+
+
+class OpusStreamDecoder:
+    """Decodes a stream of Opus packets into 16-bit PCM audio at the desired
+    sample rate.
+
+    """
+
+    def __init__(self):
+        self._codec = None
+        self._codec_channels = 0
+        self._resamplers: Dict[Tuple[int, int, int], soxr.ResampleStream] = {}
+
+    async def decode(self, packet: bytes, sample_rate: int, num_channels: int = 1) -> bytes:
+        if self._codec_channels != num_channels:
+            codec = av.CodecContext.create("libopus", "r")
+            codec.layout = _layout(num_channels)
+            codec.format = "s16"
+            self._codec = codec
+            self._codec_channels = num_channels
+
+        decoded = []
+        for frame in self._codec.decode(av.Packet(packet)):
+            samples = frame.to_ndarray()
+            # Planar audio has a row per channel, packed audio is interleaved.
+            samples = samples.T.reshape(-1) if frame.format.is_planar else samples.reshape(-1)
+            samples = int16_samples(samples)
+            decoded.append(self._resample(samples, frame.sample_rate, sample_rate, num_channels))
+
+        return b"".join(samples.tobytes() for samples in decoded)
+
+    def reset(self):
+        for resampler in self._resamplers.values():
+            resampler.clear()
+
+    def _resample(
+        self, samples: np.ndarray, in_rate: int, out_rate: int, num_channels: int
+    ) -> np.ndarray:
+        # libopus decodes at 48000 (as WebRTC does).
+        if in_rate == out_rate:
+            return samples
+        key = (in_rate, out_rate, num_channels)
+        resampler = self._resamplers.get(key)
+        if not resampler:
+            resampler = soxr.ResampleStream(
+                in_rate, out_rate, num_channels, dtype="int16", quality="HQ"
+            )
+            self._resamplers[key] = resampler
+        return resampler.resample_chunk(samples.reshape(-1, num_channels)).reshape(-1)
@@ -6,6 +6,8 @@
 
 from abc import ABC, abstractmethod
 
+from pipecat.audio.samples import AudioData
+
 
 class BaseAudioResampler(ABC):
     """Abstract base class for audio resampling. This class defines an
@@ -13,14 +15,15 @@ class BaseAudioResampler(ABC):
     """
 
     @abstractmethod
-    async def resample(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+    async def resample(self, audio: AudioData, in_rate: int, out_rate: int) -> bytes:
         """
         Resamples the given audio data to a different sample rate.
 
         This is an abstract method that must be implemented in subclasses.
 
         Parameters:
-            audio (bytes): The audio data to be resampled, represented as a byte string.
+            audio (AudioData): The audio data to be resampled, as a byte string
+                or NumPy samples (see `pipecat.audio.samples`).
             in_rate (int): The original sample rate of the audio data (in Hz).
             out_rate (int): The desired sample rate for the resampled audio data (in Hz).
 
@@ -28,3 +31,21 @@ class BaseAudioResampler(ABC):
             bytes: The resampled audio data as a byte string.
         """
         pass
+
+    async def flush(self) -> bytes:
+        """
+        Returns the audio still kept by the resampler (e.g. at the end of an
+        audio stream) and starts from scratch. Stateless resamplers don't keep
+        any audio.
+
+        Returns:
+            bytes: The remaining resampled audio data as a byte string.
+        """
+        return b""
+
+    def reset(self):
+        """
+        Discards the audio and state kept by the resampler (e.g. when the audio
+        stream is interrupted).
+        """
+        pass
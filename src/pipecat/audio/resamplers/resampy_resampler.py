@@ -8,6 +8,7 @@ import numpy as np
 import resampy
 
 from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
+from pipecat.audio.samples import AudioData, audio_bytes, int16_samples
 
 
 class ResampyResampler(BaseAudioResampler):
@@ -16,10 +17,10 @@ class ResampyResampler(BaseAudioResampler):
     def __init__(self, **kwargs):
         pass
 
-    async def resample(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+    async def resample(self, audio: AudioData, in_rate: int, out_rate: int) -> bytes:
         if in_rate == out_rate:
-            return audio
-        audio_data = np.frombuffer(audio, dtype=np.int16)
+            return audio_bytes(audio)
+        audio_data = int16_samples(audio)
         resampled_audio = resampy.resample(audio_data, in_rate, out_rate, filter="kaiser_fast")
         result = resampled_audio.astype(np.int16).tobytes()
         return result
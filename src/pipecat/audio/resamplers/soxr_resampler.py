@@ -8,18 +8,22 @@ import numpy as np
 import soxr
 
 from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
+from pipecat.audio.samples import AudioData, audio_bytes, int16_samples
 
 
 class SOXRAudioResampler(BaseAudioResampler):
-    """Audio resampler implementation using the SoX resampler library."""
+    """Audio resampler implementation using the SoX resampler library. Every
+    chunk of audio is resampled independently, use `SOXRStreamAudioResampler`
+    for audio streams.
+    """
 
-    def __init__(self, **kwargs):
-        pass
+    def __init__(self, *, quality: str = "VHQ", **kwargs):
+        self._quality = quality
 
-    async def resample(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
+    async def resample(self, audio: AudioData, in_rate: int, out_rate: int) -> bytes:
         if in_rate == out_rate:
-            return audio
-        audio_data = np.frombuffer(audio, dtype=np.int16)
-        resampled_audio = soxr.resample(audio_data, in_rate, out_rate, quality="VHQ")
+            return audio_bytes(audio)
+        audio_data = int16_samples(audio)
+        resampled_audio = soxr.resample(audio_data, in_rate, out_rate, quality=self._quality)
         result = resampled_audio.astype(np.int16).tobytes()
         return result
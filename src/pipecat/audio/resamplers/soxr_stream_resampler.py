@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import Dict, Tuple
+
+import numpy as np
+import soxr
+
+from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
+from pipecat.audio.samples import AudioData, audio_bytes, int16_samples
+
+
+class SOXRStreamAudioResampler(BaseAudioResampler):
+    """Streaming audio resampler implementation using the SoX resampler library.
+
+    A `soxr.ResampleStream` is kept for every (input rate, output rate) pair,
+    so the filter state is kept between chunks (which avoids artifacts at chunk
+    edges) and the resampler is only set up once. An instance should only be
+    used for a single audio stream (e.g. the bot output audio), use different
+    instances for different streams.
+
+    SoX processes audio in blocks, so the resampled audio might be delayed and
+    come in bursts (the lower the quality the smaller the delay). Use `flush()`
+    at the end of a stream to get the remaining audio and `reset()` if the
+    stream is interrupted.
+    """
+
+    def __init__(self, *, quality: str = "HQ", **kwargs):
+        self._quality = quality
+        self._streams: Dict[Tuple[int, int], soxr.ResampleStream] = {}
+
+    async def resample(self, audio: AudioData, in_rate: int, out_rate: int) -> bytes:
+        if in_rate == out_rate:
+            return audio_bytes(audio)
+        return self.resample_samples(int16_samples(audio), in_rate, out_rate).tobytes()
+
+    def resample_samples(self, samples: np.ndarray, in_rate: int, out_rate: int) -> np.ndarray:
+        """Resamples an int16 NumPy array. This avoids converting to and from
+        bytes when the caller already works with samples (e.g. audio codecs).
+
+        """
+        if in_rate == out_rate:
+            return samples
+        stream = self._streams.get((in_rate, out_rate))
+        if not stream:
+            stream = soxr.ResampleStream(in_rate, out_rate, 1, dtype="int16", quality=self._quality)
+            self._streams[(in_rate, out_rate)] = stream
+        return stream.resample_chunk(samples)
+
+    async def flush(self) -> bytes:
+        result = b""
+        for stream in self._streams.values():
+            result += stream.resample_chunk(np.zeros(0, dtype=np.int16), last=True).tobytes()
+            stream.clear()
+        return result
+
+    def reset(self):
+        for stream in self._streams.values():
+            stream.clear()
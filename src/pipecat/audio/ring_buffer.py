@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import Iterator
+
+
+class AudioRingBuffer:
+    """Accumulates audio and hands it out in chunks without copying.
+
+    Audio is written into a preallocated buffer and read as `memoryview`
+    chunks of it, so reading doesn't copy the remaining audio (as slicing
+    `bytes` or `bytearray` does). Read chunks are only valid until the next
+    write, since the buffer space is reused (copy them with `bytes()` if they
+    need to be kept).
+
+    The unread audio is moved to the beginning of the buffer when there's no
+    room left at the end. The buffer grows if less than half of it would be
+    free, so moving audio around is amortized.
+
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._buffer = bytearray(capacity)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def write(self, audio: bytes):
+        size = len(audio)
+        if self._end + size > len(self._buffer):
+            self._make_room(size)
+        self._buffer[self._end : self._end + size] = audio
+        self._end += size
+
+    def read(self, size: int) -> memoryview:
+        """Reads (and consumes) the oldest `size` bytes."""
+        if size > len(self):
+            raise ValueError(f"Unable to read {size} bytes, only {len(self)} available")
+        chunk = memoryview(self._buffer)[self._start : self._start + size]
+        self._start += size
+        if self._start == self._end:
+            self._start = self._end = 0
+        return chunk
+
+    def chunks(self, size: int) -> Iterator[memoryview]:
+        """Reads chunks of `size` bytes while there's enough audio. Any
+        remaining audio is kept for later.
+
+        """
+        if size <= 0:
+            raise ValueError(f"Invalid chunk size: {size}")
+        while len(self) >= size:
+            yield self.read(size)
+
+    def view(self) -> memoryview:
+        """Returns all the unread audio without consuming it."""
+        return memoryview(self._buffer)[self._start : self._end]
+
+    def discard(self, size: int):
+        """Discards the oldest `size` bytes (or all the audio if there's less)."""
+        self._start = min(self._start + size, self._end)
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def clear(self):
+        self._start = self._end = 0
+
+    def _make_room(self, size: int):
+        length = len(self)
+        buffer = memoryview(self._buffer)
+        if (length + size) * 2 > len(self._buffer):
+            # Use a new buffer, previously read chunks still point to the old one.
+            new_buffer = bytearray(max(len(self._buffer) * 2, (length + size) * 2))
+            new_buffer[:length] = buffer[self._start : self._end]
+            self._buffer = new_buffer
+        else:
+            buffer[:length] = buffer[self._start : self._end]
+        self._start = 0
+        self._end = length
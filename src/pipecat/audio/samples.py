@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Conversions between the audio representations used by Pipecat.
+
+Audio is usually passed around as bytes (16-bit signed PCM), but most audio
+processing works on NumPy arrays. Audio utilities accept any `AudioData`:
+bytes-like objects (`bytes`, `bytearray`, `memoryview`) or NumPy arrays of
+int16 samples or float32 samples (normalized between -1 and 1). Conversions
+only copy audio when they need to (e.g. bytes are viewed as int16 samples
+without copying).
+
+Audio frames cache these conversions (see `AudioRawFrame.samples` and
+`AudioRawFrame.float_samples`), so passing `frame.samples` to audio utilities
+converts the frame audio at most once.
+"""
+
+from typing import Union
+
+import numpy as np
+
+AudioData = Union[bytes, bytearray, memoryview, np.ndarray]
+
+INT16_SCALE = 32768.0
+
+
+def int16_samples(audio: AudioData) -> np.ndarray:
+    """Returns the audio as int16 samples. Bytes-like audio is not copied, so
+    the returned array is read-only if the audio is (e.g. `bytes`).
+
+    """
+    if isinstance(audio, np.ndarray):
+        if audio.dtype == np.int16:
+            return audio
+        if audio.dtype == np.float32:
+            return np.clip(audio * INT16_SCALE, -32768, 32767).astype(np.int16)
+        raise ValueError(f"Unsupported audio samples type: {audio.dtype}")
+    return np.frombuffer(audio, dtype=np.int16)
+
+
+def float32_samples(audio: AudioData) -> np.ndarray:
+    """Returns the audio as float32 samples between -1 and 1."""
+    if isinstance(audio, np.ndarray) and audio.dtype == np.float32:
+        return audio
+    return np.multiply(int16_samples(audio), 1 / INT16_SCALE, dtype=np.float32)
+
+
+def audio_buffer(audio: AudioData) -> Union[bytes, bytearray, memoryview]:
+    """Returns the audio as a bytes-like object (16-bit signed PCM), without
+    copying it if possible (e.g. to write it into a buffer).
+
+    """
+    if isinstance(audio, np.ndarray):
+        return memoryview(np.ascontiguousarray(int16_samples(audio))).cast("B")
+    return audio
+
+
+def audio_bytes(audio: AudioData) -> bytes:
+    """Returns the audio as bytes (16-bit signed PCM)."""
+    if isinstance(audio, bytes):
+        return audio
+    return int16_samples(audio).tobytes()
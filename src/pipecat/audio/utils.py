@@ -4,23 +4,28 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
-import audioop
-
 import numpy as np
 import pyloudnorm as pyln
 import soxr
 
+from pipecat.audio.g711 import g711_decode, g711_encode
 from pipecat.audio.resamplers.base_audio_resampler import BaseAudioResampler
 from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+from pipecat.audio.samples import AudioData, int16_samples
 
 
 def create_default_resampler(**kwargs) -> BaseAudioResampler:
     return SOXRAudioResampler(**kwargs)
 
 
-def mix_audio(audio1: bytes, audio2: bytes) -> bytes:
-    data1 = np.frombuffer(audio1, dtype=np.int16)
-    data2 = np.frombuffer(audio2, dtype=np.int16)
+def create_stream_resampler(**kwargs) -> BaseAudioResampler:
+    return SOXRStreamAudioResampler(**kwargs)
+
+
+def mix_audio(audio1: AudioData, audio2: AudioData) -> bytes:
+    data1 = int16_samples(audio1)
+    data2 = int16_samples(audio2)
 
     # Max length
     max_length = max(len(data1), len(data2))
@@ -36,9 +41,9 @@ def mix_audio(audio1: bytes, audio2: bytes) -> bytes:
     return mixed_audio.astype(np.int16).tobytes()
 
 
-def interleave_stereo_audio(left_audio: bytes, right_audio: bytes) -> bytes:
-    left = np.frombuffer(left_audio, dtype=np.int16)
-    right = np.frombuffer(right_audio, dtype=np.int16)
+def interleave_stereo_audio(left_audio: AudioData, right_audio: AudioData) -> bytes:
+    left = int16_samples(left_audio)
+    right = int16_samples(right_audio)
 
     min_length = min(len(left), len(right))
     left = left[:min_length]
@@ -55,8 +60,8 @@ def normalize_value(value, min_value, max_value):
     return normalized_clamped
 
 
-def calculate_audio_volume(audio: bytes, sample_rate: int) -> float:
-    audio_np = np.frombuffer(audio, dtype=np.int16)
+def calculate_audio_volume(audio: AudioData, sample_rate: int) -> float:
+    audio_np = int16_samples(audio)
     audio_float = audio_np.astype(np.float64)
 
     block_size = audio_np.size / sample_rate
@@ -78,7 +83,7 @@ async def ulaw_to_pcm(
     ulaw_bytes: bytes, in_rate: int, out_rate: int, resampler: BaseAudioResampler
 ):
     # Convert μ-law to PCM
-    in_pcm_bytes = audioop.ulaw2lin(ulaw_bytes, 2)
+    in_pcm_bytes = g711_decode(ulaw_bytes, "ulaw").tobytes()
 
     # Resample
     out_pcm_bytes = await resampler.resample(in_pcm_bytes, in_rate, out_rate)
@@ -86,12 +91,14 @@ async def ulaw_to_pcm(
     return out_pcm_bytes
 
 
-async def pcm_to_ulaw(pcm_bytes: bytes, in_rate: int, out_rate: int, resampler: BaseAudioResampler):
+async def pcm_to_ulaw(
+    pcm_bytes: AudioData, in_rate: int, out_rate: int, resampler: BaseAudioResampler
+):
     # Resample
     in_pcm_bytes = await resampler.resample(pcm_bytes, in_rate, out_rate)
 
     # Convert PCM to μ-law
-    out_ulaw_bytes = audioop.lin2ulaw(in_pcm_bytes, 2)
+    out_ulaw_bytes = g711_encode(int16_samples(in_pcm_bytes), "ulaw")
 
     return out_ulaw_bytes
 
@@ -100,7 +107,7 @@ async def alaw_to_pcm(
     alaw_bytes: bytes, in_rate: int, out_rate: int, resampler: BaseAudioResampler
 ) -> bytes:
     # Convert a-law to PCM
-    in_pcm_bytes = audioop.alaw2lin(alaw_bytes, 2)
+    in_pcm_bytes = g711_decode(alaw_bytes, "alaw").tobytes()
 
     # Resample
     out_pcm_bytes = await resampler.resample(in_pcm_bytes, in_rate, out_rate)
@@ -108,11 +115,13 @@ async def alaw_to_pcm(
     return out_pcm_bytes
 
 
-async def pcm_to_alaw(pcm_bytes: bytes, in_rate: int, out_rate: int, resampler: BaseAudioResampler):
+async def pcm_to_alaw(
+    pcm_bytes: AudioData, in_rate: int, out_rate: int, resampler: BaseAudioResampler
+):
     # Resample
     in_pcm_bytes = await resampler.resample(pcm_bytes, in_rate, out_rate)
 
-    # Convert PCM to μ-law
-    out_alaw_bytes = audioop.lin2alaw(in_pcm_bytes, 2)
+    # Convert PCM to a-law
+    out_alaw_bytes = g711_encode(int16_samples(in_pcm_bytes), "alaw")
 
     return out_alaw_bytes
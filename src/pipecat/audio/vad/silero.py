@@ -4,13 +4,22 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import asyncio
+import threading
 import time
-from typing import Optional
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from loguru import logger
 
-from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from pipecat.audio.samples import float32_samples
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+from pipecat.utils.executors import (
+    MODEL_INFERENCE_POOL,
+    ExecutorService,
+    get_default_executor_service,
+)
 
 # How often should we reset internal model state
 _MODEL_RESET_STATES_TIME = 5.0
@@ -24,22 +33,92 @@ except ModuleNotFoundError as e:
     raise Exception(f"Missing module(s): {e}")
 
 
-class SileroOnnxModel:
-    def __init__(self, path, force_onnx_cpu=True):
-        import numpy as np
+# ONNX sessions are thread-safe, so all the Silero models in the process share
+# them. Sessions are created the first time they are needed (or when warming
+# up) and kept for the lifetime of the process.
+_sessions: Dict[Tuple[str, bool], "onnxruntime.InferenceSession"] = {}
+_sessions_lock = threading.Lock()
+_default_model_file_path: Optional[str] = None
 
-        global np
 
-        opts = onnxruntime.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
+def _model_file_path():
+    global _default_model_file_path
 
-        if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
-            self.session = onnxruntime.InferenceSession(
-                path, providers=["CPUExecutionProvider"], sess_options=opts
-            )
-        else:
-            self.session = onnxruntime.InferenceSession(path, sess_options=opts)
+    if _default_model_file_path:
+        return _default_model_file_path
+
+    model_name = "silero_vad.onnx"
+    package_path = "pipecat.audio.vad.data"
+
+    try:
+        import importlib_resources as impresources
+
+        model_file_path = str(impresources.files(package_path).joinpath(model_name))
+    except BaseException:
+        from importlib import resources as impresources
+
+        try:
+            with impresources.path(package_path, model_name) as f:
+                model_file_path = f
+        except BaseException:
+            model_file_path = str(impresources.files(package_path).joinpath(model_name))
+
+    _default_model_file_path = str(model_file_path)
+    return _default_model_file_path
+
+
+def _create_session(path: str, force_onnx_cpu: bool) -> "onnxruntime.InferenceSession":
+    opts = onnxruntime.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+
+    if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
+        return onnxruntime.InferenceSession(
+            path, providers=["CPUExecutionProvider"], sess_options=opts
+        )
+    else:
+        return onnxruntime.InferenceSession(path, sess_options=opts)
+
+
+def get_silero_session(
+    path: Optional[str] = None, force_onnx_cpu: bool = True
+) -> "onnxruntime.InferenceSession":
+    """Returns the process-wide ONNX session for the given Silero model (the
+    one bundled with Pipecat by default), creating it if necessary.
+
+    """
+    key = (str(path or _model_file_path()), force_onnx_cpu)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if not session:
+            logger.debug(f"Loading Silero VAD model {key[0]}...")
+            session = _create_session(key[0], force_onnx_cpu)
+            _sessions[key] = session
+        return session
+
+
+def warm_up_silero_vad(path: Optional[str] = None, force_onnx_cpu: bool = True):
+    """Loads the Silero VAD model and runs it once for every supported sample
+    rate, so analyzers created later (e.g. when calls arrive) don't need to.
+    Call this when a worker process starts.
+
+    """
+    model = SileroOnnxModel(path, force_onnx_cpu=force_onnx_cpu)
+    for sample_rate in model.sample_rates:
+        num_samples = 512 if sample_rate == 16000 else 256
+        model(np.zeros(num_samples, dtype=np.float32), sample_rate)
+        model.reset_states()
+
+
+class SileroOnnxModel:
+    """Silero VAD model state of a single audio stream. The ONNX session is
+    shared with all the other models in the process (see
+    `get_silero_session()`).
+
+    """
+
+    def __init__(self, path=None, force_onnx_cpu=True):
+        self.session = get_silero_session(path, force_onnx_cpu)
 
         self.reset_states()
         self.sample_rates = [8000, 16000]
@@ -108,30 +187,10 @@ class SileroVADAnalyzer(VADAnalyzer):
     def __init__(self, *, sample_rate: Optional[int] = None, params: VADParams = VADParams()):
         super().__init__(sample_rate=sample_rate, params=params)
 
-        logger.debug("Loading Silero VAD model...")
-
-        model_name = "silero_vad.onnx"
-        package_path = "pipecat.audio.vad.data"
-
-        try:
-            import importlib_resources as impresources
-
-            model_file_path = str(impresources.files(package_path).joinpath(model_name))
-        except BaseException:
-            from importlib import resources as impresources
-
-            try:
-                with impresources.path(package_path, model_name) as f:
-                    model_file_path = f
-            except BaseException:
-                model_file_path = str(impresources.files(package_path).joinpath(model_name))
-
-        self._model = SileroOnnxModel(model_file_path, force_onnx_cpu=True)
+        self._model = SileroOnnxModel(force_onnx_cpu=True)
 
         self._last_reset_time = 0
 
-        logger.debug("Loaded Silero VAD")
-
     #
     # VADAnalyzer
     #
@@ -147,9 +206,7 @@ class SileroVADAnalyzer(VADAnalyzer):
 
     def voice_confidence(self, buffer) -> float:
         try:
-            audio_int16 = np.frombuffer(buffer, np.int16)
-            # Divide by 32768 because we have signed 16-bit data.
-            audio_float32 = np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
+            audio_float32 = float32_samples(buffer)
             new_confidence = self._model(audio_float32, self.sample_rate)[0]
 
             # We need to reset the model from time to time because it doesn't
@@ -165,3 +222,209 @@ class SileroVADAnalyzer(VADAnalyzer):
             # This comes from an empty audio array
             logger.error(f"Error analyzing audio with Silero VAD: {e}")
             return 0
+
+
+class SileroVADStream:
+    """Silero model state (recurrent state and audio context) of a single
+    audio stream analyzed by a `SileroVADBatcher`.
+
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.sample_rate = 0
+        self.state = np.zeros((2, 1, 128), dtype=np.float32)
+        self.context = np.zeros((1, 0), dtype=np.float32)
+
+
+class SileroVADBatcher:
+    """Runs Silero VAD inference for many audio streams in batches.
+
+    Running the model once per stream and VAD window (e.g. every 32ms for
+    hundreds of calls) has a big per-call overhead. Instead, analyzers sharing
+    a batcher submit their windows and wait. Windows submitted within
+    `max_delay_secs` (or until there are `max_batch_size` of them) are run as
+    a single batched inference, each stream keeps its own model state.
+
+    Batches run one at a time in the `MODEL_INFERENCE_POOL` of the given
+    executor service (or the default one). The batcher uses a single session
+    in the pool, so it doesn't need a thread of its own.
+
+    A batcher should be shared by analyzers running in the same event loop.
+    Call `close()` when it's not needed anymore.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch_size: int = 256,
+        max_delay_secs: float = 0.005,
+        executor_service: Optional[ExecutorService] = None,
+    ):
+        self._model = SileroOnnxModel(force_onnx_cpu=True)
+        self._max_batch_size = max_batch_size
+        self._max_delay_secs = max_delay_secs
+        executor_service = executor_service or get_default_executor_service()
+        self._executor = executor_service.executor(MODEL_INFERENCE_POOL, self)
+        self._pending: Dict[int, List[Tuple[SileroVADStream, np.ndarray, asyncio.Future]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._closed = False
+
+    async def voice_confidence(
+        self, stream: SileroVADStream, audio: np.ndarray, sample_rate: int
+    ) -> float:
+        """Returns the voice confidence of the given float32 audio window,
+        once it has been analyzed together with the windows of other streams.
+
+        """
+        if self._closed:
+            raise RuntimeError("SileroVADBatcher is closed")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(sample_rate, [])
+        pending.append((stream, audio, future))
+        if len(pending) >= self._max_batch_size:
+            self._run_batch(sample_rate)
+        elif not self._flush_handle:
+            self._flush_handle = loop.call_later(self._max_delay_secs, self._flush)
+        return await future
+
+    def infer(
+        self, streams: Sequence[SileroVADStream], audios: Sequence[np.ndarray], sample_rate: int
+    ) -> np.ndarray:
+        """Runs a batched inference of the given streams (one window each) and
+        returns their voice confidences. This blocks, so it's usually called
+        from a worker thread.
+
+        """
+        context_size = 64 if sample_rate == 16000 else 32
+        for stream in streams:
+            if stream.sample_rate != sample_rate:
+                stream.reset()
+                stream.sample_rate = sample_rate
+                stream.context = np.zeros((1, context_size), dtype=np.float32)
+
+        x = np.concatenate((np.concatenate([s.context for s in streams]), np.stack(audios)), axis=1)
+        state = np.concatenate([s.state for s in streams], axis=1)
+        ort_inputs = {"input": x, "state": state, "sr": np.array(sample_rate, dtype="int64")}
+        out, state = self._model.session.run(None, ort_inputs)
+
+        for i, stream in enumerate(streams):
+            stream.state = state[:, i : i + 1]
+            stream.context = x[i : i + 1, -context_size:]
+
+        return out[:, 0]
+
+    def close(self):
+        """Stops the batcher. Windows waiting to be analyzed are cancelled."""
+        self._closed = True
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for batch in self._pending.values():
+            for _, _, future in batch:
+                future.cancel()
+        self._pending.clear()
+
+    def _flush(self):
+        self._flush_handle = None
+        for sample_rate in list(self._pending.keys()):
+            self._run_batch(sample_rate)
+
+    def _run_batch(self, sample_rate: int):
+        batch = self._pending.pop(sample_rate, [])
+        if not self._pending and self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not batch:
+            return
+
+        streams = [stream for stream, _, _ in batch]
+        audios = [audio for _, audio, _ in batch]
+        futures = [future for _, _, future in batch]
+
+        def set_results(task: asyncio.Future):
+            for i, future in enumerate(futures):
+                if future.done():
+                    continue
+                if task.cancelled():
+                    future.cancel()
+                elif task.exception():
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(float(task.result()[i]))
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, self.infer, streams, audios, sample_rate)
+        task.add_done_callback(set_results)
+
+
+class BatchedSileroVADAnalyzer(VADAnalyzer):
+    """Silero VAD analyzer that runs inference together with other analyzers
+    through a shared `SileroVADBatcher` (e.g. one batcher for all the calls
+    handled by a process). The voice confidence is the same as with
+    `SileroVADAnalyzer`.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        batcher: SileroVADBatcher,
+        sample_rate: Optional[int] = None,
+        params: VADParams = VADParams(),
+    ):
+        super().__init__(sample_rate=sample_rate, params=params)
+        self._batcher = batcher
+        self._stream = SileroVADStream()
+        self._last_reset_time = 0
+
+    #
+    # VADAnalyzer
+    #
+
+    def set_sample_rate(self, sample_rate: int):
+        if sample_rate != 16000 and sample_rate != 8000:
+            raise ValueError("Silero VAD sample rate needs to be 16000 or 8000")
+
+        super().set_sample_rate(sample_rate)
+
+    def num_frames_required(self) -> int:
+        return 512 if self.sample_rate == 16000 else 256
+
+    def voice_confidence(self, buffer) -> float:
+        try:
+            audio = float32_samples(buffer)
+            confidence = self._batcher.infer([self._stream], [audio], self.sample_rate)[0]
+            self._maybe_reset_stream()
+            return float(confidence)
+        except Exception as e:
+            logger.error(f"Error analyzing audio with Silero VAD: {e}")
+            return 0
+
+    async def analyze_audio_async(self, buffer, executor: Optional[Executor] = None) -> VADState:
+        audio_frames = self._next_vad_window(buffer)
+        if audio_frames is None:
+            return self._vad_state
+
+        try:
+            confidence = await self._batcher.voice_confidence(
+                self._stream, float32_samples(audio_frames), self.sample_rate
+            )
+            self._maybe_reset_stream()
+        except Exception as e:
+            logger.error(f"Error analyzing audio with Silero VAD: {e}")
+            confidence = 0
+
+        return self._update_vad_state(audio_frames, confidence)
+
+    def _maybe_reset_stream(self):
+        # Reset the model state from time to time, as `SileroVADAnalyzer` does.
+        curr_time = time.time()
+        if curr_time - self._last_reset_time >= _MODEL_RESET_STATES_TIME:
+            self._stream.reset()
+            self._last_reset_time = curr_time
@@ -4,14 +4,19 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from enum import Enum
 from typing import Optional
 
 from loguru import logger
 from pydantic import BaseModel
 
+from pipecat.audio.ring_buffer import AudioRingBuffer
+from pipecat.audio.samples import audio_buffer
 from pipecat.audio.utils import calculate_audio_volume, exp_smoothing
+from pipecat.audio.volume_meter import VolumeMeter
 
 VAD_CONFIDENCE = 0.7
 VAD_START_SECS = 0.2
@@ -31,6 +36,9 @@ class VADParams(BaseModel):
     start_secs: float = VAD_START_SECS
     stop_secs: float = VAD_STOP_SECS
     min_volume: float = VAD_MIN_VOLUME
+    # Measure the volume with pyloudnorm (as `calculate_audio_volume()`)
+    # instead of the streaming `VolumeMeter`. This is much slower.
+    exact_volume: bool = False
 
 
 class VADAnalyzer(ABC):
@@ -40,7 +48,7 @@ class VADAnalyzer(ABC):
         self._params = params
         self._num_channels = 1
 
-        self._vad_buffer = b""
+        self._vad_buffer = AudioRingBuffer()
 
         # Volume exponential smoothing
         self._smoothing_factor = 0.2
@@ -84,22 +92,44 @@ class VADAnalyzer(ABC):
         self._vad_stopping_count = 0
         self._vad_state: VADState = VADState.QUIET
 
+        self._volume_meter = VolumeMeter(self.sample_rate)
+
     def _get_smoothed_volume(self, audio: bytes) -> float:
-        volume = calculate_audio_volume(audio, self.sample_rate)
+        if self._params.exact_volume:
+            volume = calculate_audio_volume(audio, self.sample_rate)
+        else:
+            volume = self._volume_meter.volume(audio)
         return exp_smoothing(volume, self._prev_volume, self._smoothing_factor)
 
     def analyze_audio(self, buffer) -> VADState:
-        self._vad_buffer += buffer
+        audio_frames = self._next_vad_window(buffer)
+        if audio_frames is None:
+            return self._vad_state
+
+        confidence = self.voice_confidence(audio_frames)
+
+        return self._update_vad_state(audio_frames, confidence)
+
+    async def analyze_audio_async(self, buffer, executor: Optional[Executor] = None) -> VADState:
+        """Analyzes audio without blocking the event loop. By default,
+        `analyze_audio()` runs in the given executor. Analyzers that can
+        compute the voice confidence asynchronously (e.g. batching inference
+        of multiple streams) can override this.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.analyze_audio, buffer)
+
+    def _next_vad_window(self, buffer) -> Optional[bytes]:
+        self._vad_buffer.write(audio_buffer(buffer))
 
         num_required_bytes = self._vad_frames_num_bytes
         if len(self._vad_buffer) < num_required_bytes:
-            return self._vad_state
-
-        audio_frames = self._vad_buffer[:num_required_bytes]
-        self._vad_buffer = self._vad_buffer[num_required_bytes:]
+            return None
 
-        confidence = self.voice_confidence(audio_frames)
+        return bytes(self._vad_buffer.read(num_required_bytes))
 
+    def _update_vad_state(self, audio_frames: bytes, confidence: float) -> VADState:
         volume = self._get_smoothed_volume(audio_frames)
         self._prev_volume = volume
 
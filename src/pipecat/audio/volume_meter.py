@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import numpy as np
+from pyloudnorm.iirfilter import IIRfilter
+from scipy.signal import lfilter
+
+from pipecat.audio.samples import AudioData, int16_samples
+from pipecat.audio.utils import normalize_value
+
+# K-weighting filter stages (ITU-R BS.1770), as defined by pyloudnorm.
+K_WEIGHTING_STAGES = [
+    (4.0, 1 / np.sqrt(2), 1500.0, "high_shelf"),
+    (0.0, 0.5, 38.0, "high_pass"),
+]
+
+# Blocks below this loudness are considered silence (ITU-R BS.1770 absolute
+# gating threshold).
+ABSOLUTE_GATE_LUFS = -70.0
+
+
+class VolumeMeter:
+    """Streaming K-weighted loudness meter for a single audio stream.
+
+    It measures the same loudness as `calculate_audio_volume()` (normalized
+    between 0 and 1), but the K-weighting filter is only designed once and its
+    state is kept between calls, and audio is processed in float32. This makes
+    it much cheaper when measuring small chunks of audio (e.g. on every VAD
+    window). Since the filter state is kept, the volume of a chunk might be
+    slightly different than with `calculate_audio_volume()`, which filters
+    every chunk from scratch.
+
+    """
+
+    def __init__(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        # Each stage is a biquad filter kept as (b, a, state). Biquads are
+        # applied one after the other (instead of a single 4th order filter)
+        # because they are numerically stable in float32.
+        self._stages = []
+        for gain, q, fc, filter_type in K_WEIGHTING_STAGES:
+            stage = IIRfilter(gain, q, fc, sample_rate, filter_type)
+            b = (stage.b / stage.a[0]).astype(np.float32)
+            a = (stage.a / stage.a[0]).astype(np.float32)
+            self._stages.append([b, a, np.zeros(2, dtype=np.float32)])
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    def volume(self, audio: AudioData) -> float:
+        """Returns the loudness of the given audio normalized between 0
+        (quiet) and 1 (loud).
+
+        """
+        samples = int16_samples(audio).astype(np.float32)
+        if samples.size == 0:
+            return 0.0
+
+        filtered = samples
+        for stage in self._stages:
+            b, a, zi = stage
+            filtered, stage[2] = lfilter(b, a, filtered, zi=zi)
+
+        mean_square = float(np.dot(filtered, filtered)) / samples.size
+        if mean_square <= 0:
+            return 0.0
+
+        loudness = -0.691 + 10.0 * np.log10(mean_square)
+        if loudness < ABSOLUTE_GATE_LUFS:
+            return 0.0
+
+        # Loudness goes from -20 to 80 (more or less), where -20 is quiet and 80
+        # is loud.
+        return normalize_value(loudness, -20, 80)
+
+    def reset(self):
+        """Resets the filter state (e.g. when the audio stream is restarted)."""
+        for stage in self._stages:
+            stage[2] = np.zeros(2, dtype=np.float32)
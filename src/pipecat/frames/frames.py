@@ -19,6 +19,9 @@ from typing import (
     Tuple,
 )
 
+import numpy as np
+
+from pipecat.audio.samples import float32_samples, int16_samples
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.clocks.base_clock import BaseClock
 from pipecat.metrics.metrics import MetricsData
@@ -52,26 +55,59 @@ def format_pts(pts: Optional[int]):
     return nanoseconds_to_str(pts) if pts else None
 
 
-@dataclass
-class Frame:
+class _FrameState:
+    """Private frame state. It's not part of the frame dataclass so it doesn't
+    show up in `dataclasses.fields()`, `asdict()`, etc.
+
+    """
+
+    # `_audio_views` is only used by audio frames (see `AudioRawFrame`), but
+    # mixins can't have slots.
+    __slots__ = ("_name", "_name_count", "_metadata", "_audio_views")
+
+
+@dataclass(slots=True)
+class Frame(_FrameState):
     """Base frame class."""
 
     id: int = field(init=False)
-    name: str = field(init=False)
     pts: Optional[int] = field(init=False)
-    metadata: Dict[str, Any] = field(init=False)
 
     def __post_init__(self):
         self.id: int = obj_id()
-        self.name: str = f"{self.__class__.__name__}#{obj_count(self)}"
         self.pts: Optional[int] = None
-        self.metadata: Dict[str, Any] = {}
+        # Most frames (e.g. audio frames) never have their name or metadata
+        # accessed, so they are only created when needed. The name number is
+        # taken now, so names follow the creation order of frames.
+        self._name: Optional[str] = None
+        self._name_count: int = obj_count(self)
+        self._metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = f"{self.__class__.__name__}#{self._name_count}"
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]):
+        self._metadata = metadata
 
     def __str__(self):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemFrame(Frame):
     """System frames are frames that are not internally queued by any of the
     frame processors and should be processed immediately.
@@ -81,7 +117,7 @@ class SystemFrame(Frame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DataFrame(Frame):
     """Data frames are frames that will be processed in order and usually
     contain data such as LLM context, text, audio or images.
@@ -91,7 +127,7 @@ class DataFrame(Frame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlFrame(Frame):
     """Control frames are frames that, similar to data frames, will be processed
     in order and usually contain control information such as frames to update
@@ -105,11 +141,26 @@ class ControlFrame(Frame):
 #
 # Mixins
 #
+# Mixins don't have slots of their own (empty `__slots__`), their fields become
+# slots of the frame classes using them. This avoids instance layout conflicts
+# when a frame inherits from a base frame and a mixin.
+#
 
 
 @dataclass
 class AudioRawFrame:
-    """A chunk of audio."""
+    """A chunk of audio.
+
+    Besides `audio` (bytes), the audio is also available as NumPy arrays
+    (`samples` and `float_samples`) and as a `memoryview` (`audio_view`). They
+    are created the first time they are needed and then cached (until `audio`
+    is replaced), so the audio of a frame is converted at most once no matter
+    how many processors use it. `samples` and `audio_view` share the memory of
+    `audio` and are read-only.
+
+    """
+
+    __slots__ = ()
 
     audio: bytes
     sample_rate: int
@@ -118,12 +169,43 @@ class AudioRawFrame:
 
     def __post_init__(self):
         self.num_frames = int(len(self.audio) / (self.num_channels * 2))
+        self._audio_views = None
+
+    @property
+    def samples(self) -> np.ndarray:
+        """The audio as int16 samples (interleaved if multiple channels)."""
+        return self._get_audio_views()[1]
+
+    @property
+    def float_samples(self) -> np.ndarray:
+        """The audio as float32 samples between -1 and 1 (interleaved if
+        multiple channels).
+
+        """
+        views = self._get_audio_views()
+        if views[2] is None:
+            views[2] = float32_samples(views[1])
+        return views[2]
+
+    @property
+    def audio_view(self) -> memoryview:
+        return memoryview(self.audio)
+
+    def _get_audio_views(self) -> list:
+        # Views are recreated if the audio has been replaced (e.g. by a filter).
+        views = self._audio_views
+        if views is None or views[0] is not self.audio:
+            views = [self.audio, int16_samples(self.audio), None]
+            self._audio_views = views
+        return views
 
 
 @dataclass
 class ImageRawFrame:
     """A raw image."""
 
+    __slots__ = ()
+
     image: bytes
     size: Tuple[int, int]
     format: Optional[str]
@@ -134,7 +216,7 @@ class ImageRawFrame:
 #
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputAudioRawFrame(DataFrame, AudioRawFrame):
     """A chunk of audio. Will be played by the output transport if the
     transport's microphone has been enabled.
@@ -142,15 +224,17 @@ class OutputAudioRawFrame(DataFrame, AudioRawFrame):
     """
 
     def __post_init__(self):
-        super().__post_init__()
-        self.num_frames = int(len(self.audio) / (self.num_channels * 2))
+        # Slotted dataclasses are re-created by `@dataclass`, so zero-argument
+        # `super()` can't be used in their methods.
+        DataFrame.__post_init__(self)
+        AudioRawFrame.__post_init__(self)
 
     def __str__(self):
         pts = format_pts(self.pts)
         return f"{self.name}(pts: {pts}, size: {len(self.audio)}, frames: {self.num_frames}, sample_rate: {self.sample_rate}, channels: {self.num_channels})"
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputImageRawFrame(DataFrame, ImageRawFrame):
     """An image that will be shown by the transport if the transport's camera is
     enabled.
@@ -162,14 +246,14 @@ class OutputImageRawFrame(DataFrame, ImageRawFrame):
         return f"{self.name}(pts: {pts}, size: {self.size}, format: {self.format})"
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSAudioRawFrame(OutputAudioRawFrame):
     """A chunk of output audio generated by a TTS service."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class URLImageRawFrame(OutputImageRawFrame):
     """An output image with an associated URL. These images are usually
     generated by third-party services that provide a URL to download the image.
@@ -183,7 +267,7 @@ class URLImageRawFrame(OutputImageRawFrame):
         return f"{self.name}(pts: {pts}, url: {self.url}, size: {self.size}, format: {self.format})"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpriteFrame(DataFrame):
     """An animated sprite. Will be shown by the transport if the transport's
     camera is enabled. Will play at the framerate specified in the transport's
@@ -198,7 +282,7 @@ class SpriteFrame(DataFrame):
         return f"{self.name}(pts: {pts}, size: {len(self.images)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextFrame(DataFrame):
     """A chunk of text. Emitted by LLM services, consumed by TTS services, can
     be used to send text through processors.
@@ -212,21 +296,21 @@ class TextFrame(DataFrame):
         return f"{self.name}(pts: {pts}, text: [{self.text}])"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMTextFrame(TextFrame):
     """A text frame generated by LLM services."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSTextFrame(TextFrame):
     """A text frame generated by TTS services."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionFrame(TextFrame):
     """A text frame with transcription-specific data. Will be placed in the
     transport's receive queue when a participant speaks.
@@ -241,7 +325,7 @@ class TranscriptionFrame(TextFrame):
         return f"{self.name}(user: {self.user_id}, text: [{self.text}], language: {self.language}, timestamp: {self.timestamp})"
 
 
-@dataclass
+@dataclass(slots=True)
 class InterimTranscriptionFrame(TextFrame):
     """A text frame with interim transcription-specific data. Will be placed in
     the transport's receive queue when a participant speaks.
@@ -256,7 +340,7 @@ class InterimTranscriptionFrame(TextFrame):
         return f"{self.name}(user: {self.user_id}, text: [{self.text}], language: {self.language}, timestamp: {self.timestamp})"
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenAILLMContextAssistantTimestampFrame(DataFrame):
     """Timestamp information for assistant message in LLM context."""
 
@@ -275,7 +359,7 @@ class TranscriptionMessage:
     timestamp: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionUpdateFrame(DataFrame):
     """A frame containing new messages added to the conversation transcript.
 
@@ -319,7 +403,7 @@ class TranscriptionUpdateFrame(DataFrame):
         return f"{self.name}(pts: {pts}, messages: {len(self.messages)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessagesFrame(DataFrame):
     """A frame containing a list of LLM messages. Used to signal that an LLM
     service should run a chat completion and emit an LLMFullResponseStartFrame,
@@ -332,7 +416,7 @@ class LLMMessagesFrame(DataFrame):
     messages: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessagesAppendFrame(DataFrame):
     """A frame containing a list of LLM messages that need to be added to the
     current context.
@@ -342,7 +426,7 @@ class LLMMessagesAppendFrame(DataFrame):
     messages: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessagesUpdateFrame(DataFrame):
     """A frame containing a list of new LLM messages. These messages will
     replace the current context LLM messages and should generate a new
@@ -353,7 +437,7 @@ class LLMMessagesUpdateFrame(DataFrame):
     messages: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMSetToolsFrame(DataFrame):
     """A frame containing a list of tools for an LLM to use for function calling.
     The specific format depends on the LLM being used, but it should typically
@@ -363,14 +447,14 @@ class LLMSetToolsFrame(DataFrame):
     tools: List[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMSetToolChoiceFrame(DataFrame):
     """A frame containing a tool choice for an LLM to use for function calling."""
 
     tool_choice: Literal["none", "auto", "required"] | dict
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMEnablePromptCachingFrame(DataFrame):
     """A frame to enable/disable prompt caching in certain LLMs."""
 
@@ -385,7 +469,7 @@ class FunctionCallResultProperties:
     on_context_updated: Optional[Callable[[], Awaitable[None]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCallResultFrame(DataFrame):
     """A frame containing the result of an LLM function (tool) call."""
 
@@ -396,7 +480,7 @@ class FunctionCallResultFrame(DataFrame):
     properties: Optional[FunctionCallResultProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSSpeakFrame(DataFrame):
     """A frame that contains a text that should be spoken by the TTS in the
     pipeline (if any).
@@ -406,7 +490,7 @@ class TTSSpeakFrame(DataFrame):
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportMessageFrame(DataFrame):
     message: Any
 
@@ -414,21 +498,21 @@ class TransportMessageFrame(DataFrame):
         return f"{self.name}(message: {self.message})"
 
 
-@dataclass
+@dataclass(slots=True)
 class DTMFFrame(DataFrame):
     """A DTMF button frame"""
 
     button: KeypadEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class InputDTMFFrame(DTMFFrame):
     """A DTMF button input"""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputDTMFFrame(DTMFFrame):
     """A DTMF button output"""
 
@@ -440,7 +524,7 @@ class OutputDTMFFrame(DTMFFrame):
 #
 
 
-@dataclass
+@dataclass(slots=True)
 class StartFrame(SystemFrame):
     """This is the first frame that should be pushed down a pipeline."""
 
@@ -451,18 +535,19 @@ class StartFrame(SystemFrame):
     allow_interruptions: bool = False
     enable_metrics: bool = False
     enable_usage_metrics: bool = False
+    enable_processor_stats: bool = False
     observer: Optional["BaseObserver"] = None
     report_only_initial_ttfb: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CancelFrame(SystemFrame):
     """Indicates that a pipeline needs to stop right away."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorFrame(SystemFrame):
     """This is used notify upstream that an error has occurred downstream the
     pipeline. A fatal error indicates the error is unrecoverable and that the
@@ -477,7 +562,7 @@ class ErrorFrame(SystemFrame):
         return f"{self.name}(error: {self.error}, fatal: {self.fatal})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FatalErrorFrame(ErrorFrame):
     """This is used notify upstream that an unrecoverable error has occurred and
     that the bot should exit.
@@ -487,7 +572,7 @@ class FatalErrorFrame(ErrorFrame):
     fatal: bool = field(default=True, init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatFrame(SystemFrame):
     """This frame is used by the pipeline task as a mechanism to know if the
     pipeline is running properly.
@@ -497,7 +582,7 @@ class HeartbeatFrame(SystemFrame):
     timestamp: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EndTaskFrame(SystemFrame):
     """This is used to notify the pipeline task that the pipeline should be
     closed nicely (flushing all the queued frames) by pushing an EndFrame
@@ -508,7 +593,7 @@ class EndTaskFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CancelTaskFrame(SystemFrame):
     """This is used to notify the pipeline task that the pipeline should be
     stopped immediately by pushing a CancelFrame downstream.
@@ -518,7 +603,7 @@ class CancelTaskFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StopTaskFrame(SystemFrame):
     """This is used to notify the pipeline task that it should be stopped as
     soon as possible (flushing all the queued frames) but that the pipeline
@@ -529,7 +614,7 @@ class StopTaskFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StartInterruptionFrame(SystemFrame):
     """Emitted by VAD to indicate that a user has started speaking (i.e. is
     interruption). This is similar to UserStartedSpeakingFrame except that it
@@ -541,7 +626,7 @@ class StartInterruptionFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StopInterruptionFrame(SystemFrame):
     """Emitted by VAD to indicate that a user has stopped speaking (i.e. no more
     interruptions). This is similar to UserStoppedSpeakingFrame except that it
@@ -553,7 +638,7 @@ class StopInterruptionFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStartedSpeakingFrame(SystemFrame):
     """Emitted by VAD to indicate that a user has started speaking. This can be
     used for interruptions or other times when detecting that someone is
@@ -565,14 +650,14 @@ class UserStartedSpeakingFrame(SystemFrame):
     emulated: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStoppedSpeakingFrame(SystemFrame):
     """Emitted by the VAD to indicate that a user stopped speaking."""
 
     emulated: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EmulateUserStartedSpeakingFrame(SystemFrame):
     """Emitted by internal processors upstream to emulate VAD behavior when a
     user starts speaking.
@@ -581,7 +666,7 @@ class EmulateUserStartedSpeakingFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class EmulateUserStoppedSpeakingFrame(SystemFrame):
     """Emitted by internal processors upstream to emulate VAD behavior when a
     user stops speaking.
@@ -590,7 +675,7 @@ class EmulateUserStoppedSpeakingFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BotInterruptionFrame(SystemFrame):
     """Emitted by when the bot should be interrupted. This will mainly cause the
     same actions as if the user interrupted except that the
@@ -601,21 +686,21 @@ class BotInterruptionFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BotStartedSpeakingFrame(SystemFrame):
     """Emitted upstream by transport outputs to indicate the bot started speaking."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BotStoppedSpeakingFrame(SystemFrame):
     """Emitted upstream by transport outputs to indicate the bot stopped speaking."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BotSpeakingFrame(SystemFrame):
     """Emitted upstream by transport outputs while the bot is still
     speaking. This can be used, for example, to detect when a user is idle. That
@@ -627,14 +712,14 @@ class BotSpeakingFrame(SystemFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsFrame(SystemFrame):
     """Emitted by processor that can compute metrics like latencies."""
 
     data: List[MetricsData]
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCallInProgressFrame(SystemFrame):
     """A frame signaling that a function call is in progress."""
 
@@ -644,7 +729,7 @@ class FunctionCallInProgressFrame(SystemFrame):
     cancel_on_interruption: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCallCancelFrame(SystemFrame):
     """A frame to signal a function call has been cancelled."""
 
@@ -652,14 +737,14 @@ class FunctionCallCancelFrame(SystemFrame):
     tool_call_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class STTMuteFrame(SystemFrame):
     """System frame to mute/unmute the STT service."""
 
     mute: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportMessageUrgentFrame(SystemFrame):
     message: Any
 
@@ -667,7 +752,7 @@ class TransportMessageUrgentFrame(SystemFrame):
         return f"{self.name}(message: {self.message})"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserImageRequestFrame(SystemFrame):
     """A frame to request an image from the given user. The frame might be
     generated by a function call in which case the corresponding fields will be
@@ -684,20 +769,21 @@ class UserImageRequestFrame(SystemFrame):
         return f"{self.name}(user: {self.user_id}, function: {self.function_name}, request: {self.tool_call_id})"
 
 
-@dataclass
+@dataclass(slots=True)
 class InputAudioRawFrame(SystemFrame, AudioRawFrame):
     """A chunk of audio usually coming from an input transport."""
 
     def __post_init__(self):
-        super().__post_init__()
-        self.num_frames = int(len(self.audio) / (self.num_channels * 2))
+        # See `OutputAudioRawFrame.__post_init__()`.
+        SystemFrame.__post_init__(self)
+        AudioRawFrame.__post_init__(self)
 
     def __str__(self):
         pts = format_pts(self.pts)
         return f"{self.name}(pts: {pts}, size: {len(self.audio)}, frames: {self.num_frames}, sample_rate: {self.sample_rate}, channels: {self.num_channels})"
 
 
-@dataclass
+@dataclass(slots=True)
 class InputImageRawFrame(SystemFrame, ImageRawFrame):
     """An image usually coming from an input transport."""
 
@@ -706,7 +792,7 @@ class InputImageRawFrame(SystemFrame, ImageRawFrame):
         return f"{self.name}(pts: {pts}, size: {self.size}, format: {self.format})"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserImageRawFrame(InputImageRawFrame):
     """An image associated to a user."""
 
@@ -718,7 +804,7 @@ class UserImageRawFrame(InputImageRawFrame):
         return f"{self.name}(pts: {pts}, user: {self.user_id}, size: {self.size}, format: {self.format}, request: {self.request})"
 
 
-@dataclass
+@dataclass(slots=True)
 class VisionImageRawFrame(InputImageRawFrame):
     """An image with an associated text to ask for a description of it."""
 
@@ -734,7 +820,7 @@ class VisionImageRawFrame(InputImageRawFrame):
 #
 
 
-@dataclass
+@dataclass(slots=True)
 class EndFrame(ControlFrame):
     """Indicates that a pipeline has ended and frame processors and pipelines
     should be shut down. If the transport receives this frame, it will stop
@@ -747,7 +833,7 @@ class EndFrame(ControlFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StopFrame(ControlFrame):
     """Indicates that a pipeline should be stopped but that the pipeline
     processors should be kept in a running state. This is normally queued from
@@ -758,7 +844,7 @@ class StopFrame(ControlFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMFullResponseStartFrame(ControlFrame):
     """Used to indicate the beginning of an LLM response. Following by one or
     more TextFrame and a final LLMFullResponseEndFrame.
@@ -767,14 +853,14 @@ class LLMFullResponseStartFrame(ControlFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMFullResponseEndFrame(ControlFrame):
     """Indicates the end of an LLM response."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSStartedFrame(ControlFrame):
     """Used to indicate the beginning of a TTS response. Following
     TTSAudioRawFrames are part of the TTS response until an
@@ -787,36 +873,36 @@ class TTSStartedFrame(ControlFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSStoppedFrame(ControlFrame):
     """Indicates the end of a TTS response."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceUpdateSettingsFrame(ControlFrame):
     """A control frame containing a request to update service settings."""
 
     settings: Mapping[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMUpdateSettingsFrame(ServiceUpdateSettingsFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TTSUpdateSettingsFrame(ServiceUpdateSettingsFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class STTUpdateSettingsFrame(ServiceUpdateSettingsFrame):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class VADParamsUpdateFrame(ControlFrame):
     """A control frame containing a request to update VAD params. Intended
     to be pushed upstream from RTVI processor.
@@ -825,42 +911,42 @@ class VADParamsUpdateFrame(ControlFrame):
     params: VADParams
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterControlFrame(ControlFrame):
     """Base control frame for other audio filter frames."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterUpdateSettingsFrame(FilterControlFrame):
     """Control frame to update filter settings."""
 
     settings: Mapping[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterEnableFrame(FilterControlFrame):
     """Control frame to enable or disable the filter at runtime."""
 
     enable: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MixerControlFrame(ControlFrame):
     """Base control frame for other audio mixer frames."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MixerUpdateSettingsFrame(MixerControlFrame):
     """Control frame to update mixer settings."""
 
     settings: Mapping[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class MixerEnableFrame(MixerControlFrame):
     """Control frame to enable or disable the mixer at runtime."""
 
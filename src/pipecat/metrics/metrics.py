@@ -30,3 +30,23 @@ class LLMUsageMetricsData(MetricsData):
 
 class TTSUsageMetricsData(MetricsData):
     value: int
+
+
+class FrameQueueMetricsData(MetricsData):
+    queue: str
+    dropped: int
+    coalesced: int
+
+
+class HistogramData(BaseModel):
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class FrameProcessorStatsMetricsData(MetricsData):
+    queue_wait: HistogramData
+    processing_time: HistogramData
+    queue_depth: HistogramData
@@ -5,6 +5,7 @@
 #
 
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple, Type
 
 from pipecat.frames.frames import Frame
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
@@ -16,8 +17,24 @@ class BaseObserver(ABC):
     processors in the pipeline. This can be useful, for example, to implement
     frame loggers or debuggers among other things.
 
+    Most observers are only interested in a few frame types. Observers can
+    declare which frames they want to receive with the following attributes, so
+    the rest of frames (e.g. audio frames) are filtered out before they reach
+    the observer:
+
+    - `frame_types`: frame types (including subclasses) to observe. If empty,
+      all frame types are observed.
+    - `direction`: frame direction to observe. If None, both directions are
+      observed.
+    - `source_types`: types of the processors pushing the frames. If empty,
+      frames from all processors are observed.
+
     """
 
+    frame_types: Tuple[Type[Frame], ...] = ()
+    direction: Optional[FrameDirection] = None
+    source_types: Tuple[Type[FrameProcessor], ...] = ()
+
     @abstractmethod
     async def on_push_frame(
         self,
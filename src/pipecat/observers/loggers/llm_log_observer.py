@@ -38,6 +38,16 @@ class LLMLogObserver(BaseObserver):
 
     """
 
+    frame_types = (
+        LLMFullResponseStartFrame,
+        LLMFullResponseEndFrame,
+        LLMTextFrame,
+        FunctionCallInProgressFrame,
+        LLMMessagesFrame,
+        OpenAILLMContextFrame,
+        FunctionCallResultFrame,
+    )
+
     async def on_push_frame(
         self,
         src: FrameProcessor,
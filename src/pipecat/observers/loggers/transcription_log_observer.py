@@ -29,6 +29,9 @@ class TranscriptionLogObserver(BaseObserver):
 
     """
 
+    frame_types = (TranscriptionFrame, InterimTranscriptionFrame)
+    source_types = (STTService,)
+
     async def on_push_frame(
         self,
         src: FrameProcessor,
@@ -11,9 +11,16 @@ from pipecat.processors.frame_processor import FrameProcessor
 
 
 class BasePipeline(FrameProcessor):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
     @abstractmethod
     def processors_with_metrics(self) -> List[FrameProcessor]:
         pass
+
+    def processors_with_stats(self) -> List[FrameProcessor]:
+        """Returns the processors (including the ones in nested pipelines) that
+        collect latency statistics.
+
+        """
+        return []
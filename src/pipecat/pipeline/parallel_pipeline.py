@@ -5,6 +5,7 @@
 #
 
 import asyncio
+from collections import OrderedDict
 from itertools import chain
 from typing import Awaitable, Callable, Dict, List
 
@@ -22,6 +23,79 @@ from pipecat.pipeline.base_pipeline import BasePipeline
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
+# Number of fanned out frames tracked per generation. See `FanOutTracker`.
+FAN_OUT_TRACKER_MAX_SIZE = 10000
+
+
+class FanOutTracker:
+    """Keeps track of the frames sent to all the branches of a parallel
+    pipeline, so each frame is only pushed out once.
+
+    For every fanned out frame we count how many branches still need to output
+    it. The first branch that outputs the frame pushes it and the others are
+    discarded. Once all the branches have output the frame it's forgotten, so
+    in the common case only frames in flight are tracked.
+
+    Branches might filter out frames, in which case they would never be
+    forgotten. Because of this, frames are stored in two generations: when the
+    current generation reaches `max_size` frames it becomes the previous
+    generation and the old previous generation is discarded. This bounds memory
+    to `2 * max_size` frames.
+
+    Discarded frames that have already been pushed are remembered (up to
+    `max_size` of them), so they are not pushed again if a branch outputs them
+    later. Any other frame that is not tracked (e.g. a frame created inside a
+    branch) is pushed.
+
+    """
+
+    def __init__(self, branches: int, max_size: int = FAN_OUT_TRACKER_MAX_SIZE):
+        self._branches = branches
+        self._max_size = max_size
+        self._current: Dict[int, int] = {}
+        self._previous: Dict[int, int] = {}
+        # Discarded frames already pushed, used as an ordered set.
+        self._discarded: OrderedDict[int, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def add(self, frame_id: int):
+        """Registers a frame that is about to be sent to all the branches."""
+        if len(self._current) >= self._max_size:
+            self._discard(self._previous)
+            self._previous = self._current
+            self._current = {}
+        self._current[frame_id] = self._branches
+
+    def should_push(self, frame_id: int) -> bool:
+        """Registers that a branch has output the given frame and returns
+        whether the frame should be pushed (i.e. it's the first time we see it).
+
+        """
+        generation = self._current
+        remaining = generation.get(frame_id)
+        if remaining is None:
+            generation = self._previous
+            remaining = generation.get(frame_id)
+            if remaining is None:
+                return frame_id not in self._discarded
+
+        if remaining > 1:
+            generation[frame_id] = remaining - 1
+        else:
+            del generation[frame_id]
+
+        return remaining == self._branches
+
+    def _discard(self, generation: Dict[int, int]):
+        for frame_id, remaining in generation.items():
+            # Frames no branch has output yet will be pushed when they are.
+            if remaining < self._branches:
+                self._discarded[frame_id] = None
+        while len(self._discarded) > self._max_size:
+            self._discarded.popitem(last=False)
+
 
 class ParallelPipelineSource(FrameProcessor):
     def __init__(
@@ -78,7 +152,7 @@ class ParallelPipeline(BasePipeline):
 
         self._sources = []
         self._sinks = []
-        self._seen_ids = set()
+        self._fan_out_tracker = FanOutTracker(len(args))
         self._endframe_counter: Dict[int, int] = {}
 
         self._up_task = None
@@ -114,10 +188,18 @@ class ParallelPipeline(BasePipeline):
     def processors_with_metrics(self) -> List[FrameProcessor]:
         return list(chain.from_iterable(p.processors_with_metrics() for p in self._pipelines))
 
+    def processors_with_stats(self) -> List[FrameProcessor]:
+        return list(chain.from_iterable(p.processors_with_stats() for p in self._pipelines))
+
     #
     # Frame processor
     #
 
+    def set_inline(self, inline: bool):
+        super().set_inline(inline)
+        for p in chain(self._sources, self._pipelines, self._sinks):
+            p.set_inline(inline)
+
     async def cleanup(self):
         await super().cleanup()
         await asyncio.gather(*[s.cleanup() for s in self._sources])
@@ -136,10 +218,10 @@ class ParallelPipeline(BasePipeline):
 
         if direction == FrameDirection.UPSTREAM:
             # If we get an upstream frame we process it in each sink.
-            await asyncio.gather(*[s.queue_frame(frame, direction) for s in self._sinks])
+            await self._fan_out(self._sinks, frame, direction)
         elif direction == FrameDirection.DOWNSTREAM:
             # If we get a downstream frame we process it in each source.
-            await asyncio.gather(*[s.queue_frame(frame, direction) for s in self._sources])
+            await self._fan_out(self._sources, frame, direction)
 
         # Handle interruptions after everything has been cancelled.
         if isinstance(frame, StartInterruptionFrame):
@@ -188,9 +270,24 @@ class ParallelPipeline(BasePipeline):
         await self._drain_queues()
         await self._create_tasks()
 
+    async def _fan_out(
+        self, processors: List[FrameProcessor], frame: Frame, direction: FrameDirection
+    ):
+        # End frames are counted separately (see `_process_down_queue()`).
+        if len(processors) > 1 and not isinstance(frame, EndFrame):
+            self._fan_out_tracker.add(frame.id)
+
+        if isinstance(frame, SystemFrame):
+            # System frames are processed right away, so we process them
+            # concurrently in all the branches.
+            await asyncio.gather(*[p.queue_frame(frame, direction) for p in processors])
+        else:
+            # Other frames are just queued, no need to create futures for them.
+            for p in processors:
+                await p.queue_frame(frame, direction)
+
     async def _parallel_push_frame(self, frame: Frame, direction: FrameDirection):
-        if frame.id not in self._seen_ids:
-            self._seen_ids.add(frame.id)
+        if self._fan_out_tracker.should_push(frame.id):
             await self.push_frame(frame, direction)
 
     async def _process_up_queue(self):
@@ -213,7 +310,11 @@ class ParallelPipeline(BasePipeline):
 
             # If we don't have a counter or we reached 0, push the frame.
             if endframe_counter == 0:
-                await self._parallel_push_frame(frame, FrameDirection.DOWNSTREAM)
+                if frame.id in self._endframe_counter:
+                    del self._endframe_counter[frame.id]
+                    await self.push_frame(frame, FrameDirection.DOWNSTREAM)
+                else:
+                    await self._parallel_push_frame(frame, FrameDirection.DOWNSTREAM)
 
             running = not (endframe_counter == 0 and isinstance(frame, EndFrame))
 
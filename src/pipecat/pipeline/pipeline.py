@@ -12,8 +12,8 @@ from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
 
 class PipelineSource(FrameProcessor):
-    def __init__(self, upstream_push_frame: Callable[[Frame, FrameDirection], Coroutine]):
-        super().__init__()
+    def __init__(self, upstream_push_frame: Callable[[Frame, FrameDirection], Coroutine], **kwargs):
+        super().__init__(**kwargs)
         self._upstream_push_frame = upstream_push_frame
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
@@ -27,8 +27,10 @@ class PipelineSource(FrameProcessor):
 
 
 class PipelineSink(FrameProcessor):
-    def __init__(self, downstream_push_frame: Callable[[Frame, FrameDirection], Coroutine]):
-        super().__init__()
+    def __init__(
+        self, downstream_push_frame: Callable[[Frame, FrameDirection], Coroutine], **kwargs
+    ):
+        super().__init__(**kwargs)
         self._downstream_push_frame = downstream_push_frame
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
@@ -42,7 +44,16 @@ class PipelineSink(FrameProcessor):
 
 
 class Pipeline(BasePipeline):
-    def __init__(self, processors: List[FrameProcessor]):
+    """A pipeline is a list of frame processors linked together.
+
+    If `inline` is True, the pipeline and all its processors (including nested
+    pipelines) will run in inline mode, that is, frames are passed from one
+    processor to the next one by calling them directly instead of going through
+    the processors' input and push queues (see `FrameProcessor.set_inline()`).
+
+    """
+
+    def __init__(self, processors: List[FrameProcessor], *, inline: bool = False):
         super().__init__()
 
         # Add a source and a sink queue so we can forward frames upstream and
@@ -53,6 +64,9 @@ class Pipeline(BasePipeline):
 
         self._link_processors()
 
+        if inline:
+            self.set_inline(True)
+
     #
     # BasePipeline
     #
@@ -66,10 +80,25 @@ class Pipeline(BasePipeline):
                 services.append(p)
         return services
 
+    def processors_with_stats(self) -> List[FrameProcessor]:
+        processors = []
+        # Skip our own source and sink.
+        for p in self._processors[1:-1]:
+            if isinstance(p, BasePipeline):
+                processors.extend(p.processors_with_stats())
+            else:
+                processors.append(p)
+        return processors
+
     #
     # Frame processor
     #
 
+    def set_inline(self, inline: bool):
+        super().set_inline(inline)
+        for p in self._processors:
+            p.set_inline(inline)
+
     async def cleanup(self):
         await super().cleanup()
         await self._cleanup_processors()
@@ -13,6 +13,7 @@ from loguru import logger
 
 from pipecat.pipeline.task import PipelineTask
 from pipecat.utils.base_object import BaseObject
+from pipecat.utils.executors import ExecutorService
 
 
 class PipelineRunner(BaseObject):
@@ -23,6 +24,7 @@ class PipelineRunner(BaseObject):
         handle_sigint: bool = True,
         force_gc: bool = False,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        executor_service: Optional[ExecutorService] = None,
     ):
         super().__init__(name=name)
 
@@ -30,6 +32,9 @@ class PipelineRunner(BaseObject):
         self._sig_task = None
         self._force_gc = force_gc
         self._loop = loop or asyncio.get_running_loop()
+        # Blocking work of all the tasks run by this runner. If not given, tasks
+        # use the process-wide executor service.
+        self._executor_service = executor_service
 
         if handle_sigint:
             self._setup_sigint()
@@ -38,6 +43,8 @@ class PipelineRunner(BaseObject):
         logger.debug(f"Runner {self} started running {task}")
         self._tasks[task.name] = task
         task.set_event_loop(self._loop)
+        if self._executor_service:
+            task.set_executor_service(self._executor_service)
         await task.run()
         del self._tasks[task.name]
 
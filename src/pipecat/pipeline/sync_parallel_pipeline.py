@@ -5,23 +5,36 @@
 #
 
 import asyncio
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from itertools import chain
-from typing import List
+from typing import Deque, List, Optional
 
 from loguru import logger
 
-from pipecat.frames.frames import ControlFrame, EndFrame, Frame, SystemFrame
+from pipecat.frames.frames import (
+    CancelFrame,
+    ControlFrame,
+    EndFrame,
+    Frame,
+    StartFrame,
+    StartInterruptionFrame,
+    SystemFrame,
+)
 from pipecat.pipeline.base_pipeline import BasePipeline
+from pipecat.pipeline.parallel_pipeline import FanOutTracker
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
 
 @dataclass
 class SyncFrame(ControlFrame):
-    """This frame is used to know when the internal pipelines have finished."""
+    """This frame is used to know when the internal pipelines have finished
+    processing the frame with the given sequence number.
 
-    pass
+    """
+
+    sequence: int = 0
 
 
 class SyncParallelPipelineSource(FrameProcessor):
@@ -54,19 +67,46 @@ class SyncParallelPipelineSink(FrameProcessor):
                 await self._down_queue.put(frame)
 
 
+class SyncBatch:
+    """The output of all the internal pipelines for a single input frame."""
+
+    def __init__(self, branches: int, end_frame: Optional[EndFrame] = None):
+        self.outputs: List[List[Frame]] = [[] for _ in range(branches)]
+        self.remaining = branches
+        self.end_frame = end_frame
+        self.flushed = asyncio.Event()
+
+
 class SyncParallelPipeline(BasePipeline):
-    def __init__(self, *args):
+    """Runs a list of pipelines in parallel and synchronizes their output. The
+    output frames for a given input frame are only pushed once all the
+    pipelines have finished processing the input frame, and they are pushed in
+    pipeline order.
+
+    Downstream frames are numbered and followed by a `SyncFrame` with the same
+    sequence number, so we know which output frames belong to which input
+    frame. Up to `max_frames_in_flight` frames can be processed by the internal
+    pipelines at the same time (e.g. an image for a sentence can be generated
+    while the audio for the next sentence is being generated), the output is
+    still pushed in input order. By default only one frame is processed at a
+    time.
+
+    """
+
+    def __init__(self, *args, max_frames_in_flight: int = 1):
         super().__init__()
 
         if len(args) == 0:
             raise Exception(f"SyncParallelPipeline needs at least one argument")
 
+        if max_frames_in_flight < 1:
+            raise ValueError(f"SyncParallelPipeline max_frames_in_flight needs to be at least 1")
+
         self._sinks = []
         self._sources = []
         self._pipelines = []
 
         self._up_queue = asyncio.Queue()
-        self._down_queue = asyncio.Queue()
 
         logger.debug(f"Creating {self} pipelines")
         for processors in args:
@@ -92,6 +132,17 @@ class SyncParallelPipeline(BasePipeline):
 
         logger.debug(f"Finished creating {self} pipelines")
 
+        # Downstream frames being processed by the internal pipelines, in
+        # order. Each internal pipeline also keeps the sequence numbers it
+        # still needs to finish, which is the batch its output frames belong to.
+        self._max_frames_in_flight = max_frames_in_flight
+        self._window = asyncio.Semaphore(max_frames_in_flight)
+        self._sequence = 0
+        self._batches: OrderedDict[int, SyncBatch] = OrderedDict()
+        self._branch_sequences: List[Deque[int]] = [deque() for _ in self._pipelines]
+        self._fan_out_tracker = FanOutTracker(len(self._pipelines))
+        self._output_tasks: List[asyncio.Task] = []
+
     #
     # BasePipeline
     #
@@ -99,12 +150,25 @@ class SyncParallelPipeline(BasePipeline):
     def processors_with_metrics(self) -> List[FrameProcessor]:
         return list(chain.from_iterable(p.processors_with_metrics() for p in self._pipelines))
 
+    def processors_with_stats(self) -> List[FrameProcessor]:
+        return list(chain.from_iterable(p.processors_with_stats() for p in self._pipelines))
+
     #
     # Frame processor
     #
 
+    def set_inline(self, inline: bool):
+        super().set_inline(inline)
+        for s in self._sources:
+            s["processor"].set_inline(inline)
+        for p in self._pipelines:
+            p.set_inline(inline)
+        for s in self._sinks:
+            s["processor"].set_inline(inline)
+
     async def cleanup(self):
         await super().cleanup()
+        await self._cancel_output_tasks()
         await asyncio.gather(*[s["processor"].cleanup() for s in self._sources])
         await asyncio.gather(*[p.cleanup() for p in self._pipelines])
         await asyncio.gather(*[s["processor"].cleanup() for s in self._sinks])
@@ -112,19 +176,69 @@ class SyncParallelPipeline(BasePipeline):
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
+        if isinstance(frame, StartFrame):
+            self._create_output_tasks()
+        elif isinstance(frame, StartInterruptionFrame):
+            self._reset_batches()
+
+        if direction == FrameDirection.UPSTREAM:
+            await self._process_upstream_frame(frame)
+        elif direction == FrameDirection.DOWNSTREAM:
+            await self._process_downstream_frame(frame)
+
+        if isinstance(frame, CancelFrame):
+            await self._cancel_output_tasks()
+
+    async def _process_downstream_frame(self, frame: Frame):
+        # System frames are not synchronized, they are pushed as soon as the
+        # first internal pipeline outputs them.
+        if isinstance(frame, SystemFrame):
+            self._fan_out_tracker.add(frame.id)
+            await asyncio.gather(
+                *[
+                    s["processor"].process_frame(frame, FrameDirection.DOWNSTREAM)
+                    for s in self._sources
+                ]
+            )
+            return
+
+        # Wait until there's room for one more frame.
+        await self._window.acquire()
+
+        sequence = self._sequence
+        self._sequence += 1
+
+        end_frame = frame if isinstance(frame, EndFrame) else None
+        batch = SyncBatch(len(self._pipelines), end_frame)
+        self._batches[sequence] = batch
+        for sequences in self._branch_sequences:
+            sequences.append(sequence)
+
+        for s in self._sources:
+            await s["processor"].process_frame(frame, FrameDirection.DOWNSTREAM)
+            # An EndFrame is the last frame out of each pipeline, so there's no
+            # need for a SyncFrame.
+            if not end_frame:
+                await s["processor"].process_frame(
+                    SyncFrame(sequence=sequence), FrameDirection.DOWNSTREAM
+                )
+
+        # Make sure everything has been pushed before finishing.
+        if end_frame:
+            await batch.flushed.wait()
+
+    async def _process_upstream_frame(self, frame: Frame):
         # The last processor of each pipeline needs to be synchronous otherwise
         # this element won't work. Since, we know it should be synchronous we
         # push a SyncFrame. Since frames are ordered we know this frame will be
         # pushed after the synchronous processor has pushed its data allowing us
         # to synchrnonize all the internal pipelines by waiting for the
         # SyncFrame in all of them.
-        async def wait_for_sync(
-            obj, main_queue: asyncio.Queue, frame: Frame, direction: FrameDirection
-        ):
+        async def wait_for_sync(obj, main_queue: asyncio.Queue, frame: Frame):
             processor = obj["processor"]
             queue = obj["queue"]
 
-            await processor.process_frame(frame, direction)
+            await processor.process_frame(frame, FrameDirection.UPSTREAM)
 
             if isinstance(frame, (SystemFrame, EndFrame)):
                 new_frame = await queue.get()
@@ -136,23 +250,15 @@ class SyncParallelPipeline(BasePipeline):
                         queue.task_done()
                         new_frame = await queue.get()
             else:
-                await processor.process_frame(SyncFrame(), direction)
+                await processor.process_frame(SyncFrame(), FrameDirection.UPSTREAM)
                 new_frame = await queue.get()
                 while not isinstance(new_frame, SyncFrame):
                     await main_queue.put(new_frame)
                     queue.task_done()
                     new_frame = await queue.get()
 
-        if direction == FrameDirection.UPSTREAM:
-            # If we get an upstream frame we process it in each sink.
-            await asyncio.gather(
-                *[wait_for_sync(s, self._up_queue, frame, direction) for s in self._sinks]
-            )
-        elif direction == FrameDirection.DOWNSTREAM:
-            # If we get a downstream frame we process it in each source.
-            await asyncio.gather(
-                *[wait_for_sync(s, self._down_queue, frame, direction) for s in self._sources]
-            )
+        # If we get an upstream frame we process it in each sink.
+        await asyncio.gather(*[wait_for_sync(s, self._up_queue, frame) for s in self._sinks])
 
         seen_ids = set()
         while not self._up_queue.empty():
@@ -162,10 +268,72 @@ class SyncParallelPipeline(BasePipeline):
                 seen_ids.add(frame.id)
             self._up_queue.task_done()
 
-        seen_ids = set()
-        while not self._down_queue.empty():
-            frame = await self._down_queue.get()
-            if frame.id not in seen_ids:
-                await self.push_frame(frame, FrameDirection.DOWNSTREAM)
-                seen_ids.add(frame.id)
-            self._down_queue.task_done()
+    def _create_output_tasks(self):
+        if not self._output_tasks:
+            self._output_tasks = [
+                self.create_task(self._output_task_handler(index, s["queue"]))
+                for index, s in enumerate(self._sources)
+            ]
+
+    async def _cancel_output_tasks(self):
+        for task in self._output_tasks:
+            await self.cancel_task(task)
+        self._output_tasks = []
+
+    def _reset_batches(self):
+        # Frames in flight are discarded by the internal pipelines, so they will
+        # never finish. Unblock anyone waiting for them.
+        for batch in self._batches.values():
+            batch.flushed.set()
+        self._batches.clear()
+        for sequences in self._branch_sequences:
+            sequences.clear()
+        self._window = asyncio.Semaphore(self._max_frames_in_flight)
+
+    async def _output_task_handler(self, index: int, queue: asyncio.Queue):
+        sequences = self._branch_sequences[index]
+        while True:
+            frame = await queue.get()
+
+            if isinstance(frame, SystemFrame):
+                if self._fan_out_tracker.should_push(frame.id):
+                    await self.push_frame(frame)
+            elif isinstance(frame, SyncFrame) or (
+                isinstance(frame, EndFrame) and self._is_end_frame_batch(sequences)
+            ):
+                # This pipeline has finished with the current input frame. Sync
+                # frames from before an interruption are ignored.
+                sequence = frame.sequence if isinstance(frame, SyncFrame) else sequences[0]
+                if sequences and sequences[0] == sequence:
+                    sequences.popleft()
+                    self._batches[sequence].remaining -= 1
+                    await self._flush_batches()
+            elif sequences:
+                self._batches[sequences[0]].outputs[index].append(frame)
+            else:
+                # Not generated by an input frame, just push it.
+                await self.push_frame(frame)
+
+            queue.task_done()
+
+    def _is_end_frame_batch(self, sequences: Deque[int]) -> bool:
+        return bool(sequences) and self._batches[sequences[0]].end_frame is not None
+
+    async def _flush_batches(self):
+        while self._batches:
+            sequence, batch = next(iter(self._batches.items()))
+            if batch.remaining > 0:
+                break
+            del self._batches[sequence]
+
+            seen_ids = set()
+            for frame in chain.from_iterable(batch.outputs):
+                if frame.id not in seen_ids:
+                    seen_ids.add(frame.id)
+                    await self.push_frame(frame)
+
+            if batch.end_frame:
+                await self.push_frame(batch.end_frame)
+
+            batch.flushed.set()
+            self._window.release()
@@ -28,16 +28,22 @@ from pipecat.frames.frames import (
     StopFrame,
     StopTaskFrame,
 )
-from pipecat.metrics.metrics import ProcessingMetricsData, TTFBMetricsData
+from pipecat.metrics.metrics import (
+    FrameProcessorStatsMetricsData,
+    ProcessingMetricsData,
+    TTFBMetricsData,
+)
 from pipecat.observers.base_observer import BaseObserver
 from pipecat.pipeline.base_pipeline import BasePipeline
 from pipecat.pipeline.base_task import BaseTask
 from pipecat.pipeline.task_observer import TaskObserver
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
-from pipecat.utils.asyncio import BaseTaskManager, TaskManager
+from pipecat.utils.asyncio import BaseTaskManager, TaskManager, wait_for
+from pipecat.utils.executors import ExecutorService
 
 HEARTBEAT_SECONDS = 1.0
 HEARTBEAT_MONITOR_SECONDS = HEARTBEAT_SECONDS * 5
+PROCESSOR_STATS_SECONDS = 10.0
 
 
 class PipelineParams(BaseModel):
@@ -50,8 +56,13 @@ class PipelineParams(BaseModel):
         enable_heartbeats: Whether to enable heartbeat monitoring.
         enable_metrics: Whether to enable metrics collection.
         enable_usage_metrics: Whether to enable usage metrics.
+        enable_processor_stats: Whether to collect latency statistics (queue
+            wait, processing time and queue depth) for every processor.
         heartbeats_period_secs: Period between heartbeats in seconds.
         observers: List of observers for monitoring pipeline execution.
+        processor_stats_period_secs: Period between processor statistics
+            metrics frames in seconds. Each frame contains the statistics of
+            the last period. None to disable them.
         report_only_initial_ttfb: Whether to report only initial time to first byte.
         send_initial_empty_metrics: Whether to send initial empty metrics.
         start_metadata: Additional metadata for pipeline start.
@@ -65,8 +76,10 @@ class PipelineParams(BaseModel):
     enable_heartbeats: bool = False
     enable_metrics: bool = False
     enable_usage_metrics: bool = False
+    enable_processor_stats: bool = False
     heartbeats_period_secs: float = HEARTBEAT_SECONDS
     observers: List[BaseObserver] = []
+    processor_stats_period_secs: Optional[float] = PROCESSOR_STATS_SECONDS
     report_only_initial_ttfb: bool = False
     send_initial_empty_metrics: bool = True
     start_metadata: Dict[str, Any] = {}
@@ -254,6 +267,13 @@ class PipelineTask(BaseTask):
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
         self._task_manager.set_event_loop(loop)
 
+    def set_executor_service(self, executor_service: ExecutorService):
+        """Sets the executor service used to run blocking work of this task's
+        frame processors.
+
+        """
+        self._task_manager.set_executor_service(executor_service)
+
     def set_reached_upstream_filter(self, types: Tuple[Type[Frame], ...]):
         """Sets which frames will be checked before calling the
         on_frame_reached_upstream event handler.
@@ -268,6 +288,19 @@ class PipelineTask(BaseTask):
         """
         self._reached_downstream_types = types
 
+    def processor_stats(self, reset: bool = False) -> List[FrameProcessorStatsMetricsData]:
+        """Returns the latency statistics (queue wait, processing time and
+        queue depth percentiles) of all the pipeline processors. Statistics
+        need to be enabled with `PipelineParams.enable_processor_stats`.
+
+        Statistics are collected since the last reset. If `reset` is True,
+        statistics are reset after this call. Note that periodic statistics
+        (see `PipelineParams.processor_stats_period_secs`) reset them.
+
+        """
+        stats = [p.get_stats(reset) for p in self._pipeline.processors_with_stats()]
+        return [s for s in stats if s]
+
     def has_finished(self) -> bool:
         """Indicates whether the tasks has finished. That is, all processors
         have stopped.
@@ -360,6 +393,12 @@ class PipelineTask(BaseTask):
                 self._heartbeat_monitor_handler(), f"{self}::_heartbeat_monitor_handler"
             )
 
+    def _maybe_start_processor_stats_task(self):
+        if self._processor_stats_enabled():
+            self._processor_stats_task = self._task_manager.create_task(
+                self._processor_stats_handler(), f"{self}::_processor_stats_handler"
+            )
+
     def _maybe_start_idle_task(self):
         if self._idle_timeout_secs:
             self._idle_monitor_task = self._task_manager.create_task(
@@ -373,6 +412,7 @@ class PipelineTask(BaseTask):
         await self._task_manager.cancel_task(self._process_down_task)
 
         await self._maybe_cancel_heartbeat_tasks()
+        await self._maybe_cancel_processor_stats_task()
         await self._maybe_cancel_idle_task()
 
     async def _maybe_cancel_heartbeat_tasks(self):
@@ -380,6 +420,15 @@ class PipelineTask(BaseTask):
             await self._task_manager.cancel_task(self._heartbeat_push_task)
             await self._task_manager.cancel_task(self._heartbeat_monitor_task)
 
+    async def _maybe_cancel_processor_stats_task(self):
+        if self._processor_stats_enabled():
+            await self._task_manager.cancel_task(self._processor_stats_task)
+
+    def _processor_stats_enabled(self) -> bool:
+        return self._params.enable_processor_stats and bool(
+            self._params.processor_stats_period_secs
+        )
+
     async def _maybe_cancel_idle_task(self):
         if self._idle_timeout_secs:
             await self._task_manager.cancel_task(self._idle_monitor_task)
@@ -415,6 +464,7 @@ class PipelineTask(BaseTask):
         self._clock.start()
 
         self._maybe_start_heartbeat_tasks()
+        self._maybe_start_processor_stats_task()
         self._maybe_start_idle_task()
 
         start_frame = StartFrame(
@@ -425,6 +475,7 @@ class PipelineTask(BaseTask):
             audio_out_sample_rate=self._params.audio_out_sample_rate,
             enable_metrics=self._params.enable_metrics,
             enable_usage_metrics=self._params.enable_usage_metrics,
+            enable_processor_stats=self._params.enable_processor_stats,
             observer=self._observer,
             report_only_initial_ttfb=self._params.report_only_initial_ttfb,
         )
@@ -521,7 +572,7 @@ class PipelineTask(BaseTask):
         wait_time = HEARTBEAT_MONITOR_SECONDS
         while True:
             try:
-                frame = await asyncio.wait_for(self._heartbeat_queue.get(), timeout=wait_time)
+                frame = await wait_for(self._heartbeat_queue.get(), timeout=wait_time)
                 process_time = (self._clock.get_time() - frame.timestamp) / 1_000_000_000
                 logger.trace(f"{self}: heartbeat frame processed in {process_time} seconds")
                 self._heartbeat_queue.task_done()
@@ -530,6 +581,19 @@ class PipelineTask(BaseTask):
                     f"{self}: heartbeat frame not received for more than {wait_time} seconds"
                 )
 
+    async def _processor_stats_handler(self):
+        """This tasks pushes a metrics frame with the processors' latency
+        statistics every period.
+
+        """
+        while True:
+            await asyncio.sleep(self._params.processor_stats_period_secs)
+            # Report the statistics of the last period only, otherwise recent
+            # regressions would be hidden by older values.
+            stats = self.processor_stats(reset=True)
+            if stats:
+                await self._source.queue_frame(MetricsFrame(data=stats))
+
     async def _idle_monitor_handler(self):
         """This tasks monitors activity in the pipeline. If no frames are
         received (heartbeats don't count) the pipeline is considered idle.
@@ -539,9 +603,7 @@ class PipelineTask(BaseTask):
         last_frame_time = 0
         while running:
             try:
-                frame = await asyncio.wait_for(
-                    self._idle_queue.get(), timeout=self._idle_timeout_secs
-                )
+                frame = await wait_for(self._idle_queue.get(), timeout=self._idle_timeout_secs)
 
                 if isinstance(frame, StartFrame) or isinstance(frame, self._idle_timeout_frames):
                     # If we find a StartFrame or one of the frames that prevents a
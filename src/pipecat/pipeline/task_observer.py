@@ -5,7 +5,7 @@
 #
 
 import asyncio
-from typing import List
+from typing import Dict, List, Optional, Type
 
 from attr import dataclass
 
@@ -52,16 +52,25 @@ class TaskObserver(BaseObserver):
     is received, it will be put in a queue for efficiency and later processed by
     each task.
 
+    Frames are only queued to the observers that want them (see
+    `BaseObserver`). The list of observers interested in a frame type and
+    direction is computed the first time the frame type is seen, so frames
+    nobody observes (usually audio frames) only cost a dictionary lookup.
+
     """
 
     def __init__(self, *, observers: List[BaseObserver] = [], task_manager: BaseTaskManager):
         self._observers = observers
         self._task_manager = task_manager
         self._proxies: List[Proxy] = []
+        self._downstream_proxies: Dict[Type[Frame], List[Proxy]] = {}
+        self._upstream_proxies: Dict[Type[Frame], List[Proxy]] = {}
 
     async def start(self):
         """Starts all proxy observer tasks."""
         self._proxies = self._create_proxies(self._observers)
+        self._downstream_proxies.clear()
+        self._upstream_proxies.clear()
 
     async def stop(self):
         """Stops all proxy observer tasks."""
@@ -76,12 +85,39 @@ class TaskObserver(BaseObserver):
         direction: FrameDirection,
         timestamp: int,
     ):
-        for proxy in self._proxies:
-            await proxy.queue.put(
-                ObserverData(
+        if direction == FrameDirection.DOWNSTREAM:
+            cache = self._downstream_proxies
+        else:
+            cache = self._upstream_proxies
+
+        frame_type = type(frame)
+        try:
+            proxies = cache[frame_type]
+        except KeyError:
+            proxies = self._subscribed_proxies(frame_type, direction)
+            cache[frame_type] = proxies
+
+        data: Optional[ObserverData] = None
+        for proxy in proxies:
+            source_types = proxy.observer.source_types
+            if source_types and not isinstance(src, source_types):
+                continue
+            if not data:
+                data = ObserverData(
                     src=src, dst=dst, frame=frame, direction=direction, timestamp=timestamp
                 )
-            )
+            await proxy.queue.put(data)
+
+    def _subscribed_proxies(self, frame_type: Type[Frame], direction: FrameDirection):
+        proxies = []
+        for proxy in self._proxies:
+            observer = proxy.observer
+            if observer.frame_types and not issubclass(frame_type, observer.frame_types):
+                continue
+            if observer.direction and observer.direction != direction:
+                continue
+            proxies.append(proxy)
+        return proxies
 
     def _create_proxies(self, observers) -> List[Proxy]:
         proxies = []
@@ -42,6 +42,7 @@ from pipecat.processors.aggregators.openai_llm_context import (
     OpenAILLMContext,
     OpenAILLMContextFrame,
 )
+from pipecat.processors.frame_dispatcher import FrameDispatcher
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.utils.time import time_now_iso8601
 
@@ -393,6 +394,8 @@ class LLMAssistantContextAggregator(LLMContextResponseAggregator):
 
     """
 
+    __dispatcher = FrameDispatcher()
+
     def __init__(self, context: OpenAILLMContext, *, expect_stripped_words: bool = True, **kwargs):
         super().__init__(context=context, role="assistant", **kwargs)
         self._expect_stripped_words = expect_stripped_words
@@ -418,37 +421,88 @@ class LLMAssistantContextAggregator(LLMContextResponseAggregator):
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
+        await self.__dispatcher.dispatch(self, frame, direction)
 
-        if isinstance(frame, StartInterruptionFrame):
-            await self._handle_interruptions(frame)
-            await self.push_frame(frame, direction)
-        elif isinstance(frame, LLMFullResponseStartFrame):
-            await self._handle_llm_start(frame)
-        elif isinstance(frame, LLMFullResponseEndFrame):
-            await self._handle_llm_end(frame)
-        elif isinstance(frame, TextFrame):
-            await self._handle_text(frame)
-        elif isinstance(frame, LLMMessagesAppendFrame):
-            self.add_messages(frame.messages)
-        elif isinstance(frame, LLMMessagesUpdateFrame):
-            self.set_messages(frame.messages)
-        elif isinstance(frame, LLMSetToolsFrame):
-            self.set_tools(frame.tools)
-        elif isinstance(frame, LLMSetToolChoiceFrame):
-            self.set_tool_choice(frame.tool_choice)
-        elif isinstance(frame, FunctionCallInProgressFrame):
-            await self._handle_function_call_in_progress(frame)
-        elif isinstance(frame, FunctionCallResultFrame):
-            await self._handle_function_call_result(frame)
-        elif isinstance(frame, FunctionCallCancelFrame):
-            await self._handle_function_call_cancel(frame)
-        elif isinstance(frame, UserImageRawFrame) and frame.request and frame.request.tool_call_id:
+    @__dispatcher.handler(StartInterruptionFrame)
+    async def __handle_start_interruption_frame(
+        self, frame: StartInterruptionFrame, direction: FrameDirection
+    ):
+        await self._handle_interruptions(frame)
+        await self.push_frame(frame, direction)
+
+    @__dispatcher.handler(LLMFullResponseStartFrame)
+    async def __handle_llm_start_frame(
+        self, frame: LLMFullResponseStartFrame, direction: FrameDirection
+    ):
+        await self._handle_llm_start(frame)
+
+    @__dispatcher.handler(LLMFullResponseEndFrame)
+    async def __handle_llm_end_frame(
+        self, frame: LLMFullResponseEndFrame, direction: FrameDirection
+    ):
+        await self._handle_llm_end(frame)
+
+    @__dispatcher.handler(TextFrame)
+    async def __handle_text_frame(self, frame: TextFrame, direction: FrameDirection):
+        await self._handle_text(frame)
+
+    @__dispatcher.handler(LLMMessagesAppendFrame)
+    async def __handle_messages_append_frame(
+        self, frame: LLMMessagesAppendFrame, direction: FrameDirection
+    ):
+        self.add_messages(frame.messages)
+
+    @__dispatcher.handler(LLMMessagesUpdateFrame)
+    async def __handle_messages_update_frame(
+        self, frame: LLMMessagesUpdateFrame, direction: FrameDirection
+    ):
+        self.set_messages(frame.messages)
+
+    @__dispatcher.handler(LLMSetToolsFrame)
+    async def __handle_set_tools_frame(self, frame: LLMSetToolsFrame, direction: FrameDirection):
+        self.set_tools(frame.tools)
+
+    @__dispatcher.handler(LLMSetToolChoiceFrame)
+    async def __handle_set_tool_choice_frame(
+        self, frame: LLMSetToolChoiceFrame, direction: FrameDirection
+    ):
+        self.set_tool_choice(frame.tool_choice)
+
+    @__dispatcher.handler(FunctionCallInProgressFrame)
+    async def __handle_function_call_in_progress_frame(
+        self, frame: FunctionCallInProgressFrame, direction: FrameDirection
+    ):
+        await self._handle_function_call_in_progress(frame)
+
+    @__dispatcher.handler(FunctionCallResultFrame)
+    async def __handle_function_call_result_frame(
+        self, frame: FunctionCallResultFrame, direction: FrameDirection
+    ):
+        await self._handle_function_call_result(frame)
+
+    @__dispatcher.handler(FunctionCallCancelFrame)
+    async def __handle_function_call_cancel_frame(
+        self, frame: FunctionCallCancelFrame, direction: FrameDirection
+    ):
+        await self._handle_function_call_cancel(frame)
+
+    @__dispatcher.handler(UserImageRawFrame)
+    async def __handle_user_image_frame(self, frame: UserImageRawFrame, direction: FrameDirection):
+        if frame.request and frame.request.tool_call_id:
             await self._handle_user_image_frame(frame)
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            await self.push_aggregation()
         else:
             await self.push_frame(frame, direction)
 
+    @__dispatcher.handler(BotStoppedSpeakingFrame)
+    async def __handle_bot_stopped_speaking_frame(
+        self, frame: BotStoppedSpeakingFrame, direction: FrameDirection
+    ):
+        await self.push_aggregation()
+
+    @__dispatcher.handler(Frame)
+    async def __handle_frame(self, frame: Frame, direction: FrameDirection):
+        await self.push_frame(frame, direction)
+
     async def push_aggregation(self):
         if not self._aggregation:
             return
@@ -7,9 +7,8 @@
 import time
 from typing import Optional
 
-from pipecat.audio.utils import create_default_resampler, interleave_stereo_audio, mix_audio
+from pipecat.audio.utils import create_stream_resampler, interleave_stereo_audio, mix_audio
 from pipecat.frames.frames import (
-    AudioRawFrame,
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
     CancelFrame,
@@ -18,6 +17,7 @@ from pipecat.frames.frames import (
     InputAudioRawFrame,
     OutputAudioRawFrame,
     StartFrame,
+    StartInterruptionFrame,
     UserStartedSpeakingFrame,
     UserStoppedSpeakingFrame,
 )
@@ -89,7 +89,10 @@ class AudioBufferProcessor(FrameProcessor):
 
         self._recording = False
 
-        self._resampler = create_default_resampler()
+        # User and bot audio are different streams, so they need their own
+        # resampler.
+        self._input_resampler = create_stream_resampler()
+        self._output_resampler = create_stream_resampler()
 
         self._register_event_handler("on_audio_data")
         self._register_event_handler("on_track_audio_data")
@@ -165,11 +168,16 @@ class AudioBufferProcessor(FrameProcessor):
         # Update output sample rate if necessary.
         if isinstance(frame, StartFrame):
             self._update_sample_rate(frame)
+        elif isinstance(frame, StartInterruptionFrame):
+            # Bot audio is discontinued.
+            self._output_resampler.reset()
 
         if self._recording:
-            await self._process_recording(frame)
+            # Audio is resampled only once, since resamplers keep state.
+            resampled = await self._resample_audio(frame)
+            await self._process_recording(frame, resampled)
             if self._enable_turn_audio:
-                await self._process_turn_recording(frame)
+                await self._process_turn_recording(frame, resampled)
 
         if isinstance(frame, (CancelFrame, EndFrame)):
             await self.stop_recording()
@@ -180,16 +188,16 @@ class AudioBufferProcessor(FrameProcessor):
         self._sample_rate = self._init_sample_rate or frame.audio_out_sample_rate
         self._audio_buffer_size_1s = self._sample_rate * 2
 
-    async def _process_recording(self, frame: Frame):
+    async def _process_recording(self, frame: Frame, resampled: bytes):
         if self._user_continuous_stream:
-            await self._handle_continuous_stream(frame)
+            await self._handle_continuous_stream(frame, resampled)
         else:
-            await self._handle_intermittent_stream(frame)
+            await self._handle_intermittent_stream(frame, resampled)
 
         if self._buffer_size > 0 and len(self._user_audio_buffer) > self._buffer_size:
             await self._call_on_audio_data_handler()
 
-    async def _process_turn_recording(self, frame: Frame):
+    async def _process_turn_recording(self, frame: Frame, resampled: bytes):
         if isinstance(frame, UserStartedSpeakingFrame):
             self._user_speaking = True
         elif isinstance(frame, UserStoppedSpeakingFrame):
@@ -208,7 +216,6 @@ class AudioBufferProcessor(FrameProcessor):
             self._bot_turn_audio_buffer = bytearray()
 
         if isinstance(frame, InputAudioRawFrame):
-            resampled = await self._resample_audio(frame)
             self._user_turn_audio_buffer += resampled
             # In the case of the user, we need to keep a short buffer of audio
             # since VAD notification of when the user starts speaking comes
@@ -220,13 +227,11 @@ class AudioBufferProcessor(FrameProcessor):
                 discarded = len(self._user_turn_audio_buffer) - self._audio_buffer_size_1s
                 self._user_turn_audio_buffer = self._user_turn_audio_buffer[discarded:]
         elif self._bot_speaking and isinstance(frame, OutputAudioRawFrame):
-            resampled = await self._resample_audio(frame)
             self._bot_turn_audio_buffer += resampled
 
-    async def _handle_continuous_stream(self, frame: Frame):
+    async def _handle_continuous_stream(self, frame: Frame, resampled: bytes):
         if isinstance(frame, InputAudioRawFrame):
             # Add user audio.
-            resampled = await self._resample_audio(frame)
             self._user_audio_buffer.extend(resampled)
             # Sync the bot's buffer to the user's buffer by adding silence if needed
             if len(self._user_audio_buffer) > len(self._bot_audio_buffer):
@@ -235,16 +240,14 @@ class AudioBufferProcessor(FrameProcessor):
                 self._bot_audio_buffer.extend(silence)
         elif self._recording and isinstance(frame, OutputAudioRawFrame):
             # Add bot audio.
-            resampled = await self._resample_audio(frame)
             self._bot_audio_buffer.extend(resampled)
 
-    async def _handle_intermittent_stream(self, frame: Frame):
+    async def _handle_intermittent_stream(self, frame: Frame, resampled: bytes):
         if isinstance(frame, InputAudioRawFrame):
             # Add silence if we need to.
             silence = self._compute_silence(self._last_user_frame_at)
             self._user_audio_buffer.extend(silence)
             # Add user audio.
-            resampled = await self._resample_audio(frame)
             self._user_audio_buffer.extend(resampled)
             # Save time of frame so we can compute silence.
             self._last_user_frame_at = time.time()
@@ -253,7 +256,6 @@ class AudioBufferProcessor(FrameProcessor):
             silence = self._compute_silence(self._last_bot_frame_at)
             self._bot_audio_buffer.extend(silence)
             # Add bot audio.
-            resampled = await self._resample_audio(frame)
             self._bot_audio_buffer.extend(resampled)
             # Save time of frame so we can compute silence.
             self._last_bot_frame_at = time.time()
@@ -284,6 +286,8 @@ class AudioBufferProcessor(FrameProcessor):
 
     def _reset_recording(self):
         self._reset_audio_buffers()
+        self._input_resampler.reset()
+        self._output_resampler.reset()
         self._last_user_frame_at = time.time()
         self._last_bot_frame_at = time.time()
 
@@ -293,8 +297,14 @@ class AudioBufferProcessor(FrameProcessor):
         self._user_turn_audio_buffer = bytearray()
         self._bot_turn_audio_buffer = bytearray()
 
-    async def _resample_audio(self, frame: AudioRawFrame) -> bytes:
-        return await self._resampler.resample(frame.audio, frame.sample_rate, self._sample_rate)
+    async def _resample_audio(self, frame: Frame) -> bytes:
+        if isinstance(frame, InputAudioRawFrame):
+            resampler = self._input_resampler
+        elif isinstance(frame, OutputAudioRawFrame):
+            resampler = self._output_resampler
+        else:
+            return b""
+        return await resampler.resample(frame.audio, frame.sample_rate, self._sample_rate)
 
     def _compute_silence(self, from_time: float) -> bytes:
         quiet_time = time.time() - from_time
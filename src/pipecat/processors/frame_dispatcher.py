@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Type
+
+from pipecat.frames.frames import Frame
+
+if TYPE_CHECKING:
+    from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+FrameHandler = Callable[["FrameProcessor", Frame, "FrameDirection"], Awaitable[None]]
+
+
+class FrameDispatcher:
+    """Maps frame types to frame handlers.
+
+    This is meant to replace long `isinstance()` chains in
+    `FrameProcessor.process_frame()`. A dispatcher is usually created as a
+    private class attribute and handlers are registered with the `handler()`
+    decorator. The handler for a frame is the one registered for the closest
+    type in the frame's MRO (so more specific types take precedence, the same
+    way a well-ordered `isinstance()` chain would). Registering a handler for
+    `Frame` works as a default handler.
+
+    The result of resolving a frame type is cached, so finding the handler for
+    a frame is a single dictionary lookup.
+
+       class MyProcessor(FrameProcessor):
+           __dispatcher = FrameDispatcher()
+
+           async def process_frame(self, frame: Frame, direction: FrameDirection):
+               await super().process_frame(frame, direction)
+               await self.__dispatcher.dispatch(self, frame, direction)
+
+           @__dispatcher.handler(TextFrame)
+           async def _handle_text(self, frame: TextFrame, direction: FrameDirection):
+               ...
+
+           @__dispatcher.handler(Frame)
+           async def _handle_other(self, frame: Frame, direction: FrameDirection):
+               await self.push_frame(frame, direction)
+
+    Handlers are stored as plain functions, so they are not looked up in
+    subclasses. Subclasses should customize behavior through the methods
+    called by the handlers or by overriding `process_frame()`.
+
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Type[Frame], FrameHandler] = {}
+        self._cache: Dict[Type[Frame], Optional[FrameHandler]] = {}
+
+    def handler(self, *frame_types: Type[Frame]):
+        """Registers the decorated function as the handler of the given frame types."""
+
+        def decorator(handler: FrameHandler):
+            for frame_type in frame_types:
+                self._handlers[frame_type] = handler
+            self._cache.clear()
+            return handler
+
+        return decorator
+
+    def get_handler(self, frame_type: Type[Frame]) -> Optional[FrameHandler]:
+        """Returns the handler for the given frame type or None if there's none."""
+        try:
+            return self._cache[frame_type]
+        except KeyError:
+            handler = next(
+                (self._handlers[t] for t in frame_type.__mro__ if t in self._handlers), None
+            )
+            self._cache[frame_type] = handler
+            return handler
+
+    async def dispatch(
+        self, processor: "FrameProcessor", frame: Frame, direction: "FrameDirection"
+    ) -> bool:
+        """Calls the handler of the given frame, if any. Returns whether the
+        frame has been handled.
+
+        """
+        handler = self.get_handler(type(frame))
+        if handler:
+            await handler(processor, frame, direction)
+            return True
+        return False
@@ -5,8 +5,9 @@
 #
 
 import asyncio
+import time
 from enum import Enum
-from typing import Awaitable, Callable, Coroutine, Optional
+from typing import Any, Awaitable, Callable, Coroutine, Optional
 
 from loguru import logger
 
@@ -20,8 +21,11 @@ from pipecat.frames.frames import (
     StopInterruptionFrame,
     SystemFrame,
 )
-from pipecat.metrics.metrics import LLMTokenUsage, MetricsData
+from pipecat.metrics.metrics import FrameProcessorStatsMetricsData, LLMTokenUsage, MetricsData
+from pipecat.processors.frame_dispatcher import FrameDispatcher
+from pipecat.processors.frame_queue import FrameQueue, FrameQueueParams
 from pipecat.processors.metrics.frame_processor_metrics import FrameProcessorMetrics
+from pipecat.processors.metrics.frame_processor_stats import FrameProcessorStats
 from pipecat.utils.asyncio import BaseTaskManager
 from pipecat.utils.base_object import BaseObject
 
@@ -32,11 +36,15 @@ class FrameDirection(Enum):
 
 
 class FrameProcessor(BaseObject):
+    __dispatcher = FrameDispatcher()
+
     def __init__(
         self,
         *,
         name: Optional[str] = None,
         metrics: Optional[FrameProcessorMetrics] = None,
+        inline: bool = False,
+        queue_params: Optional[FrameQueueParams] = None,
         **kwargs,
     ):
         super().__init__(name=name)
@@ -68,6 +76,11 @@ class FrameProcessor(BaseObject):
         self._metrics = metrics or FrameProcessorMetrics()
         self._metrics.set_processor_name(self.name)
 
+        # Latency statistics (queue wait, processing time and queue depth). They
+        # are only collected if enabled in the StartFrame, otherwise this is
+        # None and the only overhead is checking it.
+        self._stats: Optional[FrameProcessorStats] = None
+
         # Processors have an input queue. The input queue will be processed
         # immediately (default) or it will block if `pause_processing_frames()`
         # is called. To resume processing frames we need to call
@@ -75,11 +88,46 @@ class FrameProcessor(BaseObject):
         self.__should_block_frames = False
         self.__input_event = asyncio.Event()
         self.__input_frame_task: Optional[asyncio.Task] = None
+        self.__input_frame_task_waiting = False
+        self.__input_queue: Optional[FrameQueue] = None
+
+        # Input and push queues are unbounded by default. If a high-water mark
+        # is given, frames are blocked, dropped or coalesced (depending on the
+        # frame type) when the queues are full.
+        self._queue_params = queue_params or FrameQueueParams()
 
         # Every processor in Pipecat should only output frames from a single
         # task. This avoid problems like audio overlapping. System frames are the
         # exception to this rule. This create this task.
         self.__push_frame_task: Optional[asyncio.Task] = None
+        self.__push_frame_task_waiting = False
+        self.__push_queue: Optional[FrameQueue] = None
+
+        # Inline processors don't have input or push tasks. Non-system frames
+        # are processed directly by the task that pushes them and are pushed to
+        # the next processor right away. Frames are still processed one at a
+        # time for each direction (we keep a lock per direction so upstream and
+        # downstream frames can't deadlock each other) and the lock owner is
+        # tracked so a processor can re-enter itself from the same task.
+        self._inline = inline
+        self.__inline_down_lock = asyncio.Lock()
+        self.__inline_down_owner: Optional[asyncio.Task] = None
+        self.__inline_up_lock = asyncio.Lock()
+        self.__inline_up_owner: Optional[asyncio.Task] = None
+
+        # Incremented on every interruption. Queued frames are tagged with the
+        # generation they were queued in and stale frames (i.e. queued before an
+        # interruption) are discarded when dequeued. This way we don't need to
+        # recreate queues and tasks on every interruption. Inline frames waiting
+        # to be processed are also discarded.
+        self.__generation = 0
+
+        # Set when there are no frames to push (stale frames don't count). A
+        # `StartInterruptionFrame` waits for it, so frames pushed while handling
+        # an interruption (e.g. the transcript of the interrupted bot message)
+        # are pushed before it.
+        self.__push_drained = asyncio.Event()
+        self.__push_drained.set()
 
     @property
     def id(self) -> int:
@@ -89,6 +137,10 @@ class FrameProcessor(BaseObject):
     def name(self) -> str:
         return self._name
 
+    @property
+    def inline(self) -> bool:
+        return self._inline
+
     @property
     def interruptions_allowed(self):
         return self._allow_interruptions
@@ -108,6 +160,19 @@ class FrameProcessor(BaseObject):
     def can_generate_metrics(self) -> bool:
         return False
 
+    def get_stats(self, reset: bool = False) -> Optional[FrameProcessorStatsMetricsData]:
+        """Returns the latency statistics of this processor or None if they
+        are not enabled (see `PipelineParams.enable_processor_stats`). If
+        `reset` is True, statistics start from scratch after this call.
+
+        """
+        if not self._stats:
+            return None
+        data = self._stats.to_metrics_data(self.name)
+        if reset:
+            self._stats.reset()
+        return data
+
     def set_core_metrics_data(self, data: MetricsData):
         self._metrics.set_core_metrics_data(data)
 
@@ -147,6 +212,18 @@ class FrameProcessor(BaseObject):
         await self.stop_ttfb_metrics()
         await self.stop_processing_metrics()
 
+    async def _put_frame_queue(self, queue: FrameQueue, item: Any):
+        await queue.put(item)
+        if queue.check_overflow():
+            logger.warning(
+                f"{self} {queue.name} queue is full (dropped frames: {queue.dropped}, coalesced frames: {queue.coalesced})"
+            )
+            if self.metrics_enabled:
+                frame = await self._metrics.frame_queue_metrics(
+                    queue.name, queue.dropped, queue.coalesced
+                )
+                await self.push_frame(frame)
+
     def create_task(self, coroutine: Coroutine, name: Optional[str] = None) -> asyncio.Task:
         if not self._task_manager:
             raise Exception(f"{self} TaskManager is still not initialized.")
@@ -170,12 +247,27 @@ class FrameProcessor(BaseObject):
         await super().cleanup()
         await self.__cancel_input_task()
         await self.__cancel_push_task()
+        self.__close_queues()
 
     def link(self, processor: "FrameProcessor"):
         self._next = processor
         processor._prev = self
         logger.debug(f"Linking {self} -> {self._next}")
 
+    def set_inline(self, inline: bool):
+        """Enables or disables inline mode. Inline processors process and push
+        non-system frames directly, without input or push queues. This needs
+        to be set before the pipeline is started.
+
+        Inline mode is meant for lightweight processors (filters, loggers,
+        aggregators). Processors that spend a long time inside `process_frame()`
+        (e.g. LLM services) should not be inline, because their work is done
+        by the task of the processor that pushed the frame and it will only be
+        cancelled on interruptions if that processor is not inline.
+
+        """
+        self._inline = inline
+
     def get_event_loop(self) -> asyncio.AbstractEventLoop:
         if not self._task_manager:
             raise Exception(f"{self} TaskManager is still not initialized.")
@@ -212,9 +304,19 @@ class FrameProcessor(BaseObject):
         if isinstance(frame, SystemFrame):
             # We don't want to queue system frames.
             await self.process_frame(frame, direction)
+        elif self._inline:
+            # Inline processors don't queue any frames.
+            await self.__inline_process_frame(frame, direction, callback)
         else:
             # We queue everything else.
-            await self.__input_queue.put((frame, direction, callback))
+            if self._stats:
+                self._stats.queue_depth.record(self.__input_queue.qsize())
+                enqueue_time = time.perf_counter_ns()
+            else:
+                enqueue_time = 0
+            await self._put_frame_queue(
+                self.__input_queue, (frame, direction, callback, enqueue_time, self.__generation)
+            )
 
     async def pause_processing_frames(self):
         logger.trace(f"{self}: pausing frame processing")
@@ -225,22 +327,7 @@ class FrameProcessor(BaseObject):
         self.__input_event.set()
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
-        if isinstance(frame, StartFrame):
-            self._clock = frame.clock
-            self._task_manager = frame.task_manager
-            self._allow_interruptions = frame.allow_interruptions
-            self._enable_metrics = frame.enable_metrics
-            self._enable_usage_metrics = frame.enable_usage_metrics
-            self._report_only_initial_ttfb = frame.report_only_initial_ttfb
-            self._observer = frame.observer
-            await self.__start(frame)
-        elif isinstance(frame, StartInterruptionFrame):
-            await self._start_interruption()
-            await self.stop_all_metrics()
-        elif isinstance(frame, StopInterruptionFrame):
-            self._should_report_ttfb = True
-        elif isinstance(frame, CancelFrame):
-            await self.__cancel(frame)
+        await self.__dispatcher.dispatch(self, frame, direction)
 
     async def push_error(self, error: ErrorFrame):
         await self.push_frame(error, FrameDirection.UPSTREAM)
@@ -249,12 +336,48 @@ class FrameProcessor(BaseObject):
         if not self._check_ready(frame):
             return
 
-        if isinstance(frame, SystemFrame):
+        if isinstance(frame, SystemFrame) or self._inline:
+            if isinstance(frame, StartInterruptionFrame) and not self._inline:
+                await self.__push_drained.wait()
             await self.__internal_push_frame(frame, direction)
         else:
-            await self.__push_queue.put((frame, direction))
+            if not self._cancelling:
+                self.__push_drained.clear()
+            await self._put_frame_queue(self.__push_queue, (frame, direction, self.__generation))
+
+    @__dispatcher.handler(StartFrame)
+    async def __handle_start_frame(self, frame: StartFrame, direction: FrameDirection):
+        self._clock = frame.clock
+        self._task_manager = frame.task_manager
+        self._allow_interruptions = frame.allow_interruptions
+        self._enable_metrics = frame.enable_metrics
+        self._enable_usage_metrics = frame.enable_usage_metrics
+        self._report_only_initial_ttfb = frame.report_only_initial_ttfb
+        self._observer = frame.observer
+        if frame.enable_processor_stats and not self._stats:
+            self._stats = FrameProcessorStats()
+        await self.__start(frame)
+
+    @__dispatcher.handler(StartInterruptionFrame)
+    async def __handle_start_interruption_frame(
+        self, frame: StartInterruptionFrame, direction: FrameDirection
+    ):
+        await self._start_interruption()
+        await self.stop_all_metrics()
+
+    @__dispatcher.handler(StopInterruptionFrame)
+    async def __handle_stop_interruption_frame(
+        self, frame: StopInterruptionFrame, direction: FrameDirection
+    ):
+        self._should_report_ttfb = True
+
+    @__dispatcher.handler(CancelFrame)
+    async def __handle_cancel_frame(self, frame: CancelFrame, direction: FrameDirection):
+        await self.__cancel(frame)
 
     async def __start(self, frame: StartFrame):
+        if self._inline:
+            return
         self.__create_input_task()
         self.__create_push_task()
 
@@ -262,28 +385,49 @@ class FrameProcessor(BaseObject):
         self._cancelling = True
         await self.__cancel_input_task()
         await self.__cancel_push_task()
+        self.__close_queues()
+        self.__push_drained.set()
 
     #
     # Handle interruptions
     #
 
     async def _start_interruption(self):
+        # All the frames queued so far are now stale.
+        self.__generation += 1
+        self.__push_drained.set()
+
+        # Inline processors don't have tasks.
+        if self._inline:
+            return
+
+        # Tasks that are waiting for frames can keep running, they will discard
+        # stale frames. However, tasks that are busy (e.g. processing a frame or
+        # paused) need to be cancelled to stop what they are doing.
+        restart_push_task = not self.__push_frame_task_waiting
+        restart_input_task = not self.__input_frame_task_waiting
+
         try:
             # Cancel the push frame task. This will stop pushing frames downstream.
-            await self.__cancel_push_task()
+            if restart_push_task:
+                await self.__cancel_push_task()
 
-            # Cancel the input task. This will stop processing queued frames.
-            await self.__cancel_input_task()
+            # Cancel the input task. This will stop processing the current frame.
+            if restart_input_task:
+                await self.__cancel_input_task()
         except Exception as e:
             logger.exception(f"Uncaught exception in {self}: {e}")
             await self.push_error(ErrorFrame(str(e)))
             raise
 
-        # Create a new input queue and task.
-        self.__create_input_task()
+        if restart_input_task:
+            self.__create_input_task()
+        else:
+            # Interruptions also resume paused processors.
+            self.__should_block_frames = False
 
-        # Create a new output queue and task.
-        self.__create_push_task()
+        if restart_push_task:
+            self.__create_push_task()
 
     async def _stop_interruption(self):
         # Nothing to do right now.
@@ -321,11 +465,74 @@ class FrameProcessor(BaseObject):
             return False
         return True
 
+    async def __inline_process_frame(
+        self,
+        frame: Frame,
+        direction: FrameDirection,
+        callback: Optional[Callable[["FrameProcessor", Frame, FrameDirection], Awaitable[None]]],
+    ):
+        task = asyncio.current_task()
+        downstream = direction == FrameDirection.DOWNSTREAM
+        owner = self.__inline_down_owner if downstream else self.__inline_up_owner
+
+        # We are already processing a frame in this direction from this same
+        # task (e.g. the processor queued a frame to itself), so just process it.
+        if owner == task:
+            await self.__inline_handle_frame(frame, direction, callback)
+            return
+
+        generation = self.__generation
+        async with self.__inline_down_lock if downstream else self.__inline_up_lock:
+            # An interruption happened while we were waiting for our turn.
+            if generation != self.__generation:
+                return
+
+            self.__set_inline_owner(downstream, task)
+            try:
+                await self.__inline_handle_frame(frame, direction, callback)
+            finally:
+                self.__set_inline_owner(downstream, None)
+
+    def __set_inline_owner(self, downstream: bool, task: Optional[asyncio.Task]):
+        if downstream:
+            self.__inline_down_owner = task
+        else:
+            self.__inline_up_owner = task
+
+    async def __inline_handle_frame(
+        self,
+        frame: Frame,
+        direction: FrameDirection,
+        callback: Optional[Callable[["FrameProcessor", Frame, FrameDirection], Awaitable[None]]],
+    ):
+        if self.__should_block_frames:
+            logger.trace(f"{self}: frame processing paused")
+            await self.__input_event.wait()
+            self.__input_event.clear()
+            self.__should_block_frames = False
+            logger.trace(f"{self}: frame processing resumed")
+
+        if self._stats:
+            # Note this includes the time spent by the next processors if they
+            # are also inline.
+            start_time = time.perf_counter_ns()
+            await self.process_frame(frame, direction)
+            self._stats.processing_time.record(time.perf_counter_ns() - start_time)
+        else:
+            await self.process_frame(frame, direction)
+
+        if callback:
+            await callback(self, frame, direction)
+
     def __create_input_task(self):
         if not self.__input_frame_task:
             self.__should_block_frames = False
             self.__input_event.clear()
-            self.__input_queue = asyncio.Queue()
+            if not self.__input_queue:
+                self.__input_queue = FrameQueue(
+                    "input", self._queue_params, frame_getter=lambda item: item[0]
+                )
+            self.__input_frame_task_waiting = False
             self.__input_frame_task = self.create_task(self.__input_frame_task_handler())
 
     async def __cancel_input_task(self):
@@ -342,10 +549,26 @@ class FrameProcessor(BaseObject):
                 self.__should_block_frames = False
                 logger.trace(f"{self}: frame processing resumed")
 
-            (frame, direction, callback) = await self.__input_queue.get()
+            self.__input_frame_task_waiting = True
+            item = await self.__input_queue.get()
+            self.__input_frame_task_waiting = False
+
+            (frame, direction, callback, enqueue_time, generation) = item
+
+            # Discard frames queued before an interruption.
+            if generation != self.__generation:
+                self.__input_queue.task_done()
+                continue
 
             # Process the frame.
-            await self.process_frame(frame, direction)
+            if self._stats:
+                start_time = time.perf_counter_ns()
+                if enqueue_time:
+                    self._stats.queue_wait.record(start_time - enqueue_time)
+                await self.process_frame(frame, direction)
+                self._stats.processing_time.record(time.perf_counter_ns() - start_time)
+            else:
+                await self.process_frame(frame, direction)
 
             # If this frame has an associated callback, call it now.
             if callback:
@@ -355,7 +578,11 @@ class FrameProcessor(BaseObject):
 
     def __create_push_task(self):
         if not self.__push_frame_task:
-            self.__push_queue = asyncio.Queue()
+            if not self.__push_queue:
+                self.__push_queue = FrameQueue(
+                    "push", self._queue_params, frame_getter=lambda item: item[0]
+                )
+            self.__push_frame_task_waiting = False
             self.__push_frame_task = self.create_task(self.__push_frame_task_handler())
 
     async def __cancel_push_task(self):
@@ -363,8 +590,24 @@ class FrameProcessor(BaseObject):
             await self.cancel_task(self.__push_frame_task)
             self.__push_frame_task = None
 
+    def __close_queues(self):
+        # Release any producer blocked on a bounded queue, nobody will read
+        # from these queues anymore.
+        if self.__input_queue:
+            self.__input_queue.close()
+        if self.__push_queue:
+            self.__push_queue.close()
+
     async def __push_frame_task_handler(self):
         while True:
-            (frame, direction) = await self.__push_queue.get()
-            await self.__internal_push_frame(frame, direction)
+            if self.__push_queue.empty():
+                self.__push_drained.set()
+            self.__push_frame_task_waiting = True
+            (frame, direction, generation) = await self.__push_queue.get()
+            self.__push_frame_task_waiting = False
+
+            # Discard frames pushed before an interruption.
+            if generation == self.__generation:
+                await self.__internal_push_frame(frame, direction)
+
             self.__push_queue.task_done()
@@ -0,0 +1,180 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pipecat.frames.frames import Frame, InputAudioRawFrame
+
+# Minimum time between two overflow reports of the same queue.
+OVERFLOW_REPORT_INTERVAL_SECS = 1.0
+
+
+class FrameQueuePolicy(Enum):
+    """What to do with a new frame when a bounded frame queue is full.
+
+    Attributes:
+        BLOCK: Wait until there's room in the queue.
+        DROP_OLDEST: Drop the oldest queued frame that also has this policy
+            (e.g. the oldest audio frame). If there's none, block.
+        COALESCE: Replace the newest queued frame of the same type with the new
+            frame. If there's none, block.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+class FrameQueueParams(BaseModel):
+    """Configuration parameters for frame queues.
+
+    Attributes:
+        max_size: High-water mark of the queue. Zero means unbounded.
+        default_policy: Policy for frames that don't match any entry of `policies`.
+        policies: Policy per frame type. The policy of a frame is the one of the
+            closest type in the frame's MRO. By default input audio frames are
+            dropped. Output audio frames block, since TTS services usually
+            generate audio faster than real-time and dropping it would cut the
+            bot speech.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    max_size: int = 0
+    default_policy: FrameQueuePolicy = FrameQueuePolicy.BLOCK
+    policies: Dict[Type[Frame], FrameQueuePolicy] = Field(
+        default_factory=lambda: {InputAudioRawFrame: FrameQueuePolicy.DROP_OLDEST}
+    )
+
+
+class FrameQueue(asyncio.Queue):
+    """An `asyncio.Queue` for frames with an optional high-water mark.
+
+    When the queue is full, the policy of the frame being queued (see
+    `FrameQueuePolicy`) decides whether we wait for room in the queue or we
+    drop or coalesce queued frames. Queues can contain frames or tuples that
+    contain a frame, in which case `frame_getter` needs to be provided.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        params: Optional[FrameQueueParams] = None,
+        *,
+        frame_getter: Callable[[Any], Frame] = lambda item: item,
+    ):
+        self._params = params or FrameQueueParams()
+        super().__init__(maxsize=self._params.max_size)
+        self._name = name
+        self._frame_getter = frame_getter
+        self._policy_cache: Dict[Type[Frame], FrameQueuePolicy] = {}
+        self._closed = False
+        self._dropped = 0
+        self._coalesced = 0
+        self._reported_overflows = 0
+        self._last_report_time = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    def full(self) -> bool:
+        return not self._closed and super().full()
+
+    def get_policy(self, frame_type: Type[Frame]) -> FrameQueuePolicy:
+        """Returns the policy for the given frame type."""
+        try:
+            return self._policy_cache[frame_type]
+        except KeyError:
+            policies = self._params.policies
+            policy = next(
+                (policies[t] for t in frame_type.__mro__ if t in policies),
+                self._params.default_policy,
+            )
+            self._policy_cache[frame_type] = policy
+            return policy
+
+    async def put(self, item: Any):
+        # Nobody is going to read from a closed queue.
+        if self._closed:
+            return
+        if self.full():
+            frame_type = type(self._frame_getter(item))
+            policy = self.get_policy(frame_type)
+            if policy == FrameQueuePolicy.DROP_OLDEST:
+                self._drop_oldest()
+            elif policy == FrameQueuePolicy.COALESCE and self._coalesce(item, frame_type):
+                return
+        await super().put(item)
+
+    def put_nowait(self, item: Any):
+        # `asyncio.Queue.put()` ends up here after waiting for room in the
+        # queue, which might have been closed in the meantime.
+        if self._closed:
+            return
+        super().put_nowait(item)
+
+    def close(self):
+        """Discards all the queued frames and wakes up any pending `put()`. This
+        should be called when the queue is not going to be used anymore, so
+        producers don't block forever on a queue nobody reads. Frames put in a
+        closed queue are discarded.
+
+        """
+        self._closed = True
+        while not self.empty():
+            self.get_nowait()
+            self.task_done()
+        for putter in self._putters:
+            if not putter.done():
+                putter.set_result(None)
+
+    def check_overflow(self) -> bool:
+        """Returns True if frames have been dropped or coalesced since the last
+        time it returned True. To avoid flooding the pipeline, it returns True
+        at most once per `OVERFLOW_REPORT_INTERVAL_SECS`.
+
+        """
+        overflows = self._dropped + self._coalesced
+        if overflows == self._reported_overflows:
+            return False
+        now = time.monotonic()
+        if now - self._last_report_time < OVERFLOW_REPORT_INTERVAL_SECS:
+            return False
+        self._reported_overflows = overflows
+        self._last_report_time = now
+        return True
+
+    def _drop_oldest(self):
+        for i, item in enumerate(self._queue):
+            policy = self.get_policy(type(self._frame_getter(item)))
+            if policy == FrameQueuePolicy.DROP_OLDEST:
+                del self._queue[i]
+                self.task_done()
+                self._dropped += 1
+                return
+
+    def _coalesce(self, item: Any, frame_type: Type[Frame]) -> bool:
+        for i in range(len(self._queue) - 1, -1, -1):
+            if type(self._frame_getter(self._queue[i])) is frame_type:
+                self._queue[i] = item
+                self._coalesced += 1
+                return True
+        return False
@@ -407,6 +407,31 @@ class RTVIObserver(BaseObserver):
         rtvi (FrameProcessor): The RTVI processor to push frames to.
     """
 
+    frame_types = (
+        UserStartedSpeakingFrame,
+        UserStoppedSpeakingFrame,
+        BotStartedSpeakingFrame,
+        BotStoppedSpeakingFrame,
+        TranscriptionFrame,
+        InterimTranscriptionFrame,
+        OpenAILLMContextFrame,
+        LLMFullResponseStartFrame,
+        LLMFullResponseEndFrame,
+        LLMTextFrame,
+        TTSStartedFrame,
+        TTSStoppedFrame,
+        TTSTextFrame,
+        MetricsFrame,
+        RTVIServerMessageFrame,
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses that handle more frames in `on_push_frame()` observe all
+        # frames, unless they declare the frame types they need.
+        if "on_push_frame" in vars(cls) and "frame_types" not in vars(cls):
+            cls.frame_types = ()
+
     def __init__(self, rtvi: FrameProcessor):
         super().__init__()
         self._rtvi = rtvi
@@ -10,6 +10,7 @@ from loguru import logger
 
 from pipecat.frames.frames import MetricsFrame
 from pipecat.metrics.metrics import (
+    FrameQueueMetricsData,
     LLMTokenUsage,
     LLMUsageMetricsData,
     MetricsData,
@@ -84,3 +85,12 @@ class FrameProcessorMetrics:
         )
         logger.debug(f"{self._processor_name()} usage characters: {characters.value}")
         return MetricsFrame(data=[characters])
+
+    async def frame_queue_metrics(self, queue: str, dropped: int, coalesced: int):
+        value = FrameQueueMetricsData(
+            processor=self._processor_name(), queue=queue, dropped=dropped, coalesced=coalesced
+        )
+        logger.debug(
+            f"{self._processor_name()} {queue} queue dropped frames: {dropped}, coalesced frames: {coalesced}"
+        )
+        return MetricsFrame(data=[value])
@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+from typing import List
+
+from pipecat.metrics.metrics import FrameProcessorStatsMetricsData, HistogramData
+
+# Each power of two is split in this many buckets, which gives a relative error
+# of less than 1/16 (~6%).
+SUB_BUCKET_COUNT = 16
+SUB_BUCKET_BITS = 4
+
+# Enough buckets for values up to 2^64.
+BUCKET_COUNT = (64 - SUB_BUCKET_BITS + 1) * SUB_BUCKET_COUNT
+
+
+class Histogram:
+    """A histogram of non-negative integers with logarithmic buckets.
+
+    Recording a value is O(1) and doesn't allocate, which makes it suitable
+    for per-frame measurements. Values smaller than 32 are exact, bigger values
+    have a relative error of less than 1/16.
+
+    """
+
+    def __init__(self):
+        self._buckets: List[int] = [0] * BUCKET_COUNT
+        self._count = 0
+        self._max = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    def record(self, value: int):
+        if value < 2 * SUB_BUCKET_COUNT:
+            index = max(value, 0)
+        else:
+            shift = value.bit_length() - SUB_BUCKET_BITS - 1
+            index = (shift + 1) * SUB_BUCKET_COUNT + (value >> shift) - SUB_BUCKET_COUNT
+        self._buckets[index] += 1
+        self._count += 1
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percentile: float) -> float:
+        """Returns an approximation of the given percentile (0-100)."""
+        if self._count == 0:
+            return 0.0
+        target = max(1, round(self._count * percentile / 100))
+        total = 0
+        for index, count in enumerate(self._buckets):
+            total += count
+            if total >= target:
+                return float(min(self._bucket_middle(index), self._max))
+        return float(self._max)
+
+    def reset(self):
+        self._buckets = [0] * BUCKET_COUNT
+        self._count = 0
+        self._max = 0
+
+    def _bucket_middle(self, index: int) -> float:
+        if index < 2 * SUB_BUCKET_COUNT:
+            return index
+        shift = index // SUB_BUCKET_COUNT - 1
+        low = (index % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT) << shift
+        return low + ((1 << shift) - 1) / 2
+
+
+class FrameProcessorStats:
+    """Latency statistics of a frame processor.
+
+    Queue wait is the time frames spend in the processor's input queue,
+    processing time is the time spent in `process_frame()` (system frames
+    are not included) and queue depth is the number of frames already in the
+    input queue when a frame is queued. Times are recorded in nanoseconds.
+
+    """
+
+    def __init__(self):
+        self.queue_wait = Histogram()
+        self.processing_time = Histogram()
+        self.queue_depth = Histogram()
+
+    def reset(self):
+        self.queue_wait.reset()
+        self.processing_time.reset()
+        self.queue_depth.reset()
+
+    def to_metrics_data(self, processor: str) -> FrameProcessorStatsMetricsData:
+        return FrameProcessorStatsMetricsData(
+            processor=processor,
+            queue_wait=self._histogram_data(self.queue_wait, 1_000_000_000),
+            processing_time=self._histogram_data(self.processing_time, 1_000_000_000),
+            queue_depth=self._histogram_data(self.queue_depth, 1),
+        )
+
+    def _histogram_data(self, histogram: Histogram, scale: int) -> HistogramData:
+        return HistogramData(
+            count=histogram.count,
+            p50=histogram.percentile(50) / scale,
+            p95=histogram.percentile(95) / scale,
+            p99=histogram.percentile(99) / scale,
+            max=histogram.max / scale,
+        )
@@ -5,21 +5,62 @@
 #
 
 import dataclasses
+import struct
+from typing import List, Literal, Optional
 
 from loguru import logger
+from pydantic import BaseModel
 
 import pipecat.frames.protobufs.frames_pb2 as frame_protos
 from pipecat.frames.frames import (
     Frame,
     InputAudioRawFrame,
     OutputAudioRawFrame,
+    StartInterruptionFrame,
     TextFrame,
     TranscriptionFrame,
 )
 from pipecat.serializers.base_serializer import FrameSerializer, FrameSerializerType
 
+# Opus packets are sent one after the other, each one prefixed by its size.
+_OPUS_PACKET_SIZE = struct.Struct(">H")
+
+
+def _pack_opus_packets(packets: List[bytes]) -> bytes:
+    return b"".join(_OPUS_PACKET_SIZE.pack(len(packet)) + packet for packet in packets)
+
+
+def _unpack_opus_packets(data: bytes) -> List[bytes]:
+    packets = []
+    offset = 0
+    while offset + _OPUS_PACKET_SIZE.size <= len(data):
+        (size,) = _OPUS_PACKET_SIZE.unpack_from(data, offset)
+        offset += _OPUS_PACKET_SIZE.size
+        packets.append(data[offset : offset + size])
+        offset += size
+    if offset != len(data):
+        raise ValueError("Truncated Opus payload")
+    return packets
+
 
 class ProtobufFrameSerializer(FrameSerializer):
+    """Serializes frames with Protocol Buffers (see `frames.proto`).
+
+    Audio is sent as raw 16-bit PCM by default. With `audio_codec="opus"`, the
+    audio of each frame is sent as Opus packets instead (one after the other,
+    each prefixed by its size as a big-endian 16-bit integer), which needs
+    about 10 times less bandwidth for speech. The other end needs to use Opus
+    as well. Opus keeps codec state, so use a different serializer instance for
+    each session and don't add WAV headers to the audio in the transport
+    (`add_wav_header=False`).
+
+    """
+
+    class InputParams(BaseModel):
+        audio_codec: Literal["pcm", "opus"] = "pcm"
+        opus_bitrate: int = 32000
+        opus_complexity: int = 10
+
     SERIALIZABLE_TYPES = {
         TextFrame: "text",
         OutputAudioRawFrame: "audio",
@@ -34,14 +75,30 @@ class ProtobufFrameSerializer(FrameSerializer):
     }
     DESERIALIZABLE_FIELDS = {v: k for k, v in DESERIALIZABLE_TYPES.items()}
 
-    def __init__(self):
-        pass
+    def __init__(self, params: Optional[InputParams] = None):
+        self._params = params or ProtobufFrameSerializer.InputParams()
+
+        # Output and input audio are different streams, so they need their own
+        # codec.
+        self._encoder = None
+        self._decoder = None
+        if self._params.audio_codec == "opus":
+            from pipecat.audio.opus import OpusStreamDecoder, OpusStreamEncoder
+
+            self._encoder = OpusStreamEncoder(
+                bitrate=self._params.opus_bitrate, complexity=self._params.opus_complexity
+            )
+            self._decoder = OpusStreamDecoder()
 
     @property
     def type(self) -> FrameSerializerType:
         return FrameSerializerType.BINARY
 
     async def serialize(self, frame: Frame) -> str | bytes | None:
+        if isinstance(frame, StartInterruptionFrame) and self._encoder:
+            # Don't send audio buffered before the interruption.
+            self._encoder.reset()
+
         proto_frame = frame_protos.Frame()
         if type(frame) not in self.SERIALIZABLE_TYPES:
             logger.warning(f"Frame type {type(frame)} is not serializable")
@@ -50,10 +107,19 @@ class ProtobufFrameSerializer(FrameSerializer):
         # ignoring linter errors; we check that type(frame) is in this dict above
         proto_optional_name = self.SERIALIZABLE_TYPES[type(frame)]  # type: ignore
         proto_attr = getattr(proto_frame, proto_optional_name)
-        for field in dataclasses.fields(frame):  # type: ignore
-            value = getattr(frame, field.name)
-            if value and hasattr(proto_attr, field.name):
-                setattr(proto_attr, field.name, value)
+        # `name` is not a dataclass field (it's created lazily), so we add it.
+        field_names = ["name"] + [field.name for field in dataclasses.fields(frame)]  # type: ignore
+        for field_name in field_names:
+            value = getattr(frame, field_name)
+            if value and hasattr(proto_attr, field_name):
+                setattr(proto_attr, field_name, value)
+
+        if isinstance(frame, OutputAudioRawFrame) and self._encoder:
+            packets = await self._encoder.encode(frame.audio, frame.sample_rate, frame.num_channels)
+            # Not enough audio for an Opus frame yet.
+            if not packets:
+                return None
+            proto_attr.audio = _pack_opus_packets(packets)
 
         return proto_frame.SerializeToString()
 
@@ -70,6 +136,19 @@ class ProtobufFrameSerializer(FrameSerializer):
         for field in proto.DESCRIPTOR.fields_by_name[which].message_type.fields:
             args_dict[field.name] = getattr(args, field.name)
 
+        if which == "audio" and self._decoder:
+            try:
+                audio = [
+                    await self._decoder.decode(
+                        packet, args_dict["sample_rate"], args_dict["num_channels"]
+                    )
+                    for packet in _unpack_opus_packets(args_dict["audio"])
+                ]
+                args_dict["audio"] = b"".join(audio)
+            except Exception as e:
+                logger.error(f"Unable to decode Opus audio: {e}")
+                return None
+
         # Remove special fields if needed
         id = getattr(args, "id", None)
         name = getattr(args, "name", None)
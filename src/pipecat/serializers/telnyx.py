@@ -10,13 +10,7 @@ from typing import Optional
 
 from pydantic import BaseModel
 
-from pipecat.audio.utils import (
-    alaw_to_pcm,
-    create_default_resampler,
-    pcm_to_alaw,
-    pcm_to_ulaw,
-    ulaw_to_pcm,
-)
+from pipecat.audio.g711 import G711StreamDecoder, G711StreamEncoder
 from pipecat.frames.frames import (
     AudioRawFrame,
     Frame,
@@ -28,6 +22,8 @@ from pipecat.frames.frames import (
 )
 from pipecat.serializers.base_serializer import FrameSerializer, FrameSerializerType
 
+TELNYX_G711_LAWS = {"PCMU": "ulaw", "PCMA": "alaw"}
+
 
 class TelnyxFrameSerializer(FrameSerializer):
     class InputParams(BaseModel):
@@ -51,7 +47,15 @@ class TelnyxFrameSerializer(FrameSerializer):
         self._telnyx_sample_rate = self._params.telnyx_sample_rate
         self._sample_rate = 0  # Pipeline input rate
 
-        self._resampler = create_default_resampler()
+        # Input and output audio are different streams, so they need their
+        # own codec (which also resamples). Unsupported encodings will fail
+        # when audio is (de)serialized.
+        self._decoder = None
+        self._encoder = None
+        if self._params.outbound_encoding in TELNYX_G711_LAWS:
+            self._decoder = G711StreamDecoder(TELNYX_G711_LAWS[self._params.outbound_encoding])
+        if self._params.inbound_encoding in TELNYX_G711_LAWS:
+            self._encoder = G711StreamEncoder(TELNYX_G711_LAWS[self._params.inbound_encoding])
 
     @property
     def type(self) -> FrameSerializerType:
@@ -65,17 +69,13 @@ class TelnyxFrameSerializer(FrameSerializer):
             data = frame.audio
 
             # Output: Convert PCM at frame's rate to 8kHz encoded for Telnyx
-            if self._params.inbound_encoding == "PCMU":
-                serialized_data = await pcm_to_ulaw(
-                    data, frame.sample_rate, self._telnyx_sample_rate, self._resampler
-                )
-            elif self._params.inbound_encoding == "PCMA":
-                serialized_data = await pcm_to_alaw(
-                    data, frame.sample_rate, self._telnyx_sample_rate, self._resampler
-                )
-            else:
+            if not self._encoder:
                 raise ValueError(f"Unsupported encoding: {self._params.inbound_encoding}")
 
+            serialized_data = await self._encoder.encode(
+                data, frame.sample_rate, self._telnyx_sample_rate
+            )
+
             payload = base64.b64encode(serialized_data).decode("utf-8")
             answer = {
                 "event": "media",
@@ -85,6 +85,8 @@ class TelnyxFrameSerializer(FrameSerializer):
             return json.dumps(answer)
 
         if isinstance(frame, StartInterruptionFrame):
+            if self._encoder:
+                self._encoder.reset()
             answer = {"event": "clear"}
             return json.dumps(answer)
 
@@ -96,23 +98,13 @@ class TelnyxFrameSerializer(FrameSerializer):
             payload = base64.b64decode(payload_base64)
 
             # Input: Convert Telnyx's 8kHz encoded audio to PCM at pipeline input rate
-            if self._params.outbound_encoding == "PCMU":
-                deserialized_data = await ulaw_to_pcm(
-                    payload,
-                    self._telnyx_sample_rate,
-                    self._sample_rate,
-                    self._resampler,
-                )
-            elif self._params.outbound_encoding == "PCMA":
-                deserialized_data = await alaw_to_pcm(
-                    payload,
-                    self._telnyx_sample_rate,
-                    self._sample_rate,
-                    self._resampler,
-                )
-            else:
+            if not self._decoder:
                 raise ValueError(f"Unsupported encoding: {self._params.outbound_encoding}")
 
+            deserialized_data = await self._decoder.decode(
+                payload, self._telnyx_sample_rate, self._sample_rate
+            )
+
             audio_frame = InputAudioRawFrame(
                 audio=deserialized_data, num_channels=1, sample_rate=self._sample_rate
             )
@@ -8,13 +8,27 @@ import asyncio
 import io
 import wave
 from abc import abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type
+from typing import (
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 from loguru import logger
 
 from pipecat.adapters.base_llm_adapter import BaseLLMAdapter
 from pipecat.adapters.services.open_ai_adapter import OpenAILLMAdapter
+from pipecat.audio.ring_buffer import AudioRingBuffer
 from pipecat.frames.frames import (
     AudioRawFrame,
     BotStartedSpeakingFrame,
@@ -32,6 +46,7 @@ from pipecat.frames.frames import (
     StartInterruptionFrame,
     STTMuteFrame,
     STTUpdateSettingsFrame,
+    SystemFrame,
     TextFrame,
     TranscriptionFrame,
     TTSAudioRawFrame,
@@ -47,9 +62,12 @@ from pipecat.frames.frames import (
 )
 from pipecat.metrics.metrics import MetricsData
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+from pipecat.processors.frame_dispatcher import FrameDispatcher
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.tts_cache import TTSAudioCache
 from pipecat.services.websocket_service import WebsocketService
 from pipecat.transcriptions.language import Language
+from pipecat.utils.executors import IO_POOL
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator
 from pipecat.utils.text.base_text_filter import BaseTextFilter
 from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
@@ -375,6 +393,8 @@ class LLMService(AIService):
 
 
 class TTSService(AIService):
+    __dispatcher = FrameDispatcher()
+
     def __init__(
         self,
         *,
@@ -399,6 +419,13 @@ class TTSService(AIService):
         # Text filter executed after text has been aggregated.
         text_filters: Sequence[BaseTextFilter] = [],
         text_filter: Optional[BaseTextFilter] = None,
+        # Number of sentences to synthesize ahead (i.e. concurrently) while the
+        # audio of the current one is pushed. Only for services that yield all
+        # their frames from run_tts() (e.g. HTTP services). 0 disables it.
+        synthesis_lookahead: int = 0,
+        # Cache of synthesized audio, it can be shared by many services. Only
+        # for services that yield their audio from run_tts().
+        audio_cache: Optional[TTSAudioCache] = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -429,6 +456,17 @@ class TTSService(AIService):
         self._stop_frame_task: Optional[asyncio.Task] = None
         self._stop_frame_queue: asyncio.Queue = asyncio.Queue()
 
+        # Synthesis lookahead. Requests run in their own tasks and the
+        # synthesis task pushes their frames (and any frame pushed after them)
+        # in order.
+        self._synthesis_lookahead = synthesis_lookahead
+        self._synthesis_task: Optional[asyncio.Task] = None
+        self._synthesis_queue: Optional[asyncio.Queue] = None
+        self._synthesis_requests: Deque[asyncio.Task] = deque()
+        self._synthesis_slots: Optional[asyncio.Semaphore] = None
+
+        self._audio_cache = audio_cache
+
         self._processing_text: bool = False
 
     @property
@@ -460,6 +498,7 @@ class TTSService(AIService):
         self._sample_rate = self._init_sample_rate or frame.audio_out_sample_rate
         if self._push_stop_frames and not self._stop_frame_task:
             self._stop_frame_task = self.create_task(self._stop_frame_handler())
+        self._create_synthesis_task()
 
     async def stop(self, frame: EndFrame):
         await super().stop(frame)
@@ -472,6 +511,7 @@ class TTSService(AIService):
         if self._stop_frame_task:
             await self.cancel_task(self._stop_frame_task)
             self._stop_frame_task = None
+        await self._cancel_synthesis_task()
 
     async def _update_settings(self, settings: Mapping[str, Any]):
         for key, value in settings.items():
@@ -495,47 +535,66 @@ class TTSService(AIService):
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
+        await self.__dispatcher.dispatch(self, frame, direction)
 
-        if (
-            isinstance(frame, TextFrame)
-            and not isinstance(frame, InterimTranscriptionFrame)
-            and not isinstance(frame, TranscriptionFrame)
-        ):
-            await self._process_text_frame(frame)
-        elif isinstance(frame, StartInterruptionFrame):
-            await self._handle_interruption(frame, direction)
-            await self.push_frame(frame, direction)
-        elif isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
-            # We pause processing incoming frames if the LLM response included
-            # text (it might be that it's only a function calling response). We
-            # pause to avoid audio overlapping.
-            await self._maybe_pause_frame_processing()
-
-            sentence = self._text_aggregator.text
-            self._text_aggregator.reset()
-            self._processing_text = False
-            await self._push_tts_frames(sentence)
-            if isinstance(frame, LLMFullResponseEndFrame):
-                if self._push_text_frames:
-                    await self.push_frame(frame, direction)
-            else:
-                await self.push_frame(frame, direction)
-        elif isinstance(frame, TTSSpeakFrame):
-            # Store if we were processing text or not so we can set it back.
-            processing_text = self._processing_text
-            await self._push_tts_frames(frame.text)
-            # We pause processing incoming frames because we are sending data to
-            # the TTS. We pause to avoid audio overlapping.
-            await self._maybe_pause_frame_processing()
-            await self.flush_audio()
-            self._processing_text = processing_text
-        elif isinstance(frame, TTSUpdateSettingsFrame):
-            await self._update_settings(frame.settings)
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            await self._maybe_resume_frame_processing()
-            await self.push_frame(frame, direction)
+    @__dispatcher.handler(TextFrame)
+    async def __handle_text_frame(self, frame: TextFrame, direction: FrameDirection):
+        await self._process_text_frame(frame)
+
+    @__dispatcher.handler(StartInterruptionFrame)
+    async def __handle_start_interruption_frame(
+        self, frame: StartInterruptionFrame, direction: FrameDirection
+    ):
+        await self._handle_interruption(frame, direction)
+        await self.push_frame(frame, direction)
+
+    @__dispatcher.handler(LLMFullResponseEndFrame, EndFrame)
+    async def __handle_end_frame(self, frame: Frame, direction: FrameDirection):
+        # We pause processing incoming frames if the LLM response included
+        # text (it might be that it's only a function calling response). We
+        # pause to avoid audio overlapping.
+        await self._maybe_pause_frame_processing()
+
+        sentence = self._text_aggregator.text
+        self._text_aggregator.reset()
+        self._processing_text = False
+        await self._push_tts_frames(sentence)
+        if isinstance(frame, LLMFullResponseEndFrame):
+            if self._push_text_frames:
+                await self._push_frame_in_order(frame, direction)
         else:
-            await self.push_frame(frame, direction)
+            await self._push_frame_in_order(frame, direction)
+            # Wait for the pending audio to be pushed before stopping.
+            await self._stop_synthesis_task()
+
+    @__dispatcher.handler(TTSSpeakFrame)
+    async def __handle_tts_speak_frame(self, frame: TTSSpeakFrame, direction: FrameDirection):
+        # Store if we were processing text or not so we can set it back.
+        processing_text = self._processing_text
+        await self._push_tts_frames(frame.text)
+        # We pause processing incoming frames because we are sending data to
+        # the TTS. We pause to avoid audio overlapping.
+        await self._maybe_pause_frame_processing()
+        await self.flush_audio()
+        self._processing_text = processing_text
+
+    @__dispatcher.handler(TTSUpdateSettingsFrame)
+    async def __handle_update_settings_frame(
+        self, frame: TTSUpdateSettingsFrame, direction: FrameDirection
+    ):
+        await self._update_settings(frame.settings)
+
+    @__dispatcher.handler(BotStoppedSpeakingFrame)
+    async def __handle_bot_stopped_speaking_frame(
+        self, frame: BotStoppedSpeakingFrame, direction: FrameDirection
+    ):
+        await self._maybe_resume_frame_processing()
+        await self.push_frame(frame, direction)
+
+    # Transcriptions are text frames but they are not meant to be spoken.
+    @__dispatcher.handler(Frame, InterimTranscriptionFrame, TranscriptionFrame)
+    async def __handle_frame(self, frame: Frame, direction: FrameDirection):
+        await self._push_frame_in_order(frame, direction)
 
     async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
         if self._push_silence_after_stop and isinstance(frame, TTSStoppedFrame):
@@ -563,6 +622,10 @@ class TTSService(AIService):
         self._text_aggregator.handle_interruption()
         for filter in self._text_filters:
             filter.handle_interruption()
+        # Discard the requests in flight.
+        if self._synthesis_task:
+            await self._cancel_synthesis_task()
+            self._create_synthesis_task()
 
     async def _maybe_pause_frame_processing(self):
         if self._processing_text and self._pause_frame_processing:
@@ -596,14 +659,18 @@ class TTSService(AIService):
         # or when we received an LLMFullResponseEndFrame
         self._processing_text = True
 
-        await self.start_processing_metrics()
-
         # Process all filter.
         for filter in self._text_filters:
             filter.reset_interruption()
             text = filter.filter(text)
 
-        await self.process_generator(self.run_tts(text))
+        if self._synthesis_task:
+            await self._queue_synthesis(text)
+            return
+
+        await self.start_processing_metrics()
+
+        await self.process_generator(self._run_tts_cached(text))
 
         await self.stop_processing_metrics()
 
@@ -612,6 +679,140 @@ class TTSService(AIService):
             # interrupted, the text is not added to the assistant context.
             await self.push_frame(TTSTextFrame(text))
 
+    async def _run_tts_cached(self, text: str) -> AsyncGenerator[Frame, None]:
+        """Runs `run_tts()` unless the audio for the text is in the audio cache
+        (if any). Audio is only cached if synthesis completes without errors.
+
+        """
+        if not self._audio_cache:
+            async for frame in self.run_tts(text):
+                yield frame
+            return
+
+        key = TTSAudioCache.audio_key(
+            text=text,
+            service=type(self).__name__,
+            voice=self._voice_id,
+            model=self.model_name,
+            sample_rate=self.sample_rate,
+            settings=self._settings,
+        )
+        executor = self.get_task_manager().get_executor(IO_POOL)
+
+        audio = await self._audio_cache.get(key, executor)
+        if audio is not None:
+            logger.debug(f"{self}: Using cached TTS [{text}]")
+            await self.start_ttfb_metrics()
+            yield TTSStartedFrame()
+            # Same chunks as output transports (20ms). The view keeps the cache
+            # from closing memory-mapped audio while we replay it.
+            chunk_size = self.sample_rate // 50 * 2
+            with memoryview(audio) as view:
+                for i in range(0, len(view), chunk_size):
+                    await self.stop_ttfb_metrics()
+                    yield TTSAudioRawFrame(
+                        audio=view[i : i + chunk_size].tobytes(),
+                        sample_rate=self.sample_rate,
+                        num_channels=1,
+                    )
+            yield TTSStoppedFrame()
+            return
+
+        buffer = bytearray()
+        cacheable = True
+        async for frame in self.run_tts(text):
+            if isinstance(frame, TTSAudioRawFrame):
+                if frame.sample_rate == self.sample_rate and frame.num_channels == 1:
+                    buffer.extend(frame.audio)
+                else:
+                    cacheable = False
+            elif isinstance(frame, ErrorFrame):
+                cacheable = False
+            yield frame
+
+        if cacheable and buffer:
+            await self._audio_cache.put(key, bytes(buffer), executor)
+
+    async def _push_frame_in_order(
+        self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM
+    ):
+        """Pushes the frame after the audio of the text sent to the TTS so far
+        (if synthesis lookahead is enabled).
+
+        """
+        if (
+            self._synthesis_task
+            and direction == FrameDirection.DOWNSTREAM
+            and not isinstance(frame, SystemFrame)
+        ):
+            await self._synthesis_queue.put(frame)
+        else:
+            await self.push_frame(frame, direction)
+
+    def _create_synthesis_task(self):
+        if self._synthesis_lookahead > 0 and not self._synthesis_task:
+            self._synthesis_queue = asyncio.Queue()
+            # The request being pushed and the ones ahead.
+            self._synthesis_slots = asyncio.Semaphore(self._synthesis_lookahead + 1)
+            self._synthesis_task = self.create_task(self._synthesis_task_handler())
+
+    async def _cancel_synthesis_task(self):
+        if self._synthesis_task:
+            await self.cancel_task(self._synthesis_task)
+            self._synthesis_task = None
+        while self._synthesis_requests:
+            await self.cancel_task(self._synthesis_requests.popleft())
+
+    async def _stop_synthesis_task(self):
+        if self._synthesis_task:
+            await self._synthesis_queue.put(None)
+            await self.wait_for_task(self._synthesis_task)
+            self._synthesis_task = None
+
+    async def _queue_synthesis(self, text: str):
+        # Wait if there are already enough requests ahead.
+        await self._synthesis_slots.acquire()
+        frames = asyncio.Queue()
+        request = self.create_task(self._synthesis_request_handler(text, frames))
+        self._synthesis_requests.append(request)
+        await self._synthesis_queue.put((text, frames))
+
+    async def _synthesis_request_handler(self, text: str, frames: asyncio.Queue):
+        try:
+            async for frame in self._run_tts_cached(text):
+                if frame:
+                    await frames.put(frame)
+        except Exception as e:
+            logger.exception(f"{self} error generating TTS: {e}")
+            await frames.put(ErrorFrame(str(e)))
+        finally:
+            await frames.put(None)
+
+    async def _synthesis_task_handler(self):
+        while True:
+            item = await self._synthesis_queue.get()
+            if item is None:
+                break
+            if isinstance(item, Frame):
+                await self.push_frame(item)
+                continue
+
+            text, frames = item
+            await self.start_processing_metrics()
+            while (frame := await frames.get()) is not None:
+                if isinstance(frame, ErrorFrame):
+                    await self.push_error(frame)
+                else:
+                    await self.push_frame(frame)
+            await self.stop_processing_metrics()
+
+            request = self._synthesis_requests.popleft()
+            await self.wait_for_task(request)
+            self._synthesis_slots.release()
+
+            if self._push_text_frames:
+                await self.push_frame(TTSTextFrame(text))
+
     async def _stop_frame_handler(self):
         has_started = False
         while True:
@@ -1031,7 +1232,7 @@ class SegmentedSTTService(STTService):
         super().__init__(sample_rate=sample_rate, **kwargs)
         self._content = None
         self._wave = None
-        self._audio_buffer = bytearray()
+        self._audio_buffer = AudioRingBuffer()
         self._audio_buffer_size_1s = 0
         self._user_speaking = False
 
@@ -1063,7 +1264,7 @@ class SegmentedSTTService(STTService):
         wav.setsampwidth(2)
         wav.setnchannels(1)
         wav.setframerate(self.sample_rate)
-        wav.writeframes(self._audio_buffer)
+        wav.writeframes(self._audio_buffer.view())
         wav.close()
         content.seek(0)
 
@@ -1074,12 +1275,12 @@ class SegmentedSTTService(STTService):
 
     async def process_audio_frame(self, frame: AudioRawFrame, direction: FrameDirection):
         # If the user is speaking the audio buffer will keep growing.
-        self._audio_buffer += frame.audio
+        self._audio_buffer.write(frame.audio)
 
         # If the user is not speaking we keep just a little bit of audio.
         if not self._user_speaking and len(self._audio_buffer) > self._audio_buffer_size_1s:
             discarded = len(self._audio_buffer) - self._audio_buffer_size_1s
-            self._audio_buffer = self._audio_buffer[discarded:]
+            self._audio_buffer.discard(discarded)
 
 
 class ImageGenService(AIService):
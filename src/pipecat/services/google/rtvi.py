@@ -27,6 +27,8 @@ class RTVIBotLLMSearchResponseMessage(BaseModel):
 
 
 class GoogleRTVIObserver(RTVIObserver):
+    frame_types = RTVIObserver.frame_types + (LLMSearchResponseFrame,)
+
     def __init__(self, rtvi: FrameProcessor):
         super().__init__(rtvi)
 
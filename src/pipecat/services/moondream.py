@@ -4,7 +4,6 @@
 # SPDX-License-Identifier: BSD 2-Clause License
 #
 
-import asyncio
 from typing import AsyncGenerator
 
 from loguru import logger
@@ -12,6 +11,7 @@ from PIL import Image
 
 from pipecat.frames.frames import ErrorFrame, Frame, TextFrame, VisionImageRawFrame
 from pipecat.services.ai_services import VisionService
+from pipecat.utils.executors import MODEL_INFERENCE_POOL
 
 try:
     import torch
@@ -80,6 +80,10 @@ class MoondreamService(VisionService):
             )
             return description
 
-        description = await asyncio.to_thread(get_image_description, frame)
+        description = await self.get_event_loop().run_in_executor(
+            self.get_task_manager().get_executor(MODEL_INFERENCE_POOL),
+            get_image_description,
+            frame,
+        )
 
         yield TextFrame(text=description)
@@ -93,7 +93,7 @@ class SimliVideoService(FrameProcessor):
             # Send audio frame to Simli
             try:
                 old_frame = AudioFrame.from_ndarray(
-                    np.frombuffer(frame.audio, dtype=np.int16)[None, :],
+                    frame.samples[None, :],
                     layout="mono" if frame.num_channels == 1 else "stereo",
                 )
                 old_frame.sample_rate = frame.sample_rate
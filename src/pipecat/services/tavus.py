@@ -12,7 +12,7 @@ import base64
 import aiohttp
 from loguru import logger
 
-from pipecat.audio.utils import create_default_resampler
+from pipecat.audio.utils import create_stream_resampler
 from pipecat.frames.frames import (
     CancelFrame,
     EndFrame,
@@ -49,7 +49,7 @@ class TavusVideoService(AIService):
 
         self._conversation_id: str
 
-        self._resampler = create_default_resampler()
+        self._resampler = create_stream_resampler()
 
     async def initialize(self) -> str:
         url = "https://tavusapi.com/v2/conversations"
@@ -110,10 +110,15 @@ class TavusVideoService(AIService):
         elif isinstance(frame, TTSAudioRawFrame):
             await self._encode_audio_and_send(frame.audio, frame.sample_rate, done=False)
         elif isinstance(frame, TTSStoppedFrame):
+            # Send the audio still kept by the resampler.
+            audio = await self._resampler.flush()
+            if audio:
+                await self._encode_audio_and_send(audio, self._sample_rate, done=False)
             await self._encode_audio_and_send(b"\x00", self._sample_rate, done=True)
             await self.stop_ttfb_metrics()
             await self.stop_processing_metrics()
         elif isinstance(frame, StartInterruptionFrame):
+            self._resampler.reset()
             await self._send_interrupt_message()
         else:
             await self.push_frame(frame, direction)
@@ -0,0 +1,258 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Cache of synthesized TTS audio.
+
+Bots say the same things over and over (greetings, fillers, confirmations,
+menu prompts...), and each of them is synthesized again every time. A
+`TTSAudioCache` keeps the synthesized audio (16-bit PCM) so TTS services can
+replay it instead (see the `audio_cache` argument of `TTSService`). The same
+cache can be shared by the TTS services of every session in the process.
+
+Audio is kept in memory (least recently used audio is evicted when the memory
+budget is exceeded) and, optionally, on disk as raw PCM files that are
+memory-mapped when read, so they survive restarts and are shared with other
+processes using the same directory. The disk budget is enforced with the files
+found when the cache first writes to disk plus the files it writes itself.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Union
+
+from loguru import logger
+
+CachedAudio = Union[bytes, mmap.mmap]
+
+
+@dataclass
+class TTSAudioCacheStats:
+    """Statistics of a TTS audio cache.
+
+    Parameters:
+        memory_hits: Number of lookups found in memory.
+        disk_hits: Number of lookups found on disk.
+        misses: Number of lookups not found.
+        entries: Number of entries in memory.
+        memory_bytes: Size of the audio in memory.
+
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    memory_bytes: int = 0
+
+
+class TTSAudioCache:
+    """Synthesized audio cache with an in-memory LRU tier and an optional disk
+    tier.
+
+    Entries are looked up by a key that identifies the synthesized audio (see
+    `audio_key()`). Disk files are read and written in the given executor
+    (or the default one), everything else runs in the event loop.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+    ):
+        self._max_memory_bytes = max_memory_bytes
+        self._disk_dir = disk_dir
+        self._max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict[str, CachedAudio] = OrderedDict()
+        self._stats = TTSAudioCacheStats()
+        # Size of the disk files (least recently used first), only tracked if
+        # there's a disk budget. Files are read and written in executor
+        # threads, so this needs a lock.
+        self._disk_files: Optional[OrderedDict[str, int]] = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def audio_key(
+        *,
+        text: str,
+        service: str,
+        voice: str,
+        model: str,
+        sample_rate: int,
+        settings: Mapping[str, Any],
+    ) -> str:
+        """Returns the key of the audio synthesized for the given text with
+        the given service and settings. Text is normalized, so texts that only
+        differ in whitespace share the same audio.
+
+        """
+        text = " ".join(unicodedata.normalize("NFC", text).split())
+        data = json.dumps(
+            [text, service, voice, model, sample_rate, settings], sort_keys=True, default=str
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def stats(self) -> TTSAudioCacheStats:
+        return TTSAudioCacheStats(
+            memory_hits=self._stats.memory_hits,
+            disk_hits=self._stats.disk_hits,
+            misses=self._stats.misses,
+            entries=len(self._entries),
+            memory_bytes=self._stats.memory_bytes,
+        )
+
+    async def get(self, key: str, executor: Optional[Executor] = None) -> Optional[CachedAudio]:
+        """Returns the cached audio for the given key, or None. Audio from
+        disk is memory-mapped.
+
+        """
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+            self._stats.memory_hits += 1
+            return audio
+
+        if self._disk_dir:
+            loop = asyncio.get_running_loop()
+            audio = await loop.run_in_executor(executor, self._read_file, key)
+            if audio is not None:
+                self._stats.disk_hits += 1
+                self._add_entry(key, audio)
+                return audio
+
+        self._stats.misses += 1
+        return None
+
+    async def put(self, key: str, audio: bytes, executor: Optional[Executor] = None):
+        """Stores the audio for the given key."""
+        self._add_entry(key, audio)
+
+        if self._disk_dir:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor, self._write_file, key, audio)
+
+    def clear(self):
+        """Clears the in-memory entries. Disk files are kept."""
+        for audio in self._entries.values():
+            _close_audio(audio)
+        self._entries.clear()
+        self._stats.memory_bytes = 0
+
+    def _add_entry(self, key: str, audio: CachedAudio):
+        if len(audio) > self._max_memory_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._stats.memory_bytes -= len(previous)
+            if previous is not audio:
+                _close_audio(previous)
+
+        self._entries[key] = audio
+        self._stats.memory_bytes += len(audio)
+
+        while self._stats.memory_bytes > self._max_memory_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._stats.memory_bytes -= len(evicted)
+            _close_audio(evicted)
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self._disk_dir, f"{key}.pcm")
+
+    def _read_file(self, key: str) -> Optional[mmap.mmap]:
+        path = self._file_path(key)
+        try:
+            with open(path, "rb") as f:
+                audio = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            # Used recently, so it's evicted last (also by other processes).
+            os.utime(path)
+            with self._disk_lock:
+                if self._disk_files is not None and key in self._disk_files:
+                    self._disk_files.move_to_end(key)
+            return audio
+        except (FileNotFoundError, ValueError):
+            # ValueError: empty file.
+            return None
+        except OSError as e:
+            logger.warning(f"Unable to read TTS cache file {path}: {e}")
+            return None
+
+    def _write_file(self, key: str, audio: bytes):
+        path = self._file_path(key)
+        try:
+            # A unique temporary file per write, so concurrent writes of the
+            # same audio don't write the same file and readers never see
+            # partially written files.
+            fd, tmp_path = tempfile.mkstemp(dir=self._disk_dir, suffix=".tmp")
+        except OSError as e:
+            logger.warning(f"Unable to write TTS cache file {path}: {e}")
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Unable to write TTS cache file {path}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return
+
+        if self._max_disk_bytes is not None:
+            self._add_file(key, len(audio))
+
+    def _add_file(self, key: str, size: int):
+        with self._disk_lock:
+            if self._disk_files is None:
+                self._disk_files = self._scan_files()
+                self._disk_bytes = sum(self._disk_files.values())
+
+            previous = self._disk_files.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous
+            self._disk_files[key] = size
+            self._disk_bytes += size
+
+            while self._disk_bytes > self._max_disk_bytes and self._disk_files:
+                evicted, evicted_size = self._disk_files.popitem(last=False)
+                self._disk_bytes -= evicted_size
+                with contextlib.suppress(OSError):
+                    os.remove(self._file_path(evicted))
+
+    def _scan_files(self) -> OrderedDict[str, int]:
+        files = []
+        with os.scandir(self._disk_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pcm"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[: -len(".pcm")], stat.st_size))
+
+        # Least recently used first.
+        return OrderedDict((key, size) for _, key, size in sorted(files))
+
+
+def _close_audio(audio: CachedAudio):
+    if isinstance(audio, mmap.mmap):
+        try:
+            audio.close()
+        except BufferError:
+            # Still being replayed. It's closed when it's released.
+            pass
@@ -6,16 +6,16 @@
 
 """This module implements Whisper transcription with a locally-downloaded model."""
 
-import asyncio
 from enum import Enum
 from typing import AsyncGenerator, Optional
 
-import numpy as np
 from loguru import logger
 
+from pipecat.audio.samples import float32_samples
 from pipecat.frames.frames import ErrorFrame, Frame, TranscriptionFrame
 from pipecat.services.ai_services import SegmentedSTTService
 from pipecat.transcriptions.language import Language
+from pipecat.utils.executors import MODEL_INFERENCE_POOL
 from pipecat.utils.time import time_now_iso8601
 
 try:
@@ -327,12 +327,18 @@ class WhisperSTTService(SegmentedSTTService):
         await self.start_processing_metrics()
         await self.start_ttfb_metrics()
 
-        # Divide by 32768 because we have signed 16-bit data.
-        audio_float = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        audio_float = float32_samples(audio)
 
         whisper_lang = self.language_to_service_language(self._settings["language"])
-        segments, _ = await asyncio.to_thread(
-            self._model.transcribe, audio_float, language=whisper_lang
+
+        def transcribe():
+            segments, _ = self._model.transcribe(audio_float, language=whisper_lang)
+            # Segments are generated lazily (i.e. while iterating them), so
+            # iterate them here too.
+            return list(segments)
+
+        segments = await self.get_event_loop().run_in_executor(
+            self.get_task_manager().get_executor(MODEL_INFERENCE_POOL), transcribe
         )
         text: str = ""
         for segment in segments:
@@ -9,7 +9,7 @@ from typing import Any, AsyncGenerator, Dict, Optional
 import aiohttp
 from loguru import logger
 
-from pipecat.audio.utils import create_default_resampler
+from pipecat.audio.utils import create_stream_resampler
 from pipecat.frames.frames import (
     ErrorFrame,
     Frame,
@@ -89,8 +89,6 @@ class XTTSService(TTSService):
         self._studio_speakers: Optional[Dict[str, Any]] = None
         self._aiohttp_session = aiohttp_session
 
-        self._resampler = create_default_resampler()
-
     def can_generate_metrics(self) -> bool:
         return True
 
@@ -150,6 +148,10 @@ class XTTSService(TTSService):
 
             yield TTSStartedFrame()
 
+            # Each request gets its own resampler, so requests can run
+            # concurrently (see `synthesis_lookahead`).
+            resampler = create_stream_resampler()
+
             CHUNK_SIZE = 1024
 
             buffer = bytearray()
@@ -169,18 +171,19 @@ class XTTSService(TTSService):
                         buffer = buffer[48000:]
 
                         # XTTS uses 24000 so we need to resample to our desired rate.
-                        resampled_audio = await self._resampler.resample(
+                        resampled_audio = await resampler.resample(
                             bytes(process_data), 24000, self.sample_rate
                         )
                         # Create the frame with the resampled audio
                         frame = TTSAudioRawFrame(resampled_audio, self.sample_rate, 1)
                         yield frame
 
-            # Process any remaining data in the buffer.
+            # Process any remaining data in the buffer and the resampler.
+            resampled_audio = b""
             if len(buffer) > 0:
-                resampled_audio = await self._resampler.resample(
-                    bytes(buffer), 24000, self.sample_rate
-                )
+                resampled_audio = await resampler.resample(bytes(buffer), 24000, self.sample_rate)
+            resampled_audio += await resampler.flush()
+            if len(resampled_audio) > 0:
                 frame = TTSAudioRawFrame(resampled_audio, self.sample_rate, 1)
                 yield frame
 
@@ -5,11 +5,12 @@
 #
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor
 from typing import Optional
 
 from loguru import logger
 
+from pipecat.audio.input_chain import AudioInputChain
 from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADState
 from pipecat.frames.frames import (
     BotInterruptionFrame,
@@ -23,16 +24,19 @@ from pipecat.frames.frames import (
     StartFrame,
     StartInterruptionFrame,
     StopInterruptionFrame,
-    SystemFrame,
     UserStartedSpeakingFrame,
     UserStoppedSpeakingFrame,
     VADParamsUpdateFrame,
 )
+from pipecat.processors.frame_dispatcher import FrameDispatcher
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.transports.base_transport import TransportParams
+from pipecat.utils.executors import CPU_AUDIO_POOL
 
 
 class BaseInputTransport(FrameProcessor):
+    __dispatcher = FrameDispatcher()
+
     def __init__(self, params: TransportParams, **kwargs):
         super().__init__(**kwargs)
 
@@ -42,8 +46,12 @@ class BaseInputTransport(FrameProcessor):
         self._sample_rate = 0
 
         # We read audio from a single queue one at a time and we then run VAD in
-        # a thread. Therefore, only one thread should be necessary.
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # a thread of the pipeline task's CPU audio pool (shared with other
+        # sessions). It will be initialized on StartFrame.
+        self._executor: Optional[Executor] = None
+
+        # Audio filter and VAD, created when needed.
+        self._audio_input_chain: Optional[AudioInputChain] = None
 
         # Task to process incoming audio (VAD) and push audio frames downstream
         # if passthrough is enabled.
@@ -66,6 +74,7 @@ class BaseInputTransport(FrameProcessor):
 
     async def start(self, frame: StartFrame):
         self._sample_rate = self._params.audio_in_sample_rate or frame.audio_in_sample_rate
+        self._executor = self.get_task_manager().get_executor(CPU_AUDIO_POOL)
 
         # Configure VAD analyzer.
         if self._params.vad_enabled and self._params.vad_analyzer:
@@ -103,42 +112,73 @@ class BaseInputTransport(FrameProcessor):
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
+        await self.__dispatcher.dispatch(self, frame, direction)
+
+    # Specific system frames
+
+    @__dispatcher.handler(StartFrame)
+    async def __handle_start_frame(self, frame: StartFrame, direction: FrameDirection):
+        # Push StartFrame before start(), because we want StartFrame to be
+        # processed by every processor before any other frame is processed.
+        await self.push_frame(frame, direction)
+        await self.start(frame)
+
+    @__dispatcher.handler(CancelFrame)
+    async def __handle_cancel_frame(self, frame: CancelFrame, direction: FrameDirection):
+        await self.cancel(frame)
+        await self.push_frame(frame, direction)
+
+    @__dispatcher.handler(BotInterruptionFrame)
+    async def __handle_bot_interruption_frame(
+        self, frame: BotInterruptionFrame, direction: FrameDirection
+    ):
+        await self._handle_bot_interruption(frame)
+
+    @__dispatcher.handler(EmulateUserStartedSpeakingFrame)
+    async def __handle_emulate_user_started_speaking_frame(
+        self, frame: EmulateUserStartedSpeakingFrame, direction: FrameDirection
+    ):
+        logger.debug("Emulating user started speaking")
+        await self._handle_user_interruption(UserStartedSpeakingFrame(emulated=True))
+
+    @__dispatcher.handler(EmulateUserStoppedSpeakingFrame)
+    async def __handle_emulate_user_stopped_speaking_frame(
+        self, frame: EmulateUserStoppedSpeakingFrame, direction: FrameDirection
+    ):
+        logger.debug("Emulating user stopped speaking")
+        await self._handle_user_interruption(UserStoppedSpeakingFrame(emulated=True))
+
+    # Control frames
+
+    @__dispatcher.handler(EndFrame)
+    async def __handle_end_frame(self, frame: EndFrame, direction: FrameDirection):
+        # Push EndFrame before stop(), because stop() waits on the task to
+        # finish and the task finishes when EndFrame is processed.
+        await self.push_frame(frame, direction)
+        await self.stop(frame)
+
+    @__dispatcher.handler(VADParamsUpdateFrame)
+    async def __handle_vad_params_update_frame(
+        self, frame: VADParamsUpdateFrame, direction: FrameDirection
+    ):
+        if self.vad_analyzer:
+            self.vad_analyzer.set_params(frame.params)
 
-        # Specific system frames
-        if isinstance(frame, StartFrame):
-            # Push StartFrame before start(), because we want StartFrame to be
-            # processed by every processor before any other frame is processed.
-            await self.push_frame(frame, direction)
-            await self.start(frame)
-        elif isinstance(frame, CancelFrame):
-            await self.cancel(frame)
-            await self.push_frame(frame, direction)
-        elif isinstance(frame, BotInterruptionFrame):
-            await self._handle_bot_interruption(frame)
-        elif isinstance(frame, EmulateUserStartedSpeakingFrame):
-            logger.debug("Emulating user started speaking")
-            await self._handle_user_interruption(UserStartedSpeakingFrame(emulated=True))
-        elif isinstance(frame, EmulateUserStoppedSpeakingFrame):
-            logger.debug("Emulating user stopped speaking")
-            await self._handle_user_interruption(UserStoppedSpeakingFrame(emulated=True))
-        # All other system frames
-        elif isinstance(frame, SystemFrame):
-            await self.push_frame(frame, direction)
-        # Control frames
-        elif isinstance(frame, EndFrame):
-            # Push EndFrame before stop(), because stop() waits on the task to
-            # finish and the task finishes when EndFrame is processed.
-            await self.push_frame(frame, direction)
-            await self.stop(frame)
-        elif isinstance(frame, VADParamsUpdateFrame):
-            if self.vad_analyzer:
-                self.vad_analyzer.set_params(frame.params)
-        elif isinstance(frame, FilterUpdateSettingsFrame) and self._params.audio_in_filter:
+    @__dispatcher.handler(FilterUpdateSettingsFrame)
+    async def __handle_filter_update_settings_frame(
+        self, frame: FilterUpdateSettingsFrame, direction: FrameDirection
+    ):
+        if self._params.audio_in_filter:
             await self._params.audio_in_filter.process_frame(frame)
-        # Other frames
         else:
             await self.push_frame(frame, direction)
 
+    # All other frames (including system frames)
+
+    @__dispatcher.handler(Frame)
+    async def __handle_frame(self, frame: Frame, direction: FrameDirection):
+        await self.push_frame(frame, direction)
+
     #
     # Handle interruptions
     #
@@ -171,16 +211,22 @@ class BaseInputTransport(FrameProcessor):
     # Audio input
     #
 
-    async def _vad_analyze(self, audio_frame: InputAudioRawFrame) -> VADState:
-        state = VADState.QUIET
-        if self.vad_analyzer:
-            state = await self.get_event_loop().run_in_executor(
-                self._executor, self.vad_analyzer.analyze_audio, audio_frame.audio
+    def _get_audio_input_chain(self) -> AudioInputChain:
+        # The VAD analyzer might be set after the transport starts (e.g. if
+        # it's created by the transport), so check if the chain is outdated.
+        vad_analyzer = self.vad_analyzer if self._params.vad_enabled else None
+        audio_filter = self._params.audio_in_filter
+        if (
+            not self._audio_input_chain
+            or self._audio_input_chain.vad_analyzer is not vad_analyzer
+            or self._audio_input_chain.audio_filter is not audio_filter
+        ):
+            self._audio_input_chain = AudioInputChain(
+                audio_filter=audio_filter, vad_analyzer=vad_analyzer
             )
-        return state
+        return self._audio_input_chain
 
-    async def _handle_vad(self, audio_frame: InputAudioRawFrame, vad_state: VADState):
-        new_vad_state = await self._vad_analyze(audio_frame)
+    async def _handle_vad(self, new_vad_state: VADState, vad_state: VADState) -> VADState:
         if (
             new_vad_state != vad_state
             and new_vad_state != VADState.STARTING
@@ -205,14 +251,16 @@ class BaseInputTransport(FrameProcessor):
 
             audio_passthrough = True
 
-            # If an audio filter is available, run it before VAD.
-            if self._params.audio_in_filter:
-                frame.audio = await self._params.audio_in_filter.filter(frame.audio)
+            # Run the audio filter (if any) and then VAD (usually in a single
+            # executor job).
+            frame.audio, new_vad_state = await self._get_audio_input_chain().process(
+                frame.audio, self._executor
+            )
 
             # Check VAD and push event if necessary. We just care about
             # changes from QUIET to SPEAKING and vice versa.
             if self._params.vad_enabled:
-                vad_state = await self._handle_vad(frame, vad_state)
+                vad_state = await self._handle_vad(new_vad_state or VADState.QUIET, vad_state)
                 audio_passthrough = self._params.vad_audio_passthrough
 
             # Push audio downstream if passthrough.
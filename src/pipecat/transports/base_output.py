@@ -8,12 +8,13 @@ import asyncio
 import itertools
 import sys
 import time
-from typing import AsyncGenerator, List
+from typing import AsyncGenerator, List, Optional, Type
 
 from loguru import logger
 from PIL import Image
 
-from pipecat.audio.utils import create_default_resampler
+from pipecat.audio.ring_buffer import AudioRingBuffer
+from pipecat.audio.utils import create_stream_resampler
 from pipecat.frames.frames import (
     BotSpeakingFrame,
     BotStartedSpeakingFrame,
@@ -32,15 +33,21 @@ from pipecat.frames.frames import (
     TransportMessageFrame,
     TransportMessageUrgentFrame,
     TTSAudioRawFrame,
+    TTSStoppedFrame,
 )
+from pipecat.processors.frame_dispatcher import FrameDispatcher
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.processors.frame_queue import FrameQueue
 from pipecat.transports.base_transport import TransportParams
+from pipecat.utils.asyncio import wait_for
 from pipecat.utils.time import nanoseconds_to_seconds
 
 BOT_VAD_STOP_SECS = 0.3
 
 
 class BaseOutputTransport(FrameProcessor):
+    __dispatcher = FrameDispatcher()
+
     def __init__(self, params: TransportParams, **kwargs):
         super().__init__(**kwargs)
 
@@ -48,9 +55,18 @@ class BaseOutputTransport(FrameProcessor):
 
         # Task to process incoming frames so we don't block upstream elements.
         self._sink_task = None
+        self._sink_task_waiting = False
+        self._sink_queue: Optional[FrameQueue] = None
 
         # Task to process incoming frames using a clock.
         self._sink_clock_task = None
+        self._sink_clock_task_waiting = False
+        self._sink_clock_queue: Optional[asyncio.PriorityQueue] = None
+
+        # Incremented on every interruption. Frames in the sink and camera
+        # queues are tagged with the generation they were queued in, so stale
+        # frames are discarded when dequeued instead of recreating the queues.
+        self._sink_generation = 0
 
         # Task to write/send audio and image frames.
         self._camera_out_task = None
@@ -61,11 +77,11 @@ class BaseOutputTransport(FrameProcessor):
 
         # Output sample rate. It will be initialized on StartFrame.
         self._sample_rate = 0
-        self._resampler = create_default_resampler()
+        self._resampler = create_stream_resampler()
 
         # Chunk size that will be written. It will be computed on StartFrame
         self._audio_chunk_size = 0
-        self._audio_buffer = bytearray()
+        self._audio_buffer = AudioRingBuffer()
 
         self._stopped_event = asyncio.Event()
 
@@ -92,8 +108,8 @@ class BaseOutputTransport(FrameProcessor):
 
     async def stop(self, frame: EndFrame):
         # Let the sink tasks process the queue until they reach this EndFrame.
-        await self._sink_clock_queue.put((sys.maxsize, frame.id, frame))
-        await self._sink_queue.put(frame)
+        await self._sink_clock_queue.put((sys.maxsize, frame.id, frame, self._sink_generation))
+        await self._queue_sink_frame(frame)
 
         # At this point we have enqueued an EndFrame and we need to wait for
         # that EndFrame to be processed by the sink tasks. We also need to wait
@@ -134,58 +150,106 @@ class BaseOutputTransport(FrameProcessor):
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
+        await self.__dispatcher.dispatch(self, frame, direction)
 
-        #
-        # System frames (like StartInterruptionFrame) are pushed
-        # immediately. Other frames require order so they are put in the sink
-        # queue.
-        #
-        if isinstance(frame, StartFrame):
-            # Push StartFrame before start(), because we want StartFrame to be
-            # processed by every processor before any other frame is processed.
-            await self.push_frame(frame, direction)
-            await self.start(frame)
-        elif isinstance(frame, CancelFrame):
-            await self.cancel(frame)
-            await self.push_frame(frame, direction)
-        elif isinstance(frame, (StartInterruptionFrame, StopInterruptionFrame)):
-            await self.push_frame(frame, direction)
-            await self._handle_interruptions(frame)
-        elif isinstance(frame, TransportMessageUrgentFrame):
-            await self.send_message(frame)
-        elif isinstance(frame, SystemFrame):
-            await self.push_frame(frame, direction)
-        # Control frames.
-        elif isinstance(frame, EndFrame):
-            await self.stop(frame)
-            # Keep pushing EndFrame down so all the pipeline stops nicely.
-            await self.push_frame(frame, direction)
-        elif isinstance(frame, MixerControlFrame) and self._params.audio_out_mixer:
+    #
+    # System frames (like StartInterruptionFrame) are pushed immediately. Other
+    # frames require order so they are put in the sink queue.
+    #
+
+    @__dispatcher.handler(StartFrame)
+    async def __handle_start_frame(self, frame: StartFrame, direction: FrameDirection):
+        # Push StartFrame before start(), because we want StartFrame to be
+        # processed by every processor before any other frame is processed.
+        await self.push_frame(frame, direction)
+        await self.start(frame)
+
+    @__dispatcher.handler(CancelFrame)
+    async def __handle_cancel_frame(self, frame: CancelFrame, direction: FrameDirection):
+        await self.cancel(frame)
+        await self.push_frame(frame, direction)
+
+    @__dispatcher.handler(StartInterruptionFrame, StopInterruptionFrame)
+    async def __handle_interruption_frame(self, frame: Frame, direction: FrameDirection):
+        await self.push_frame(frame, direction)
+        await self._handle_interruptions(frame)
+
+    @__dispatcher.handler(TransportMessageUrgentFrame)
+    async def __handle_urgent_message_frame(
+        self, frame: TransportMessageUrgentFrame, direction: FrameDirection
+    ):
+        await self.send_message(frame)
+
+    @__dispatcher.handler(SystemFrame)
+    async def __handle_system_frame(self, frame: SystemFrame, direction: FrameDirection):
+        await self.push_frame(frame, direction)
+
+    # Control frames.
+
+    @__dispatcher.handler(EndFrame)
+    async def __handle_end_frame(self, frame: EndFrame, direction: FrameDirection):
+        await self.stop(frame)
+        # Keep pushing EndFrame down so all the pipeline stops nicely.
+        await self.push_frame(frame, direction)
+
+    @__dispatcher.handler(MixerControlFrame)
+    async def __handle_mixer_control_frame(
+        self, frame: MixerControlFrame, direction: FrameDirection
+    ):
+        if self._params.audio_out_mixer:
             await self._params.audio_out_mixer.process_frame(frame)
-        # Other frames.
-        elif isinstance(frame, OutputAudioRawFrame):
-            await self._handle_audio(frame)
-        elif isinstance(frame, (OutputImageRawFrame, SpriteFrame)):
-            await self._handle_image(frame)
+        else:
+            await self.__handle_frame(frame, direction)
+
+    @__dispatcher.handler(TTSStoppedFrame)
+    async def __handle_tts_stopped_frame(self, frame: TTSStoppedFrame, direction: FrameDirection):
+        # The resampler might still have the end of the bot audio.
+        if direction == FrameDirection.DOWNSTREAM:
+            await self._flush_audio()
+        await self.__handle_frame(frame, direction)
+
+    # Other frames.
+
+    @__dispatcher.handler(OutputAudioRawFrame)
+    async def __handle_audio_frame(self, frame: OutputAudioRawFrame, direction: FrameDirection):
+        await self._handle_audio(frame)
+
+    @__dispatcher.handler(OutputImageRawFrame, SpriteFrame)
+    async def __handle_image_frame(
+        self, frame: OutputImageRawFrame | SpriteFrame, direction: FrameDirection
+    ):
+        await self._handle_image(frame)
+
+    @__dispatcher.handler(Frame)
+    async def __handle_frame(self, frame: Frame, direction: FrameDirection):
         # TODO(aleix): Images and audio should support presentation timestamps.
-        elif frame.pts:
-            await self._sink_clock_queue.put((frame.pts, frame.id, frame))
+        if frame.pts:
+            await self._sink_clock_queue.put((frame.pts, frame.id, frame, self._sink_generation))
         elif direction == FrameDirection.UPSTREAM:
             await self.push_frame(frame, direction)
         else:
-            await self._sink_queue.put(frame)
+            await self._queue_sink_frame(frame)
 
     async def _handle_interruptions(self, frame: Frame):
         if not self.interruptions_allowed:
             return
 
         if isinstance(frame, StartInterruptionFrame):
-            # Cancel sink and camera tasks.
-            await self._cancel_sink_tasks()
-            await self._cancel_camera_task()
-            # Create sink and camera tasks.
-            self._create_camera_task()
+            # Discard everything queued so far.
+            self._sink_generation += 1
+            self._resampler.reset()
+            # Sink tasks that are waiting for frames keep running, but if they
+            # are busy (e.g. writing audio or waiting for a frame timestamp) we
+            # need to stop them right away.
+            if self._sink_task and not self._sink_task_waiting:
+                await self.cancel_task(self._sink_task)
+                self._sink_task = None
+            if self._sink_clock_task and not self._sink_clock_task_waiting:
+                await self.cancel_task(self._sink_clock_task)
+                self._sink_clock_task = None
             self._create_sink_tasks()
+            # Start live camera timing from scratch.
+            self._camera_out_start_time = None
             # Let's send a bot stopped speaking if we have to.
             await self._bot_stopped_speaking()
 
@@ -198,26 +262,31 @@ class BaseOutputTransport(FrameProcessor):
         resampled = await self._resampler.resample(
             frame.audio, frame.sample_rate, self._sample_rate
         )
+        await self._queue_audio(resampled, type(frame), frame.num_channels)
+
+    async def _flush_audio(self):
+        if not self._params.audio_out_enabled:
+            return
 
-        cls = type(frame)
-        self._audio_buffer.extend(resampled)
-        while len(self._audio_buffer) >= self._audio_chunk_size:
+        audio = await self._resampler.flush()
+        await self._queue_audio(audio, TTSAudioRawFrame, self._params.audio_out_channels)
+
+    async def _queue_audio(self, audio: bytes, cls: Type[OutputAudioRawFrame], num_channels: int):
+        self._audio_buffer.write(audio)
+        for audio_chunk in self._audio_buffer.chunks(self._audio_chunk_size):
             chunk = cls(
-                bytes(self._audio_buffer[: self._audio_chunk_size]),
-                sample_rate=self._sample_rate,
-                num_channels=frame.num_channels,
+                bytes(audio_chunk), sample_rate=self._sample_rate, num_channels=num_channels
             )
-            await self._sink_queue.put(chunk)
-            self._audio_buffer = self._audio_buffer[self._audio_chunk_size :]
+            await self._queue_sink_frame(chunk)
 
     async def _handle_image(self, frame: OutputImageRawFrame | SpriteFrame):
         if not self._params.camera_out_enabled:
             return
 
         if self._params.camera_out_is_live:
-            await self._camera_out_queue.put(frame)
+            await self._camera_out_queue.put((frame, self._sink_generation))
         else:
-            await self._sink_queue.put(frame)
+            await self._queue_sink_frame(frame)
 
     async def _bot_started_speaking(self):
         if not self._bot_speaking:
@@ -233,19 +302,29 @@ class BaseOutputTransport(FrameProcessor):
             await self.push_frame(BotStoppedSpeakingFrame(), FrameDirection.UPSTREAM)
             self._bot_speaking = False
             # Clean audio buffer (there could be tiny left overs if not multiple
-            # to our output chunk size).
-            self._audio_buffer = bytearray()
+            # to our output chunk size) and resampler.
+            self._audio_buffer.clear()
+            self._resampler.reset()
 
     #
     # Sink tasks
     #
 
+    async def _queue_sink_frame(self, frame: Frame):
+        await self._put_frame_queue(self._sink_queue, (frame, self._sink_generation))
+
     def _create_sink_tasks(self):
         if not self._sink_task:
-            self._sink_queue = asyncio.Queue()
+            if not self._sink_queue:
+                self._sink_queue = FrameQueue(
+                    "sink", self._params.audio_out_queue_params, frame_getter=lambda item: item[0]
+                )
+            self._sink_task_waiting = False
             self._sink_task = self.create_task(self._sink_task_handler())
         if not self._sink_clock_task:
-            self._sink_clock_queue = asyncio.PriorityQueue()
+            if not self._sink_clock_queue:
+                self._sink_clock_queue = asyncio.PriorityQueue()
+            self._sink_clock_task_waiting = False
             self._sink_clock_task = self.create_task(self._sink_clock_task_handler())
 
     async def _cancel_sink_tasks(self):
@@ -253,6 +332,9 @@ class BaseOutputTransport(FrameProcessor):
         if self._sink_task:
             await self.cancel_task(self._sink_task)
             self._sink_task = None
+        if self._sink_queue:
+            self._sink_queue.close()
+            self._sink_queue = None
         # Stop sink clock tasks.
         if self._sink_clock_task:
             await self.cancel_task(self._sink_clock_task)
@@ -270,15 +352,18 @@ class BaseOutputTransport(FrameProcessor):
         running = True
         while running:
             try:
-                timestamp, _, frame = await self._sink_clock_queue.get()
+                self._sink_clock_task_waiting = True
+                timestamp, _, frame, generation = await self._sink_clock_queue.get()
+                self._sink_clock_task_waiting = False
 
                 # If we hit an EndFrame, we can finish right away.
                 running = not isinstance(frame, EndFrame)
 
                 # If we have a frame we check it's presentation timestamp. If it
                 # has already passed we process it, otherwise we wait until it's
-                # time to process it.
-                if running:
+                # time to process it. Frames queued before an interruption are
+                # discarded.
+                if running and generation == self._sink_generation:
                     current_time = self.get_clock().get_time()
                     if timestamp > current_time:
                         wait_time = nanoseconds_to_seconds(timestamp - current_time)
@@ -300,9 +385,16 @@ class BaseOutputTransport(FrameProcessor):
         async def without_mixer(vad_stop_secs: float) -> AsyncGenerator[Frame, None]:
             while True:
                 try:
-                    frame = await asyncio.wait_for(self._sink_queue.get(), timeout=vad_stop_secs)
-                    yield frame
+                    self._sink_task_waiting = True
+                    frame, generation = await wait_for(
+                        self._sink_queue.get(), timeout=vad_stop_secs
+                    )
+                    self._sink_task_waiting = False
+                    # Discard frames queued before an interruption.
+                    if generation == self._sink_generation:
+                        yield frame
                 except asyncio.TimeoutError:
+                    self._sink_task_waiting = False
                     # Notify the bot stopped speaking upstream if necessary.
                     await self._bot_stopped_speaking()
 
@@ -311,7 +403,10 @@ class BaseOutputTransport(FrameProcessor):
             silence = b"\x00" * self._audio_chunk_size
             while True:
                 try:
-                    frame = self._sink_queue.get_nowait()
+                    frame, generation = self._sink_queue.get_nowait()
+                    # Discard frames queued before an interruption.
+                    if generation != self._sink_generation:
+                        continue
                     if isinstance(frame, OutputAudioRawFrame):
                         frame.audio = await self._params.audio_out_mixer.mix(frame.audio)
                     last_frame_time = time.time()
@@ -408,7 +503,12 @@ class BaseOutputTransport(FrameProcessor):
                 await asyncio.sleep(self._camera_out_frame_duration)
 
     async def _camera_out_is_live_handler(self):
-        image = await self._camera_out_queue.get()
+        image, generation = await self._camera_out_queue.get()
+
+        # Discard images queued before an interruption.
+        if generation != self._sink_generation:
+            self._camera_out_queue.task_done()
+            return
 
         # We get the start time as soon as we get the first image.
         if not self._camera_out_start_time:
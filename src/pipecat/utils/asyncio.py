@@ -6,10 +6,35 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Coroutine, Optional, Set
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Coroutine, Optional, Set
 
 from loguru import logger
 
+from pipecat.utils.executors import ExecutorService, get_default_executor_service
+
+
+async def wait_for(aw: Awaitable, timeout: Optional[float]) -> Any:
+    """Same as `asyncio.wait_for()` but it never swallows the cancellation of
+    the calling task.
+
+    Before Python 3.12, if the calling task is cancelled right when the
+    awaitable completes, `asyncio.wait_for()` returns the result and the
+    cancellation is lost. Tasks that wait on busy queues in a loop (where
+    `get()` completes immediately) would then never finish.
+
+    """
+    future = asyncio.ensure_future(aw)
+    try:
+        done, _ = await asyncio.wait({future}, timeout=timeout)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    if not done:
+        future.cancel()
+        raise asyncio.TimeoutError()
+    return future.result()
+
 
 class BaseTaskManager(ABC):
     @abstractmethod
@@ -73,11 +98,30 @@ class BaseTaskManager(ABC):
         """Returns the list of currently created/registered tasks."""
         pass
 
+    @abstractmethod
+    def set_executor_service(self, executor_service: ExecutorService):
+        pass
+
+    @abstractmethod
+    def get_executor_service(self) -> ExecutorService:
+        pass
+
+    @abstractmethod
+    def get_executor(self, pool: str) -> Executor:
+        """Returns an executor to run blocking work in the given pool of the
+        executor service (e.g. `CPU_AUDIO_POOL`). Work submitted through it is
+        scheduled fairly with the work of other task managers (i.e. other
+        sessions) sharing the same pool.
+
+        """
+        pass
+
 
 class TaskManager(BaseTaskManager):
-    def __init__(self) -> None:
+    def __init__(self, executor_service: Optional[ExecutorService] = None) -> None:
         self._tasks: Set[asyncio.Task] = set()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor_service = executor_service
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
@@ -183,6 +227,19 @@ class TaskManager(BaseTaskManager):
         """Returns the list of currently created/registered tasks."""
         return self._tasks
 
+    def set_executor_service(self, executor_service: ExecutorService):
+        self._executor_service = executor_service
+
+    def get_executor_service(self) -> ExecutorService:
+        if not self._executor_service:
+            self._executor_service = get_default_executor_service()
+        return self._executor_service
+
+    def get_executor(self, pool: str) -> Executor:
+        # This task manager is the session, so its work takes turns with the
+        # work of other sessions.
+        return self.get_executor_service().executor(pool, self)
+
     def _add_task(self, task: asyncio.Task):
         self._tasks.add(task)
 
@@ -0,0 +1,271 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Bounded thread pools for blocking work, shared by all the sessions (i.e.
+pipeline tasks) in a process.
+
+Blocking work (e.g. VAD, local model inference, reading files) shouldn't run
+in the event loop. Creating a thread pool per session (or using the default
+`asyncio` executor for everything) means the number of threads grows with the
+number of sessions, or that a single busy session can delay everyone else.
+
+An `ExecutorService` keeps a few named pools (see `CPU_AUDIO_POOL`,
+`MODEL_INFERENCE_POOL` and `IO_POOL`) with a fixed number of threads. Each
+session submits work through its own `concurrent.futures.Executor` (see
+`ExecutorPool.executor()`), and pools run the queued work of every session in
+turns (round-robin), so a session with a lot of work queued doesn't starve
+the others. A session runs one work item at a time, so work of the same
+session runs in the order it was submitted and never concurrently.
+"""
+
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Mapping, Optional, Set, Tuple
+
+from loguru import logger
+
+# Short CPU-bound audio work (VAD, filters, resampling).
+CPU_AUDIO_POOL = "cpu-audio"
+# Local model inference (e.g. Whisper, Moondream).
+MODEL_INFERENCE_POOL = "model-inference"
+# Blocking I/O (e.g. reading files).
+IO_POOL = "io"
+
+
+def default_pool_sizes() -> Dict[str, int]:
+    cpu_count = os.cpu_count() or 1
+    return {
+        CPU_AUDIO_POOL: cpu_count,
+        MODEL_INFERENCE_POOL: max(1, cpu_count // 2),
+        IO_POOL: min(32, cpu_count + 4),
+    }
+
+
+@dataclass
+class ExecutorPoolStats:
+    """Statistics of an executor pool.
+
+    Parameters:
+        name: The name of the pool.
+        max_workers: The number of threads of the pool.
+        queued: The number of work items waiting for a thread.
+        running: The number of work items currently running.
+        completed: The number of work items finished so far (including
+            cancelled ones).
+        sessions: The number of sessions with queued work.
+
+    """
+
+    name: str
+    max_workers: int
+    queued: int
+    running: int
+    completed: int
+    sessions: int
+
+
+_WorkItem = Tuple[Future, Callable, Tuple[Any, ...], Dict[str, Any]]
+
+
+class ExecutorPool:
+    """A pool with a fixed number of threads shared by many sessions.
+
+    Work is queued per session and sessions take turns, so it's fair across
+    sessions. Each session runs at most one work item at a time. Threads are
+    only created when needed.
+
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        if max_workers <= 0:
+            raise ValueError(f"Invalid number of workers for pool {name}: {max_workers}")
+        self._name = name
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        # Sessions with queued work, in the order they will run.
+        self._queues: OrderedDict[Hashable, Deque[_WorkItem]] = OrderedDict()
+        # Sessions with a work item running.
+        self._busy_sessions: Set[Hashable] = set()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._shutdown = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def queue_depth(self) -> int:
+        """Returns the number of work items waiting for a thread."""
+        return self._queued
+
+    def stats(self) -> ExecutorPoolStats:
+        with self._lock:
+            return ExecutorPoolStats(
+                name=self._name,
+                max_workers=self._max_workers,
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+                sessions=len(self._queues),
+            )
+
+    def executor(self, session: Hashable) -> Executor:
+        """Returns an executor that submits work to this pool on behalf of the
+        given session. It can be used with `loop.run_in_executor()`.
+
+        """
+        return _SessionExecutor(self, session)
+
+    def submit(self, session: Hashable, fn: Callable, /, *args, **kwargs) -> Future:
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(f"Executor pool {self._name} is shut down")
+            queue = self._queues.get(session)
+            if queue is None:
+                queue = self._queues[session] = deque()
+            queue.append((future, fn, args, kwargs))
+            self._queued += 1
+            self._dispatch()
+        return future
+
+    def shutdown(self, wait: bool = True):
+        """Stops the pool. Queued work that didn't start is cancelled."""
+        with self._lock:
+            self._shutdown = True
+            queues = list(self._queues.values())
+            self._queues.clear()
+            self._queued = 0
+        for queue in queues:
+            for future, _, _, _ in queue:
+                future.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _dispatch(self):
+        # Needs to be called with the lock held. Only submits work when there's
+        # an idle thread, so the underlying executor never queues anything and
+        # we decide what runs next.
+        while self._running < self._max_workers:
+            # The first session without work running (at most `max_workers`
+            # sessions are skipped).
+            for session, queue in self._queues.items():
+                if session not in self._busy_sessions:
+                    break
+            else:
+                return
+            item = queue.popleft()
+            if queue:
+                # Other sessions go first next time.
+                self._queues.move_to_end(session)
+            else:
+                del self._queues[session]
+            self._queued -= 1
+            self._running += 1
+            self._busy_sessions.add(session)
+            self._executor.submit(self._run, session, item)
+
+    def _run(self, session: Hashable, item: _WorkItem):
+        future, fn, args, kwargs = item
+        if not future.set_running_or_notify_cancel():
+            result = exception = None
+        else:
+            try:
+                result, exception = fn(*args, **kwargs), None
+            except BaseException as e:
+                result, exception = None, e
+
+        # Update statistics before the result is available, so they are up to
+        # date for whoever is waiting for it.
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+            self._busy_sessions.discard(session)
+            if not self._shutdown:
+                self._dispatch()
+
+        if future.cancelled():
+            return
+        if exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+class _SessionExecutor(Executor):
+    def __init__(self, pool: ExecutorPool, session: Hashable):
+        self._pool = pool
+        self._session = session
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        return self._pool.submit(self._session, fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        # The pool is shared, it's shut down by its executor service.
+        pass
+
+
+class ExecutorService:
+    """Named executor pools for blocking work.
+
+    By default all the pipeline tasks in the process share the same service
+    (see `get_default_executor_service()`). Pool sizes can be configured by
+    creating a new service and passing it to `PipelineRunner` or `TaskManager`.
+
+    """
+
+    def __init__(self, pool_sizes: Optional[Mapping[str, int]] = None):
+        sizes = default_pool_sizes()
+        sizes.update(pool_sizes or {})
+        self._pools = {name: ExecutorPool(name, size) for name, size in sizes.items()}
+
+    def get_pool(self, name: str) -> ExecutorPool:
+        if name not in self._pools:
+            raise ValueError(
+                f"Unknown executor pool: {name} (available: {', '.join(self._pools.keys())})"
+            )
+        return self._pools[name]
+
+    def executor(self, name: str, session: Hashable) -> Executor:
+        """Returns an executor that submits work to the given pool on behalf of
+        the given session.
+
+        """
+        return self.get_pool(name).executor(session)
+
+    def stats(self) -> Dict[str, ExecutorPoolStats]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    def shutdown(self, wait: bool = True):
+        for pool in self._pools.values():
+            pool.shutdown(wait)
+
+
+_default_executor_service: Optional[ExecutorService] = None
+_default_executor_service_lock = threading.Lock()
+
+
+def get_default_executor_service() -> ExecutorService:
+    """Returns the executor service shared by all the pipeline tasks in the
+    process (unless they are given a different one).
+
+    """
+    global _default_executor_service
+
+    with _default_executor_service_lock:
+        if not _default_executor_service:
+            _default_executor_service = ExecutorService()
+            logger.debug(f"Created default executor service: {default_pool_sizes()}")
+        return _default_executor_service
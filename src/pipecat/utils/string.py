@@ -26,6 +26,14 @@ EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 
 NUMBER_PATTERN = re.compile(r"[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?")
 
+# Emails and numbers are only made of these characters.
+_EMAIL_OR_NUMBER_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-@"
+)
+
+# The longest lookbehind in ENDOFSENTENCE_PATTERN ("Prof").
+_ENDOFSENTENCE_LOOKBEHIND = 4
+
 StartEndTags = Tuple[str, str]
 
 
@@ -50,6 +58,10 @@ def replace_match(text: str, match: re.Match, old: str, new: str) -> str:
     return text
 
 
+def _mask_dots(match: re.Match) -> str:
+    return match.group(0).replace(".", "&")
+
+
 def match_endofsentence(text: str) -> int:
     """Finds the position of the end of a sentence in the provided text string.
 
@@ -65,23 +77,66 @@ def match_endofsentence(text: str) -> int:
         int: The position of the end of the sentence if found, otherwise 0.
 
     """
-    text = text.rstrip()
+    return EndOfSentenceScanner().scan(text)
 
-    # Replace email dots by ampersands so we can find the end of sentence. For
-    # example, first.last@email.com becomes first&last@email&com.
-    emails = list(EMAIL_PATTERN.finditer(text))
-    for email_match in emails:
-        text = replace_match(text, email_match, ".", "&")
 
-    # Replace number dots by ampersands so we can find the end of sentence.
-    numbers = list(NUMBER_PATTERN.finditer(text))
-    for number_match in numbers:
-        text = replace_match(text, number_match, ".", "&")
+class EndOfSentenceScanner:
+    """Finds the end of a sentence in text that grows over time (e.g. text
+    streamed by an LLM), only looking at the new text on each call.
 
-    # Match against the new text.
-    match = ENDOFSENTENCE_PATTERN.search(text)
+    `scan()` returns the same as `match_endofsentence()`, as long as the text
+    passed to it only grows (i.e. it's the previously scanned text plus new
+    text). Call `reset()` when the text changes in any other way (e.g. after
+    removing a sentence from the beginning).
+
+    This works because text that had no end of sentence can only get one in
+    the new text: the lookbehinds of `ENDOFSENTENCE_PATTERN` only look at a few
+    characters, and more text can only turn dots into email or number dots,
+    never the other way around. Email and number dots only need to be found
+    again in the trailing word, since emails and numbers can't span
+    whitespace.
+
+    """
 
-    return match.end() if match else 0
+    def __init__(self):
+        # Where the next end of sentence can start.
+        self._cursor = 0
+
+    def scan(self, text: str) -> int:
+        """Returns the position of the end of the first sentence in the text,
+        or 0 if there's none yet.
+
+        """
+        if self._cursor > len(text):
+            self._cursor = 0
+
+        # We need a few characters before the cursor for the lookbehinds. Also,
+        # start at the beginning of a word so emails and numbers are complete.
+        start = max(0, self._cursor - _ENDOFSENTENCE_LOOKBEHIND)
+        while start > 0 and text[start - 1] in _EMAIL_OR_NUMBER_CHARS:
+            start -= 1
+
+        window = text[start:].rstrip()
+
+        # Replace email dots by ampersands so we can find the end of sentence.
+        # For example, first.last@email.com becomes first&last@email&com. Then
+        # do the same with number dots.
+        window = EMAIL_PATTERN.sub(_mask_dots, window)
+        window = NUMBER_PATTERN.sub(_mask_dots, window)
+
+        # Search from the cursor, lookbehinds still see the previous text. Note
+        # that `^` only matches at the beginning of the window (not the text),
+        # but the numbered list lookbehind never matches masked text anyway.
+        match = ENDOFSENTENCE_PATTERN.search(window, self._cursor - start)
+        if match:
+            self._cursor = 0
+            return start + match.end()
+
+        self._cursor = len(text)
+        return 0
+
+    def reset(self):
+        self._cursor = 0
 
 
 def parse_start_end_tags(
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import re
+import time
+from typing import Optional
+
+from pipecat.utils.text.simple_text_aggregator import SimpleTextAggregator
+
+# A comma, colon or dash followed by whitespace (so "3,000" or "10:30" are not
+# clause boundaries).
+CLAUSE_END_PATTERN = re.compile(r"([,:—–]|\s-)(?=\s)")
+
+
+class FirstPhraseTextAggregator(SimpleTextAggregator):
+    """Text aggregator that releases the first phrase of each response early.
+
+    Waiting for the first full sentence of an LLM response before sending it
+    to the TTS delays the first audio, specially with long sentences. This
+    aggregator releases the first phrase as soon as there's a clause boundary
+    (comma, colon or dash) after `min_words` words or, if `max_delay_s` seconds
+    have passed since the first text of the response, as soon as there are
+    `min_words` complete words. After the first phrase, text is aggregated in
+    sentences (as `SimpleTextAggregator` does) until the response ends (i.e.
+    the aggregator is reset or interrupted).
+
+    The time budget is checked when text is aggregated, so nothing is released
+    if the LLM doesn't send more text.
+
+    """
+
+    def __init__(self, *, min_words: int = 4, max_delay_s: Optional[float] = 0.5):
+        super().__init__()
+        self._min_words = min_words
+        self._max_delay_s = max_delay_s
+        self._first_phrase_done = False
+        self._start_time: Optional[float] = None
+        # Where the next clause boundary search starts (always right after a
+        # whitespace) and the number of words before it.
+        self._scan_pos = 0
+        self._scan_words = 0
+
+    def aggregate(self, text: str) -> Optional[str]:
+        if self._first_phrase_done:
+            return super().aggregate(text)
+
+        if self._start_time is None:
+            self._start_time = time.monotonic()
+
+        # We might get a full sentence before a phrase.
+        result = super().aggregate(text)
+        if result:
+            self._first_phrase_done = True
+            return result
+
+        phrase_end = self._match_first_phrase()
+        if phrase_end:
+            result = self._text[:phrase_end]
+            self._text = self._text[phrase_end:]
+            self._scanner.reset()
+            self._first_phrase_done = True
+
+        return result
+
+    def handle_interruption(self):
+        super().handle_interruption()
+        self._reset_first_phrase()
+
+    def reset(self):
+        super().reset()
+        self._reset_first_phrase()
+
+    def _reset_first_phrase(self):
+        self._first_phrase_done = False
+        self._start_time = None
+        self._scan_pos = 0
+        self._scan_words = 0
+
+    def _match_first_phrase(self) -> int:
+        # Only the text after the last scan position is new. Clause boundaries
+        # need the whitespace after them, so the trailing word (which might
+        # still grow) is scanned again next time. A boundary can start at the
+        # whitespace right before the scan position (e.g. " -").
+        text = self._text
+        pos = self._scan_pos
+        for match in CLAUSE_END_PATTERN.finditer(text, max(pos - 1, 0)):
+            words = self._scan_words + len(text[pos : match.start()].split())
+            if words >= self._min_words:
+                return match.end()
+
+        # Only complete words (i.e. followed by whitespace) are counted.
+        end = len(text)
+        while end > pos and not text[end - 1].isspace():
+            end -= 1
+        self._scan_words += len(text[pos:end].split())
+        self._scan_pos = end
+
+        if (
+            self._max_delay_s is not None
+            and time.monotonic() - self._start_time >= self._max_delay_s
+            and self._scan_words >= self._min_words
+        ):
+            return len(text[:end].rstrip())
+
+        return 0
@@ -7,11 +7,35 @@
 import re
 from typing import Any, Mapping, Optional
 
-from markdown import Markdown
 from pydantic import BaseModel
 
 from pipecat.utils.text.base_text_filter import BaseTextFilter
 
+# Empty (or whitespace only) lines.
+_EMPTY_LINES_PATTERN = re.compile(r"^\s*\n", re.MULTILINE)
+
+# Block markers at the start of a line: headings, block quotes and bullets.
+# Indented lines are left as they are.
+_BLOCK_MARKER_PATTERN = re.compile(r"#{1,6}[ \t]*|>[ \t]?|[-+*][ \t]+")
+
+# Horizontal rules, heading underlines and table separators.
+_RULE_PATTERN = re.compile(r"[ \t]*(?:[-=*_:|][ \t]*)+")
+
+_FENCE_PATTERN = re.compile(r"`{3,}")
+_ESCAPE_PATTERN = re.compile(r"\\([\\`*_{}\[\]()#+\-.!|>])")
+_REPEATED_CHARS_PATTERN = re.compile(r"(\S)\1{4,}")
+_CODE_SPAN_PATTERN = re.compile(r"(?<!`)(`+)(?!`)(.+?)(?<!`)\1(?!`)")
+_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_AUTOLINK_PATTERN = re.compile(r"<([a-zA-Z][a-zA-Z0-9+.-]*:[^<>\s]+)>")
+_HTML_TAG_PATTERN = re.compile(r"<[a-zA-Z/!][^<>]*>")
+_HTML_ENTITY_PATTERN = re.compile(r"&(nbsp|lt|gt|amp);")
+_ASTERISK_EMPHASIS_PATTERN = re.compile(r"\*(?=\S)(.+?)(?<=\S)\*")
+_UNDERSCORE_EMPHASIS_PATTERN = re.compile(r"(?<!\w)(__?)(?=\S)(.+?)(?<=\S)\1(?!\w)")
+_STRAY_ASTERISK_PATTERN = re.compile(r"(^|\s)\*|\*($|\s)")
+
+_HTML_ENTITIES = {"nbsp": " ", "lt": "<", "gt": ">", "amp": "&"}
+
 
 class MarkdownTextFilter(BaseTextFilter):
     """Removes Markdown formatting from text in TextFrames.
@@ -19,6 +43,10 @@ class MarkdownTextFilter(BaseTextFilter):
     Converts Markdown to plain text while preserving the overall structure,
     including leading and trailing spaces. Handles special cases like
     asterisks and table formatting.
+
+    Markdown is not rendered, text is filtered line by line in a single pass.
+    Code blocks and tables can span multiple calls (e.g. the sentences of a
+    streamed LLM response), so they are removed even if they are split.
     """
 
     class InputParams(BaseModel):
@@ -30,6 +58,8 @@ class MarkdownTextFilter(BaseTextFilter):
         super().__init__(**kwargs)
         self._settings = params
         self._in_code_block = False
+        # Whether the last table row didn't end (i.e. the next text starts in
+        # the middle of the row).
         self._in_table = False
         self._interrupted = False
 
@@ -39,70 +69,30 @@ class MarkdownTextFilter(BaseTextFilter):
                 setattr(self._settings, key, value)
 
     def filter(self, text: str) -> str:
-        if self._settings.enable_text_filter:
-            # Remove newlines and replace with a space only when there's no text before or after
-            filtered_text = re.sub(r"^\s*\n", " ", text, flags=re.MULTILINE)
-
-            # Remove backticks from inline code, but not from code blocks
-            filtered_text = re.sub(r"(?<!`)`([^`\n]+)`(?!`)", r"\1", filtered_text)
-
-            # Remove repeated sequences of 5 or more characters
-            filtered_text = re.sub(r"(\S)(\1{4,})", "", filtered_text)
-
-            # Preserve numbered list items with a unique marker, §NUM§
-            filtered_text = re.sub(r"^(\d+\.)\s", r"§NUM§\1 ", filtered_text)
-
-            # Preserve leading/trailing spaces with a unique marker, §
-            # Critical for word-by-word streaming in bot-tts-text
-            filtered_text = re.sub(
-                r"^( +)|\s+$", lambda m: "§" * len(m.group(0)), filtered_text, flags=re.MULTILINE
-            )
-
-            # Remove space placeholders before tables, so that tables are converted to HTML
-            # correctly
-            filtered_text = re.sub(r"§\| ", "| ", filtered_text)
-
-            # Convert markdown to HTML
-            extension = ["tables"] if self._settings.filter_tables else []
-            md = Markdown(extensions=extension)
-            filtered_text = md.convert(filtered_text)
-
-            # Remove tables
-            if self._settings.filter_tables:
-                filtered_text = self.remove_tables(filtered_text)
-
-            # Remove HTML tags
-            filtered_text = re.sub("<[^<]+?>", "", filtered_text)
-
-            # Replace HTML entities
-            filtered_text = filtered_text.replace("&nbsp;", " ")
-            filtered_text = filtered_text.replace("&lt;", "<")
-            filtered_text = filtered_text.replace("&gt;", ">")
-            filtered_text = filtered_text.replace("&amp;", "&")
-
-            # Remove double asterisks (consecutive without any exceptions)
-            filtered_text = re.sub(r"\*\*", "", filtered_text)
-
-            # Remove single asterisks at the start or end of words
-            filtered_text = re.sub(r"(^|\s)\*|\*($|\s)", r"\1\2", filtered_text)
+        if not self._settings.enable_text_filter:
+            return text
 
-            # Remove Markdown table formatting
-            filtered_text = re.sub(r"\|", "", filtered_text)
-            filtered_text = re.sub(r"^\s*[-:]+\s*$", "", filtered_text, flags=re.MULTILINE)
+        if self._interrupted:
+            self._in_code_block = False
+            self._in_table = False
 
-            # Remove code blocks
-            if self._settings.filter_code:
-                filtered_text = self._remove_code_blocks(filtered_text)
+        # Replace empty lines with a space.
+        text = _EMPTY_LINES_PATTERN.sub(" ", text)
 
-            # Restore numbered list items
-            filtered_text = filtered_text.replace("§NUM§", "")
+        lines = []
+        for i, line in enumerate(text.split("\n")):
+            line = self._filter_blocks(line, i == 0)
+            if line is not None:
+                lines.append(self._filter_inline(line))
+        filtered_text = "\n".join(lines)
 
-            # Restore leading and trailing spaces
-            filtered_text = re.sub("§", " ", filtered_text)
+        # Trailing whitespace (e.g. newlines) becomes spaces. Critical for
+        # word-by-word streaming in bot-tts-text.
+        stripped_text = filtered_text.rstrip()
+        if len(stripped_text) < len(filtered_text):
+            filtered_text = stripped_text + " " * (len(filtered_text) - len(stripped_text))
 
-            return filtered_text
-        else:
-            return text
+        return filtered_text
 
     def handle_interruption(self):
         self._interrupted = True
@@ -112,99 +102,91 @@ class MarkdownTextFilter(BaseTextFilter):
     def reset_interruption(self):
         self._interrupted = False
 
-    #
-    # Filter code
-    #
+    def _filter_blocks(self, line: str, first_line: bool) -> Optional[str]:
+        """Filters block level Markdown. Returns None if the whole line needs
+        to be removed.
 
-    def _remove_code_blocks(self, text: str) -> str:
-        """Main method to remove code blocks from the input text.
-        Handles interruptions and delegates to specific methods based on the current state.
         """
-        if self._interrupted:
-            self._in_code_block = False
-            return text
+        if self._settings.filter_code and not self._interrupted:
+            line = self._filter_code_blocks(line)
+            if line is None:
+                return None
+        elif "```" in line:
+            # Remove code block delimiters but keep the code.
+            line = _FENCE_PATTERN.sub("", line)
+            if not line.strip():
+                return None
+
+        if self._settings.filter_tables and not self._interrupted:
+            if (first_line and self._in_table) or line.lstrip().startswith("|"):
+                self._in_table = not line.rstrip().endswith("|")
+                return None
+            self._in_table = False
 
-        # Pattern to match three consecutive backticks (code block delimiter)
-        code_block_pattern = r"```"
-        match = re.search(code_block_pattern, text)
+        if _RULE_PATTERN.fullmatch(line) and line.strip():
+            return None
 
-        if self._in_code_block:
-            return self._handle_in_code_block(match, text)
+        match = _BLOCK_MARKER_PATTERN.match(line)
+        if match:
+            line = line[match.end() :]
 
-        return self._handle_not_in_code_block(match, text, code_block_pattern)
+        return line
 
-    def _handle_in_code_block(self, match, text):
-        """Handle text when we're currently inside a code block.
-        If we find the end of the block, return text after it. Otherwise, skip the content.
-        """
-        if match:
+    def _filter_code_blocks(self, line: str) -> Optional[str]:
+        if self._in_code_block:
+            match = _FENCE_PATTERN.search(line)
+            if not match:
+                return None
+            # Keep the text after the end of the block.
             self._in_code_block = False
-            end_index = match.end()
-            return text[end_index:].strip()
-        return ""  # Skip content inside code block
+            line = line[match.end() :]
+            return line if line.strip() else None
 
-    def _handle_not_in_code_block(self, match, text, code_block_pattern):
-        """Handle text when we're not currently inside a code block.
-        Delegate to specific methods based on whether we find a code block delimiter.
-        """
+        match = _FENCE_PATTERN.search(line)
         if not match:
-            return text  # No code block found, return original text
+            return line
 
-        start_index = match.start()
-        if start_index == 0 or text[:start_index].isspace():
-            return self._handle_start_of_code_block(text, start_index)
-        return self._handle_code_block_within_text(text, code_block_pattern)
+        end_match = _FENCE_PATTERN.search(line, match.end())
+        if end_match:
+            # The whole block is in this line.
+            line = line[: match.start()] + line[end_match.end() :]
+            return line if line.strip() else None
 
-    def _handle_start_of_code_block(self, text, start_index):
-        """Handle the case where we find the start of a code block.
-        Return any text before the code block and set the state to inside a code block.
-        """
+        # Keep the text before the start of the block.
         self._in_code_block = True
-        return text[:start_index].strip()
+        line = line[: match.start()]
+        return line if line.strip() else None
 
-    def _handle_code_block_within_text(self, text, code_block_pattern):
-        """Handle the case where we find a code block within the text.
-        If it's a complete code block, remove it and return surrounding text.
-        If it's the start of a code block, return text before it and set state.
-        """
-        parts = re.split(code_block_pattern, text)
-        if len(parts) > 2:
-            return (parts[0] + " " + parts[-1]).strip()
-        self._in_code_block = True
-        return parts[0].strip()
-
-    #
-    # Filter tables
-    #
-    def remove_tables(self, text: str) -> str:
-        """Remove tables from the input text, handling cases where
-        both start and end tags are in the same input.
-        """
-        if self._interrupted:
-            self._in_table = False
-            return text
+    def _filter_inline(self, line: str) -> str:
+        if "\\" in line:
+            line = _ESCAPE_PATTERN.sub(r"\1", line)
 
-        # Pattern to match entire table or parts of it
-        table_pattern = r"<table>.*?</table>"
-        partial_table_start = r"<table>.*"
-        partial_table_end = r".*</table>"
-
-        # Remove complete tables
-        text = re.sub(table_pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
-
-        # Handle partial tables at the start
-        if self._in_table:
-            match = re.match(partial_table_end, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                self._in_table = False
-                return text[match.end() :].strip()
-            else:
-                return ""  # Still inside a table, remove all content
-
-        # Handle partial tables at the end
-        match = re.search(partial_table_start, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            self._in_table = True
-            return text[: match.start()].strip()
+        # Remove repeated sequences of 5 or more characters.
+        line = _REPEATED_CHARS_PATTERN.sub("", line)
+
+        if "`" in line:
+            line = _CODE_SPAN_PATTERN.sub(r"\2", line)
+
+        if "](" in line:
+            line = _IMAGE_PATTERN.sub("", line)
+            line = _LINK_PATTERN.sub(r"\1", line)
+
+        if "<" in line:
+            line = _AUTOLINK_PATTERN.sub(r"\1", line)
+            line = _HTML_TAG_PATTERN.sub("", line)
+
+        if "&" in line:
+            line = _HTML_ENTITY_PATTERN.sub(lambda m: _HTML_ENTITIES[m.group(1)], line)
+
+        if "*" in line:
+            line = line.replace("**", "")
+            line = _ASTERISK_EMPHASIS_PATTERN.sub(r"\1", line)
+            line = _STRAY_ASTERISK_PATTERN.sub(r"\1\2", line)
+
+        if "_" in line:
+            line = _UNDERSCORE_EMPHASIS_PATTERN.sub(r"\2", line)
+
+        if "|" in line:
+            line = line.replace("|", "")
 
-        return text.strip()
+        return line
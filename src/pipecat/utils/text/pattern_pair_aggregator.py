@@ -9,7 +9,7 @@ from typing import Callable, Optional, Tuple
 
 from loguru import logger
 
-from pipecat.utils.string import match_endofsentence
+from pipecat.utils.string import EndOfSentenceScanner
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator
 
 
@@ -70,6 +70,7 @@ class PatternPairAggregator(BaseTextAggregator):
         self._text = ""
         self._patterns = {}
         self._handlers = {}
+        self._scanner = EndOfSentenceScanner()
 
     @property
     def text(self) -> str:
@@ -228,6 +229,8 @@ class PatternPairAggregator(BaseTextAggregator):
         # Only update the buffer if modifications were made
         if modified:
             self._text = processed_text
+            # The text changed, so it needs to be scanned again.
+            self._scanner.reset()
 
         # Check if we have incomplete patterns
         if self._has_incomplete_patterns(self._text):
@@ -235,11 +238,12 @@ class PatternPairAggregator(BaseTextAggregator):
             return None
 
         # Find sentence boundary if no incomplete patterns
-        eos_marker = match_endofsentence(self._text)
+        eos_marker = self._scanner.scan(self._text)
         if eos_marker:
             # Extract text up to the sentence boundary
             result = self._text[:eos_marker]
             self._text = self._text[eos_marker:]
+            self._scanner.reset()
             return result
 
         # No complete sentence found yet
@@ -252,6 +256,7 @@ class PatternPairAggregator(BaseTextAggregator):
         to reset the state and discard any partially aggregated text.
         """
         self._text = ""
+        self._scanner.reset()
 
     def reset(self):
         """Clear the internally aggregated text.
@@ -260,3 +265,4 @@ class PatternPairAggregator(BaseTextAggregator):
         buffered text.
         """
         self._text = ""
+        self._scanner.reset()
@@ -6,18 +6,19 @@
 
 from typing import Optional
 
-from pipecat.utils.string import match_endofsentence
+from pipecat.utils.string import EndOfSentenceScanner
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator
 
 
 class SimpleTextAggregator(BaseTextAggregator):
     """This is a simple text aggregator. It aggregates text until an end of
-    sentence is found.
+    sentence is found. Only new text is scanned for the end of sentence.
 
     """
 
     def __init__(self):
         self._text = ""
+        self._scanner = EndOfSentenceScanner()
 
     @property
     def text(self) -> str:
@@ -28,15 +29,18 @@ class SimpleTextAggregator(BaseTextAggregator):
 
         self._text += text
 
-        eos_end_marker = match_endofsentence(self._text)
+        eos_end_marker = self._scanner.scan(self._text)
         if eos_end_marker:
             result = self._text[:eos_end_marker]
             self._text = self._text[eos_end_marker:]
+            self._scanner.reset()
 
         return result
 
     def handle_interruption(self):
         self._text = ""
+        self._scanner.reset()
 
     def reset(self):
         self._text = ""
+        self._scanner.reset()
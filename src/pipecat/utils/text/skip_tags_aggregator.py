@@ -6,7 +6,7 @@
 
 from typing import Optional, Sequence
 
-from pipecat.utils.string import StartEndTags, match_endofsentence, parse_start_end_tags
+from pipecat.utils.string import EndOfSentenceScanner, StartEndTags, parse_start_end_tags
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator
 
 
@@ -33,6 +33,7 @@ class SkipTagsAggregator(BaseTextAggregator):
         self._tags = tags
         self._current_tag: Optional[StartEndTags] = None
         self._current_tag_index: int = 0
+        self._scanner = EndOfSentenceScanner()
 
     @property
     def text(self) -> str:
@@ -67,11 +68,12 @@ class SkipTagsAggregator(BaseTextAggregator):
 
         # Find sentence boundary if no incomplete patterns
         if not self._current_tag:
-            eos_marker = match_endofsentence(self._text)
+            eos_marker = self._scanner.scan(self._text)
             if eos_marker:
                 # Extract text up to the sentence boundary
                 result = self._text[:eos_marker]
                 self._text = self._text[eos_marker:]
+                self._scanner.reset()
                 return result
 
         # No complete sentence found yet
@@ -84,6 +86,7 @@ class SkipTagsAggregator(BaseTextAggregator):
         to reset the state and discard any partially aggregated text.
         """
         self._text = ""
+        self._scanner.reset()
 
     def reset(self):
         """Clear the internally aggregated text.
@@ -92,3 +95,4 @@ class SkipTagsAggregator(BaseTextAggregator):
         buffered text.
         """
         self._text = ""
+        self._scanner.reset()
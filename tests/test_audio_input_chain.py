@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pipecat.audio.filters.base_audio_filter import BaseAudioFilter
+from pipecat.audio.input_chain import AudioInputChain
+from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADParams, VADState
+from pipecat.frames.frames import FilterControlFrame, FilterEnableFrame
+
+
+class GainFilter(BaseAudioFilter):
+    def __init__(self):
+        self._filtering = True
+
+    async def start(self, sample_rate: int):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def process_frame(self, frame: FilterControlFrame):
+        if isinstance(frame, FilterEnableFrame):
+            self._filtering = frame.enable
+
+    async def filter(self, audio: bytes) -> bytes:
+        return self.filter_samples(np.frombuffer(audio, dtype=np.int16)).tobytes()
+
+    def filter_samples(self, samples: np.ndarray) -> np.ndarray:
+        if not self._filtering:
+            return samples
+        return samples // 2
+
+
+class AsyncGainFilter(GainFilter):
+    filter_samples = BaseAudioFilter.filter_samples
+
+    async def filter(self, audio: bytes) -> bytes:
+        return (np.frombuffer(audio, dtype=np.int16) // 2).tobytes()
+
+
+class EnergyVADAnalyzer(VADAnalyzer):
+    def __init__(self):
+        super().__init__(
+            sample_rate=16000, params=VADParams(start_secs=0.032, stop_secs=0.032, min_volume=0)
+        )
+        self.set_sample_rate(16000)
+
+    def num_frames_required(self) -> int:
+        return 512
+
+    def voice_confidence(self, buffer) -> float:
+        samples = np.frombuffer(buffer, dtype=np.int16).astype(np.float32)
+        return 1.0 if np.abs(samples).mean() > 1000 else 0.0
+
+
+class AsyncEnergyVADAnalyzer(EnergyVADAnalyzer):
+    async def analyze_audio_async(self, buffer, executor=None) -> VADState:
+        return self.analyze_audio(buffer)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.jobs = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.jobs += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def frames():
+    # 32ms of silence, 64ms of loud audio and 64ms of silence again.
+    loud = (np.ones(512) * 8000).astype(np.int16)
+    silence = np.zeros(512, dtype=np.int16)
+    audio = np.concatenate([silence, loud, loud, silence, silence])
+    return [audio[i : i + 256].tobytes() for i in range(0, len(audio), 256)]
+
+
+class TestAudioInputChain(unittest.IsolatedAsyncioTestCase):
+    async def process(self, chain: AudioInputChain):
+        executor = CountingExecutor()
+        results = [await chain.process(audio, executor) for audio in frames()]
+        executor.shutdown()
+        return results, executor.jobs
+
+    async def test_empty(self):
+        chain = AudioInputChain()
+        audio = frames()[0]
+        self.assertEqual(await chain.process(audio), (audio, None))
+
+    async def test_fused(self):
+        chain = AudioInputChain(audio_filter=GainFilter(), vad_analyzer=EnergyVADAnalyzer())
+        self.assertTrue(chain.fused)
+        results, jobs = await self.process(chain)
+
+        # One executor job per frame.
+        self.assertEqual(jobs, len(frames()))
+        for (audio, _), original in zip(results, frames()):
+            expected = np.frombuffer(original, dtype=np.int16) // 2
+            np.testing.assert_array_equal(np.frombuffer(audio, dtype=np.int16), expected)
+        states = [state for _, state in results]
+        self.assertIn(VADState.SPEAKING, states)
+        self.assertEqual(states[-1], VADState.QUIET)
+
+    async def test_same_as_unfused(self):
+        fused, _ = await self.process(
+            AudioInputChain(audio_filter=GainFilter(), vad_analyzer=EnergyVADAnalyzer())
+        )
+        chain = AudioInputChain(
+            audio_filter=AsyncGainFilter(), vad_analyzer=AsyncEnergyVADAnalyzer()
+        )
+        self.assertFalse(chain.fused)
+        unfused, jobs = await self.process(chain)
+        self.assertEqual(jobs, 0)
+        self.assertEqual(fused, unfused)
+
+    async def test_disabled_filter(self):
+        audio_filter = GainFilter()
+        await audio_filter.process_frame(FilterEnableFrame(enable=False))
+        chain = AudioInputChain(audio_filter=audio_filter)
+        audio = frames()[2]
+        filtered, vad_state = await chain.process(audio)
+        self.assertIs(filtered, audio)
+        self.assertIsNone(vad_state)
+
+    async def test_vad_analyzes_filtered_samples(self):
+        analyzed = []
+
+        class SpyVADAnalyzer(EnergyVADAnalyzer):
+            def analyze_audio(self, buffer) -> VADState:
+                analyzed.append(buffer)
+                return super().analyze_audio(buffer)
+
+        chain = AudioInputChain(audio_filter=GainFilter(), vad_analyzer=SpyVADAnalyzer())
+        await self.process(chain)
+        self.assertTrue(all(isinstance(buffer, np.ndarray) for buffer in analyzed))
+
+    async def test_default_filter_samples(self):
+        self.assertTrue(GainFilter.implements_filter_samples())
+        self.assertFalse(AsyncGainFilter.implements_filter_samples())
+
+        # The default runs `filter()`, so it can't run in the event loop thread.
+        samples = np.frombuffer(frames()[2], dtype=np.int16)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            filtered = executor.submit(AsyncGainFilter().filter_samples, samples).result()
+        np.testing.assert_array_equal(filtered, samples // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+
+def sine(sample_rate: int, secs: float, freq: float = 440.0) -> bytes:
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    return (10000 * np.sin(2 * np.pi * freq * t)).astype(np.int16).tobytes()
+
+
+def chunks(audio: bytes, size: int):
+    return [audio[i : i + size] for i in range(0, len(audio), size)]
+
+
+class TestSOXRStreamAudioResampler(unittest.IsolatedAsyncioTestCase):
+    async def test_same_rate(self):
+        resampler = SOXRStreamAudioResampler()
+        audio = sine(16000, 0.02)
+        self.assertEqual(await resampler.resample(audio, 16000, 16000), audio)
+        self.assertEqual(await resampler.flush(), b"")
+
+    async def test_stream(self):
+        """Resampling a stream in 20ms chunks gives the same audio as
+        resampling all the audio at once."""
+        audio = sine(24000, 1.0)
+
+        resampler = SOXRStreamAudioResampler(quality="VHQ")
+        streamed = b""
+        for chunk in chunks(audio, 960):
+            streamed += await resampler.resample(chunk, 24000, 16000)
+        streamed += await resampler.flush()
+
+        one_shot = await SOXRAudioResampler().resample(audio, 24000, 16000)
+
+        self.assertEqual(len(streamed), len(one_shot))
+        diff = np.frombuffer(streamed, dtype=np.int16).astype(np.int32) - np.frombuffer(
+            one_shot, dtype=np.int16
+        )
+        # Only rounding differences.
+        self.assertLessEqual(np.abs(diff).max(), 4)
+
+    async def test_streams_per_rate(self):
+        resampler = SOXRStreamAudioResampler()
+        audio = sine(16000, 0.5)
+        resampled_8k = b""
+        resampled_24k = b""
+        for chunk in chunks(audio, 640):
+            resampled_8k += await resampler.resample(chunk, 16000, 8000)
+            resampled_24k += await resampler.resample(chunk, 16000, 24000)
+        resampled = resampled_8k + resampled_24k + await resampler.flush()
+        # 0.5 seconds at 8000 and 24000 (2 bytes per sample).
+        self.assertEqual(len(resampled), 8000 + 24000)
+
+    async def test_reset(self):
+        resampler = SOXRStreamAudioResampler()
+        for chunk in chunks(sine(16000, 0.5), 640):
+            await resampler.resample(chunk, 16000, 8000)
+        resampler.reset()
+        self.assertEqual(await resampler.flush(), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import random
+import unittest
+
+from pipecat.audio.ring_buffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer(unittest.TestCase):
+    def test_chunks(self):
+        buffer = AudioRingBuffer(capacity=8)
+        buffer.write(bytes(range(10)))
+        self.assertEqual(
+            [bytes(c) for c in buffer.chunks(4)], [bytes(range(4)), bytes(range(4, 8))]
+        )
+        self.assertEqual(bytes(buffer.view()), bytes([8, 9]))
+        buffer.write(bytes([10, 11]))
+        self.assertEqual([bytes(c) for c in buffer.chunks(4)], [bytes(range(8, 12))])
+        self.assertEqual(len(buffer), 0)
+
+    def test_read_too_much(self):
+        buffer = AudioRingBuffer()
+        buffer.write(b"\x00\x01")
+        with self.assertRaises(ValueError):
+            buffer.read(4)
+
+    def test_discard_and_clear(self):
+        buffer = AudioRingBuffer(capacity=4)
+        buffer.write(bytes(range(6)))
+        buffer.discard(4)
+        self.assertEqual(bytes(buffer.view()), bytes([4, 5]))
+        buffer.discard(10)
+        self.assertEqual(len(buffer), 0)
+        buffer.write(b"\x01")
+        buffer.clear()
+        self.assertEqual(bytes(buffer.view()), b"")
+
+    def test_grow_keeps_read_chunks(self):
+        buffer = AudioRingBuffer(capacity=4)
+        buffer.write(b"\x01\x02")
+        chunk = buffer.read(1)
+        buffer.write(b"\x03" * 16)
+        self.assertEqual(bytes(chunk), b"\x01")
+        self.assertEqual(bytes(buffer.view()), b"\x02" + b"\x03" * 16)
+
+    def test_random_writes_and_reads(self):
+        rng = random.Random(0)
+        buffer = AudioRingBuffer(capacity=16)
+        expected = bytearray()
+        for _ in range(2000):
+            data = rng.randbytes(rng.randint(0, 40))
+            buffer.write(data)
+            expected.extend(data)
+            size = rng.randint(1, 32)
+            for chunk in buffer.chunks(size):
+                self.assertEqual(bytes(chunk), bytes(expected[:size]))
+                del expected[:size]
+            self.assertEqual(bytes(buffer.view()), bytes(expected))
+        # The buffer doesn't keep growing.
+        self.assertLessEqual(buffer.capacity, 256)
+
+
+if __name__ == "__main__":
+    unittest.main()
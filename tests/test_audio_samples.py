@@ -0,0 +1,98 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.samples import audio_buffer, audio_bytes, float32_samples, int16_samples
+from pipecat.audio.utils import calculate_audio_volume, mix_audio, pcm_to_ulaw
+from pipecat.audio.volume_meter import VolumeMeter
+from pipecat.frames.frames import InputAudioRawFrame, OutputAudioRawFrame
+
+
+def sine(sample_rate: int = 16000, secs: float = 0.02) -> np.ndarray:
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    return (10000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+
+class TestAudioSamples(unittest.TestCase):
+    def test_conversions(self):
+        samples = sine()
+        audio = samples.tobytes()
+
+        int16 = int16_samples(audio)
+        np.testing.assert_array_equal(int16, samples)
+        # Bytes are not copied.
+        self.assertFalse(int16.flags.owndata)
+        self.assertIs(int16_samples(samples), samples)
+
+        floats = float32_samples(audio)
+        self.assertEqual(floats.dtype, np.float32)
+        np.testing.assert_array_equal(floats, samples.astype(np.float32) / 32768.0)
+        self.assertIs(float32_samples(floats), floats)
+        np.testing.assert_array_equal(int16_samples(floats), samples)
+
+        self.assertIs(audio_bytes(audio), audio)
+        self.assertEqual(audio_bytes(samples), audio)
+        self.assertEqual(audio_bytes(floats), audio)
+        self.assertEqual(bytes(audio_buffer(samples)), audio)
+
+        with self.assertRaises(ValueError):
+            int16_samples(np.zeros(10, dtype=np.int64))
+
+    def test_frame_views(self):
+        audio = sine().tobytes()
+        frame = OutputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)
+
+        samples = frame.samples
+        np.testing.assert_array_equal(samples, int16_samples(audio))
+        self.assertFalse(samples.flags.writeable)
+        # Views are cached.
+        self.assertIs(frame.samples, samples)
+        self.assertIs(frame.float_samples, frame.float_samples)
+        np.testing.assert_array_equal(frame.float_samples, float32_samples(audio))
+        self.assertEqual(frame.audio_view, memoryview(audio))
+
+        # Replacing the audio updates the views.
+        frame.audio = bytes(audio[:64])
+        self.assertEqual(len(frame.samples), 32)
+        self.assertEqual(len(frame.float_samples), 32)
+
+    def test_frame_views_not_fields(self):
+        frame = InputAudioRawFrame(audio=sine().tobytes(), sample_rate=16000, num_channels=1)
+        frame.samples
+        self.assertNotIn("_audio_views", repr(frame))
+
+
+class TestAudioUtils(unittest.IsolatedAsyncioTestCase):
+    async def test_same_results(self):
+        """Audio utilities give the same results with bytes and samples."""
+        samples = sine(secs=0.1)
+        audio = samples.tobytes()
+        other = sine(secs=0.05)
+
+        self.assertEqual(mix_audio(audio, other.tobytes()), mix_audio(samples, other))
+        self.assertEqual(
+            calculate_audio_volume(audio, 16000), calculate_audio_volume(samples, 16000)
+        )
+        self.assertEqual(VolumeMeter(16000).volume(audio), VolumeMeter(16000).volume(samples))
+
+        resampler = SOXRAudioResampler()
+        from_bytes = int16_samples(await resampler.resample(audio, 16000, 8000))
+        from_samples = int16_samples(await resampler.resample(samples, 16000, 8000))
+        # SoX dithers int16 audio.
+        self.assertLessEqual(np.abs(from_bytes.astype(np.int32) - from_samples).max(), 2)
+        self.assertEqual(await resampler.resample(samples, 16000, 16000), audio)
+        self.assertEqual(
+            await pcm_to_ulaw(audio, 8000, 8000, resampler),
+            await pcm_to_ulaw(samples, 8000, 8000, resampler),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
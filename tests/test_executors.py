@@ -0,0 +1,150 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import threading
+import unittest
+
+from pipecat.utils.asyncio import TaskManager
+from pipecat.utils.executors import (
+    CPU_AUDIO_POOL,
+    ExecutorPool,
+    ExecutorService,
+    get_default_executor_service,
+)
+
+
+class TestExecutorPool(unittest.IsolatedAsyncioTestCase):
+    async def test_run_in_executor(self):
+        pool = ExecutorPool("test", 2)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(pool.executor("session"), sum, [1, 2, 3])
+        self.assertEqual(result, 6)
+        with self.assertRaises(ZeroDivisionError):
+            await loop.run_in_executor(pool.executor("session"), lambda: 1 / 0)
+        self.assertEqual(pool.stats().completed, 2)
+        pool.shutdown()
+
+    async def test_fairness(self):
+        """A session with a lot of queued work doesn't delay other sessions."""
+        pool = ExecutorPool("test", 1)
+        blocker = threading.Event()
+        order = []
+
+        def work(name):
+            blocker.wait()
+            order.append(name)
+
+        futures = [pool.submit("busy", work, f"busy-{i}") for i in range(10)]
+        futures += [pool.submit("quiet", work, f"quiet-{i}") for i in range(2)]
+
+        stats = pool.stats()
+        self.assertEqual(stats.running, 1)
+        self.assertEqual(stats.queued, 11)
+        self.assertEqual(stats.sessions, 2)
+        self.assertEqual(pool.queue_depth, 11)
+
+        blocker.set()
+        await asyncio.gather(*[asyncio.wrap_future(f) for f in futures])
+
+        # Sessions take turns (the quiet session only waits for one item of the
+        # busy session each time) and each session's work runs in order.
+        self.assertEqual(order[:5], ["busy-0", "busy-1", "quiet-0", "busy-2", "quiet-1"])
+        self.assertEqual(order[5:], [f"busy-{i}" for i in range(3, 10)])
+        self.assertEqual(pool.stats().queued, 0)
+        self.assertEqual(pool.stats().completed, 12)
+        pool.shutdown()
+
+    async def test_bounded_threads(self):
+        pool = ExecutorPool("test", 2)
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def work():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            threading.Event().wait(0.001)
+            with lock:
+                running -= 1
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[loop.run_in_executor(pool.executor(i % 10), work) for i in range(100)]
+        )
+        self.assertLessEqual(max_running, 2)
+        pool.shutdown()
+
+    async def test_session_runs_one_item_at_a_time(self):
+        """Work of the same session never runs concurrently, even if there
+        are idle threads.
+        """
+        pool = ExecutorPool("test", 2)
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def work():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            threading.Event().wait(0.05)
+            with lock:
+                running -= 1
+
+        first = pool.submit("session", work)
+        second = pool.submit("session", work)
+        self.assertEqual(pool.stats().running, 1)
+        self.assertEqual(pool.stats().queued, 1)
+
+        # Other sessions still use the idle thread.
+        other = pool.submit("other", threading.Event().wait, 0)
+        await asyncio.wrap_future(other)
+
+        await asyncio.gather(asyncio.wrap_future(first), asyncio.wrap_future(second))
+        self.assertEqual(max_running, 1)
+        pool.shutdown()
+
+    async def test_cancel_queued(self):
+        pool = ExecutorPool("test", 1)
+        blocker = threading.Event()
+        called = []
+        running = pool.submit("session", blocker.wait)
+        queued = pool.submit("session", called.append, 1)
+        self.assertTrue(queued.cancel())
+        blocker.set()
+        await asyncio.wrap_future(running)
+        pool.shutdown()
+        self.assertEqual(called, [])
+
+
+class TestExecutorService(unittest.IsolatedAsyncioTestCase):
+    async def test_pools(self):
+        service = ExecutorService({CPU_AUDIO_POOL: 3, "custom": 1})
+        self.assertEqual(service.get_pool(CPU_AUDIO_POOL).max_workers, 3)
+        self.assertEqual(service.get_pool("custom").max_workers, 1)
+        self.assertIn("io", service.stats())
+        with self.assertRaises(ValueError):
+            service.get_pool("unknown")
+        service.shutdown()
+
+    async def test_task_manager(self):
+        self.assertIs(TaskManager().get_executor_service(), get_default_executor_service())
+
+        service = ExecutorService({CPU_AUDIO_POOL: 1})
+        task_manager = TaskManager(service)
+        executor = task_manager.get_executor(CPU_AUDIO_POOL)
+        result = await asyncio.get_running_loop().run_in_executor(executor, max, 1, 2)
+        self.assertEqual(result, 2)
+        self.assertEqual(service.get_pool(CPU_AUDIO_POOL).stats().completed, 1)
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
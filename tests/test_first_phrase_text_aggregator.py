@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.utils.text.first_phrase_text_aggregator import FirstPhraseTextAggregator
+
+
+class TestFirstPhraseTextAggregator(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.aggregator = FirstPhraseTextAggregator(min_words=3, max_delay_s=None)
+
+    async def test_first_phrase(self):
+        assert self.aggregator.aggregate("Well, I think") == None
+        assert self.aggregator.aggregate(" that, in") == "Well, I think that,"
+        assert self.aggregator.text == " in"
+        # Then sentences.
+        assert self.aggregator.aggregate(" general, yes") == None
+        assert self.aggregator.aggregate(". And") == " in general, yes."
+        assert self.aggregator.text == " And"
+
+    async def test_sentence_first(self):
+        assert self.aggregator.aggregate("Hello! How are") == "Hello!"
+        assert self.aggregator.aggregate(" you, my friend") == None
+        assert self.aggregator.aggregate("?") == " How are you, my friend?"
+
+    async def test_numbers(self):
+        assert self.aggregator.aggregate("It costs 3,000 dollars at 10:30") == None
+        assert self.aggregator.aggregate(" or so: ") == "It costs 3,000 dollars at 10:30 or so:"
+
+    async def test_dash(self):
+        assert self.aggregator.aggregate("The answer - ") == None
+        assert self.aggregator.aggregate("I think - is") == "The answer - I think -"
+
+    async def test_reset(self):
+        assert self.aggregator.aggregate("One two three, four") == "One two three,"
+        assert self.aggregator.aggregate(" five, six") == None
+        self.aggregator.reset()
+        assert self.aggregator.text == ""
+        assert self.aggregator.aggregate("One two three, four") == "One two three,"
+        self.aggregator.handle_interruption()
+        assert self.aggregator.aggregate("One two three, four") == "One two three,"
+
+    async def test_max_delay(self):
+        aggregator = FirstPhraseTextAggregator(min_words=3, max_delay_s=0.05)
+        assert aggregator.aggregate("This is a very") == None
+        await asyncio.sleep(0.1)
+        # The last word might not be complete.
+        assert aggregator.aggregate(" long sent") == "This is a very long"
+        assert aggregator.text == " sent"
+        assert aggregator.aggregate("ence") == None
+
+    async def test_split_tokens(self):
+        # Clause boundaries and words split across tokens.
+        for token in ["The", " ans", "wer", " ", "-", " I"]:
+            assert self.aggregator.aggregate(token) == None
+        assert self.aggregator.aggregate(" think,") == None
+        assert self.aggregator.aggregate(" yes") == "The answer - I think,"
+        assert self.aggregator.text == " yes"
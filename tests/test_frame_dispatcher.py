@@ -0,0 +1,75 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+from pipecat.frames.frames import (
+    Frame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    SystemFrame,
+    TextFrame,
+    TranscriptionFrame,
+    TTSAudioRawFrame,
+)
+from pipecat.processors.frame_dispatcher import FrameDispatcher
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+class DispatchProcessor(FrameProcessor):
+    __dispatcher = FrameDispatcher()
+
+    def __init__(self):
+        super().__init__()
+        self.handled = []
+
+    async def dispatch(self, frame: Frame) -> bool:
+        return await self.__dispatcher.dispatch(self, frame, FrameDirection.DOWNSTREAM)
+
+    @__dispatcher.handler(TextFrame)
+    async def __handle_text(self, frame: TextFrame, direction: FrameDirection):
+        self.handled.append("text")
+
+    @__dispatcher.handler(TranscriptionFrame)
+    async def __handle_transcription(self, frame: TranscriptionFrame, direction: FrameDirection):
+        self.handled.append("transcription")
+
+    @__dispatcher.handler(OutputAudioRawFrame, SystemFrame)
+    async def __handle_audio_or_system(self, frame: Frame, direction: FrameDirection):
+        self.handled.append("audio_or_system")
+
+
+class TestFrameDispatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_dispatch_closest_type(self):
+        processor = DispatchProcessor()
+        await processor.dispatch(TextFrame(text="Hello"))
+        await processor.dispatch(TranscriptionFrame(text="Hello", user_id="", timestamp=""))
+        await processor.dispatch(TTSAudioRawFrame(audio=b"", sample_rate=16000, num_channels=1))
+        await processor.dispatch(InputAudioRawFrame(audio=b"", sample_rate=16000, num_channels=1))
+        assert processor.handled == ["text", "transcription", "audio_or_system", "audio_or_system"]
+
+    async def test_dispatch_not_handled(self):
+        processor = DispatchProcessor()
+        assert not await processor.dispatch(Frame())
+        assert processor.handled == []
+
+    async def test_default_handler(self):
+        dispatcher = FrameDispatcher()
+
+        @dispatcher.handler(TextFrame)
+        async def handle_text(processor, frame, direction):
+            pass
+
+        assert dispatcher.get_handler(TranscriptionFrame) == handle_text
+        assert dispatcher.get_handler(Frame) is None
+
+        # Registering new handlers invalidates previously resolved types.
+        @dispatcher.handler(Frame)
+        async def handle_frame(processor, frame, direction):
+            pass
+
+        assert dispatcher.get_handler(Frame) == handle_frame
+        assert dispatcher.get_handler(TranscriptionFrame) == handle_text
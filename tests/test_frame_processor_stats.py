@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.frames.frames import EndFrame, Frame, TextFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.processors.metrics.frame_processor_stats import Histogram
+
+
+class SlowProcessor(FrameProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(0.02)
+        await self.push_frame(frame, direction)
+
+
+async def run_task(params: PipelineParams, processors) -> PipelineTask:
+    task = PipelineTask(Pipeline(processors), params=params, cancel_on_idle_timeout=False)
+    await task.queue_frames([TextFrame(text=f"{i}") for i in range(5)] + [EndFrame()])
+    await PipelineRunner(handle_sigint=False).run(task)
+    return task
+
+
+class TestHistogram(unittest.TestCase):
+    def test_exact_small_values(self):
+        histogram = Histogram()
+        for value in range(10):
+            histogram.record(value)
+        assert histogram.count == 10
+        assert histogram.max == 9
+        assert histogram.percentile(50) == 4
+        assert histogram.percentile(100) == 9
+
+    def test_relative_error(self):
+        histogram = Histogram()
+        for value in range(1, 100001):
+            histogram.record(value * 1000)
+        for percentile in (50, 95, 99):
+            expected = percentile * 1_000_000
+            assert abs(histogram.percentile(percentile) - expected) / expected < 1 / 16
+
+    def test_empty(self):
+        histogram = Histogram()
+        assert histogram.percentile(99) == 0
+
+
+class TestFrameProcessorStats(unittest.IsolatedAsyncioTestCase):
+    async def test_stats_disabled(self):
+        task = await run_task(PipelineParams(), [SlowProcessor()])
+        assert task.processor_stats() == []
+
+    async def test_stats(self):
+        slow = SlowProcessor()
+        identity = IdentityFilter()
+        params = PipelineParams(enable_processor_stats=True)
+        task = await run_task(params, [slow, Pipeline([identity])])
+        stats = {s.processor: s for s in task.processor_stats()}
+        assert list(stats.keys()) == [slow.name, identity.name]
+
+        slow_stats = stats[slow.name]
+        # 5 text frames and the EndFrame.
+        assert slow_stats.processing_time.count == 6
+        assert slow_stats.processing_time.p50 >= 0.02
+        # Text frames wait in the queue while the previous ones are processed.
+        assert slow_stats.queue_wait.max >= 0.02
+        assert slow_stats.queue_depth.max >= 1
+
+    async def test_stats_reset(self):
+        slow = SlowProcessor()
+        params = PipelineParams(enable_processor_stats=True)
+        task = await run_task(params, [slow])
+        (stats,) = task.processor_stats(reset=True)
+        assert stats.processing_time.count == 6
+        (stats,) = task.processor_stats()
+        assert stats.processing_time.count == 0
+        assert stats.queue_wait.max == 0
@@ -0,0 +1,169 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+    TTSUpdateSettingsFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.processors.frame_queue import FrameQueue, FrameQueueParams, FrameQueuePolicy
+from pipecat.tests.utils import run_test
+
+
+def audio_frame() -> InputAudioRawFrame:
+    return InputAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+
+
+def output_audio_frame() -> OutputAudioRawFrame:
+    return OutputAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+
+
+def queued_frames(queue: FrameQueue):
+    frames = []
+    while not queue.empty():
+        frames.append(queue.get_nowait())
+    return frames
+
+
+class TestFrameQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_unbounded(self):
+        queue = FrameQueue("test")
+        for _ in range(100):
+            await queue.put(audio_frame())
+        assert queue.qsize() == 100
+        assert queue.dropped == 0
+
+    async def test_drop_oldest_audio(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=3))
+        text = TextFrame(text="Hello")
+        audio1 = audio_frame()
+        audio2 = audio_frame()
+        audio3 = audio_frame()
+        for frame in [text, audio1, audio2, audio3]:
+            await queue.put(frame)
+        assert queue.dropped == 1
+        assert queued_frames(queue) == [text, audio2, audio3]
+
+    async def test_block(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=2))
+        await queue.put(audio_frame())
+        await queue.put(TextFrame(text="Hello"))
+        put_task = asyncio.create_task(queue.put(EndFrame()))
+        await asyncio.sleep(0.01)
+        assert not put_task.done()
+        queue.get_nowait()
+        await asyncio.wait_for(put_task, timeout=1.0)
+        assert queue.qsize() == 2
+        assert queue.dropped == 0
+
+    async def test_block_when_nothing_to_drop(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=1))
+        await queue.put(TextFrame(text="Hello"))
+        put_task = asyncio.create_task(queue.put(audio_frame()))
+        await asyncio.sleep(0.01)
+        assert not put_task.done()
+        put_task.cancel()
+
+    async def test_block_output_audio(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=1))
+        await queue.put(output_audio_frame())
+        put_task = asyncio.create_task(
+            queue.put(TTSAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1))
+        )
+        await asyncio.sleep(0.01)
+        assert not put_task.done()
+        assert queue.dropped == 0
+        put_task.cancel()
+
+    async def test_coalesce(self):
+        params = FrameQueueParams(
+            max_size=2, policies={TTSUpdateSettingsFrame: FrameQueuePolicy.COALESCE}
+        )
+        queue = FrameQueue("test", params)
+        text = TextFrame(text="Hello")
+        settings1 = TTSUpdateSettingsFrame(settings={"voice": "1"})
+        settings2 = TTSUpdateSettingsFrame(settings={"voice": "2"})
+        for frame in [settings1, text, settings2]:
+            await queue.put(frame)
+        assert queue.coalesced == 1
+        assert queued_frames(queue) == [settings2, text]
+
+    async def test_frame_getter(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=1), frame_getter=lambda i: i[0])
+        await queue.put((audio_frame(), 1))
+        item = (audio_frame(), 2)
+        await queue.put(item)
+        assert queue.dropped == 1
+        assert queued_frames(queue) == [item]
+
+    async def test_close_wakes_up_putters(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=1))
+        await queue.put(TextFrame(text="Hello"))
+        put_task = asyncio.create_task(queue.put(TextFrame(text="World")))
+        await asyncio.sleep(0.01)
+        queue.close()
+        await asyncio.wait_for(put_task, timeout=1.0)
+        # The frame of the woken up putter is discarded.
+        assert queue.empty()
+        await asyncio.wait_for(queue.join(), timeout=1.0)
+
+    async def test_close(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=2))
+        await queue.put(TextFrame(text="Hello"))
+        await queue.put(TextFrame(text="World"))
+        queue.close()
+        # Discarded frames are marked as done.
+        await asyncio.wait_for(queue.join(), timeout=1.0)
+        # A closed queue doesn't grow.
+        for _ in range(5):
+            await queue.put(TextFrame(text="Hello"))
+        assert queue.empty()
+
+    async def test_check_overflow(self):
+        queue = FrameQueue("test", FrameQueueParams(max_size=1))
+        assert not queue.check_overflow()
+        await queue.put(audio_frame())
+        await queue.put(audio_frame())
+        assert queue.check_overflow()
+        await queue.put(audio_frame())
+        # Reported too recently.
+        assert not queue.check_overflow()
+
+
+class SlowTextProcessor(FrameProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(0.1)
+        await self.push_frame(frame, direction)
+
+
+class TestFrameProcessorQueues(unittest.IsolatedAsyncioTestCase):
+    async def test_input_queue_drops_audio(self):
+        params = FrameQueueParams(
+            max_size=2, policies={OutputAudioRawFrame: FrameQueuePolicy.DROP_OLDEST}
+        )
+        processor = SlowTextProcessor(queue_params=params)
+        frames_to_send = [TextFrame(text="Hello")] + [output_audio_frame() for _ in range(5)]
+        # Audio frames pile up in the input queue while the text frame is being
+        # processed and then again in the push queue (the push task doesn't get
+        # a chance to run until the input queue is empty).
+        expected_down_frames = [TextFrame, OutputAudioRawFrame]
+        (received_down, _) = await run_test(
+            processor,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        # The newest audio frame is the one that makes it.
+        assert received_down[1] is frames_to_send[-1]
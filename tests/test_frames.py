@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import dataclasses
+import unittest
+
+from pipecat.frames.frames import (
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+)
+
+
+class TestFrames(unittest.TestCase):
+    def test_name_creation_order(self):
+        frame1 = TextFrame(text="Hello")
+        frame2 = TextFrame(text="Pipecat!")
+        # Access the names in reverse order.
+        name2 = frame2.name
+        name1 = frame1.name
+        count1 = int(name1.split("#")[1])
+        count2 = int(name2.split("#")[1])
+        assert name1.startswith("TextFrame#")
+        assert count2 == count1 + 1
+
+    def test_name_setter(self):
+        frame = TextFrame(text="Hello")
+        frame.name = "MyFrame"
+        assert frame.name == "MyFrame"
+        assert str(frame).startswith("MyFrame")
+
+    def test_metadata(self):
+        frame = TextFrame(text="Hello")
+        assert frame.metadata == {}
+        frame.metadata["foo"] = "bar"
+        assert frame.metadata == {"foo": "bar"}
+        frame.metadata = {"bar": "foo"}
+        assert frame.metadata == {"bar": "foo"}
+
+    def test_fields(self):
+        frame = TextFrame(text="Hello")
+        names = [f.name for f in dataclasses.fields(frame)]
+        assert names == ["id", "pts", "text"]
+        assert dataclasses.asdict(frame)["text"] == "Hello"
+
+    def test_slotted_mixin_frames(self):
+        for frame_cls in (InputAudioRawFrame, OutputAudioRawFrame, TTSAudioRawFrame):
+            with self.subTest(frame_cls=frame_cls):
+                frame = frame_cls(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+                assert frame.num_frames == 160
+                assert frame.name.startswith(f"{frame_cls.__name__}#")
+                frame.metadata["foo"] = "bar"
+                assert frame.metadata == {"foo": "bar"}
+                assert not hasattr(frame, "__dict__")
+                with self.assertRaises(AttributeError):
+                    frame.foo = "bar"
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from pipecat.audio.g711 import G711StreamDecoder, G711StreamEncoder, g711_decode, g711_encode
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+try:
+    import audioop
+except ModuleNotFoundError:
+    audioop = None
+
+ALL_PCM = np.arange(-32768, 32768, dtype=np.int16)
+ALL_G711 = bytes(range(256))
+
+
+def sine(sample_rate: int, secs: float, freq: float = 440.0) -> bytes:
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    return (10000 * np.sin(2 * np.pi * freq * t)).astype(np.int16).tobytes()
+
+
+def chunks(audio: bytes, size: int):
+    return [audio[i : i + size] for i in range(0, len(audio), size)]
+
+
+class TestG711(unittest.IsolatedAsyncioTestCase):
+    @unittest.skipIf(audioop is None, "audioop is not available")
+    def test_audioop_compatible(self):
+        self.assertEqual(g711_decode(ALL_G711, "ulaw").tobytes(), audioop.ulaw2lin(ALL_G711, 2))
+        self.assertEqual(g711_decode(ALL_G711, "alaw").tobytes(), audioop.alaw2lin(ALL_G711, 2))
+        self.assertEqual(g711_encode(ALL_PCM, "ulaw"), audioop.lin2ulaw(ALL_PCM.tobytes(), 2))
+        self.assertEqual(g711_encode(ALL_PCM, "alaw"), audioop.lin2alaw(ALL_PCM.tobytes(), 2))
+
+    def test_round_trip(self):
+        for law in ["ulaw", "alaw"]:
+            # Decoding and encoding gives back the same code, except for
+            # μ-law's negative zero (0x7F) which is encoded as zero (0xFF).
+            decoded = g711_decode(ALL_G711, law)
+            encoded = np.frombuffer(g711_encode(decoded, law), dtype=np.uint8)
+            mismatches = np.flatnonzero(encoded != np.frombuffer(ALL_G711, dtype=np.uint8))
+            self.assertEqual(list(mismatches), [0x7F] if law == "ulaw" else [])
+
+    def test_unsupported_law(self):
+        with self.assertRaises(ValueError):
+            G711StreamDecoder("g722")
+        with self.assertRaises(ValueError):
+            g711_encode(ALL_PCM, "g722")
+
+    async def test_stream_decoder(self):
+        """Decoding and resampling in a single pass gives the same audio as
+        doing it separately."""
+        encoded = g711_encode(np.frombuffer(sine(8000, 0.5), dtype=np.int16))
+
+        decoder = G711StreamDecoder()
+        resampler = SOXRStreamAudioResampler()
+        for chunk in chunks(encoded, 160):
+            decoded = np.frombuffer(await decoder.decode(chunk, 8000, 16000), dtype=np.int16)
+            expected = np.frombuffer(
+                await resampler.resample(g711_decode(chunk).tobytes(), 8000, 16000),
+                dtype=np.int16,
+            )
+            self.assertEqual(len(decoded), len(expected))
+            # SoX dithers int16 output, so there might be rounding differences.
+            self.assertLessEqual(np.abs(decoded.astype(np.int32) - expected).max(initial=0), 2)
+
+    async def test_stream_encoder(self):
+        encoder = G711StreamEncoder("alaw")
+        resampler = SOXRStreamAudioResampler()
+        for chunk in chunks(sine(24000, 0.5), 960):
+            encoded = await encoder.encode(chunk, 24000, 8000)
+            expected = np.frombuffer(await resampler.resample(chunk, 24000, 8000), dtype=np.int16)
+            self.assertEqual(len(encoded), len(expected))
+            # Within one A-law quantization step (16 for the smallest values).
+            diff = np.abs(g711_decode(encoded, "alaw").astype(np.int32) - expected)
+            self.assertTrue(np.all(diff <= np.maximum(32, np.abs(expected) // 8)))
+        self.assertEqual(len(await encoder.flush()), len(await resampler.flush()) // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
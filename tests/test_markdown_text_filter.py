@@ -228,3 +228,52 @@ class TestMarkdownTextFilter(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(
             filter.filter(input_text), "bold and italic", "Text filtering should be re-enabled"
         )
+
+    async def test_links_and_headings(self):
+        """Test removal of links, images, headings and block quotes."""
+        test_cases = {
+            "See [the docs](https://docs.pipecat.ai) for more.": "See the docs for more.",
+            "An image ![diagram](diagram.png) here": "An image  here",
+            "# Title\nText": "Title\nText",
+            "Intro\n## Step 1: Setup": "Intro\nStep 1: Setup",
+            "> Quoted text": "Quoted text",
+            "Before\n---\nAfter": "Before\nAfter",
+            "snake_case_name and _emphasis_": "snake_case_name and emphasis",
+        }
+
+        for input_text, expected in test_cases.items():
+            result = self.filter.filter(input_text)
+            self.assertEqual(result, expected, f"Markdown removal failed for: '{input_text}'")
+
+    async def test_streamed_code_block_removal(self):
+        """Test removal of code blocks split across multiple calls."""
+        filter = MarkdownTextFilter(params=MarkdownTextFilter.InputParams(filter_code=True))
+
+        chunks = ["Here is the code:\n```python\nx = 1", " y = 2.", "\n```\nThat's it."]
+        expected = ["Here is the code:", "", "That's it."]
+
+        self.assertEqual([filter.filter(chunk) for chunk in chunks], expected)
+
+    async def test_streamed_table_removal(self):
+        """Test removal of tables split across multiple calls (even in the middle
+        of a row).
+        """
+        filter = MarkdownTextFilter(params=MarkdownTextFilter.InputParams(filter_tables=True))
+
+        chunks = [
+            "Cities:\n| City | Notes |\n|---|---|\n| Paris | Big.",
+            " Old. |\n| Rome | Nice |",
+            "Anything else?",
+        ]
+        expected = ["Cities:", "", "Anything else?"]
+
+        self.assertEqual([filter.filter(chunk) for chunk in chunks], expected)
+
+    async def test_interruption_resets_code_block(self):
+        """Test that an interruption ends the current code block."""
+        filter = MarkdownTextFilter(params=MarkdownTextFilter.InputParams(filter_code=True))
+
+        self.assertEqual(filter.filter("Code:\n```\nx = 1"), "Code:")
+        filter.handle_interruption()
+        filter.reset_interruption()
+        self.assertEqual(filter.filter("New answer."), "New answer.")
@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from pipecat.frames.frames import OutputAudioRawFrame, StartInterruptionFrame
+from pipecat.serializers.protobuf import (
+    ProtobufFrameSerializer,
+    _pack_opus_packets,
+    _unpack_opus_packets,
+)
+
+try:
+    from pipecat.audio.opus import OpusStreamDecoder, OpusStreamEncoder
+except Exception:
+    OpusStreamEncoder = None
+
+
+def sine(sample_rate: int, secs: float, freq: float = 440.0) -> bytes:
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    return (10000 * np.sin(2 * np.pi * freq * t)).astype(np.int16).tobytes()
+
+
+def chunks(audio: bytes, size: int):
+    return [audio[i : i + size] for i in range(0, len(audio), size)]
+
+
+def best_correlation(expected: np.ndarray, actual: np.ndarray, max_delay: int) -> float:
+    # Opus (and resampling) delays the audio a bit.
+    best = 0.0
+    for delay in range(max_delay):
+        a = actual[delay : delay + len(expected) // 2].astype(np.float64)
+        e = expected[: len(a)].astype(np.float64)
+        best = max(best, np.dot(a, e) / (np.linalg.norm(a) * np.linalg.norm(e) + 1e-9))
+    return best
+
+
+class TestOpusPackets(unittest.TestCase):
+    def test_roundtrip(self):
+        packets = [b"", b"a", b"bc" * 300]
+        self.assertEqual(_unpack_opus_packets(_pack_opus_packets(packets)), packets)
+
+    def test_truncated(self):
+        data = _pack_opus_packets([b"abcdef"])
+        with self.assertRaises(ValueError):
+            _unpack_opus_packets(data[:-1])
+        with self.assertRaises(ValueError):
+            _unpack_opus_packets(data + b"\x00")
+
+
+@unittest.skipIf(OpusStreamEncoder is None, "Opus (PyAV) is not installed")
+class TestOpusCodec(unittest.IsolatedAsyncioTestCase):
+    async def _roundtrip(self, sample_rate: int) -> bytes:
+        audio = sine(sample_rate, 0.5)
+        encoder = OpusStreamEncoder()
+        decoder = OpusStreamDecoder()
+        decoded = b""
+        # 10ms chunks, so half of the calls don't have a full Opus frame.
+        for chunk in chunks(audio, sample_rate // 100 * 2):
+            for packet in await encoder.encode(chunk, sample_rate):
+                decoded += await decoder.decode(packet, sample_rate)
+        return audio, decoded
+
+    async def test_roundtrip(self):
+        for sample_rate in (16000, 24000, 22050):
+            audio, decoded = await self._roundtrip(sample_rate)
+            # Only full 20ms frames are encoded and resamplers keep some audio.
+            self.assertAlmostEqual(len(decoded), len(audio), delta=sample_rate // 25 * 2)
+            correlation = best_correlation(
+                np.frombuffer(audio, dtype=np.int16),
+                np.frombuffer(decoded, dtype=np.int16),
+                sample_rate // 50,
+            )
+            self.assertGreater(correlation, 0.9, f"sample rate {sample_rate}")
+
+    async def test_reset(self):
+        encoder = OpusStreamEncoder()
+        self.assertEqual(await encoder.encode(sine(16000, 0.01), 16000), [])
+        encoder.reset()
+        # The buffered 10ms were discarded.
+        self.assertEqual(await encoder.encode(sine(16000, 0.01), 16000), [])
+        self.assertEqual(len(await encoder.encode(sine(16000, 0.01), 16000)), 1)
+
+    async def test_invalid_frame_duration(self):
+        with self.assertRaises(ValueError):
+            OpusStreamEncoder(frame_ms=30)
+
+
+@unittest.skipIf(OpusStreamEncoder is None, "Opus (PyAV) is not installed")
+class TestProtobufSerializerOpus(unittest.IsolatedAsyncioTestCase):
+    async def test_roundtrip(self):
+        serializer = ProtobufFrameSerializer(
+            ProtobufFrameSerializer.InputParams(audio_codec="opus")
+        )
+        audio = sine(24000, 1.0)
+        pcm_size = opus_size = 0
+        decoded = b""
+        for chunk in chunks(audio, 24000 // 50 * 2):
+            frame = OutputAudioRawFrame(audio=chunk, sample_rate=24000, num_channels=1)
+            pcm_size += len(await ProtobufFrameSerializer().serialize(frame))
+            data = await serializer.serialize(frame)
+            opus_size += len(data)
+            frame = await serializer.deserialize(data)
+            self.assertEqual(frame.sample_rate, 24000)
+            self.assertEqual(frame.num_channels, 1)
+            decoded += frame.audio
+
+        # The decoder resampler (48000 to 24000) keeps some audio.
+        self.assertAlmostEqual(len(decoded), len(audio), delta=24000 // 25 * 2)
+        self.assertLess(opus_size * 5, pcm_size)
+
+    async def test_interruption(self):
+        serializer = ProtobufFrameSerializer(
+            ProtobufFrameSerializer.InputParams(audio_codec="opus")
+        )
+        frame = OutputAudioRawFrame(audio=sine(16000, 0.01), sample_rate=16000, num_channels=1)
+        # Not enough audio for an Opus frame.
+        self.assertIsNone(await serializer.serialize(frame))
+        await serializer.serialize(StartInterruptionFrame())
+        self.assertIsNone(await serializer.serialize(frame))
+        self.assertIsNotNone(await serializer.serialize(frame))
+
+    async def test_invalid_audio(self):
+        serializer = ProtobufFrameSerializer(
+            ProtobufFrameSerializer.InputParams(audio_codec="opus")
+        )
+        data = await ProtobufFrameSerializer().serialize(
+            OutputAudioRawFrame(audio=b"\x00\x10abc", sample_rate=16000, num_channels=1)
+        )
+        self.assertIsNone(await serializer.deserialize(data))
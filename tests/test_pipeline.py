@@ -8,13 +8,60 @@ import asyncio
 import time
 import unittest
 
-from pipecat.frames.frames import EndFrame, HeartbeatFrame, StartFrame, TextFrame
-from pipecat.pipeline.parallel_pipeline import ParallelPipeline
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    HeartbeatFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+    StartInterruptionFrame,
+    TextFrame,
+)
+from pipecat.pipeline.parallel_pipeline import FanOutTracker, ParallelPipeline
 from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.sync_parallel_pipeline import SyncParallelPipeline
 from pipecat.pipeline.task import PipelineParams, PipelineTask
+from pipecat.processors.filters.frame_filter import FrameFilter
 from pipecat.processors.filters.identity_filter import IdentityFilter
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
-from pipecat.tests.utils import HeartbeatsObserver, run_test
+from pipecat.tests.utils import HeartbeatsObserver, SleepFrame, run_test
+
+
+class SlowTextProcessor(FrameProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(0.1)
+        await self.push_frame(frame, direction)
+
+
+class ConcurrentPushProcessor(FrameProcessor):
+    """Pushes every text frame from a new task. Needs to be inline, otherwise
+    frames would go through the push queue."""
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            self.create_task(self.push_frame(frame, direction))
+        else:
+            await self.push_frame(frame, direction)
+
+
+class SuffixTextProcessor(FrameProcessor):
+    """Replaces text frames with a new text frame with a suffix."""
+
+    def __init__(self, suffix: str, delay: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self._suffix = suffix
+        self._delay = delay
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await asyncio.sleep(self._delay)
+            await self.push_frame(TextFrame(text=f"{frame.text}{self._suffix}"), direction)
+        else:
+            await self.push_frame(frame, direction)
 
 
 class TestPipeline(unittest.IsolatedAsyncioTestCase):
@@ -44,6 +91,121 @@ class TestPipeline(unittest.IsolatedAsyncioTestCase):
             expected_down_frames=expected_down_frames,
         )
 
+    async def test_pipeline_inline(self):
+        identity1 = IdentityFilter()
+        identity2 = IdentityFilter()
+        identity3 = IdentityFilter()
+
+        pipeline = Pipeline([identity1, identity2, identity3], inline=True)
+        assert identity1.inline and identity2.inline and identity3.inline
+
+        frames_to_send = [
+            TextFrame(text="Hello"),
+            TextFrame(text="from"),
+            TextFrame(text="Pipecat!"),
+        ]
+        expected_down_frames = [TextFrame, TextFrame, TextFrame]
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        assert [f.text for f in received_down] == ["Hello", "from", "Pipecat!"]
+
+    async def test_pipeline_inline_nested(self):
+        identity1 = IdentityFilter()
+        identity2 = IdentityFilter()
+        pipeline = Pipeline([ParallelPipeline([identity1], [identity2])], inline=True)
+        assert identity1.inline and identity2.inline
+
+    async def test_pipeline_inline_concurrent_order(self):
+        """Frames pushed from concurrent tasks are processed in order."""
+        pipeline = Pipeline([ConcurrentPushProcessor(inline=True), SlowTextProcessor(inline=True)])
+
+        frames_to_send = [TextFrame(text=f"{i}") for i in range(5)] + [SleepFrame(sleep=0.7)]
+        expected_down_frames = [TextFrame] * 5
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        assert [f.text for f in received_down] == ["0", "1", "2", "3", "4"]
+
+    async def test_pipeline_inline_interruption(self):
+        """A frame waiting for an inline processor is discarded if an
+        interruption happens meanwhile."""
+        pipeline = Pipeline(
+            [
+                ConcurrentPushProcessor(inline=True),
+                SuffixTextProcessor("", delay=0.3, inline=True),
+            ]
+        )
+
+        frames_to_send = [
+            TextFrame(text="Hello"),
+            TextFrame(text="Pipecat!"),
+            SleepFrame(sleep=0.1),
+            StartInterruptionFrame(),
+            SleepFrame(sleep=0.5),
+        ]
+        # The frame being processed is not cancelled but the waiting one is
+        # discarded.
+        expected_down_frames = [StartInterruptionFrame, TextFrame]
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        assert received_down[1].text == "Hello"
+
+    async def test_pipeline_inline_processor(self):
+        pipeline = Pipeline([IdentityFilter(), IdentityFilter(inline=True), IdentityFilter()])
+
+        frames_to_send = [TextFrame(text="Hello from Pipecat!")]
+        expected_down_frames = [TextFrame]
+        await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
+    async def test_pipeline_interruption(self):
+        pipeline = Pipeline([IdentityFilter(), IdentityFilter()])
+
+        frames_to_send = [
+            TextFrame(text="Hello"),
+            SleepFrame(),
+            StartInterruptionFrame(),
+            TextFrame(text="Pipecat!"),
+        ]
+        expected_down_frames = [TextFrame, StartInterruptionFrame, TextFrame]
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        assert received_down[-1].text == "Pipecat!"
+
+    async def test_pipeline_interruption_discards_queued_frames(self):
+        pipeline = Pipeline([SlowTextProcessor(), IdentityFilter()])
+
+        frames_to_send = [
+            TextFrame(text="Hello"),
+            TextFrame(text="from"),
+            SleepFrame(sleep=0.05),
+            StartInterruptionFrame(),
+            TextFrame(text="Pipecat!"),
+        ]
+        # The first frame is being processed when the interruption arrives and
+        # the second one is still queued, so both are discarded.
+        expected_down_frames = [StartInterruptionFrame, TextFrame]
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        assert received_down[-1].text == "Pipecat!"
+
     async def test_pipeline_start_metadata(self):
         pipeline = Pipeline([IdentityFilter()])
 
@@ -83,6 +245,180 @@ class TestParallelPipeline(unittest.IsolatedAsyncioTestCase):
             expected_down_frames=expected_down_frames,
         )
 
+    async def test_parallel_audio_load(self):
+        """Should only passthrough one instance of each audio frame and forget
+        about them once all branches have output them."""
+        for branches in (2, 4, 8):
+            with self.subTest(branches=branches):
+                pipeline = ParallelPipeline(*[[IdentityFilter()] for _ in range(branches)])
+
+                frames_to_send = [
+                    OutputAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+                    for _ in range(200)
+                ]
+                expected_down_frames = [OutputAudioRawFrame] * 200
+                await run_test(
+                    pipeline,
+                    frames_to_send=frames_to_send,
+                    expected_down_frames=expected_down_frames,
+                )
+                assert len(pipeline._fan_out_tracker) == 0
+
+    async def test_parallel_filtered_frames(self):
+        """Frames filtered out by some branches should be pushed once."""
+        pipeline = ParallelPipeline([FrameFilter((TextFrame,))], [IdentityFilter()])
+
+        frames_to_send = [
+            TextFrame(text="Hello from Pipecat!"),
+            OutputAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1),
+        ]
+        expected_down_frames = [TextFrame, OutputAudioRawFrame]
+        await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
+
+class TestSyncParallelPipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_sync_parallel_single(self):
+        pipeline = SyncParallelPipeline([IdentityFilter()])
+
+        frames_to_send = [TextFrame(text="Hello from Pipecat!")]
+        expected_down_frames = [TextFrame]
+        await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
+    async def test_sync_parallel_multiple(self):
+        """Should only passthrough one instance of TextFrame."""
+        pipeline = SyncParallelPipeline([IdentityFilter()], [IdentityFilter()])
+
+        frames_to_send = [TextFrame(text="Hello from Pipecat!")]
+        expected_down_frames = [TextFrame]
+        await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+
+    async def test_sync_parallel_order(self):
+        """Output is pushed in input order and pipeline order, even if the
+        second pipeline is faster."""
+        for max_frames_in_flight in (1, 3):
+            with self.subTest(max_frames_in_flight=max_frames_in_flight):
+                pipeline = SyncParallelPipeline(
+                    [SuffixTextProcessor("a", delay=0.02)],
+                    [SuffixTextProcessor("b")],
+                    max_frames_in_flight=max_frames_in_flight,
+                )
+
+                frames_to_send = [TextFrame(text=f"{i}") for i in range(3)]
+                expected_down_frames = [TextFrame] * 6
+                (received_down, _) = await run_test(
+                    pipeline,
+                    frames_to_send=frames_to_send,
+                    expected_down_frames=expected_down_frames,
+                )
+                texts = [f.text for f in received_down]
+                assert texts == ["0a", "0b", "1a", "1b", "2a", "2b"]
+
+    async def test_sync_parallel_frames_in_flight(self):
+        """Frames overlap in the internal pipelines."""
+        pipeline = SyncParallelPipeline(
+            [SuffixTextProcessor("a", delay=0.1), SuffixTextProcessor("a", delay=0.1)],
+            max_frames_in_flight=4,
+        )
+
+        frames_to_send = [TextFrame(text=f"{i}") for i in range(4)]
+        expected_down_frames = [TextFrame] * 4
+        start_time = time.time()
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        # One frame at a time would take 0.8 seconds.
+        assert time.time() - start_time < 0.7
+        assert [f.text for f in received_down] == ["0aa", "1aa", "2aa", "3aa"]
+
+    async def test_sync_parallel_interruption(self):
+        pipeline = SyncParallelPipeline(
+            [SuffixTextProcessor("a", delay=0.2)],
+            [SuffixTextProcessor("b")],
+            max_frames_in_flight=2,
+        )
+
+        frames_to_send = [
+            TextFrame(text="0"),
+            TextFrame(text="1"),
+            SleepFrame(sleep=0.1),
+            StartInterruptionFrame(),
+            TextFrame(text="2"),
+        ]
+        expected_down_frames = [StartInterruptionFrame, TextFrame, TextFrame]
+        (received_down, _) = await run_test(
+            pipeline,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        assert [f.text for f in received_down[1:]] == ["2a", "2b"]
+
+
+class TestFanOutTracker(unittest.TestCase):
+    def test_push_once(self):
+        tracker = FanOutTracker(branches=3)
+        tracker.add(1)
+        assert tracker.should_push(1)
+        assert not tracker.should_push(1)
+        assert not tracker.should_push(1)
+        assert len(tracker) == 0
+
+    def test_not_fanned_out(self):
+        tracker = FanOutTracker(branches=3)
+        assert tracker.should_push(1)
+        assert tracker.should_push(1)
+
+    def test_bounded(self):
+        tracker = FanOutTracker(branches=2, max_size=10)
+        # Frames are only output by one of the branches, so they are never
+        # forgotten unless they are discarded by generations.
+        for frame_id in range(1000):
+            tracker.add(frame_id)
+            assert tracker.should_push(frame_id)
+            assert len(tracker) <= 20
+        # Recent frames are still tracked.
+        assert not tracker.should_push(999)
+
+    def test_discarded_frames_not_pushed_again(self):
+        tracker = FanOutTracker(branches=2, max_size=10)
+        for frame_id in range(100):
+            tracker.add(frame_id)
+            assert tracker.should_push(frame_id)
+        # The second branch outputs a frame that has been discarded.
+        assert not tracker.should_push(75)
+        # Newer frames created inside a branch are still pushed.
+        assert tracker.should_push(1000)
+
+    def test_untracked_old_frames_pushed(self):
+        """Frames created inside a branch are pushed even if their id is older
+        than discarded frames (ids are shared by the whole process).
+        """
+        tracker = FanOutTracker(branches=2, max_size=10)
+        for frame_id in range(100, 200):
+            tracker.add(frame_id)
+            assert tracker.should_push(frame_id)
+        assert tracker.should_push(50)
+
+    def test_discarded_frames_bounded(self):
+        tracker = FanOutTracker(branches=2, max_size=10)
+        for frame_id in range(1000):
+            tracker.add(frame_id)
+            tracker.should_push(frame_id)
+            assert len(tracker._discarded) <= 10
+
 
 class TestPipelineTask(unittest.IsolatedAsyncioTestCase):
     async def test_task_single(self):
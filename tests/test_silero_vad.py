@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+try:
+    import onnxruntime  # noqa: F401
+
+    from pipecat.audio.vad.silero import (
+        SileroVADAnalyzer,
+        get_silero_session,
+        warm_up_silero_vad,
+    )
+except ModuleNotFoundError:
+    onnxruntime = None
+
+
+def window(seed: int) -> bytes:
+    rng = np.random.default_rng(seed)
+    t = np.arange(512) / 16000
+    audio = 8000 * np.sin(2 * np.pi * 200 * t) + rng.normal(0, 1000, 512)
+    return audio.astype(np.int16).tobytes()
+
+
+@unittest.skipIf(onnxruntime is None, "onnxruntime is not installed")
+class TestSileroVADAnalyzer(unittest.TestCase):
+    def test_shared_session(self):
+        warm_up_silero_vad()
+        analyzer1 = SileroVADAnalyzer(sample_rate=16000)
+        analyzer2 = SileroVADAnalyzer(sample_rate=16000)
+        self.assertIs(analyzer1._model.session, get_silero_session())
+        self.assertIs(analyzer1._model.session, analyzer2._model.session)
+
+    def test_independent_streams(self):
+        """Analyzers sharing a session keep their own state."""
+        windows = [window(i) for i in range(5)]
+
+        expected = []
+        analyzer = SileroVADAnalyzer(sample_rate=16000)
+        analyzer.set_sample_rate(16000)
+        for w in windows:
+            expected.append(analyzer.voice_confidence(w)[0])
+
+        analyzer1 = SileroVADAnalyzer(sample_rate=16000)
+        analyzer1.set_sample_rate(16000)
+        analyzer2 = SileroVADAnalyzer(sample_rate=16000)
+        analyzer2.set_sample_rate(16000)
+        confidences = []
+        for w in windows:
+            confidences.append(analyzer1.voice_confidence(w)[0])
+            # Feed different audio to the other analyzer in between.
+            analyzer2.voice_confidence(window(100))
+
+        np.testing.assert_allclose(confidences, expected, atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
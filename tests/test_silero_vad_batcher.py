@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+import numpy as np
+
+from pipecat.audio.samples import float32_samples
+from pipecat.utils.executors import MODEL_INFERENCE_POOL, ExecutorService
+
+try:
+    import onnxruntime  # noqa: F401
+
+    from pipecat.audio.vad.silero import (
+        BatchedSileroVADAnalyzer,
+        SileroVADAnalyzer,
+        SileroVADBatcher,
+        SileroVADStream,
+    )
+except ModuleNotFoundError:
+    onnxruntime = None
+
+
+def stream_audio(seed: int, sample_rate: int, secs: float) -> bytes:
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    voice = np.sin(2 * np.pi * (150 + 50 * seed) * t) * np.sin(np.pi * 2 * t) ** 2
+    audio = 8000 * voice + rng.normal(0, 300, len(t))
+    return audio.astype(np.int16).tobytes()
+
+
+@unittest.skipIf(onnxruntime is None, "onnxruntime is not installed")
+class TestSileroVADBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_same_confidence_as_silero_analyzer(self):
+        batcher = SileroVADBatcher(max_delay_secs=0.001)
+        num_streams = 4
+        window = 1024  # 512 samples at 16kHz
+
+        batched = []
+        single = []
+        for _ in range(num_streams):
+            analyzer = BatchedSileroVADAnalyzer(batcher=batcher, sample_rate=16000)
+            analyzer.set_sample_rate(16000)
+            batched.append(analyzer)
+            analyzer = SileroVADAnalyzer(sample_rate=16000)
+            analyzer.set_sample_rate(16000)
+            single.append(analyzer)
+
+        audios = [stream_audio(i, 16000, 1.0) for i in range(num_streams)]
+
+        calls = 0
+        infer = batcher.infer
+
+        def counting_infer(*args):
+            nonlocal calls
+            calls += 1
+            return infer(*args)
+
+        batcher.infer = counting_infer
+
+        num_windows = len(audios[0]) // window
+        for w in range(num_windows):
+            chunks = [audio[w * window : (w + 1) * window] for audio in audios]
+            expected = [a.voice_confidence(c)[0] for a, c in zip(single, chunks)]
+            confidences = await asyncio.gather(
+                *[
+                    batcher.voice_confidence(a._stream, float32_samples(c), a.sample_rate)
+                    for a, c in zip(batched, chunks)
+                ]
+            )
+            for a in batched:
+                a._maybe_reset_stream()
+            np.testing.assert_allclose(confidences, expected, atol=1e-5)
+
+        # One inference per window for all the streams.
+        self.assertEqual(calls, num_windows)
+
+    async def test_analyze_audio_async(self):
+        batcher = SileroVADBatcher(max_delay_secs=0.001)
+        analyzer = BatchedSileroVADAnalyzer(batcher=batcher, sample_rate=8000)
+        analyzer.set_sample_rate(8000)
+        audio = stream_audio(0, 8000, 1.0)
+        states = set()
+        for i in range(0, len(audio), 320):
+            states.add(await analyzer.analyze_audio_async(audio[i : i + 320]))
+        self.assertTrue(states)
+
+    async def test_close(self):
+        service = ExecutorService({MODEL_INFERENCE_POOL: 1})
+        batcher = SileroVADBatcher(max_delay_secs=10, executor_service=service)
+        stream = SileroVADStream()
+        audio = float32_samples(stream_audio(0, 16000, 0.032))
+        pending = asyncio.create_task(batcher.voice_confidence(stream, audio, 16000))
+        await asyncio.sleep(0)
+
+        # Windows waiting for a batch are cancelled.
+        batcher.close()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        with self.assertRaises(RuntimeError):
+            await batcher.voice_confidence(stream, audio, 16000)
+        self.assertEqual(service.get_pool(MODEL_INFERENCE_POOL).stats().completed, 0)
+        service.shutdown()
+
+    async def test_runs_in_model_inference_pool(self):
+        service = ExecutorService({MODEL_INFERENCE_POOL: 1})
+        batcher = SileroVADBatcher(max_delay_secs=0.001, executor_service=service)
+        audio = float32_samples(stream_audio(0, 16000, 0.032))
+        confidence = await batcher.voice_confidence(SileroVADStream(), audio, 16000)
+        self.assertTrue(0 <= confidence <= 1)
+        self.assertEqual(service.get_pool(MODEL_INFERENCE_POOL).stats().completed, 1)
+        batcher.close()
+        service.shutdown()
+
+    def test_sync_voice_confidence(self):
+        batcher = SileroVADBatcher()
+        analyzer = BatchedSileroVADAnalyzer(batcher=batcher, sample_rate=16000)
+        analyzer.set_sample_rate(16000)
+        confidence = analyzer.voice_confidence(stream_audio(0, 16000, 0.032))
+        self.assertTrue(0 <= confidence <= 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+from typing import List
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    OutputAudioRawFrame,
+    TextFrame,
+    TranscriptionFrame,
+)
+from pipecat.observers.base_observer import BaseObserver
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.filters.identity_filter import IdentityFilter
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.processors.frameworks.rtvi import RTVIObserver
+
+
+class UpstreamProcessor(FrameProcessor):
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame):
+            await self.push_frame(TextFrame(text="upstream"), FrameDirection.UPSTREAM)
+        await self.push_frame(frame, direction)
+
+
+class RecordingObserver(BaseObserver):
+    def __init__(self):
+        self.frames: List[Frame] = []
+
+    async def on_push_frame(
+        self,
+        src: FrameProcessor,
+        dst: FrameProcessor,
+        frame: Frame,
+        direction: FrameDirection,
+        timestamp: int,
+    ):
+        self.frames.append(frame)
+
+
+class TextObserver(RecordingObserver):
+    frame_types = (TextFrame,)
+
+
+class UpstreamTextObserver(RecordingObserver):
+    frame_types = (TextFrame,)
+    direction = FrameDirection.UPSTREAM
+
+
+class UpstreamProcessorObserver(RecordingObserver):
+    source_types = (UpstreamProcessor,)
+
+
+async def run_observers(observers: List[BaseObserver]):
+    pipeline = Pipeline([IdentityFilter(), UpstreamProcessor()])
+    task = PipelineTask(pipeline, observers=observers, cancel_on_idle_timeout=False)
+    audio = OutputAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+    await task.queue_frames([audio, TranscriptionFrame("Hi", "", ""), EndFrame()])
+    await PipelineRunner(handle_sigint=False).run(task)
+
+
+class TestTaskObserver(unittest.IsolatedAsyncioTestCase):
+    async def test_all_frames(self):
+        observer = RecordingObserver()
+        await run_observers([observer])
+        assert any(isinstance(f, OutputAudioRawFrame) for f in observer.frames)
+
+    async def test_frame_types(self):
+        observer = TextObserver()
+        await run_observers([observer])
+        assert observer.frames
+        assert all(isinstance(f, TextFrame) for f in observer.frames)
+        # The transcription frame and its subclass are seen downstream.
+        assert any(isinstance(f, TranscriptionFrame) for f in observer.frames)
+
+    async def test_direction(self):
+        observer = UpstreamTextObserver()
+        await run_observers([observer])
+        assert observer.frames
+        assert all(f.text == "upstream" for f in observer.frames)
+
+    async def test_source_types(self):
+        all_observer = RecordingObserver()
+        observer = UpstreamProcessorObserver()
+        await run_observers([all_observer, observer])
+        assert 0 < len(observer.frames) < len(all_observer.frames)
+
+    async def test_rtvi_observer_subclass(self):
+        class CustomRTVIObserver(RTVIObserver):
+            async def on_push_frame(self, src, dst, frame, direction, timestamp):
+                await super().on_push_frame(src, dst, frame, direction, timestamp)
+
+        class FilteredRTVIObserver(CustomRTVIObserver):
+            frame_types = (TextFrame,)
+
+        assert RTVIObserver.frame_types
+        # Subclasses handling more frames observe everything by default.
+        assert CustomRTVIObserver.frame_types == ()
+        assert FilteredRTVIObserver.frame_types == (TextFrame,)
@@ -0,0 +1,179 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator
+
+from pipecat.frames.frames import (
+    ErrorFrame,
+    Frame,
+    TTSAudioRawFrame,
+    TTSSpeakFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.services.ai_services import TTSService
+from pipecat.services.tts_cache import TTSAudioCache
+from pipecat.tests.utils import run_test
+
+SAMPLE_RATE = 16000
+
+
+def key(text: str, **kwargs) -> str:
+    args = dict(
+        text=text, service="TTS", voice="voice", model="model", sample_rate=16000, settings={}
+    )
+    args.update(kwargs)
+    return TTSAudioCache.audio_key(**args)
+
+
+class MockTTSService(TTSService):
+    def __init__(self, fail: bool = False, **kwargs):
+        super().__init__(sample_rate=SAMPLE_RATE, **kwargs)
+        self.requests = 0
+        self.fail = fail
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        self.requests += 1
+        yield TTSStartedFrame()
+        if self.fail:
+            yield ErrorFrame("TTS error")
+        else:
+            # 100ms of audio in a single frame.
+            audio = bytes(range(256)) * (SAMPLE_RATE // 10 * 2 // 256) + bytes(128)
+            yield TTSAudioRawFrame(audio=audio, sample_rate=SAMPLE_RATE, num_channels=1)
+        yield TTSStoppedFrame()
+
+
+class TestTTSAudioCache(unittest.IsolatedAsyncioTestCase):
+    async def test_audio_key(self):
+        assert key("Hello there!") == key("  Hello\n there! ")
+        assert key("Hello there!") != key("Hello there.")
+        assert key("Hello") != key("Hello", voice="other")
+        assert key("Hello") != key("Hello", model="other")
+        assert key("Hello") != key("Hello", sample_rate=24000)
+        assert key("Hello") != key("Hello", settings={"speed": 1.2})
+        assert key("Hello", settings={"a": 1, "b": 2}) == key("Hello", settings={"b": 2, "a": 1})
+
+    async def test_memory_lru(self):
+        cache = TTSAudioCache(max_memory_bytes=10)
+        await cache.put("a", b"aaaa")
+        await cache.put("b", b"bbbb")
+        assert await cache.get("a") == b"aaaa"
+        # "b" is now the least recently used.
+        await cache.put("c", b"cccc")
+        assert await cache.get("b") is None
+        assert await cache.get("a") == b"aaaa"
+        assert await cache.get("c") == b"cccc"
+        # Too big.
+        await cache.put("d", b"d" * 11)
+        assert await cache.get("d") is None
+
+        stats = cache.stats()
+        assert stats.memory_hits == 3
+        assert stats.misses == 2
+        assert stats.entries == 2
+        assert stats.memory_bytes == 8
+
+    async def test_disk(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            cache = TTSAudioCache(disk_dir=disk_dir)
+            await cache.put("a", b"aaaa")
+
+            # A new cache (e.g. after a restart) finds the audio on disk.
+            cache = TTSAudioCache(disk_dir=disk_dir)
+            audio = await cache.get("a")
+            assert audio[:] == b"aaaa"
+            assert (await cache.get("a"))[:] == b"aaaa"
+            assert await cache.get("b") is None
+            stats = cache.stats()
+            assert (stats.disk_hits, stats.memory_hits, stats.misses) == (1, 1, 1)
+
+    async def test_disk_eviction(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            cache = TTSAudioCache(disk_dir=disk_dir, max_disk_bytes=8)
+            await cache.put("a", b"aaaa")
+            os.utime(os.path.join(disk_dir, "a.pcm"), (0, 0))
+            await cache.put("b", b"bbbb")
+            await cache.put("c", b"cccc")
+            assert sorted(os.listdir(disk_dir)) == ["b.pcm", "c.pcm"]
+
+            # Files written before (e.g. by a previous run) count too.
+            cache = TTSAudioCache(disk_dir=disk_dir, max_disk_bytes=8)
+            await cache.put("d", b"dddd")
+            assert len(os.listdir(disk_dir)) == 2
+            assert "d.pcm" in os.listdir(disk_dir)
+
+    async def test_concurrent_disk_writes(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            cache = TTSAudioCache(disk_dir=disk_dir, max_disk_bytes=1024 * 1024)
+            audio = [bytes([i]) * 100_000 for i in range(8)]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                await asyncio.gather(*[cache.put("a", a, executor) for a in audio])
+            # No temporary files left and the file is one of the complete writes.
+            assert os.listdir(disk_dir) == ["a.pcm"]
+            with open(os.path.join(disk_dir, "a.pcm"), "rb") as f:
+                assert f.read() in audio
+
+    async def test_evicted_mmap_closed(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            await TTSAudioCache(disk_dir=disk_dir).put("a", b"aaaa")
+
+            cache = TTSAudioCache(max_memory_bytes=4, disk_dir=disk_dir)
+            audio = await cache.get("a")
+            await cache.put("b", b"bbbb")
+            assert audio.closed
+
+            # Audio being replayed is not closed.
+            audio = await cache.get("a")
+            with memoryview(audio) as view:
+                await cache.put("b", b"bbbb")
+                assert view.tobytes() == b"aaaa"
+
+
+class TestTTSServiceAudioCache(unittest.IsolatedAsyncioTestCase):
+    async def test_replay(self):
+        cache = TTSAudioCache()
+        tts = MockTTSService(audio_cache=cache)
+        (received_down, _) = await run_test(
+            tts,
+            frames_to_send=[
+                TTSSpeakFrame(text="One moment please."),
+                TTSSpeakFrame(text="One moment  please."),
+            ],
+            expected_down_frames=[TTSStartedFrame, TTSAudioRawFrame, TTSStoppedFrame, TTSTextFrame]
+            + [TTSStartedFrame]
+            + [TTSAudioRawFrame] * 5
+            + [TTSStoppedFrame, TTSTextFrame],
+        )
+        assert tts.requests == 1
+
+        synthesized = [f for f in received_down[:3] if isinstance(f, TTSAudioRawFrame)]
+        replayed = received_down[4:]
+        chunks = [f for f in replayed if isinstance(f, TTSAudioRawFrame)]
+        # 20ms chunks.
+        assert all(len(f.audio) == SAMPLE_RATE // 50 * 2 for f in chunks)
+        assert b"".join(f.audio for f in chunks) == synthesized[0].audio
+
+        # Other sessions share the cache.
+        other_tts = MockTTSService(audio_cache=cache)
+        await run_test(other_tts, frames_to_send=[TTSSpeakFrame(text="One moment please.")])
+        assert other_tts.requests == 0
+
+    async def test_errors_not_cached(self):
+        cache = TTSAudioCache()
+        tts = MockTTSService(fail=True, audio_cache=cache)
+        await run_test(
+            tts,
+            frames_to_send=[TTSSpeakFrame(text="Hello."), TTSSpeakFrame(text="Hello.")],
+        )
+        assert tts.requests == 2
+        assert cache.stats().entries == 0
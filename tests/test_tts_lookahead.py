@@ -0,0 +1,100 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+from typing import AsyncGenerator
+
+from pipecat.frames.frames import (
+    Frame,
+    LLMFullResponseEndFrame,
+    StartInterruptionFrame,
+    TextFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+    TTSTextFrame,
+)
+from pipecat.services.ai_services import TTSService
+from pipecat.tests.utils import SleepFrame, run_test
+
+
+class MockHTTPTTSService(TTSService):
+    """Takes longer to synthesize the first sentences than the last ones."""
+
+    def __init__(self, **kwargs):
+        super().__init__(sample_rate=16000, **kwargs)
+        self.requests = 0
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = 0
+
+    async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
+        self.requests += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            yield TTSStartedFrame()
+            await asyncio.sleep(0.1 / self.requests)
+            for _ in range(2):
+                yield TTSAudioRawFrame(audio=text.encode(), sample_rate=16000, num_channels=1)
+                await asyncio.sleep(0.01)
+            yield TTSStoppedFrame()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+
+SENTENCES = ["One.", " Two.", " Three.", " Four."]
+
+
+class TestTTSLookahead(unittest.IsolatedAsyncioTestCase):
+    async def test_order(self):
+        tts = MockHTTPTTSService(synthesis_lookahead=2)
+        frames_to_send = [TextFrame(text=s) for s in SENTENCES] + [LLMFullResponseEndFrame()]
+        expected_down_frames = [
+            TTSStartedFrame,
+            TTSAudioRawFrame,
+            TTSAudioRawFrame,
+            TTSStoppedFrame,
+            TTSTextFrame,
+        ] * len(SENTENCES) + [LLMFullResponseEndFrame]
+        (received_down, _) = await run_test(
+            tts,
+            frames_to_send=frames_to_send,
+            expected_down_frames=expected_down_frames,
+        )
+        audio = [f.audio.decode() for f in received_down if isinstance(f, TTSAudioRawFrame)]
+        assert audio == [s for s in SENTENCES for _ in range(2)]
+        texts = [f.text for f in received_down if isinstance(f, TTSTextFrame)]
+        assert texts == SENTENCES
+        # The sentence being pushed and 2 ahead.
+        assert tts.max_running == 3
+
+    async def test_no_lookahead(self):
+        tts = MockHTTPTTSService()
+        frames_to_send = [TextFrame(text=s) for s in SENTENCES]
+        await run_test(tts, frames_to_send=frames_to_send)
+        assert tts.max_running == 1
+
+    async def test_interruption(self):
+        tts = MockHTTPTTSService(synthesis_lookahead=2)
+        frames_to_send = [
+            TextFrame(text="One."),
+            TextFrame(text=" Two."),
+            SleepFrame(sleep=0.02),
+            StartInterruptionFrame(),
+            SleepFrame(sleep=0.2),
+        ]
+        (received_down, _) = await run_test(
+            tts,
+            frames_to_send=frames_to_send,
+            expected_down_frames=[TTSStartedFrame, StartInterruptionFrame],
+        )
+        assert tts.cancelled == 2
+        assert tts.running == 0
@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from pipecat.utils.asyncio import wait_for
+
+
+class TestWaitFor(unittest.IsolatedAsyncioTestCase):
+    async def test_result(self):
+        queue = asyncio.Queue()
+        queue.put_nowait(1)
+        self.assertEqual(await wait_for(queue.get(), timeout=1), 1)
+
+    async def test_timeout(self):
+        queue = asyncio.Queue()
+        with self.assertRaises(asyncio.TimeoutError):
+            await wait_for(queue.get(), timeout=0.01)
+
+    async def test_cancellation_not_swallowed(self):
+        """The calling task is cancelled right after the awaitable completes
+        (before Python 3.12, `asyncio.wait_for()` would return the result).
+        """
+        queue = asyncio.Queue()
+
+        async def waiter():
+            return await wait_for(queue.get(), timeout=10)
+
+        task = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        queue.put_nowait(1)
+        # Let `get()` complete, then cancel before the waiter resumes.
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@
 
 import unittest
 
-from pipecat.utils.string import match_endofsentence, parse_start_end_tags
+from pipecat.utils.string import EndOfSentenceScanner, match_endofsentence, parse_start_end_tags
 
 
 class TestUtilsString(unittest.IsolatedAsyncioTestCase):
@@ -62,6 +62,35 @@ class TestUtilsString(unittest.IsolatedAsyncioTestCase):
             assert match_endofsentence(i)
         assert not match_endofsentence("हैलो，")
 
+    async def test_endofsentence_scanner(self):
+        texts = [
+            "This is for Mr. and Mrs. Jones.",
+            "U.S.A and U.S.A..",
+            "My emails are foo@pipecat.ai and bar@pipecat.ai.",
+            "The number pi is 3.14159.",
+            "Valid scientific notation 1.23e4.",
+            "This is a sentence . . .",
+            "Prof. Walker, I presume ",
+            "It still early, it's 3:00 a.",
+            "你好，吃了吗？",
+        ]
+        for text in texts:
+            # Scanning text as it grows, one character at a time.
+            scanner = EndOfSentenceScanner()
+            for i in range(1, len(text) + 1):
+                assert scanner.scan(text[:i]) == match_endofsentence(text[:i]), text[:i]
+                if match_endofsentence(text[:i]):
+                    scanner.reset()
+
+    async def test_endofsentence_scanner_skip(self):
+        scanner = EndOfSentenceScanner()
+        assert not scanner.scan("Hello ")
+        # Text not scanned yet is still scanned.
+        assert scanner.scan("Hello there! How are you") == 12
+        scanner.reset()
+        assert not scanner.scan(" How are you")
+        assert scanner.scan(" How are you? I") == 13
+
 
 class TestStartEndTags(unittest.IsolatedAsyncioTestCase):
     async def test_empty(self):
@@ -0,0 +1,51 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from pipecat.audio.utils import calculate_audio_volume
+from pipecat.audio.volume_meter import VolumeMeter
+
+
+def speech_like(sample_rate: int, secs: float) -> np.ndarray:
+    """A tone that fades in and out every other second, plus some noise."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(sample_rate * secs)) / sample_rate
+    envelope = np.where(np.floor(t) % 2 == 0, 8000 * np.sin(np.pi * t) ** 2, 0)
+    audio = envelope * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 100, len(t))
+    return audio.astype(np.int16)
+
+
+class TestVolumeMeter(unittest.TestCase):
+    def test_close_to_pyloudnorm(self):
+        for sample_rate, window in [(8000, 256), (16000, 512)]:
+            meter = VolumeMeter(sample_rate)
+            audio = speech_like(sample_rate, 3.0)
+            for i in range(0, len(audio) - window + 1, window):
+                chunk = audio[i : i + window].tobytes()
+                self.assertAlmostEqual(
+                    meter.volume(chunk), calculate_audio_volume(chunk, sample_rate), delta=0.01
+                )
+
+    def test_silence(self):
+        meter = VolumeMeter(16000)
+        self.assertEqual(meter.volume(np.zeros(512, dtype=np.int16).tobytes()), 0.0)
+        self.assertEqual(meter.volume(b""), 0.0)
+
+    def test_reset(self):
+        audio = speech_like(16000, 1.0)
+        first = audio[:512].tobytes()
+        meter = VolumeMeter(16000)
+        volume = meter.volume(first)
+        meter.volume(audio[512:].tobytes())
+        meter.reset()
+        self.assertEqual(meter.volume(first), volume)
+
+
+if __name__ == "__main__":
+    unittest.main()